@@ -39,3 +39,8 @@ try:
     from azure.storage.blob import ContainerClient
 except (ImportError, AttributeError):
     ContainerClient = AZURE_BLOB_STORAGE_NOT_IMPORTED  # type: ignore[misc] # assigning to type
+
+try:
+    from azure.core.exceptions import ResourceNotFoundError
+except (ImportError, AttributeError):
+    ResourceNotFoundError = AZURE_BLOB_STORAGE_NOT_IMPORTED  # type: ignore[misc] # assigning to type
@@ -10,3 +10,13 @@ try:
     import pyarrow
 except ImportError:
     pyarrow = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import parquet
+except ImportError:
+    parquet = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import compute
+except ImportError:
+    compute = PYARROW_NOT_IMPORTED
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import copy
 import datetime
+import functools
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 import dateutil
@@ -37,6 +39,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 _epsilon = 1e-12
 
+# Maximum number of distinct parameter expressions kept (compiled) in "_compile_evaluation_parameter_expression" cache.
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 1024
+
 
 class EvaluationParameterParser:
     """
@@ -233,7 +238,8 @@ def build_evaluation_parameters(
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
     """
-    evaluation_args = copy.deepcopy(expectation_args)
+    # Substitutions replace (rather than modify) values; hence, unchanged values are shared with "expectation_args".
+    evaluation_args = dict(expectation_args)
     substituted_parameters = {}
 
     # Iterate over arguments, and replace $PARAMETER-defined args with their
@@ -248,8 +254,12 @@ def build_evaluation_parameters(
             # If it was, use that one, but remove it from the stored config
             param_key = f"$PARAMETER.{value['$PARAMETER']}"
             if param_key in value:
-                evaluation_args[key] = evaluation_args[key][param_key]
-                del expectation_args[key][param_key]
+                evaluation_args[key] = value[param_key]
+                expectation_args[key] = {
+                    value_key: value_value
+                    for value_key, value_value in value.items()
+                    if value_key != param_key
+                }
 
             # If not, try to parse the evaluation parameter and substitute, which will raise
             # an exception if we do not have a value
@@ -267,7 +277,63 @@ def build_evaluation_parameters(
     return evaluation_args, substituted_parameters
 
 
-EXPR = EvaluationParameterParser()
+@dataclass(frozen=True)
+class CompiledEvaluationParameterExpression:
+    """Immutable outcome of parsing evaluation parameter expression once.
+
+    Args:
+        parse_results: top-level tokens returned by parser (or "Parse Failure" marker, expression, and error details)
+        expr_stack: expression in postfix order (operands, operators, and functions), as consumed by "evaluate_stack"
+    """
+
+    parse_results: tuple
+    expr_stack: tuple
+
+    @property
+    def is_parse_failure(self) -> bool:
+        return len(self.parse_results) > 0 and self.parse_results[0] == "Parse Failure"
+
+
+# Parse actions of "EvaluationParameterParser" append to its "exprStack"; hence, each thread parses with its own parser.
+_thread_local_parsers = threading.local()
+
+
+def _get_thread_local_parser() -> EvaluationParameterParser:
+    parser: Optional[EvaluationParameterParser] = getattr(
+        _thread_local_parsers, "parser", None
+    )
+    if parser is None:
+        parser = EvaluationParameterParser()
+        _thread_local_parsers.parser = parser
+
+    return parser
+
+
+@functools.lru_cache(maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE)
+def _compile_evaluation_parameter_expression(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    """Parses expression (once per distinct expression text) into "CompiledEvaluationParameterExpression".
+
+    Compiled expressions are shared (across expectations, validation runs, and threads) and must never be mutated;
+    substitution of parameter values and evaluation operate on copy of "expr_stack".
+    """
+    expr: EvaluationParameterParser = _get_thread_local_parser()
+    # Calling get_parser clears the stack
+    parser = expr.get_parser()
+    parse_results: Union[ParseResults, list]
+    try:
+        parse_results = parser.parseString(parameter_expression, parseAll=True)
+    except ParseException as err:
+        parse_results = [
+            "Parse Failure",
+            parameter_expression,
+            (str(err), err.line, err.column),
+        ]
+
+    return CompiledEvaluationParameterExpression(
+        parse_results=tuple(parse_results), expr_stack=tuple(expr.exprStack)
+    )
 
 
 def find_evaluation_parameter_dependencies(parameter_expression):
@@ -282,23 +348,23 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GX URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
+        compiled_expression: CompiledEvaluationParameterExpression = (
+            _compile_evaluation_parameter_expression(parameter_expression)
         )
-    except AttributeError as err:
+    except (AttributeError, TypeError) as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
 
-    for word in expr.exprStack:
+    if compiled_expression.is_parse_failure:
+        err_str, err_line, err_col = compiled_expression.parse_results[-1]
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
+
+    for word in compiled_expression.expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -306,7 +372,11 @@ def find_evaluation_parameter_dependencies(parameter_expression):
             # If we have a function that itself is a tuple (e.g. (trunc, 1))
             continue
 
-        if word in expr.opn or word in expr.fn or word == "unary -":
+        if (
+            word in EvaluationParameterParser.opn
+            or word in EvaluationParameterParser.fn
+            or word == "unary -"
+        ):
             # operations and functions
             continue
 
@@ -354,10 +424,15 @@ def parse_evaluation_parameter(  # noqa: C901, PLR0912, PLR0915
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    parse_results: Union[ParseResults, list] = _get_parse_results(parameter_expression)
+    compiled_expression: CompiledEvaluationParameterExpression = (
+        _compile_evaluation_parameter_expression(parameter_expression)
+    )
+    parse_results: tuple = compiled_expression.parse_results
+    # Substitutions are made in (and evaluation consumes) this copy; compiled expression itself is shared.
+    expr_stack: list = list(compiled_expression.expr_stack)
 
     if _is_single_function_no_args(parse_results):
-        # Necessary to catch `now()` (which only needs to be evaluated with `expr.exprStack`)
+        # Necessary to catch `now()` (which only needs to be evaluated with `expr_stack`)
         # NOTE: 20211122 - Chetan - Any future built-ins that are zero arity functions will match this behavior
         pass
 
@@ -403,9 +478,9 @@ def parse_evaluation_parameter(  # noqa: C901, PLR0912, PLR0915
     elif len(parse_results) == 0 or parse_results[0] != "Parse Failure":
         # we have a stack to evaluate and there was no parse failure.
         # iterate through values and look for URNs pointing to a store:
-        for i, ob in enumerate(EXPR.exprStack):
+        for i, ob in enumerate(expr_stack):
             if isinstance(ob, str) and ob in evaluation_parameters:
-                EXPR.exprStack[i] = str(evaluation_parameters[ob])
+                expr_stack[i] = str(evaluation_parameters[ob])
             elif isinstance(ob, str) and ob not in evaluation_parameters:
                 # try to retrieve this value from a store
                 try:
@@ -413,7 +488,7 @@ def parse_evaluation_parameter(  # noqa: C901, PLR0912, PLR0915
                     if res["urn_type"] == "stores":
                         store = data_context.stores.get(res["store_name"])  # type: ignore[union-attr]
                         if store:
-                            EXPR.exprStack[i] = str(
+                            expr_stack[i] = str(
                                 store.get_query_result(
                                     res["metric_name"], res.get("metric_kwargs", {})
                                 )
@@ -434,7 +509,7 @@ def parse_evaluation_parameter(  # noqa: C901, PLR0912, PLR0915
         )
 
     try:
-        result = EXPR.evaluate_stack(EXPR.exprStack)
+        result = EvaluationParameterParser().evaluate_stack(expr_stack)
         result = convert_to_json_serializable(result)
     except Exception as e:
         exception_traceback = traceback.format_exc()
@@ -449,23 +524,7 @@ def parse_evaluation_parameter(  # noqa: C901, PLR0912, PLR0915
     return result
 
 
-def _get_parse_results(
-    parameter_expression: str,
-) -> Union[ParseResults, list]:
-    # Calling get_parser clears the stack
-    parser = EXPR.get_parser()
-    try:
-        parse_results = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        parse_results = [
-            "Parse Failure",
-            parameter_expression,
-            (str(err), err.line, err.column),
-        ]
-    return parse_results
-
-
-def _is_single_function_no_args(parse_results: Union[ParseResults, list]) -> bool:
+def _is_single_function_no_args(parse_results: tuple) -> bool:
     # Represents a valid parser result of a single function that has no arguments
     return (
         len(parse_results) == 1
@@ -70,6 +70,8 @@ def parse_result_format(result_format: Union[str, dict]) -> dict:
             "include_unexpected_rows": False,
         }
     else:
+        # Copy, rather than update in place, "result_format" dictionary, which may be shared by (derived) configurations.
+        result_format = dict(result_format)
         if (
             "include_unexpected_rows" in result_format
             and "result_format" not in result_format
@@ -1064,6 +1066,27 @@ class ExpectationConfiguration(SerializableDictDot):
 
         return raw_config
 
+    def derive(self, kwargs: Optional[dict] = None) -> ExpectationConfiguration:
+        """Returns copy of this ExpectationConfiguration, whose kwargs are updated with given "kwargs" (if any).
+
+        The copy is copy-on-write: its kwargs (raw and evaluated) and meta are new dictionaries, but their values are
+        shared with this ExpectationConfiguration, rather than deep-copied.  Hence, values of kwargs and meta must be
+        replaced, never modified in place (which "patch" and evaluation parameter processing adhere to).
+
+        Args:
+            kwargs: kwargs to add to (or to replace in) kwargs of the copy
+
+        Returns:
+            Derived ExpectationConfiguration object
+        """
+        derived_config = copy.copy(self)
+        derived_config._kwargs = {**self._kwargs, **(kwargs or {})}
+        if self._raw_kwargs is not None:
+            derived_config._raw_kwargs = dict(self._raw_kwargs)
+
+        derived_config.meta = dict(self.meta)
+        return derived_config
+
     def patch(self, op: str, path: str, value: Any) -> ExpectationConfiguration:
         """
 
@@ -1092,6 +1115,10 @@ class ExpectationConfiguration(SerializableDictDot):
         # TODO: Call validate_kwargs when implemented
         patch = jsonpatch.JsonPatch([{"op": op, "path": path, "value": value}])
 
+        if valid_path in self.kwargs:
+            # Copy on write: value being patched may be shared with derived configurations (see "derive").
+            self.kwargs[valid_path] = deepcopy(self.kwargs[valid_path])
+
         patch.apply(self.kwargs, in_place=True)
         return self
 
@@ -1269,7 +1296,7 @@ class ExpectationConfiguration(SerializableDictDot):
             runtime_keys = self.runtime_kwargs
 
         success_kwargs = self.get_success_kwargs()
-        lookup_kwargs = deepcopy(self.kwargs)
+        lookup_kwargs = dict(self.kwargs)
         if runtime_configuration:
             lookup_kwargs.update(runtime_configuration)
 
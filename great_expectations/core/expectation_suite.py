@@ -37,6 +37,7 @@ from great_expectations.core.expectation_configuration import (
     ExpectationConfigurationSchema,
     expectationConfigurationSchema,
 )
+from great_expectations.core.expectation_suite_index import ExpectationSuiteIndex
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.util import (
@@ -103,6 +104,7 @@ class ExpectationSuite(SerializableDictDot):
         self.expectation_suite_name = expectation_suite_name
         self.ge_cloud_id = ge_cloud_id
         self._data_context = data_context
+        self._expectation_index = ExpectationSuiteIndex()
 
         if expectations is None:
             expectations = []
@@ -247,6 +249,7 @@ class ExpectationSuite(SerializableDictDot):
             setattr(result, key, deepcopy(getattr(self, key)))
 
         result._data_context = self._data_context
+        result._expectation_index = ExpectationSuiteIndex()
 
         return result
 
@@ -448,18 +451,24 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
-        match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if ge_cloud_id is not None:
-                if expectation.ge_cloud_id == ge_cloud_id:
-                    match_indexes.append(idx)
-            else:  # noqa: PLR5501
-                if expectation.isEquivalentTo(
-                    other=expectation_configuration, match_type=match_type  # type: ignore[arg-type]
-                ):
-                    match_indexes.append(idx)
+        if ge_cloud_id is not None:
+            return self._expectation_index.find_ge_cloud_id_indexes(
+                expectations=self.expectations, ge_cloud_id=ge_cloud_id
+            )
 
-        return match_indexes
+        # Only Expectations sharing Domain of given configuration (looked up in hash index) can match it.
+        candidate_indexes: List[int] = self._expectation_index.find_candidate_indexes(
+            expectations=self.expectations,
+            expectation_configuration=expectation_configuration,  # type: ignore[arg-type]
+        )
+        idx: int
+        return [
+            idx
+            for idx in candidate_indexes
+            if self.expectations[idx].isEquivalentTo(
+                other=expectation_configuration, match_type=match_type  # type: ignore[arg-type]
+            )
+        ]
 
     @public_api
     def find_expectations(
@@ -583,6 +592,7 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        self._expectation_index.reindex(self.expectations[found_expectation_indexes[0]])
         return self.expectations[found_expectation_indexes[0]]
 
     def _add_expectation(
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import logging
+import operator
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
+
+import great_expectations.exceptions as gx_exceptions
+
+if TYPE_CHECKING:
+    from great_expectations.core.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Indexed configuration, its Domain key (None, if configuration has no hashable Domain key), and its "ge_cloud_id".
+IndexedExpectationKeys = Tuple["ExpectationConfiguration", Optional[Hashable], Any]
+
+
+class ExpectationSuiteIndex:
+    """Hash index of positions of "ExpectationConfiguration" objects in "ExpectationSuite.expectations" list.
+
+    Positions are indexed by Domain key ("expectation_type" and Domain kwargs) and by "ge_cloud_id".  Configurations,
+    matching given configuration by any "match_type" ("domain", "success", or "runtime"), share its Domain key; hence,
+    only configurations indexed under that key (and configurations without hashable Domain key) are candidates, which
+    "ExpectationSuite.find_expectation_indexes()" compares with given configuration.
+
+    The index follows "ExpectationSuite.expectations" list by identity of its elements: configurations appended to,
+    replaced in, or removed from the list (also directly, bypassing "ExpectationSuite" methods) are re-indexed upon next
+    lookup, computing keys only for configurations not indexed before.  Domain kwargs and "ge_cloud_id" of indexed
+    configurations are assumed not to change in place, except through "ExpectationSuite" methods (which re-index
+    configurations they modify).
+    """
+
+    def __init__(self) -> None:
+        # Elements of indexed "ExpectationSuite.expectations" list, in order.
+        self._expectations: List[ExpectationConfiguration] = []
+        # Keys of indexed configurations, by identity of configuration.
+        self._keys: Dict[int, IndexedExpectationKeys] = {}
+        self._positions_by_domain_key: Dict[Hashable, List[int]] = {}
+        self._positions_by_ge_cloud_id: Dict[Any, List[int]] = {}
+        # Positions of configurations without hashable Domain key (these are candidates for any lookup).
+        self._unindexed_positions: List[int] = []
+
+    def find_candidate_indexes(
+        self,
+        expectations: List[ExpectationConfiguration],
+        expectation_configuration: ExpectationConfiguration,
+    ) -> List[int]:
+        """Returns ascending positions of configurations in "expectations", which may match given configuration."""
+        self._refresh(expectations=expectations)
+
+        domain_key: Optional[Hashable] = get_domain_key(
+            expectation_configuration=expectation_configuration
+        )
+        if domain_key is None:
+            return list(range(len(expectations)))
+
+        candidate_indexes: List[int] = self._positions_by_domain_key.get(domain_key, [])
+        if self._unindexed_positions:
+            return sorted(candidate_indexes + self._unindexed_positions)
+
+        return list(candidate_indexes)
+
+    def find_ge_cloud_id_indexes(
+        self,
+        expectations: List[ExpectationConfiguration],
+        ge_cloud_id: Any,
+    ) -> List[int]:
+        """Returns ascending positions of configurations in "expectations", having given "ge_cloud_id"."""
+        self._refresh(expectations=expectations)
+
+        try:
+            return list(self._positions_by_ge_cloud_id.get(ge_cloud_id, []))
+        except TypeError:
+            return [
+                idx
+                for idx, expectation in enumerate(expectations)
+                if expectation.ge_cloud_id == ge_cloud_id
+            ]
+
+    def reindex(self, expectation_configuration: ExpectationConfiguration) -> None:
+        """Recomputes keys of given configuration (after its Domain kwargs or "ge_cloud_id" were modified in place)."""
+        if self._keys.pop(id(expectation_configuration), None) is not None:
+            # Positions are rebuilt upon next lookup.
+            self._clear_positions()
+
+    def _refresh(self, expectations: List[ExpectationConfiguration]) -> None:
+        start: int = len(self._expectations)
+        cached_keys: Dict[int, IndexedExpectationKeys] = self._keys
+        if len(expectations) < start or not all(
+            map(operator.is_, expectations, self._expectations)
+        ):
+            # Indexed list was modified other than by appending to it; positions are rebuilt from cached keys.
+            self._clear_positions()
+            self._keys = {}
+            start = 0
+        elif len(expectations) == start:
+            return
+
+        idx: int
+        expectation_configuration: ExpectationConfiguration
+        for idx, expectation_configuration in enumerate(
+            expectations[start:], start=start
+        ):
+            self._add(
+                idx=idx,
+                expectation_configuration=expectation_configuration,
+                cached_keys=cached_keys,
+            )
+
+        self._expectations = list(expectations)
+
+    def _clear_positions(self) -> None:
+        self._expectations = []
+        self._positions_by_domain_key = {}
+        self._positions_by_ge_cloud_id = {}
+        self._unindexed_positions = []
+
+    def _add(
+        self,
+        idx: int,
+        expectation_configuration: ExpectationConfiguration,
+        cached_keys: Dict[int, IndexedExpectationKeys],
+    ) -> None:
+        keys: Optional[IndexedExpectationKeys] = cached_keys.get(
+            id(expectation_configuration)
+        )
+        if keys is None or keys[0] is not expectation_configuration:
+            keys = (
+                expectation_configuration,
+                get_domain_key(expectation_configuration=expectation_configuration),
+                expectation_configuration.ge_cloud_id,
+            )
+
+        self._keys[id(expectation_configuration)] = keys
+
+        domain_key: Optional[Hashable] = keys[1]
+        if domain_key is None:
+            self._unindexed_positions.append(idx)
+        else:
+            self._positions_by_domain_key.setdefault(domain_key, []).append(idx)
+
+        ge_cloud_id: Any = keys[2]
+        if ge_cloud_id is not None:
+            try:
+                self._positions_by_ge_cloud_id.setdefault(ge_cloud_id, []).append(idx)
+            except TypeError:
+                logger.debug(f'Unhashable "ge_cloud_id" is not indexed: {ge_cloud_id}')
+
+
+def get_domain_key(
+    expectation_configuration: ExpectationConfiguration,
+) -> Optional[Hashable]:
+    """Returns hashable ("expectation_type", canonical Domain kwargs) key of given configuration (or None, if unhashable).
+
+    Canonical forms of equal Domain kwargs are equal (dictionaries, lists, and sets become frozensets and tuples), so
+    configurations, whose Domain kwargs are equal, share Domain key.
+    """
+    try:
+        domain_key: Hashable = (
+            expectation_configuration.expectation_type,
+            _to_hashable(expectation_configuration.get_domain_kwargs()),
+        )
+        hash(domain_key)
+    except (TypeError, gx_exceptions.GreatExpectationsError) as e:
+        logger.debug(
+            f'Expectation of type "{expectation_configuration.expectation_type}" is not indexed by Domain: {e}'
+        )
+        return None
+
+    return domain_key
+
+
+def _to_hashable(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(element)) for key, element in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(element) for element in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(element) for element in value)
+
+    return value
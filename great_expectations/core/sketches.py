@@ -0,0 +1,459 @@
+"""Mergeable, fixed-memory summaries of data streams, used to approximate metrics in a single pass over column values.
+"""
+from __future__ import annotations
+
+import math
+import random
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+# Default relative error of sketch-based metrics (when "allow_relative_error" is given as "True").
+DEFAULT_SKETCH_RELATIVE_ERROR: float = 0.01
+
+
+def is_sketch_relative_error(allow_relative_error: Any) -> bool:
+    """Determines whether or not "allow_relative_error" requests approximate (sketch-based) metric."""
+    if isinstance(allow_relative_error, bool):
+        return allow_relative_error
+
+    return isinstance(allow_relative_error, float) and 0.0 < allow_relative_error < 1.0
+
+
+def get_sketch_relative_error(allow_relative_error: Union[bool, float]) -> float:
+    """Returns relative error target of sketch (True means "DEFAULT_SKETCH_RELATIVE_ERROR")."""
+    if allow_relative_error is True:
+        return DEFAULT_SKETCH_RELATIVE_ERROR
+
+    return float(allow_relative_error)
+
+
+class KllSketch:
+    """Approximate quantiles sketch (Karnin, Lang, Liberty, "Optimal Quantile Approximation in Streams", 2016).
+
+    Items are kept in a hierarchy of compactors; an item at height "h" represents "2 ** h" original items.  When a
+    compactor is full, it is sorted and every other item (starting at random offset) is promoted to next height.  With
+    "k" items in top compactor, rank error is about "1.65 / k" (with high probability), independent of stream length.
+
+    Until first compaction, all items are retained and quantiles are exact.
+    """
+
+    _CAPACITY_DECAY: float = 2.0 / 3.0
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 2:  # noqa: PLR2004
+            raise ValueError('KllSketch "k" parameter must be at least 2.')
+
+        self._k = k
+        self._random = random.Random(seed)
+        self._compactors: List[List[Any]] = []
+        self._num_items = 0
+        self._num_retained_items = 0
+        self._max_num_retained_items = 0
+        self._grow()
+
+    @classmethod
+    def from_relative_error(
+        cls, relative_error: float, seed: Optional[int] = None
+    ) -> KllSketch:
+        """Builds sketch, sized to keep normalized rank error of quantiles within "relative_error"."""
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(
+                'KllSketch "relative_error" parameter must be between 0 and 1 (exclusive).'
+            )
+
+        return cls(k=max(2, math.ceil(1.65 / relative_error)), seed=seed)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def relative_error(self) -> float:
+        """Normalized rank error bound of quantiles (with high probability)."""
+        return 1.65 / self._k
+
+    @property
+    def num_items(self) -> int:
+        """Number of items the sketch summarizes."""
+        return self._num_items
+
+    @property
+    def num_retained_items(self) -> int:
+        return self._num_retained_items
+
+    def update(self, item: Any) -> None:
+        """Adds item (None values are ignored)."""
+        if item is None:
+            return
+
+        self._compactors[0].append(item)
+        self._num_items += 1
+        self._num_retained_items += 1
+        if self._num_retained_items >= self._max_num_retained_items:
+            self._compress()
+
+    def update_many(self, items: Iterable[Any]) -> None:
+        item: Any
+        for item in items:
+            self.update(item=item)
+
+    def merge(self, other: KllSketch) -> None:
+        """Adds all items summarized by "other" sketch into this sketch."""
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+
+        height: int
+        compactor: List[Any]
+        for height, compactor in enumerate(other._compactors):
+            self._compactors[height].extend(compactor)
+
+        self._num_items += other._num_items
+        self._num_retained_items = sum(len(compactor) for compactor in self._compactors)
+        while self._num_retained_items >= self._max_num_retained_items:
+            self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[Any]:
+        """Returns smallest item, whose (estimated) cumulative fraction of items reaches each quantile.
+
+        This corresponds to semantics of "percentile_disc" (inverse of discrete cumulative distribution function).
+        """
+        if not all(0.0 <= quantile <= 1.0 for quantile in quantiles):
+            raise ValueError("Quantiles must be between 0 and 1 (inclusive).")
+
+        weighted_items: List[Tuple[Any, int]] = sorted(
+            (
+                (item, 2**height)
+                for height, compactor in enumerate(self._compactors)
+                for item in compactor
+            ),
+            key=lambda weighted_item: weighted_item[0],
+        )
+        if not weighted_items:
+            return [None for _ in quantiles]
+
+        total_weight: int = sum(weight for _, weight in weighted_items)
+
+        results: List[Any] = []
+
+        quantile: float
+        cumulative_weight: int
+        item: Any
+        weight: int
+        for quantile in quantiles:
+            cumulative_weight = 0
+            for item, weight in weighted_items:
+                cumulative_weight += weight
+                if cumulative_weight >= quantile * total_weight:
+                    break
+
+            results.append(item)
+
+        return results
+
+    def quantile(self, quantile: float) -> Any:
+        return self.quantiles(quantiles=[quantile])[0]
+
+    def _capacity(self, height: int) -> int:
+        depth: int = len(self._compactors) - height - 1
+        return 2 * math.ceil(self._k * self._CAPACITY_DECAY**depth) + 1
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._max_num_retained_items = sum(
+            self._capacity(height=height) for height in range(len(self._compactors))
+        )
+
+    def _compress(self) -> None:
+        height: int
+        compactor: List[Any]
+        for height, compactor in enumerate(self._compactors):
+            if len(compactor) >= self._capacity(height=height):
+                if height + 1 >= len(self._compactors):
+                    self._grow()
+
+                compactor.sort()
+                # Odd item out (if any) stays at present height, so that total weight is preserved exactly.
+                num_compacted_items: int = len(compactor) - len(compactor) % 2
+                offset: int = self._random.randint(0, 1)
+                self._compactors[height + 1].extend(
+                    compactor[offset:num_compacted_items:2]
+                )
+                self._compactors[height] = compactor[num_compacted_items:]
+                self._num_retained_items = sum(
+                    len(compactor) for compactor in self._compactors
+                )
+                break
+
+
+class HyperLogLogSketch:
+    """Approximate distinct count sketch (Flajolet et al., "HyperLogLog: the analysis of a near-optimal cardinality
+    estimation algorithm", 2007).
+
+    Every item is hashed to 64 bits; first "precision" bits select one of "2 ** precision" registers, which keeps the
+    largest position of leftmost 1-bit among remaining bits seen so far.  Relative standard error of distinct count is
+    about "1.04 / sqrt(2 ** precision)"; small cardinalities are estimated by linear counting (nearly exact).
+
+    Items are hashed with "pandas.util.hash_pandas_object()" (vectorized), so that only sketches fed with values of same
+    types should be merged (e.g., integer 1 and string "1" are distinct values).
+    """
+
+    _MIN_PRECISION: int = 4
+    _MAX_PRECISION: int = 18
+
+    def __init__(self, precision: int = 12) -> None:
+        if not self._MIN_PRECISION <= precision <= self._MAX_PRECISION:
+            raise ValueError(
+                f'HyperLogLogSketch "precision" parameter must be between {self._MIN_PRECISION} and '
+                f"{self._MAX_PRECISION}."
+            )
+
+        self._precision = precision
+        self._registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> HyperLogLogSketch:
+        """Builds sketch, sized to keep relative standard error of distinct count within "relative_error"."""
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(
+                'HyperLogLogSketch "relative_error" parameter must be between 0 and 1 (exclusive).'
+            )
+
+        precision: int = math.ceil(math.log2((1.04 / relative_error) ** 2))
+        return cls(
+            precision=min(max(precision, cls._MIN_PRECISION), cls._MAX_PRECISION)
+        )
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of distinct count estimate."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, item: Any) -> None:
+        """Adds item (None values are ignored)."""
+        self.update_many(items=[item])
+
+    def update_many(self, items: Iterable[Any]) -> None:
+        """Adds items (null values are ignored); pandas Series are hashed without conversion."""
+        values: pd.Series = (
+            items
+            if isinstance(items, pd.Series)
+            else pd.Series(list(items), dtype=object)
+        )
+        values = values.dropna()
+        if len(values) == 0:
+            return
+
+        if values.dtype == object:
+            # Let pandas infer dtype, so that (e.g.) integers fetched from database hash as integer DataFrame columns do.
+            values = pd.Series(values.tolist())
+
+        self.update_hashes(
+            hashes=pd.util.hash_pandas_object(values, index=False).to_numpy()
+        )
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Adds items, given by their (uniformly distributed) 64-bit hashes."""
+        hashes = hashes.astype(np.uint64, copy=False)
+        num_value_bits: int = 64 - self._precision
+        register_indices: np.ndarray = (hashes >> np.uint64(num_value_bits)).astype(
+            np.int64
+        )
+        value_bits: np.ndarray = hashes & np.uint64((1 << num_value_bits) - 1)
+        # Position of leftmost 1-bit among "num_value_bits" remaining bits (one more than "num_value_bits", if all 0).
+        ranks: np.ndarray = (
+            num_value_bits - _bit_length(values=value_bits) + 1
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, register_indices, ranks)
+
+    def merge(self, other: HyperLogLogSketch) -> None:
+        """Adds all items summarized by "other" sketch into this sketch (both must have same "precision")."""
+        if other._precision != self._precision:
+            raise ValueError(
+                "HyperLogLogSketch objects can only be merged, if they have same precision."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Returns estimated number of distinct items."""
+        num_registers: int = len(self._registers)
+        num_zero_registers: int = int(np.count_nonzero(self._registers == 0))
+        if num_zero_registers == num_registers:
+            return 0
+
+        alpha: float = 0.7213 / (1.0 + 1.079 / num_registers)
+        estimate: float = (
+            alpha
+            * num_registers**2
+            / float(np.sum(np.ldexp(1.0, -self._registers.astype(np.int64))))
+        )
+        if estimate <= 2.5 * num_registers and num_zero_registers > 0:  # noqa: PLR2004
+            estimate = num_registers * math.log(num_registers / num_zero_registers)
+
+        return int(round(estimate))
+
+
+class SpaceSavingSketch:
+    """Approximate heavy hitters sketch (Metwally, Agrawal, El Abbadi, "Efficient Computation of Frequent and Top-k
+    Elements in Data Streams", 2005).
+
+    At most "capacity" items are monitored, each with upper bound of its count and error (count minus error is lower
+    bound).  Unmonitored item replaces monitored item with smallest count, inheriting that count as its error.  Any
+    item, whose true count exceeds "num_items / capacity", is monitored.  Sketches are merged by adding counters (with
+    upper bound of counts of unmonitored items standing in for missing counters) and keeping largest "capacity" ones.
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        if capacity < 1:
+            raise ValueError(
+                'SpaceSavingSketch "capacity" parameter must be at least 1.'
+            )
+
+        self._capacity = capacity
+        self._counters: Dict[Any, Tuple[int, int]] = {}
+        self._num_items = 0
+        # Upper bound of counts of items, which are not monitored.
+        self._unmonitored_max_count = 0
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> SpaceSavingSketch:
+        """Builds sketch, whose count errors stay within "relative_error" times number of items summarized."""
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(
+                'SpaceSavingSketch "relative_error" parameter must be between 0 and 1 (exclusive).'
+            )
+
+        return cls(capacity=math.ceil(1.0 / relative_error))
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def num_items(self) -> int:
+        """Number of items the sketch summarizes."""
+        return self._num_items
+
+    @property
+    def max_error(self) -> int:
+        """Upper bound of overestimation of any count (counts of unmonitored items are estimated as 0)."""
+        return max(
+            [self._unmonitored_max_count]
+            + [error for _, error in self._counters.values()]
+        )
+
+    def update(self, item: Any, count: int = 1) -> None:
+        """Adds "count" occurrences of item (None values are ignored)."""
+        if item is None or count <= 0:
+            return
+
+        self._num_items += count
+        if item in self._counters:
+            item_count, error = self._counters[item]
+            self._counters[item] = (item_count + count, error)
+            return
+
+        if len(self._counters) >= self._capacity:
+            evicted_item: Any = min(
+                self._counters, key=lambda monitored: self._counters[monitored][0]
+            )
+            self._unmonitored_max_count = max(
+                self._unmonitored_max_count, self._counters.pop(evicted_item)[0]
+            )
+
+        self._counters[item] = (
+            self._unmonitored_max_count + count,
+            self._unmonitored_max_count,
+        )
+
+    def update_many(self, items: Iterable[Any]) -> None:
+        item: Any
+        for item in items:
+            self.update(item=item)
+
+    def update_counts(self, counts: Mapping[Any, int]) -> None:
+        """Adds items with (exact) counts, e.g., value counts of one partition of data."""
+        other = SpaceSavingSketch(capacity=self._capacity)
+        other._num_items = int(sum(counts.values()))
+        other._counters = {
+            item: (int(count), 0) for item, count in counts.items() if item is not None
+        }
+        other._truncate()
+        self.merge(other=other)
+
+    def merge(self, other: SpaceSavingSketch) -> None:
+        """Adds all items summarized by "other" sketch into this sketch."""
+        merged_counters: Dict[Any, Tuple[int, int]] = {}
+
+        item: Any
+        for item in set(self._counters) | set(other._counters):
+            count, error = self._counters.get(
+                item, (self._unmonitored_max_count, self._unmonitored_max_count)
+            )
+            other_count, other_error = other._counters.get(
+                item, (other._unmonitored_max_count, other._unmonitored_max_count)
+            )
+            merged_counters[item] = (count + other_count, error + other_error)
+
+        self._counters = merged_counters
+        self._num_items += other._num_items
+        self._unmonitored_max_count += other._unmonitored_max_count
+        self._truncate()
+
+    def heavy_hitters(
+        self, min_count: int = 0, guaranteed: bool = False
+    ) -> List[Tuple[Any, int, int]]:
+        """Returns monitored items as "(item, count, error)" tuples, in descending order of (upper bound of) counts.
+
+        Args:
+            min_count: only items, whose count (upper bound, or lower bound, if "guaranteed") reaches "min_count"
+            guaranteed: if True, "min_count" is compared with lower bound of counts (no false positives)
+
+        Returns:
+            List of "(item, count, error)" tuples
+        """
+        return sorted(
+            (
+                (item, count, error)
+                for item, (count, error) in self._counters.items()
+                if (count - error if guaranteed else count) >= min_count
+            ),
+            key=lambda counter: counter[1],
+            reverse=True,
+        )
+
+    def _truncate(self) -> None:
+        if len(self._counters) <= self._capacity:
+            return
+
+        ordered_items: List[Any] = sorted(
+            self._counters, key=lambda item: self._counters[item][0], reverse=True
+        )
+        item: Any
+        for item in ordered_items[self._capacity :]:
+            self._unmonitored_max_count = max(
+                self._unmonitored_max_count, self._counters.pop(item)[0]
+            )
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized "int.bit_length()" of 64-bit unsigned integers (exact; 32-bit halves are represented by floats)."""
+    high: np.ndarray = (values >> np.uint64(32)).astype(np.float64)
+    low: np.ndarray = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
@@ -0,0 +1,197 @@
+"""Compact representation of unexpected (integer) row indices of Pandas DataFrame.
+
+With `result_format="COMPLETE"`, "unexpected_index_list" holds index of every unexpected row; for large DataFrame, this
+amounts to very long list of Python integers.  Requesting `"unexpected_index_list_format": "ranges"` in `result_format`
+replaces it with "UnexpectedIndexRanges", which keeps consecutive runs of indices as (start, stop) intervals in NumPy
+arrays, serializes as these intervals, and produces the list form only on demand.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Union, overload
+
+import numpy as np
+
+UNEXPECTED_INDEX_LIST_FORMATS = ("list", "ranges")
+
+UNEXPECTED_INDEX_RANGES_KEY = "unexpected_index_ranges"
+
+
+def use_unexpected_index_ranges(result_format: dict) -> bool:
+    """Determines whether or not `result_format` requests "UnexpectedIndexRanges" (rather than list) of indices.
+
+    Args:
+        result_format: parsed `result_format` dictionary
+
+    Returns:
+        True, if `"unexpected_index_list_format"` of `result_format` is "ranges"
+
+    Raises:
+        ValueError: If `"unexpected_index_list_format"` is not one of supported formats.
+    """
+    unexpected_index_list_format: str = result_format.get(
+        "unexpected_index_list_format", "list"
+    )
+    if unexpected_index_list_format not in UNEXPECTED_INDEX_LIST_FORMATS:
+        raise ValueError(
+            f"""Unknown unexpected_index_list_format "{unexpected_index_list_format}" (must be one of \
+{UNEXPECTED_INDEX_LIST_FORMATS})."""
+        )
+
+    return unexpected_index_list_format == "ranges"
+
+
+def expand_unexpected_index_list(unexpected_index_list: Any) -> Any:
+    """Returns list form of "UnexpectedIndexRanges" (or of its serialized form); other values are returned unchanged."""
+    if isinstance(unexpected_index_list, UnexpectedIndexRanges):
+        return unexpected_index_list.to_list()
+
+    if (
+        isinstance(unexpected_index_list, dict)
+        and UNEXPECTED_INDEX_RANGES_KEY in unexpected_index_list
+    ):
+        return UnexpectedIndexRanges.from_json_dict(
+            data=unexpected_index_list
+        ).to_list()
+
+    return unexpected_index_list
+
+
+def build_unexpected_index_list(
+    indices: np.ndarray,
+) -> Union[UnexpectedIndexRanges, List[int]]:
+    """Returns "UnexpectedIndexRanges" of integer indices, if it is more compact than list of them (else, the list).
+
+    Every run is serialized as two integers; hence, when indices form more runs than half their number (e.g., scattered
+    unexpected rows), plain list is smaller and is returned instead.
+    """
+    index_ranges: UnexpectedIndexRanges = UnexpectedIndexRanges.from_indices(
+        indices=indices
+    )
+    if 2 * index_ranges.num_runs > len(index_ranges):
+        return index_ranges.to_list()
+
+    return index_ranges
+
+
+class UnexpectedIndexRanges(Sequence):
+    """Read-only sequence of integer indices, stored as runs of consecutive values (half-open [start, stop) intervals).
+
+    Args:
+        starts: first index of every run
+        stops: one past last index of every run
+    """
+
+    def __init__(
+        self,
+        starts: Union[np.ndarray, Iterable[int]],
+        stops: Union[np.ndarray, Iterable[int]],
+    ) -> None:
+        self._starts: np.ndarray = np.asarray(starts, dtype=np.int64)
+        self._stops: np.ndarray = np.asarray(stops, dtype=np.int64)
+        if self._starts.shape != self._stops.shape:
+            raise ValueError("Every run of indices must have both start and stop.")
+
+        # Position (in sequence) of first index of every run, followed by total number of indices.
+        self._offsets: np.ndarray = np.concatenate(
+            ([0], np.cumsum(self._stops - self._starts))
+        )
+
+    @classmethod
+    def from_indices(
+        cls, indices: Union[np.ndarray, Iterable[int]]
+    ) -> UnexpectedIndexRanges:
+        """Builds "UnexpectedIndexRanges" from integer indices (their order is preserved)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size == 0:
+            return cls(starts=[], stops=[])
+
+        run_starts: np.ndarray = np.flatnonzero(np.diff(indices) != 1) + 1
+        return cls(
+            starts=indices[np.concatenate(([0], run_starts))],
+            stops=indices[np.concatenate((run_starts - 1, [indices.size - 1]))] + 1,
+        )
+
+    @classmethod
+    def from_json_dict(cls, data: Dict[str, List[List[int]]]) -> UnexpectedIndexRanges:
+        ranges: np.ndarray = np.asarray(
+            data[UNEXPECTED_INDEX_RANGES_KEY], dtype=np.int64
+        ).reshape(-1, 2)
+        return cls(starts=ranges[:, 0], stops=ranges[:, 1])
+
+    @property
+    def num_runs(self) -> int:
+        return int(self._starts.size)
+
+    @property
+    def ranges(self) -> List[range]:
+        return [
+            range(start, stop)
+            for start, stop in zip(self._starts.tolist(), self._stops.tolist())
+        ]
+
+    def to_json_dict(self) -> Dict[str, List[List[int]]]:
+        return {
+            UNEXPECTED_INDEX_RANGES_KEY: np.stack(
+                (self._starts, self._stops), axis=-1
+            ).tolist()
+        }
+
+    def to_numpy(self) -> np.ndarray:
+        # Index at position "p" within run "r" is "starts[r] + (p - offsets[r])".
+        return np.repeat(
+            self._starts - self._offsets[:-1], self._stops - self._starts
+        ) + np.arange(len(self), dtype=np.int64)
+
+    def to_list(self) -> List[int]:
+        return self.to_numpy().tolist()
+
+    def to_python_expression(self) -> str:
+        """Renders indices as Python list expression (e.g., "[*range(0, 1000), 1500]") for "unexpected_index_query"."""
+        items: List[str] = [
+            str(index_range.start)
+            if len(index_range) == 1
+            else f"*range({index_range.start}, {index_range.stop})"
+            for index_range in self.ranges
+        ]
+        return f"[{', '.join(items)}]"
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    @overload
+    def __getitem__(self, key: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[int]:
+        ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, List[int]]:
+        if isinstance(key, slice):
+            # Slices (e.g., "partial_unexpected_index_list") are short; hence, they are returned in list form.
+            return [self[position] for position in range(*key.indices(len(self)))]
+
+        position: int = key + len(self) if key < 0 else key
+        if not 0 <= position < len(self):
+            raise IndexError("UnexpectedIndexRanges index out of range")
+
+        run: int = int(np.searchsorted(self._offsets, position, side="right")) - 1
+        return int(self._starts[run] + (position - self._offsets[run]))
+
+    def __iter__(self) -> Iterator[int]:
+        index_range: range
+        for index_range in self.ranges:
+            yield from index_range
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, UnexpectedIndexRanges):
+            return self.to_json_dict() == other.to_json_dict()
+
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"UnexpectedIndexRanges({self.to_python_expression()})"
@@ -41,6 +41,7 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.unexpected_index_ranges import UnexpectedIndexRanges
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.types import SerializableDictDot
 from great_expectations.types.base import SerializableDotDict
@@ -278,6 +279,9 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     if isinstance(data, (SerializableDictDot, SerializableDotDict)):
         return data.to_json_dict()
 
+    if isinstance(data, UnexpectedIndexRanges):
+        return data.to_json_dict()
+
     # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
     if isinstance(data, float) and np.isnan(data):
         return None
@@ -428,7 +432,9 @@ def ensure_json_serializable(data):  # noqa: C901, PLR0911, PLR0912
         test_obj may also be converted in place.
     """
 
-    if isinstance(data, (SerializableDictDot, SerializableDotDict)):
+    if isinstance(
+        data, (SerializableDictDot, SerializableDotDict, UnexpectedIndexRanges)
+    ):
         return
 
     if isinstance(data, ((str,), (int,), float, bool)):
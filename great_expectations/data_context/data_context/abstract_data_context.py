@@ -71,7 +71,11 @@ from great_expectations.data_asset import DataAsset
 from great_expectations.data_context.config_validator.yaml_config_validator import (
     _YamlConfigValidator,
 )
-from great_expectations.data_context.store import Store, TupleStoreBackend
+from great_expectations.data_context.store import (
+    CachedStoreBackend,
+    Store,
+    TupleStoreBackend,
+)
 from great_expectations.data_context.store.profiler_store import ProfilerStore
 from great_expectations.data_context.templates import CONFIG_VARIABLES_TEMPLATE
 from great_expectations.data_context.types.base import (
@@ -5118,7 +5122,12 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
     def _construct_data_context_id(self) -> str:
         # Choose the id of the currently-configured expectations store, if it is a persistent store
         expectations_store = self.stores[self.expectations_store_name]
-        if isinstance(expectations_store.store_backend, TupleStoreBackend):
+        store_backend = expectations_store.store_backend
+        if isinstance(store_backend, CachedStoreBackend):
+            # Cache is transparent: persistence is determined by backend it wraps.
+            store_backend = store_backend.store_backend
+
+        if isinstance(store_backend, TupleStoreBackend):
             # suppress_warnings since a warning will already have been issued during the store creation
             # if there was an invalid store config
             return expectations_store.store_backend_id_warnings_suppressed
@@ -16,10 +16,12 @@ from .tuple_store_backend import (  # isort:skip
 from .database_store_backend import DatabaseStoreBackend  # isort:skip
 from .inline_store_backend import InlineStoreBackend  # isort:skip
 from .in_memory_store_backend import InMemoryStoreBackend  # isort:skip
+from .cached_store_backend import CachedStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
 from .checkpoint_store import CheckpointStore  # isort:skip
 from .metric_store import (  # isort:skip
     EvaluationParameterStore,
+    MetricStateStore,
     MetricStore,
 )
 from .expectations_store import ExpectationsStore  # isort:skip
@@ -2,7 +2,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import pyparsing as pp
 
@@ -131,6 +131,47 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_version(self, key) -> Optional[str]:
+        """Returns token (e.g., ETag, generation, or modification time) of stored value of key, changing with value.
+
+        Backends, which do not track versions of values, return None.  Raises InvalidKeyError, if key is not stored.
+        """
+        self._validate_key(key)
+        return self._get_version(key)
+
+    def _get_version(self, key) -> Optional[str]:
+        return None
+
+    def get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        """Retrieves values of all given keys (in order of keys); cloud backends retrieve them concurrently."""
+        key: tuple
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(keys, **kwargs)
+
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        """Stores all given (key, value) pairs, returning results of setting them (in order of items)."""
+        key: tuple
+        value: Any
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        try:
+            return self._set_many(items, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        return [self._set(key, value, **kwargs) for key, value in items]
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import base64
+import getpass
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.types.resource_identifiers import DataContextKey
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import InvalidKeyError, StoreBackendError
+from great_expectations.util import filter_properties_dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHE_SIZE_BYTES: int = 256 * 1024 * 1024
+
+CACHE_ENTRY_FILE_EXTENSION: str = ".json"
+
+CACHE_DIRECTORY_MODE: int = 0o700
+
+
+class CachedStoreBackend(StoreBackend):
+    """Local read-through cache, stored on disk, in front of any (typically remote) store backend.
+
+    Values, retrieved from wrapped backend, are cached in "cache_directory" (in subdirectory specific to configuration
+    of wrapped backend, so that stores may share "cache_directory").  Cached value is served without contacting wrapped
+    backend for "ttl_seconds" after it was last retrieved (or revalidated); afterward:
+
+    - if "revalidate" is True (default), version (ETag, generation, or modification time) of stored value is compared
+      with version of cached value, which is downloaded again only if it changed (with "ttl_seconds" of None, every read
+      is revalidated);
+    - otherwise (pure TTL mode), value is downloaded again.
+
+    Writes, moves, and removals go to wrapped backend, and invalidate cached values of keys they modify.  Cache size is
+    bounded by "max_cache_size_bytes"; least recently used values are evicted first.
+
+    Unless given, "cache_directory" is "uncommitted/store_cache" of Data Context root directory (or, without one,
+    directory in system temporary directory, specific to current user); relative "cache_directory" is relative to root
+    directory.  Cached values are kept in subdirectories accessible to their owner only; subdirectories (and default
+    "cache_directory") owned by other users are rejected.
+
+    Example store configuration:
+
+        store_backend:
+          class_name: CachedStoreBackend
+          cache_directory: uncommitted/store_cache
+          ttl_seconds: 300
+          store_backend:
+            class_name: TupleS3StoreBackend
+            bucket: my_bucket
+            prefix: expectations
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        store_backend: dict,
+        cache_directory: Optional[str] = None,
+        max_cache_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES,
+        ttl_seconds: Optional[float] = None,
+        revalidate: bool = True,
+        runtime_environment: Optional[dict] = None,
+        store_name=None,
+    ) -> None:
+        super().__init__(store_name=store_name)
+        if not isinstance(max_cache_size_bytes, int) or max_cache_size_bytes < 1:
+            raise StoreBackendError(
+                f"Unable to initialize CachedStoreBackend: max_cache_size_bytes must be a positive integer; received: {max_cache_size_bytes}"
+            )
+
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise StoreBackendError(
+                f"Unable to initialize CachedStoreBackend: ttl_seconds may not be negative; received: {ttl_seconds}"
+            )
+
+        if not revalidate and ttl_seconds is None:
+            raise StoreBackendError(
+                "Unable to initialize CachedStoreBackend: ttl_seconds must be given, unless revalidate is True"
+            )
+
+        module_name = "great_expectations.data_context.store"
+        self._store_backend: StoreBackend = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment or {},
+            config_defaults={
+                "module_name": module_name,
+                "store_name": store_name,
+            },
+        )
+        if not isinstance(self._store_backend, StoreBackend):
+            raise StoreBackendError(
+                "Unable to initialize CachedStoreBackend: store_backend must be configuration of a StoreBackend."
+            )
+
+        root_directory: Optional[str] = (runtime_environment or {}).get(
+            "root_directory"
+        )
+        base_cache_directory: str
+        if cache_directory is None:
+            base_cache_directory = self._get_default_cache_directory(
+                root_directory=root_directory
+            )
+            self._make_private_directory(path=base_cache_directory)
+        else:
+            if root_directory and not os.path.isabs(cache_directory):  # noqa: PTH117
+                base_cache_directory = os.path.join(  # noqa: PTH118
+                    root_directory, cache_directory
+                )
+            else:
+                base_cache_directory = cache_directory
+
+            # Configured directory may be shared; only (new) directories, created for it, are private.
+            try:
+                os.makedirs(  # noqa: PTH103
+                    base_cache_directory, mode=CACHE_DIRECTORY_MODE, exist_ok=True
+                )
+            except OSError as e:
+                raise StoreBackendError(
+                    f"Unable to initialize CachedStoreBackend: cache directory {base_cache_directory} could not be created: {e}"
+                )
+
+        # Caches of differently configured backends (and of different stores) never share entries.
+        backend_fingerprint: str = hashlib.sha256(
+            json.dumps(self._store_backend.config, sort_keys=True, default=str).encode(
+                "utf-8"
+            )
+        ).hexdigest()[:16]
+        self._cache_directory = os.path.join(  # noqa: PTH118
+            base_cache_directory, backend_fingerprint
+        )
+        self._make_private_directory(path=self._cache_directory)
+
+        self._max_cache_size_bytes = max_cache_size_bytes
+        self._ttl_seconds = ttl_seconds
+        self._revalidate = revalidate
+        # Size of cache directory is computed upon first write (and recomputed, whenever it appears to be exceeded).
+        self._cache_size_bytes: Optional[int] = None
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": self._store_backend.config,
+            "cache_directory": cache_directory,
+            "max_cache_size_bytes": max_cache_size_bytes,
+            "ttl_seconds": ttl_seconds,
+            "revalidate": revalidate,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        # Falsy "revalidate" (pure TTL mode) must be kept.
+        self._config["revalidate"] = revalidate
+
+    @property
+    def store_backend(self) -> StoreBackend:
+        return self._store_backend
+
+    @property
+    def cache_directory(self) -> str:
+        return self._cache_directory
+
+    @property
+    def fixed_length_key(self):
+        return self._store_backend.fixed_length_key
+
+    @property
+    def store_backend_id(self):
+        return self._store_backend.store_backend_id
+
+    @property
+    def store_backend_id_warnings_suppressed(self):
+        return self._store_backend.store_backend_id_warnings_suppressed
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+    def _validate_key(self, key) -> None:
+        self._store_backend._validate_key(key)
+
+    def _validate_value(self, value) -> None:
+        self._store_backend._validate_value(value)
+
+    def _get(self, key, **kwargs):
+        if kwargs:
+            # Retrieval options (e.g., of Cloud backend) may change value, which is hence not cached.
+            return self._store_backend.get(key, **kwargs)
+
+        now: float = time.time()
+        entry: Optional[dict] = self._read_entry(key=key)
+        if entry is not None:
+            # Entries validated "in the future" (e.g., written before system clock was set back) are expired.
+            if (
+                self._ttl_seconds is not None
+                and 0 <= now - entry["validated_at"] < self._ttl_seconds
+            ):
+                self._touch_entry(key=key)
+                return self._decode_value(entry=entry)
+
+            if self._revalidate and entry["version"] is not None:
+                version: Optional[str] = self._get_stored_version(key=key)
+                if version is not None and version == entry["version"]:
+                    value: Any = self._decode_value(entry=entry)
+                    self._write_entry(
+                        key=key, value=value, version=version, validated_at=now
+                    )
+                    return value
+
+        # Version is retrieved before value, so that value, changed in between, is downloaded again upon revalidation.
+        version = self._get_stored_version(key=key) if self._revalidate else None
+        value = self._store_backend.get(key)
+        if isinstance(value, (str, bytes)):
+            self._write_entry(key=key, value=value, version=version, validated_at=now)
+        else:
+            logger.debug(
+                f"Value of key {key} of type {type(value).__name__} is not cached by CachedStoreBackend."
+            )
+
+        return value
+
+    def _get_version(self, key) -> Optional[str]:
+        return self._store_backend.get_version(key)
+
+    def _set(self, key, value, **kwargs):
+        try:
+            return self._store_backend.set(key, value, **kwargs)
+        finally:
+            self._remove_entry(key=key)
+
+    def _move(self, source_key, dest_key, **kwargs):
+        try:
+            return self._store_backend.move(source_key, dest_key, **kwargs)
+        finally:
+            self._remove_entry(key=source_key)
+            self._remove_entry(key=dest_key)
+
+    def list_keys(self, prefix: Tuple = ()) -> List[Any]:
+        return self._store_backend.list_keys(prefix=prefix)
+
+    def remove_key(self, key):
+        try:
+            return self._store_backend.remove_key(key)
+        finally:
+            if isinstance(key, DataContextKey):
+                key = key.to_tuple()
+
+            self._remove_entry(key=key)
+
+    def _has_key(self, key) -> bool:
+        return self._store_backend.has_key(key)
+
+    def get_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_url_for_key(key, protocol=protocol)
+
+    def build_key(self, *args, **kwargs):
+        return self._store_backend.build_key(*args, **kwargs)
+
+    def clear_cache(self) -> None:
+        """Removes all cached values (of wrapped backend)."""
+        path: str
+        for path, _, _ in self._list_entry_files():
+            self._remove_file(path=path)
+
+        self._cache_size_bytes = 0
+
+    @staticmethod
+    def _get_default_cache_directory(root_directory: Optional[str]) -> str:
+        if root_directory:
+            return os.path.join(  # noqa: PTH118
+                root_directory, "uncommitted", "store_cache"
+            )
+
+        # Shared temporary directory is used by all users; hence, each of them gets their own cache directory.
+        return os.path.join(  # noqa: PTH118
+            tempfile.gettempdir(),
+            f"great_expectations_store_cache_{getpass.getuser()}",
+        )
+
+    @staticmethod
+    def _make_private_directory(path: str) -> None:
+        """Creates directory accessible to its owner only; rejects existing directory of another user.
+
+        Mode of existing directory, owned by current user, is restricted, so that cached values are never exposed to
+        (or planted by) other users.
+        """
+        try:
+            os.makedirs(path, mode=CACHE_DIRECTORY_MODE, exist_ok=True)  # noqa: PTH103
+            stat: os.stat_result = os.stat(path)  # noqa: PTH116
+            if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+                raise StoreBackendError(
+                    f"Unable to initialize CachedStoreBackend: cache directory {path} is owned by another user."
+                )
+
+            if stat.st_mode & 0o077:
+                os.chmod(path, CACHE_DIRECTORY_MODE)  # noqa: PTH101
+        except OSError as e:
+            raise StoreBackendError(
+                f"Unable to initialize CachedStoreBackend: cache directory {path} could not be created: {e}"
+            )
+
+    def _get_stored_version(self, key) -> Optional[str]:
+        try:
+            return self._store_backend.get_version(key)
+        except InvalidKeyError:
+            self._remove_entry(key=key)
+            raise
+        except Exception as e:
+            # Value is then downloaded (and error, if any, surfaces from wrapped backend).
+            logger.debug(
+                f"Unable to retrieve version of key {key} from {self._store_backend.__class__.__name__}: {e}"
+            )
+            return None
+
+    def _get_entry_path(self, key) -> str:
+        key_digest: str = hashlib.sha256(
+            json.dumps(list(key)).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(  # noqa: PTH118
+            self._cache_directory, f"{key_digest}{CACHE_ENTRY_FILE_EXTENSION}"
+        )
+
+    def _read_entry(self, key) -> Optional[dict]:
+        path: str = self._get_entry_path(key=key)
+        try:
+            with open(path) as f:
+                entry: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove_file(path=path)
+            return None
+
+        if entry.get("key") != list(key):
+            # Entries of keys, whose digests collide, replace each other.
+            return None
+
+        return entry
+
+    def _write_entry(
+        self, key, value: Any, version: Optional[str], validated_at: float
+    ) -> None:
+        entry: Dict[str, Any] = {
+            "key": list(key),
+            "version": version,
+            "validated_at": validated_at,
+        }
+        if isinstance(value, bytes):
+            entry["encoding"] = "base64"
+            entry["value"] = base64.b64encode(value).decode("ascii")
+        else:
+            entry["encoding"] = None
+            entry["value"] = value
+
+        path: str = self._get_entry_path(key=key)
+        previous_size: int = self._get_file_size(path=path)
+        try:
+            # Entry is replaced atomically, so that concurrent readers (also in other processes) never see partial entry.
+            fd, temp_path = tempfile.mkstemp(dir=self._cache_directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+
+            os.replace(temp_path, path)  # noqa: PTH105
+        except OSError as e:
+            logger.warning(f"Unable to write cache entry {path}: {e}")
+            return
+
+        if self._cache_size_bytes is not None:
+            self._cache_size_bytes += self._get_file_size(path=path) - previous_size
+
+        self._evict_entries()
+
+    def _touch_entry(self, key) -> None:
+        try:
+            os.utime(self._get_entry_path(key=key))
+        except OSError:
+            pass
+
+    def _remove_entry(self, key) -> None:
+        path: str = self._get_entry_path(key=key)
+        size: int = self._get_file_size(path=path)
+        if self._remove_file(path=path) and self._cache_size_bytes is not None:
+            self._cache_size_bytes -= size
+
+    def _evict_entries(self) -> None:
+        """Removes least recently used entries, until cache size does not exceed "max_cache_size_bytes"."""
+        if (
+            self._cache_size_bytes is not None
+            and self._cache_size_bytes <= self._max_cache_size_bytes
+        ):
+            return
+
+        entry_files: List[Tuple[str, float, int]] = self._list_entry_files()
+        cache_size_bytes: int = sum(size for _, _, size in entry_files)
+        path: str
+        size: int
+        for path, _, size in sorted(entry_files, key=lambda entry_file: entry_file[1]):
+            if cache_size_bytes <= self._max_cache_size_bytes:
+                break
+
+            if self._remove_file(path=path):
+                cache_size_bytes -= size
+
+        self._cache_size_bytes = cache_size_bytes
+
+    def _list_entry_files(self) -> List[Tuple[str, float, int]]:
+        """Returns path, modification (last use) time, and size of each entry file."""
+        entry_files: List[Tuple[str, float, int]] = []
+        try:
+            with os.scandir(self._cache_directory) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(CACHE_ENTRY_FILE_EXTENSION):
+                        continue
+
+                    try:
+                        stat: os.stat_result = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    entry_files.append((dir_entry.path, stat.st_mtime, stat.st_size))
+        except FileNotFoundError:
+            pass
+
+        return entry_files
+
+    @staticmethod
+    def _decode_value(entry: dict) -> Any:
+        if entry.get("encoding") == "base64":
+            return base64.b64decode(entry["value"])
+
+        return entry["value"]
+
+    @staticmethod
+    def _get_file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)  # noqa: PTH202
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove_file(path: str) -> bool:
+        try:
+            os.remove(path)  # noqa: PTH107
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Unable to remove cache entry {path}: {e}")
+            return False
+
+        return True
@@ -3,6 +3,7 @@ import os
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Optional
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.core.data_context_key import DataContextKey
@@ -102,6 +103,8 @@ class HtmlSiteStore:
     """
 
     _key_class = SiteSectionIdentifier
+    _manifest_key = ("data_docs_manifest.json",)
+    _index_shards_key_prefix = ("index",)
 
     def __init__(self, store_backend=None, runtime_environment=None) -> None:
         store_backend_module_name = store_backend.get(
@@ -372,6 +375,55 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_manifest(self) -> Optional[str]:
+        """Returns build manifest of site (kept by "static_assets" backend, at the root of site), if site has one."""
+        store_backend = self.store_backends["static_assets"]
+        if not store_backend.has_key(self._manifest_key):
+            return None
+
+        return store_backend.get(self._manifest_key)
+
+    def write_manifest(self, manifest: str) -> None:
+        """Writes build manifest of site (see "read_manifest()")."""
+        self.store_backends["static_assets"].set(
+            self._manifest_key,
+            manifest,
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
+    def write_index_shard(
+        self, section_name: str, shard_number: int, shard: str
+    ) -> str:
+        """Writes shard (script, holding rows of table of index page) of site section; returns its relative path."""
+        key = self._get_index_shard_key(
+            section_name=section_name, shard_number=shard_number
+        )
+        self.store_backends["static_assets"].set(
+            key,
+            shard,
+            content_encoding="utf-8",
+            content_type="text/javascript",
+        )
+        return "/".join(key)
+
+    def remove_index_shards(self, section_name: str, first_shard_number: int) -> None:
+        """Removes shards of site section, numbered "first_shard_number" and above (left over by larger index)."""
+        store_backend = self.store_backends["static_assets"]
+        shard_number = first_shard_number
+        key = self._get_index_shard_key(
+            section_name=section_name, shard_number=shard_number
+        )
+        while store_backend.has_key(key):
+            store_backend.remove_key(key)
+            shard_number += 1
+            key = self._get_index_shard_key(
+                section_name=section_name, shard_number=shard_number
+            )
+
+    def _get_index_shard_key(self, section_name: str, shard_number: int) -> tuple:
+        return (*self._index_shards_key_prefix, section_name, f"{shard_number}.js")
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -6,6 +6,7 @@ from great_expectations.data_context.store.database_store_backend import (
 )
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.types.resource_identifiers import (
+    MetricStateIdentifier,
     ValidationMetricIdentifier,
 )
 from great_expectations.util import (
@@ -106,3 +107,52 @@ class EvaluationParameterStore(MetricStore):
     @property
     def config(self) -> dict:
         return self._config
+
+
+class MetricStateStore(MetricStore):
+    """
+    A MetricStateStore stores states of mergeable metrics (with their watermarks) for incremental validation.
+    """
+
+    _key_class = MetricStateIdentifier  # type: ignore[assignment]
+
+    def __init__(self, store_backend=None, store_name=None) -> None:
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                store_backend["table_name"] = store_backend.get(
+                    "table_name", "ge_metric_states"
+                )
+                store_backend["key_columns"] = store_backend.get(
+                    "key_columns",
+                    [
+                        "data_asset_name",
+                        "watermark_column",
+                        "metric_name",
+                        "metric_kwargs_id",
+                    ],
+                )
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+        self._config = {
+            "store_backend": store_backend,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @property
+    def config(self) -> dict:
+        return self._config
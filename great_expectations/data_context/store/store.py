@@ -198,6 +198,23 @@ class Store:
 
         return None
 
+    def get_many(self, keys: List[DataContextKey]) -> List[Optional[Any]]:
+        """Retrieves values of all given keys (in order of keys); cloud-storage backends retrieve them concurrently.
+
+        Raises InvalidKeyError, if any of keys is not stored.
+        """
+        if self.cloud_mode:
+            return [self.get(key) for key in keys]
+
+        key: DataContextKey
+        for key in keys:
+            self._validate_key(key)
+
+        values: List[Any] = self._store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys]
+        )
+        return [self.deserialize(value) if value else None for value in values]
+
     def set(self, key: DataContextKey, value: Any, **kwargs) -> None:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.set(key, value, **kwargs)
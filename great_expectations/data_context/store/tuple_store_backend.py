@@ -5,8 +5,10 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -15,6 +17,34 @@ from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent requests, which cloud backends make in bulk operations ("get_many", "set_many", and
+# "list_keys"); "max_workers=1" makes these operations sequential.
+DEFAULT_MAX_WORKERS: int = 8
+
+# Number of levels of delimited ("directory") listing, through which "TupleS3StoreBackend.list_keys" fans out.
+MAX_LISTING_FAN_OUT_DEPTH: int = 2
+
+
+def _map_concurrently(
+    fn: Callable, args_list: List[tuple], max_workers: int
+) -> List[Any]:
+    """Calls "fn" with each tuple of arguments on bounded thread pool, returning results in order of "args_list".
+
+    Exception, raised by any call, is re-raised (after all calls have completed).
+    """
+    if max_workers <= 1 or len(args_list) <= 1:
+        return [fn(*args) for args in args_list]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        return list(executor.map(lambda args: fn(*args), args_list))
+
+
+def _validate_max_workers(max_workers: int) -> None:
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(
+            f"max_workers must be a positive integer; received: {max_workers}"
+        )
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -437,6 +467,19 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         public_url = self.base_public_path + path
         return public_url
 
+    def _get_version(self, key):
+        filepath: str = os.path.join(  # noqa: PTH118
+            self.full_base_directory, self._convert_key_to_filepath(key)
+        )
+        try:
+            stat: os.stat_result = os.stat(filepath)  # noqa: PTH116
+        except FileNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
+            )
+
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     def _has_key(self, key):
         return os.path.isfile(  # noqa: PTH113
             os.path.join(  # noqa: PTH118
@@ -456,6 +499,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    A single boto3 client (whose connection pool fits "max_workers" concurrent requests) is shared by all operations.
+    Bulk operations ("get_many", "set_many") and "list_keys" make up to "max_workers" concurrent requests.
     """
 
     def __init__(  # noqa: PLR0913
@@ -475,7 +521,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
+        _validate_max_workers(max_workers=max_workers)
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
@@ -504,6 +552,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        self.max_workers = max_workers
+        self._client: Optional[Any] = None
+        self._client_lock = threading.Lock()
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -526,6 +577,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "max_workers": max_workers if max_workers != DEFAULT_MAX_WORKERS else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -551,7 +603,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _get(self, key):
         s3_object_key = self._build_s3_object_key(key)
 
-        s3 = self._create_client()
+        s3 = self._get_client()
 
         try:
             s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
@@ -576,27 +628,46 @@ class TupleS3StoreBackend(TupleStoreBackend):
     ):
         s3_object_key = self._build_s3_object_key(key)
 
-        s3 = self._create_resource()
+        s3 = self._get_client()
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                     **self.s3_put_options,
                 )
             else:
-                result_s3.put(
-                    Body=value, ContentType=content_type, **self.s3_put_options
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                    **self.s3_put_options,
                 )
-        except s3.meta.client.exceptions.ClientError as e:
+        except aws.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
         return s3_object_key
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return _map_concurrently(
+            fn=functools.partial(self._get, **kwargs),
+            args_list=[(key,) for key in keys],
+            max_workers=self.max_workers,
+        )
+
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        return _map_concurrently(
+            fn=functools.partial(self._set, **kwargs),
+            args_list=list(items),
+            max_workers=self.max_workers,
+        )
+
     def _move(self, source_key, dest_key, **kwargs) -> None:
         s3 = self._create_resource()
 
@@ -615,15 +686,12 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
         # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        s3r = self._create_resource()
-        bucket = s3r.Bucket(self.bucket)
         key_list = []
-        if self.prefix:
-            objects_list = bucket.objects.filter(Prefix=self.prefix)
-        else:
-            objects_list = bucket.objects.all()
-        for s3_object_info in objects_list:
-            s3_object_key = s3_object_info.key
+        listed_s3_object_key: str
+        for listed_s3_object_key in self._list_s3_object_keys(
+            listing_prefix=self._get_listing_prefix()
+        ):
+            s3_object_key = listed_s3_object_key
             if self.platform_specific_separator:
                 s3_object_key = os.path.relpath(s3_object_key, self.prefix)
             else:  # noqa: PLR5501
@@ -647,6 +715,75 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         return key_list
 
+    def _get_listing_prefix(self) -> str:
+        """Returns prefix of S3 object keys to list (including "filepath_prefix", so that listing is scoped by S3)."""
+        if not self.filepath_prefix:
+            return self.prefix or ""
+
+        if not self.prefix:
+            return self.filepath_prefix
+
+        if self.platform_specific_separator:
+            return os.path.join(self.prefix, self.filepath_prefix)  # noqa: PTH118
+
+        return "/".join((self.prefix, self.filepath_prefix))
+
+    def _list_s3_object_keys(self, listing_prefix: str) -> List[str]:
+        """Lists S3 object keys, starting with "listing_prefix", in lexicographic order.
+
+        Listing fans out through up to "MAX_LISTING_FAN_OUT_DEPTH" levels of delimited ("directory") listing, until there
+        are "max_workers" prefixes, which are then listed concurrently.
+        """
+        s3_object_keys: List[str] = []
+        prefixes: List[str] = [listing_prefix]
+        for _ in range(MAX_LISTING_FAN_OUT_DEPTH):
+            if self.max_workers <= 1 or len(prefixes) >= self.max_workers:
+                break
+
+            listings: List[Tuple[List[str], List[str]]] = _map_concurrently(
+                fn=functools.partial(self._list_s3_objects, delimiter="/"),
+                args_list=[(prefix,) for prefix in prefixes],
+                max_workers=self.max_workers,
+            )
+            prefixes = []
+            object_keys: List[str]
+            common_prefixes: List[str]
+            for object_keys, common_prefixes in listings:
+                s3_object_keys.extend(object_keys)
+                prefixes.extend(common_prefixes)
+
+        listings = _map_concurrently(
+            fn=self._list_s3_objects,
+            args_list=[(prefix,) for prefix in prefixes],
+            max_workers=self.max_workers,
+        )
+        for object_keys, _ in listings:
+            s3_object_keys.extend(object_keys)
+
+        return sorted(s3_object_keys)
+
+    def _list_s3_objects(
+        self, prefix: str, delimiter: Optional[str] = None
+    ) -> Tuple[List[str], List[str]]:
+        """Returns keys of S3 objects and (if "delimiter" is given) common prefixes, paging through entire listing."""
+        paginate_kwargs: dict = {"Bucket": self.bucket, "Prefix": prefix}
+        if delimiter:
+            paginate_kwargs["Delimiter"] = delimiter
+
+        paginator = self._get_client().get_paginator("list_objects_v2")
+        object_keys: List[str] = []
+        common_prefixes: List[str] = []
+        for page in paginator.paginate(**paginate_kwargs):
+            object_keys.extend(
+                s3_object_info["Key"] for s3_object_info in page.get("Contents", [])
+            )
+            common_prefixes.extend(
+                common_prefix["Prefix"]
+                for common_prefix in page.get("CommonPrefixes", [])
+            )
+
+        return object_keys, common_prefixes
+
     def get_url_for_key(self, key, protocol=None):
         location = None
         if self.boto3_options.get("endpoint_url"):
@@ -699,9 +836,40 @@ class TupleS3StoreBackend(TupleStoreBackend):
         else:
             return False
 
+    def _get_version(self, key):
+        s3_object_key = self._build_s3_object_key(key)
+        try:
+            s3_response_object = self._get_client().head_object(
+                Bucket=self.bucket, Key=s3_object_key
+            )
+        except aws.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "404",
+                "NoSuchKey",
+                "NotFound",
+            ):
+                raise InvalidKeyError(
+                    f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
+                )
+            raise
+
+        return s3_response_object["ETag"]
+
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        try:
+            self._get_client().head_object(
+                Bucket=self.bucket, Key=self._build_s3_object_key(key)
+            )
+        except aws.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in (
+                "404",
+                "NoSuchKey",
+                "NotFound",
+            ):
+                return False
+            raise
+
+        return True
 
     def _assume_role_and_get_secret_credentials(self):
         role_session_name = "GXAssumeRoleSession"
@@ -738,6 +906,21 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _create_client(self):
         return aws.boto3.client("s3", **self.boto3_options)
 
+    def _get_client(self):
+        """Returns boto3 client, shared by all operations (boto3 clients are thread-safe), creating it on first use."""
+        with self._client_lock:
+            if self._client is None:
+                boto3_options: dict = self.boto3_options
+                # Connection pool must fit concurrent requests (options configured explicitly take precedence).
+                config = aws.Config(max_pool_connections=max(10, self.max_workers))
+                if boto3_options.get("config") is not None:
+                    config = config.merge(boto3_options["config"])
+
+                boto3_options["config"] = config
+                self._client = aws.boto3.client("s3", **boto3_options)
+
+            return self._client
+
     def _create_resource(self):
         return aws.boto3.resource("s3", **self.boto3_options)
 
@@ -754,6 +937,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
 
     The filepath_template is a string template used to convert the key to a filepath.
+
+    Bulk operations ("get_many", "set_many") make up to "max_workers" concurrent requests, each worker thread reusing
+    its GCS client for all of its requests.
     """
 
     def __init__(  # noqa: PLR0913
@@ -772,7 +958,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
+        _validate_max_workers(max_workers=max_workers)
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
@@ -789,6 +977,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.max_workers = max_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -810,6 +999,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "max_workers": max_workers if max_workers != DEFAULT_MAX_WORKERS else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -832,13 +1022,18 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 gcs_object_key = self._convert_key_to_filepath(key)
         return gcs_object_key
 
-    def _get(self, key):
-        gcs_object_key = self._build_gcs_object_key(key)
-
+    def _create_bucket(self):
         from great_expectations.compatibility import google
 
         gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        return gcs.bucket(self.bucket)
+
+    def _get(self, key):
+        return self._get_from_bucket(bucket=self._create_bucket(), key=key)
+
+    def _get_from_bucket(self, bucket, key):
+        gcs_object_key = self._build_gcs_object_key(key)
+
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -855,12 +1050,25 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         content_type="application/json",
         **kwargs,
     ):
-        gcs_object_key = self._build_gcs_object_key(key)
+        return self._set_in_bucket(
+            bucket=self._create_bucket(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
 
-        from great_expectations.compatibility import google
+    def _set_in_bucket(
+        self,
+        bucket,
+        key,
+        value,
+        content_encoding="utf-8",
+        content_type="application/json",
+        **kwargs,
+    ):
+        gcs_object_key = self._build_gcs_object_key(key)
 
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -872,6 +1080,36 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             blob.upload_from_string(value, content_type=content_type)
         return gcs_object_key
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        get_bucket: Callable = self._get_thread_local_bucket_getter()
+        return _map_concurrently(
+            fn=lambda key: self._get_from_bucket(bucket=get_bucket(), key=key),
+            args_list=[(key,) for key in keys],
+            max_workers=self.max_workers,
+        )
+
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        get_bucket: Callable = self._get_thread_local_bucket_getter()
+        return _map_concurrently(
+            fn=lambda key, value: self._set_in_bucket(
+                bucket=get_bucket(), key=key, value=value, **kwargs
+            ),
+            args_list=list(items),
+            max_workers=self.max_workers,
+        )
+
+    def _get_thread_local_bucket_getter(self) -> Callable:
+        """Returns function, which creates bucket (and its GCS client) once per worker thread of bulk operation."""
+        thread_local = threading.local()
+
+        def get_bucket():
+            if getattr(thread_local, "bucket", None) is None:
+                thread_local.bucket = self._create_bucket()
+
+            return thread_local.bucket
+
+        return get_bucket
+
     def _move(self, source_key, dest_key, **kwargs) -> None:
         from great_expectations.compatibility import google
 
@@ -896,7 +1134,16 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
         gcs = google.storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        # Listing is scoped by "filepath_prefix" on GCS side (other keys are never returned).
+        listing_prefix: str = self.prefix
+        if self.filepath_prefix:
+            listing_prefix = (
+                "/".join((self.prefix, self.filepath_prefix))
+                if self.prefix
+                else self.filepath_prefix
+            )
+
+        for blob in gcs.list_blobs(self.bucket, prefix=listing_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -963,9 +1210,21 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             return False
         return True
 
+    def _get_version(self, key):
+        gcs_response_object = self._create_bucket().get_blob(
+            self._build_gcs_object_key(key)
+        )
+        if not gcs_response_object:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
+            )
+
+        return str(gcs_response_object.generation)
+
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return (
+            self._create_bucket().get_blob(self._build_gcs_object_key(key)) is not None
+        )
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -978,6 +1237,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     You need to setup the connection string environment variable
     https://docs.microsoft.com/en-us/azure/storage/blobs/storage-quickstart-blobs-python
+
+    Bulk operations ("get_many", "set_many") make up to "max_workers" concurrent requests through shared container
+    client.
     """
 
     # We will use blobclient here
@@ -996,7 +1258,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
+        _validate_max_workers(max_workers=max_workers)
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
@@ -1008,6 +1272,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
         )
+        self.max_workers = max_workers
         self.connection_string = connection_string or os.environ.get(
             "AZURE_STORAGE_CONNECTION_STRING"
         )
@@ -1088,11 +1353,35 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             )
         return az_blob_key
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        # Container client is created before worker threads start, so that all of them share it.
+        _ = self._container_client
+        return _map_concurrently(
+            fn=functools.partial(self._get, **kwargs),
+            args_list=[(key,) for key in keys],
+            max_workers=self.max_workers,
+        )
+
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        _ = self._container_client
+        return _map_concurrently(
+            fn=functools.partial(self._set, **kwargs),
+            args_list=list(items),
+            max_workers=self.max_workers,
+        )
+
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
         # Note that the prefix arg is only included to maintain consistency with the parent class signature
         key_list = []
 
-        for obj in self._container_client.list_blobs(name_starts_with=self.prefix):  # type: ignore[attr-defined]
+        # Listing is scoped by "filepath_prefix" on Azure side (other keys are never returned).
+        listing_prefix: str = self.prefix
+        if self.filepath_prefix:
+            listing_prefix = os.path.join(  # noqa: PTH118
+                self.prefix, self.filepath_prefix
+            )
+
+        for obj in self._container_client.list_blobs(name_starts_with=listing_prefix):  # type: ignore[attr-defined]
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(f"{self.prefix}{os.path.sep}"):
                 az_blob_key = az_blob_key[len(self.prefix) + 1 :]
@@ -1120,9 +1409,25 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             az_blob_path,
         )
 
+    def _get_version(self, key):
+        from great_expectations.compatibility import azure
+
+        az_blob_key = os.path.join(  # noqa: PTH118
+            self.prefix, self._convert_key_to_filepath(key)
+        )
+        blob = self._container_client.get_blob_client(az_blob_key)  # type: ignore[attr-defined]
+        try:
+            return blob.get_blob_properties().etag
+        except azure.ResourceNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleAzureBlobStoreBackend with the following Key: {str(key)}"
+            )
+
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        az_blob_key = os.path.join(  # noqa: PTH118
+            self.prefix, self._convert_key_to_filepath(key)
+        )
+        return self._container_client.get_blob_client(az_blob_key).exists()  # type: ignore[attr-defined]
 
     def _move(self, source_key, dest_key, **kwargs) -> None:
         source_blob_path = self._convert_key_to_filepath(source_key)
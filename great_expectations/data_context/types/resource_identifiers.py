@@ -222,6 +222,56 @@ class MetricIdentifier(DataContextKey):
         return cls(*tuple_)
 
 
+class MetricStateIdentifier(MetricIdentifier):
+    """Key of persisted state of mergeable metric, kept for incremental validation of Data Asset by watermark column."""
+
+    def __init__(
+        self,
+        data_asset_name,
+        watermark_column,
+        metric_name,
+        metric_kwargs_id,
+    ) -> None:
+        super().__init__(metric_name, metric_kwargs_id)
+        self._data_asset_name = data_asset_name
+        self._watermark_column = watermark_column
+
+    @property
+    def data_asset_name(self):
+        return self._data_asset_name
+
+    @property
+    def watermark_column(self):
+        return self._watermark_column
+
+    def to_tuple(self):
+        if self.data_asset_name is None:
+            tuple_data_asset_name = "__"
+        else:
+            tuple_data_asset_name = self.data_asset_name
+        return tuple(
+            [tuple_data_asset_name, self.watermark_column] + list(super().to_tuple())
+        )
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 4:  # noqa: PLR2004
+            raise gx_exceptions.GreatExpectationsError(
+                "MetricStateIdentifier tuple must have exactly four components."
+            )
+        if tuple_[0] == "__":
+            tuple_data_asset_name = None
+        else:
+            tuple_data_asset_name = tuple_[0]
+        metric_id = MetricIdentifier.from_tuple(tuple_[-2:])
+        return cls(
+            data_asset_name=tuple_data_asset_name,
+            watermark_column=tuple_[1],
+            metric_name=metric_id.metric_name,
+            metric_kwargs_id=metric_id.metric_kwargs_id,
+        )
+
+
 class ValidationMetricIdentifier(MetricIdentifier):
     def __init__(  # noqa: PLR0913
         self,
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
+import json
+import time
 from pprint import pformat as pf
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
     Protocol,
+    Tuple,
     Type,
     Union,
     cast,
@@ -58,10 +63,25 @@ if TYPE_CHECKING:
     )
 
 
+_DEFAULT_PARTITION_PAGE_SIZE: int = 100
+
+
 class SQLDatasourceError(Exception):
     pass
 
 
+@dataclasses.dataclass(frozen=True)
+class _SQLBatchHandle:
+    """A batch of a SQL asset described only by its BatchRequest, metadata, and batch spec kwargs.
+
+    No data is loaded (and no temp table is created) until the handle is materialized into a "Batch".
+    """
+
+    batch_request: BatchRequest
+    metadata: BatchMetadata
+    batch_spec_kwargs: Dict[str, Any]
+
+
 class _Splitter(Protocol):
     @property
     def columns(self) -> list[str]:
@@ -124,7 +144,9 @@ class _Splitter(Protocol):
                  This category was only 1 parameter per column.
         """
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> List[Dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchRequestOptions] = None
+    ) -> List[Dict]:
         """Creates all valid batch requests options for sql_asset
 
         This can be implemented by querying the data defined in the sql_asset to generate
@@ -133,11 +155,16 @@ class _Splitter(Protocol):
         set of distinct (year, month) pairs. We would then return a list of BatchRequest.options,
         ie dictionaries, of the form {"year": year, "month": month} that contain all these distinct
         pairs.
+
+        If (possibly partial) `options` are given, they are pushed down into the query, so that
+        only matching batch requests options are retrieved from the database.
         """
 
 
 def _splitter_and_sql_asset_to_batch_identifier_data(
-    splitter: _Splitter, asset: _SQLAsset
+    splitter: _Splitter,
+    asset: _SQLAsset,
+    batch_identifiers: Optional[Dict[str, Any]] = None,
 ) -> list[dict]:
     execution_engine = asset.datasource.get_execution_engine()
     sqlalchemy_data_splitter = SqlAlchemyDataSplitter(execution_engine.dialect_name)
@@ -146,9 +173,21 @@ def _splitter_and_sql_asset_to_batch_identifier_data(
         selectable=asset.as_selectable(),
         splitter_method_name=splitter.method_name,
         splitter_kwargs=splitter.splitter_method_kwargs(),
+        batch_identifiers=batch_identifiers,
     )
 
 
+def _specified_options(
+    options: Optional[BatchRequestOptions], param_names: List[str]
+) -> Dict[str, Any]:
+    """The (not None) values of `options` for this splitter's parameters."""
+    return {
+        param_name: options[param_name]
+        for param_name in param_names
+        if options and options.get(param_name) is not None
+    }
+
+
 class _SplitterDatetime(FluentBaseModel):
     column_name: str
     method_name: str
@@ -157,9 +196,16 @@ class _SplitterDatetime(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchRequestOptions] = None
+    ) -> list[dict]:
+        specified_options = _specified_options(options, self.param_names)
         batch_identifier_data = _splitter_and_sql_asset_to_batch_identifier_data(
-            splitter=self, asset=sql_asset
+            splitter=self,
+            asset=sql_asset,
+            batch_identifiers={self.column_name: specified_options}
+            if specified_options
+            else None,
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -254,9 +300,16 @@ class _SplitterOneColumnOneParam(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchRequestOptions] = None
+    ) -> list[dict]:
+        specified_options = _specified_options(options, self.param_names)
         batch_identifier_data = _splitter_and_sql_asset_to_batch_identifier_data(
-            splitter=self, asset=sql_asset
+            splitter=self,
+            asset=sql_asset,
+            batch_identifiers={self.column_name: specified_options[self.param_names[0]]}
+            if specified_options
+            else None,
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -340,11 +393,15 @@ class SplitterColumnValue(_SplitterOneColumnOneParam):
             )
         return {self.column_name: options[self.column_name]}
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchRequestOptions] = None
+    ) -> list[dict]:
         # The superclass version of param_defaults is correct, but here we leverage that
         # the parameter name is the same as the column name to make this much faster.
         return _splitter_and_sql_asset_to_batch_identifier_data(
-            splitter=self, asset=sql_asset
+            splitter=self,
+            asset=sql_asset,
+            batch_identifiers=_specified_options(options, self.param_names) or None,
         )
 
 
@@ -375,9 +432,13 @@ class SplitterMultiColumnValue(FluentBaseModel):
             )
         return {col: options[col] for col in self.column_names}
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchRequestOptions] = None
+    ) -> list[dict]:
         return _splitter_and_sql_asset_to_batch_identifier_data(
-            splitter=self, asset=sql_asset
+            splitter=self,
+            asset=sql_asset,
+            batch_identifiers=_specified_options(options, self.param_names) or None,
         )
 
 
@@ -401,6 +462,12 @@ class _SQLAsset(DataAsset):
     splitter: Optional[Splitter] = None
     name: str
 
+    # Partitions (batch request options) discovered by the splitter, cached for "_partition_cache_ttl" seconds.
+    _partition_cache: Dict[
+        str, Tuple[float, List[Dict[str, Any]]]
+    ] = pydantic.PrivateAttr(default_factory=dict)
+    _partition_cache_ttl: float = pydantic.PrivateAttr(default=0.0)
+
     @property
     def batch_request_options(self) -> tuple[str, ...]:
         """The potential keys for BatchRequestOptions.
@@ -593,7 +660,7 @@ class _SQLAsset(DataAsset):
 
         batch_requests: List[BatchRequest] = []
         # We iterate through all possible batches as determined by the splitter
-        for params in self.splitter.param_defaults(self):
+        for params in self._get_partitions(options=batch_request.options):
             # If the params from the splitter don't match the batch request options
             # we don't create this batch.
             if not _SQLAsset._matches_request_options(params, batch_request.options):
@@ -609,6 +676,71 @@ class _SQLAsset(DataAsset):
             )
         return batch_requests
 
+    def set_partition_cache_ttl(self, ttl_seconds: float) -> None:
+        """Caches partitions discovered by the splitter of this asset for `ttl_seconds` (0 disables caching).
+
+        While cached, partitions added to (or removed from) the underlying data are not reflected in batch lists.
+        """
+        self._partition_cache_ttl = ttl_seconds
+        self._partition_cache.clear()
+
+    def clear_partition_cache(self) -> None:
+        self._partition_cache.clear()
+
+    def iter_partitions(
+        self,
+        options: Optional[BatchRequestOptions] = None,
+        page_size: int = _DEFAULT_PARTITION_PAGE_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterates over pages of partitions (batch request options, that select batches with data) of this asset.
+
+        Args:
+            options: Optional (possibly partial) batch request options; only matching partitions are retrieved,
+                filtering them in the splitter query.
+            page_size: The maximum number of partitions per page.
+
+        Returns:
+            An iterator over lists of at most `page_size` batch request options dictionaries.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+
+        partitions: List[Dict[str, Any]] = (
+            self._get_partitions(options=options) if self.splitter else [{}]
+        )
+        for start in range(0, len(partitions), page_size):
+            yield partitions[start : start + page_size]
+
+    def _get_partitions(
+        self, options: Optional[BatchRequestOptions] = None
+    ) -> List[Dict[str, Any]]:
+        assert self.splitter, "partitions are only defined by a splitter"
+
+        if self._partition_cache_ttl <= 0:
+            return self.splitter.param_defaults(self, options=options)
+
+        cache_key: str = json.dumps(
+            [
+                self.splitter.dict(),
+                self._create_batch_spec_kwargs(),
+                _specified_options(options, self.splitter.param_names),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        now: float = time.monotonic()
+        cached: Optional[
+            Tuple[float, List[Dict[str, Any]]]
+        ] = self._partition_cache.get(cache_key)
+        if cached is not None and now - cached[0] < self._partition_cache_ttl:
+            return cached[1]
+
+        partitions: List[Dict[str, Any]] = self.splitter.param_defaults(
+            self, options=options
+        )
+        self._partition_cache[cache_key] = (now, partitions)
+        return partitions
+
     def get_batch_list_from_batch_request(
         self, batch_request: BatchRequest
     ) -> List[Batch]:
@@ -623,7 +755,27 @@ class _SQLAsset(DataAsset):
         """
         self._validate_batch_request(batch_request)
 
-        batch_list: List[Batch] = []
+        # Batches are sorted and sliced on their metadata alone; only the requested ones are loaded
+        # by the execution engine (which may create a temp table per batch).
+        batch_handles: List[_SQLBatchHandle] = self._get_batch_handles(
+            batch_request=batch_request
+        )
+        self.sort_batches(batch_handles)  # type: ignore[arg-type]  # only metadata is used to sort batches
+        batch_handles = batch_handles[batch_request.batch_slice]
+
+        execution_engine: SqlAlchemyExecutionEngine = (
+            self.datasource.get_execution_engine()
+        )
+        return [
+            self._materialize_batch(
+                batch_handle=batch_handle, execution_engine=execution_engine
+            )
+            for batch_handle in batch_handles
+        ]
+
+    def _get_batch_handles(self, batch_request: BatchRequest) -> List[_SQLBatchHandle]:
+        """Describes batches matching the BatchRequest by their specs and metadata, without loading any data."""
+        batch_handles: List[_SQLBatchHandle] = []
         splitter = self.splitter
         batch_spec_kwargs: dict[str, str | dict | None]
         for request in self._fully_specified_batch_requests(batch_request):
@@ -641,48 +793,55 @@ class _SQLAsset(DataAsset):
                         request.options
                     )
                 )
-            # Creating the batch_spec is our hook into the execution engine.
-            batch_spec = SqlAlchemyDatasourceBatchSpec(**batch_spec_kwargs)
-            execution_engine: SqlAlchemyExecutionEngine = (
-                self.datasource.get_execution_engine()
-            )
-            data, markers = execution_engine.get_batch_data_and_markers(
-                batch_spec=batch_spec
-            )
-
-            # batch_definition (along with batch_spec and markers) is only here to satisfy a
-            # legacy constraint when computing usage statistics in a validator. We hope to remove
-            # it in the future.
-            # imports are done inline to prevent a circular dependency with core/batch.py
-            from great_expectations.core import IDDict
-            from great_expectations.core.batch import BatchDefinition
-
-            batch_definition = BatchDefinition(
-                datasource_name=self.datasource.name,
-                data_connector_name=_DATA_CONNECTOR_NAME,
-                data_asset_name=self.name,
-                batch_identifiers=IDDict(batch_spec["batch_identifiers"]),
-                batch_spec_passthrough=None,
-            )
-
-            # Some pydantic annotations are postponed due to circular imports.
-            # Batch.update_forward_refs() will set the annotations before we
-            # instantiate the Batch class since we can import them in this scope.
-            Batch.update_forward_refs()
-            batch_list.append(
-                Batch(
-                    datasource=self.datasource,
-                    data_asset=self,
+            batch_handles.append(
+                _SQLBatchHandle(
                     batch_request=request,
-                    data=data,
                     metadata=batch_metadata,
-                    legacy_batch_markers=markers,
-                    legacy_batch_spec=batch_spec,
-                    legacy_batch_definition=batch_definition,
+                    batch_spec_kwargs=batch_spec_kwargs,
                 )
             )
-        self.sort_batches(batch_list)
-        return batch_list[batch_request.batch_slice]
+        return batch_handles
+
+    def _materialize_batch(
+        self,
+        batch_handle: _SQLBatchHandle,
+        execution_engine: SqlAlchemyExecutionEngine,
+    ) -> Batch:
+        # Creating the batch_spec is our hook into the execution engine.
+        batch_spec = SqlAlchemyDatasourceBatchSpec(**batch_handle.batch_spec_kwargs)
+        data, markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+
+        # batch_definition (along with batch_spec and markers) is only here to satisfy a
+        # legacy constraint when computing usage statistics in a validator. We hope to remove
+        # it in the future.
+        # imports are done inline to prevent a circular dependency with core/batch.py
+        from great_expectations.core import IDDict
+        from great_expectations.core.batch import BatchDefinition
+
+        batch_definition = BatchDefinition(
+            datasource_name=self.datasource.name,
+            data_connector_name=_DATA_CONNECTOR_NAME,
+            data_asset_name=self.name,
+            batch_identifiers=IDDict(batch_spec["batch_identifiers"]),
+            batch_spec_passthrough=None,
+        )
+
+        # Some pydantic annotations are postponed due to circular imports.
+        # Batch.update_forward_refs() will set the annotations before we
+        # instantiate the Batch class since we can import them in this scope.
+        Batch.update_forward_refs()
+        return Batch(
+            datasource=self.datasource,
+            data_asset=self,
+            batch_request=batch_handle.batch_request,
+            data=data,
+            metadata=batch_handle.metadata,
+            legacy_batch_markers=markers,
+            legacy_batch_spec=batch_spec,
+            legacy_batch_definition=batch_definition,
+        )
 
     @public_api
     def build_batch_request(
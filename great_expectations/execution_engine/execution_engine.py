@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
@@ -19,9 +20,18 @@ from typing import (
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch_manager import BatchManager
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    MetricCache,
+    MetricCacheKey,
+    build_metric_cache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -33,6 +43,10 @@ from great_expectations.validator.computed_metric import MetricValue  # noqa: TC
 from great_expectations.validator.metric_configuration import (
     MetricConfiguration,  # noqa: TCH001
 )
+from great_expectations.validator.metric_resolution_tracer import (
+    NULL_METRIC_RESOLUTION_TRACER,
+    MetricResolutionTracer,
+)
 
 if TYPE_CHECKING:
     from great_expectations.compatibility.pyspark import functions as F
@@ -50,18 +64,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
-        return None
-
-
 @dataclass(frozen=True)
 class MetricComputationConfiguration(DictDot):
     """
@@ -130,10 +132,19 @@ class ExecutionEngine(ABC):
 
     Args:
         name: (str) name of this ExecutionEngine
-        caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        caching: (Boolean) if True (default), then resolved (computed) metrics are added to metric cache.
+        metric_cache: MetricCache object or its config (with "class_name"; e.g., "InMemoryMetricCache" with "max_size"
+            and/or "max_memory_bytes" bounds, or on-disk "SqliteMetricCache" with "filepath"); unbounded in-memory
+            cache is used by default.
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        concurrency: (ConcurrencyConfig) configuration controlling whether metrics may be resolved concurrently
+        max_metric_resolution_workers: (int) maximum number of threads used to resolve independent metrics (and
+            independent compute Domain bundles) of one level of ValidationGraph concurrently; None or 1 (default)
+            resolves metrics serially.  Concurrent resolution is opt-in: it takes place only if this number exceeds 1
+            and "concurrency" (if supplied) is enabled; effective thread count is capped the same way as for
+            AsyncExecutor (by "ConcurrencyConfig.max_database_query_concurrency").
     """
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -145,18 +156,31 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        concurrency: Optional[ConcurrencyConfig] = None,
+        max_metric_resolution_workers: Optional[int] = None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
+        self._concurrency = concurrency
+        self._max_metric_resolution_workers = max_metric_resolution_workers
+
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
-        else:
-            self._metric_cache = NoOpDict()
+        self._metric_cache: MetricCache = build_metric_cache(
+            metric_cache=metric_cache, caching=caching
+        )
+        # Metrics of Batches without content fingerprint are never persisted; they are cached for lifetime of this object.
+        self._unfingerprinted_metric_cache: MetricCache = (
+            InMemoryMetricCache()
+            if self._metric_cache.persistent
+            else self._metric_cache
+        )
+        self._metric_resolution_tracer: MetricResolutionTracer = (
+            NULL_METRIC_RESOLUTION_TRACER
+        )
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -190,6 +214,8 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "max_metric_resolution_workers": max_metric_resolution_workers,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -201,6 +227,12 @@ class ExecutionEngine(ABC):
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
 
+    def release_metric_resolution_resources(  # noqa: B027 # empty-method-without-abstract-decorator
+        self,
+    ) -> None:
+        """Optionally release resources held for the duration of metric resolution (called once it is complete)."""
+        pass
+
     @property
     def config(self) -> dict:
         return self._config
@@ -214,6 +246,74 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """Cache of resolved metric values (exposes hit/miss "statistics")."""
+        return self._metric_cache
+
+    @property
+    def metric_resolution_tracer(self) -> MetricResolutionTracer:
+        """Records timings of metric resolution (no-op "NULL_METRIC_RESOLUTION_TRACER", unless tracer is attached)."""
+        return self._metric_resolution_tracer
+
+    @metric_resolution_tracer.setter
+    def metric_resolution_tracer(
+        self, metric_resolution_tracer: Optional[MetricResolutionTracer]
+    ) -> None:
+        self._metric_resolution_tracer = (
+            metric_resolution_tracer or NULL_METRIC_RESOLUTION_TRACER
+        )
+
+    def _get_active_batch_fingerprint(self) -> Optional[str]:
+        """Returns content fingerprint of active Batch, recorded in its batch markers (e.g., "pandas_data_fingerprint").
+
+        Only exact fingerprints (batch markers named "<...>_data_fingerprint") identify Batch content.  Lossy ones
+        (e.g., "pandas_data_sample_fingerprint") miss changes to unsampled rows; hence, they are never used for caching.
+        """
+        active_batch_data_id: Optional[str] = self._batch_manager.active_batch_data_id
+        batch: Optional[Any] = (
+            None
+            if active_batch_data_id is None
+            else self._batch_manager.batch_cache.get(active_batch_data_id)
+        )
+        batch_markers: Optional[dict] = getattr(batch, "batch_markers", None)
+        if not batch_markers:
+            return None
+
+        marker_name: str
+        for marker_name in sorted(batch_markers):
+            if marker_name.endswith("_data_fingerprint") and batch_markers[marker_name]:
+                return str(batch_markers[marker_name])
+
+        return None
+
+    def _get_active_metric_cache(self) -> MetricCache:
+        """Returns cache of metrics of active Batch (persistent caches only hold metrics of fingerprinted Batches)."""
+        if self._get_active_batch_fingerprint() is None:
+            return self._unfingerprinted_metric_cache
+
+        return self._metric_cache
+
+    def _get_metric_cache_key(
+        self, metric_configuration: MetricConfiguration
+    ) -> MetricCacheKey:
+        """Metric values are cached per Batch, identified by ID of active "BatchData" object and by content fingerprint.
+
+        IDs of evaluation dependencies are part of key, since "MetricConfiguration.id" does not account for them.
+        """
+        metric_dependency_ids: Tuple[Tuple[str, Tuple[str, str, str]], ...] = tuple(
+            sorted(
+                (metric_name, metric_dependency.id)
+                for metric_name, metric_dependency in metric_configuration.metric_dependencies.items()
+            )
+        )
+        return (
+            self._batch_manager.active_batch_data_id,
+            self._get_active_batch_fingerprint(),
+            metric_configuration.id,
+            metric_dependency_ids,
+        )
+
     def _load_batch_data_from_dict(
         self, batch_data_dict: Dict[str, BatchDataType]
     ) -> None:
@@ -268,6 +368,14 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
+        cached_metrics: Dict[Tuple[str, str, str], MetricValue]
+        (
+            cached_metrics,
+            metrics_to_resolve,
+        ) = self._get_cached_metrics_and_metrics_to_compute(
+            metrics_to_resolve=metrics_to_resolve
+        )
+
         metric_fn_direct_configurations: List[MetricComputationConfiguration]
         metric_fn_bundle_configurations: List[MetricComputationConfiguration]
         (
@@ -278,10 +386,47 @@ class ExecutionEngine(ABC):
             metrics=metrics,
             runtime_configuration=runtime_configuration,
         )
-        return self._process_direct_and_bundled_metric_computation_configurations(
+        resolved_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = self._process_direct_and_bundled_metric_computation_configurations(
             metric_fn_direct_configurations=metric_fn_direct_configurations,
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
         )
+        resolved_metrics.update(cached_metrics)
+        return resolved_metrics
+
+    def _get_cached_metrics_and_metrics_to_compute(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+    ) -> Tuple[Dict[Tuple[str, str, str], MetricValue], List[MetricConfiguration]]:
+        """Splits "metrics_to_resolve" into values available from metric cache and metrics still to be computed."""
+        cached_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        metrics_to_compute: List[MetricConfiguration] = []
+
+        if not self._caching:
+            return cached_metrics, list(metrics_to_resolve)
+
+        metric_cache: MetricCache = self._get_active_metric_cache()
+        metric_to_resolve: MetricConfiguration
+        found: bool
+        metric_value: Optional[MetricValue]
+        for metric_to_resolve in metrics_to_resolve:
+            found, metric_value = metric_cache.lookup(
+                key=self._get_metric_cache_key(metric_configuration=metric_to_resolve)
+            )
+            if found:
+                cached_metrics[metric_to_resolve.id] = metric_value
+            else:
+                metrics_to_compute.append(metric_to_resolve)
+
+        self._metric_resolution_tracer.increment(
+            name="metric_cache",
+            category="cache",
+            hits=len(cached_metrics),
+            misses=len(metrics_to_compute),
+        )
+
+        return cached_metrics, metrics_to_compute
 
     def resolve_metric_bundle(
         self, metric_fn_bundle
@@ -501,6 +646,8 @@ class ExecutionEngine(ABC):
 
         metric_name: str
         metric_configuration: MetricConfiguration
+        found: bool
+        metric_value: Optional[MetricValue]
         for (
             metric_name,
             metric_configuration,
@@ -509,10 +656,15 @@ class ExecutionEngine(ABC):
                 metric_dependencies_by_metric_name[metric_name] = metrics[
                     metric_configuration.id
                 ]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
+                continue
+
+            found, metric_value = self._get_active_metric_cache().lookup(
+                key=self._get_metric_cache_key(
+                    metric_configuration=metric_configuration
+                )
+            )
+            if found:
+                metric_dependencies_by_metric_name[metric_name] = metric_value
             else:
                 raise gx_exceptions.MetricError(
                     message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'
@@ -537,44 +689,178 @@ class ExecutionEngine(ABC):
         """
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
+        max_workers: int = self._get_metric_resolution_max_workers()
+
+        metric_fn_bundles: List[List[MetricComputationConfiguration]]
+        if max_workers > 1:
+            # Bundles for distinct compute Domains are independent and can be submitted to the backend concurrently.
+            metric_fn_bundles = (
+                self._group_metric_computation_configurations_by_compute_domain(
+                    metric_computation_configurations=metric_fn_bundle_configurations
+                )
+            )
+        else:
+            metric_fn_bundles = [metric_fn_bundle_configurations]
+
         metric_computation_configuration: MetricComputationConfiguration
+        metric_fn_bundle: List[MetricComputationConfiguration]
+        async_results: List[AsyncResult]
+        async_result: AsyncResult
+        with AsyncExecutor(
+            concurrency_config=self._get_metric_resolution_concurrency_config(
+                max_workers=max_workers
+            ),
+            max_workers=max_workers,
+        ) as async_executor:
+            async_results = [
+                async_executor.submit(
+                    self._resolve_direct_metric_computation_configuration,
+                    metric_computation_configuration=metric_computation_configuration,
+                )
+                for metric_computation_configuration in metric_fn_direct_configurations
+            ]
+            async_results.extend(
+                [
+                    async_executor.submit(
+                        self._resolve_bundled_metric_computation_configurations,
+                        metric_fn_bundle=metric_fn_bundle,
+                    )
+                    for metric_fn_bundle in metric_fn_bundles
+                ]
+            )
+            for async_result in async_results:
+                resolved_metrics.update(async_result.result())
 
-        for metric_computation_configuration in metric_fn_direct_configurations:
-            try:
-                resolved_metrics[
-                    metric_computation_configuration.metric_configuration.id
-                ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                    **metric_computation_configuration.metric_provider_kwargs
+        if self._caching:
+            metric_configurations_by_id: Dict[
+                Tuple[str, str, str], MetricConfiguration
+            ] = {
+                metric_computation_configuration.metric_configuration.id: metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in itertools.chain(
+                    metric_fn_direct_configurations, metric_fn_bundle_configurations
                 )
-            except Exception as e:
-                raise gx_exceptions.MetricResolutionError(
-                    message=str(e),
-                    failed_metrics=(
-                        metric_computation_configuration.metric_configuration,
-                    ),
-                ) from e
+            }
+            metric_id: Tuple[str, str, str]
+            metric_value: MetricValue
+            self._get_active_metric_cache().update(
+                {
+                    self._get_metric_cache_key(
+                        metric_configuration=metric_configurations_by_id[metric_id]
+                    ): metric_value
+                    for metric_id, metric_value in resolved_metrics.items()
+                    if metric_id in metric_configurations_by_id
+                }
+            )
 
+        return resolved_metrics
+
+    def _resolve_direct_metric_computation_configuration(
+        self,
+        metric_computation_configuration: MetricComputationConfiguration,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes one directly-computable metric; failure is reported as "MetricResolutionError" for this metric."""
+        metric_configuration: MetricConfiguration = (
+            metric_computation_configuration.metric_configuration
+        )
         try:
-            # an engine-specific way of computing metrics together
-            resolved_metric_bundle: Dict[
-                Tuple[str, str, str], MetricValue
-            ] = self.resolve_metric_bundle(
-                metric_fn_bundle=metric_fn_bundle_configurations
-            )
-            resolved_metrics.update(resolved_metric_bundle)
+            with self._metric_resolution_tracer.span(
+                name=metric_configuration.metric_name,
+                category="metric",
+                args=self._get_metric_trace_args(
+                    metric_computation_configuration=metric_computation_configuration
+                ),
+                metric_ids=[metric_configuration.id],
+            ):
+                return {
+                    metric_configuration.id: metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                        **metric_computation_configuration.metric_provider_kwargs
+                    )
+                }
+        except Exception as e:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(e),
+                failed_metrics=(metric_computation_configuration.metric_configuration,),
+            ) from e
+
+    def _resolve_bundled_metric_computation_configurations(
+        self,
+        metric_fn_bundle: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes bundle of aggregate metrics; failure is reported as "MetricResolutionError" for all of them."""
+        metric_ids: List[Tuple[str, str, str]] = [
+            metric_computation_configuration.metric_configuration.id
+            for metric_computation_configuration in metric_fn_bundle
+        ]
+        try:
+            if not metric_ids:
+                return self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+            with self._metric_resolution_tracer.span(
+                name="metric_bundle",
+                category="metric_bundle",
+                args={"metric_ids": metric_ids},
+                metric_ids=metric_ids,
+            ):
+                # an engine-specific way of computing metrics together
+                return self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
                 failed_metrics=[
                     metric_computation_configuration.metric_configuration
-                    for metric_computation_configuration in metric_fn_bundle_configurations
+                    for metric_computation_configuration in metric_fn_bundle
                 ],
             ) from e
 
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+    def _get_metric_trace_args(
+        self, metric_computation_configuration: MetricComputationConfiguration
+    ) -> dict:
+        """Describes metric computation in trace event (only called, if metric resolution is traced)."""
+        if not self._metric_resolution_tracer.enabled:
+            return {}
 
-        return resolved_metrics
+        metric_configuration: MetricConfiguration = (
+            metric_computation_configuration.metric_configuration
+        )
+        return {
+            "metric_id": metric_configuration.id,
+            "metric_domain_kwargs": metric_configuration.metric_domain_kwargs,
+            "metric_value_kwargs": metric_configuration.metric_value_kwargs,
+        }
+
+    @staticmethod
+    def _group_metric_computation_configurations_by_compute_domain(
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> List[List[MetricComputationConfiguration]]:
+        """Splits bundled "MetricComputationConfiguration" objects into lists, sharing same compute Domain kwargs."""
+        metric_computation_configurations_by_domain_id: Dict[
+            Union[str, Tuple], List[MetricComputationConfiguration]
+        ] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        domain_id: Union[str, Tuple]
+        for metric_computation_configuration in metric_computation_configurations:
+            domain_id = IDDict(
+                metric_computation_configuration.compute_domain_kwargs or {}
+            ).to_id()
+            metric_computation_configurations_by_domain_id.setdefault(
+                domain_id, []
+            ).append(metric_computation_configuration)
+
+        return list(metric_computation_configurations_by_domain_id.values())
+
+    def _get_metric_resolution_max_workers(self) -> int:
+        """Number of threads, requested for resolving metrics; backends unable to run concurrently should return 1."""
+        return self._max_metric_resolution_workers or 1
+
+    def _get_metric_resolution_concurrency_config(
+        self, max_workers: int
+    ) -> ConcurrencyConfig:
+        """Explicitly supplied "ConcurrencyConfig" takes precedence; otherwise, requesting multiple workers opts in."""
+        if self._concurrency is not None:
+            return self._concurrency
+
+        return ConcurrencyConfig(enabled=max_workers > 1)
 
     def _split_domain_kwargs(
         self,
@@ -0,0 +1,443 @@
+"""
+Caches of resolved metric values, used by "ExecutionEngine" to avoid recomputing metrics.
+
+Cache keys are four-tuples of ID of "BatchData" object (on which metric was computed), content fingerprint of its
+Batch (recorded in batch markers, e.g., "pandas_data_fingerprint"; None, if unavailable), "MetricConfiguration.id", and
+IDs of metric dependencies.  In-memory caches make the strong assumption that the user will not modify the data
+underlying a Batch with a given ID during the lifetime of the "ExecutionEngine".  Persistent caches ("SqliteMetricCache")
+only hold metrics of Batches with exact content fingerprint (sampled ones, e.g., "pandas_data_sample_fingerprint", are
+not used), and are only as reliable as that fingerprint (e.g., "file_metadata" fingerprint misses rewrites of a file,
+which preserve its size and modification time).
+
+WARNING: This module is experimental.
+"""
+from __future__ import annotations
+
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Mapping, Optional, Tuple, Union
+
+from great_expectations.compatibility import pyspark, sqlalchemy
+from great_expectations.types import DictDot
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+MetricCacheKey = Hashable
+
+
+@dataclass
+class MetricCacheStatistics(DictDot):
+    """Hit/miss/eviction counters of "MetricCache" object."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / lookups
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class MetricCache(ABC):
+    """Interface of cache of resolved metric values.
+
+    Implementations must be safe to use from multiple threads (metrics can be resolved concurrently).  Persistent
+    implementations (which outlive "ExecutionEngine" object) set "persistent" to True.
+    """
+
+    persistent: bool = False
+
+    def __init__(self) -> None:
+        self._statistics = MetricCacheStatistics()
+        self._lock = threading.RLock()
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        return self._statistics
+
+    def lookup(self, key: MetricCacheKey) -> Tuple[bool, Optional[MetricValue]]:
+        """Returns two-tuple: whether or not key is cached and cached value (or None); counts lookup as hit or miss."""
+        with self._lock:
+            found: bool
+            value: Optional[MetricValue]
+            found, value = self._get(key=key)
+            if found:
+                self._statistics.hits += 1
+            else:
+                self._statistics.misses += 1
+
+            return found, value
+
+    def get(self, key: MetricCacheKey) -> Optional[MetricValue]:
+        """Returns cached value (or None, if absent), counting lookup as hit or miss."""
+        return self.lookup(key=key)[1]
+
+    def __contains__(self, key: MetricCacheKey) -> bool:
+        with self._lock:
+            return self._contains(key=key)
+
+    def __setitem__(self, key: MetricCacheKey, value: MetricValue) -> None:
+        with self._lock:
+            self._set(key=key, value=value)
+
+    def update(self, values: Mapping[MetricCacheKey, MetricValue]) -> None:
+        with self._lock:
+            key: MetricCacheKey
+            value: MetricValue
+            for key, value in values.items():
+                self._set(key=key, value=value)
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Releases resources held by this cache (no-op by default)."""
+        pass
+
+    @abstractmethod
+    def _get(self, key: MetricCacheKey) -> Tuple[bool, Optional[MetricValue]]:
+        pass
+
+    @abstractmethod
+    def _contains(self, key: MetricCacheKey) -> bool:
+        pass
+
+    @abstractmethod
+    def _set(self, key: MetricCacheKey, value: MetricValue) -> None:
+        pass
+
+
+class NoOpMetricCache(MetricCache):
+    """Cache that stores nothing (used when "ExecutionEngine" caching is disabled)."""
+
+    def __len__(self) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+    def _get(self, key: MetricCacheKey) -> Tuple[bool, Optional[MetricValue]]:
+        return False, None
+
+    def _contains(self, key: MetricCacheKey) -> bool:
+        return False
+
+    def _set(self, key: MetricCacheKey, value: MetricValue) -> None:
+        pass
+
+
+class InMemoryMetricCache(MetricCache):
+    """Least-recently-used cache of metric values, bounded by number of entries and/or estimated memory footprint.
+
+    Args:
+        max_size: maximum number of cached metric values (None means unbounded).
+        max_memory_bytes: maximum total estimated size of cached metric values, in bytes (None means unbounded).
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._max_size = max_size
+        self._max_memory_bytes = max_memory_bytes
+        self._values: OrderedDict[MetricCacheKey, MetricValue] = OrderedDict()
+        self._sizes: Dict[MetricCacheKey, int] = {}
+        self._memory_bytes: int = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total estimated size of cached metric values, in bytes (tracked only if "max_memory_bytes" is set)."""
+        return self._memory_bytes
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._sizes.clear()
+            self._memory_bytes = 0
+
+    def _get(self, key: MetricCacheKey) -> Tuple[bool, Optional[MetricValue]]:
+        if key not in self._values:
+            return False, None
+
+        self._values.move_to_end(key)
+        return True, self._values[key]
+
+    def _contains(self, key: MetricCacheKey) -> bool:
+        return key in self._values
+
+    def _set(self, key: MetricCacheKey, value: MetricValue) -> None:
+        self._discard(key=key)
+
+        if self._max_memory_bytes is not None:
+            size: int = estimate_metric_value_size(value=value)
+            if size > self._max_memory_bytes:
+                # Value would evict everything else and still not fit.
+                return
+
+            self._sizes[key] = size
+            self._memory_bytes += size
+
+        self._values[key] = value
+        self._evict()
+
+    def _discard(self, key: MetricCacheKey) -> None:
+        if key in self._values:
+            del self._values[key]
+            self._memory_bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        while self._values and (
+            (self._max_size is not None and len(self._values) > self._max_size)
+            or (
+                self._max_memory_bytes is not None
+                and self._memory_bytes > self._max_memory_bytes
+            )
+        ):
+            self._discard(key=next(iter(self._values)))
+            self._statistics.evictions += 1
+
+
+class SqliteMetricCache(MetricCache):
+    """Least-recently-used cache of metric values, persisted in SQLite database file, so that it can be shared by
+    successive runs (e.g., of Checkpoint against unchanged Batch) and by processes on same host.
+
+    Values, which cannot be pickled (e.g., partial aggregate functions, holding SQLAlchemy or Spark expressions), are
+    not persisted.
+
+    Args:
+        filepath: path to SQLite database file (created if it does not exist).
+        max_size: maximum number of cached metric values (None means unbounded).
+    """
+
+    _TABLE_NAME = "gx_metric_cache"
+
+    persistent: bool = True
+
+    def __init__(
+        self,
+        filepath: str,
+        max_size: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._filepath = filepath
+        self._max_size = max_size
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        self._connection.execute(
+            f"""CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (
+    cache_key TEXT PRIMARY KEY,
+    cache_value BLOB NOT NULL,
+    last_access INTEGER NOT NULL
+)"""
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self._TABLE_NAME}_last_access ON {self._TABLE_NAME} (last_access)"
+        )
+        self._connection.commit()
+        self._access_counter: int = self._get_max_last_access()
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM {self._TABLE_NAME}"
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self._TABLE_NAME}")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: MetricCacheKey) -> Tuple[bool, Optional[MetricValue]]:
+        cache_key: str = self._serialize_key(key=key)
+        row = self._connection.execute(
+            f"SELECT cache_value FROM {self._TABLE_NAME} WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        try:
+            value: MetricValue = pickle.loads(row[0])
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cached metric value {cache_key}: {e}")
+            self._connection.execute(
+                f"DELETE FROM {self._TABLE_NAME} WHERE cache_key = ?", (cache_key,)
+            )
+            self._connection.commit()
+            return False, None
+
+        self._connection.execute(
+            f"UPDATE {self._TABLE_NAME} SET last_access = ? WHERE cache_key = ?",
+            (self._next_access(), cache_key),
+        )
+        self._connection.commit()
+        return True, value
+
+    def _contains(self, key: MetricCacheKey) -> bool:
+        return (
+            self._connection.execute(
+                f"SELECT 1 FROM {self._TABLE_NAME} WHERE cache_key = ?",
+                (self._serialize_key(key=key),),
+            ).fetchone()
+            is not None
+        )
+
+    def _set(self, key: MetricCacheKey, value: MetricValue) -> None:
+        if not _is_persistable(value=value):
+            return
+
+        try:
+            serialized_value: bytes = pickle.dumps(value)
+        except Exception as e:
+            logger.debug(f"Metric value for {key} cannot be persisted: {e}")
+            return
+
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO {self._TABLE_NAME} (cache_key, cache_value, last_access) VALUES (?, ?, ?)",
+            (self._serialize_key(key=key), serialized_value, self._next_access()),
+        )
+        self._evict()
+        self._connection.commit()
+
+    def _evict(self) -> None:
+        if self._max_size is None:
+            return
+
+        num_evicted: int = self._connection.execute(
+            f"""DELETE FROM {self._TABLE_NAME} WHERE cache_key IN (
+    SELECT cache_key FROM {self._TABLE_NAME} ORDER BY last_access DESC LIMIT -1 OFFSET ?
+)""",
+            (self._max_size,),
+        ).rowcount
+        self._statistics.evictions += max(num_evicted, 0)
+
+    def _next_access(self) -> int:
+        self._access_counter += 1
+        return self._access_counter
+
+    def _get_max_last_access(self) -> int:
+        return (
+            self._connection.execute(
+                f"SELECT MAX(last_access) FROM {self._TABLE_NAME}"
+            ).fetchone()[0]
+            or 0
+        )
+
+    @staticmethod
+    def _serialize_key(key: MetricCacheKey) -> str:
+        # Keys are tuples of strings (and nested tuples of strings), whose "repr()" is deterministic across processes.
+        return repr(key)
+
+
+def build_metric_cache(
+    metric_cache: Optional[Union[MetricCache, dict]], caching: bool
+) -> MetricCache:
+    """Returns "MetricCache" object, specified either as instance or as config (with "class_name" and, optionally,
+    "module_name"); if unspecified, unbounded "InMemoryMetricCache" is used ("NoOpMetricCache" if caching is off).
+    """
+    if not caching:
+        return NoOpMetricCache()
+
+    if metric_cache is None:
+        return InMemoryMetricCache()
+
+    if isinstance(metric_cache, MetricCache):
+        return metric_cache
+
+    # Imported here to avoid circular imports.
+    from great_expectations.data_context.util import instantiate_class_from_config
+
+    return instantiate_class_from_config(
+        config=metric_cache,
+        runtime_environment={},
+        config_defaults={
+            "module_name": "great_expectations.execution_engine.metric_cache"
+        },
+    )
+
+
+def estimate_metric_value_size(value: Any) -> int:
+    """Returns estimated memory footprint of metric value, in bytes (accounting for Pandas and NumPy containers)."""
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except Exception:
+            pass
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(
+            estimate_metric_value_size(value=element) for element in value
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_metric_value_size(value=key)
+            + estimate_metric_value_size(value=element)
+            for key, element in value.items()
+        )
+
+    return sys.getsizeof(value)
+
+
+def _is_persistable(value: Any) -> bool:
+    """Backend-bound values (queries, Spark columns/DataFrames) are only meaningful within current process."""
+    if isinstance(value, tuple):
+        return all(_is_persistable(value=element) for element in value)
+
+    if sqlalchemy.ColumnElement and isinstance(value, sqlalchemy.ColumnElement):  # type: ignore[truthy-function]
+        return False
+
+    if sqlalchemy.Selectable and isinstance(value, sqlalchemy.Selectable):  # type: ignore[truthy-function]
+        return False
+
+    if pyspark.Column and isinstance(value, pyspark.Column):  # type: ignore[truthy-function]
+        return False
+
+    if pyspark.DataFrame and isinstance(value, pyspark.DataFrame):  # type: ignore[truthy-function]
+        return False
+
+    return True
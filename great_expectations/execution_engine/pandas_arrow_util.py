@@ -0,0 +1,187 @@
+"""Arrow-backed columns of Pandas Batch data and "pyarrow.compute" kernels for metrics over them.
+
+With "dtype_backend" of "PandasExecutionEngine" set to "pyarrow", string columns are stored as "string[pyarrow]"
+(contiguous Arrow buffers, rather than NumPy arrays of Python objects).  Column map metrics over strings (regular
+expressions, value lengths, set membership, nulls) and value counts evaluate such columns with "pyarrow.compute"
+kernels; whenever a kernel cannot reproduce semantics of NumPy-backed implementation exactly (e.g., regular expression
+syntax unsupported by RE2), the helpers below return None and metrics fall back to their usual implementations.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.pyarrow import compute, pyarrow
+
+logger = logging.getLogger(__name__)
+
+ARROW_DTYPE_BACKEND: str = "pyarrow"
+
+SUPPORTED_DTYPE_BACKENDS: tuple = (ARROW_DTYPE_BACKEND,)
+
+_ARROW_STRING_DTYPE: str = "string[pyarrow]"
+
+# RE2 (used by Arrow) and Python "re" agree only on a subset of regular expression syntax.  Patterns using any of the
+# following are left to Pandas: "$" (Python also matches before trailing newline), alphanumeric escapes other than
+# "\A", "\f", "\n", "\r", "\t", and "\v" (e.g., "\d", "\w", "\s", and "\b" are Unicode-aware in Python, but
+# ASCII-only in RE2; backreferences, "\p", and "\Z" are specific to one of them), inline flags and group extensions
+# ("(?"), POSIX character classes ("[:"), and quantifiers with omitted lower bound ("{,").
+_RE2_INCOMPATIBLE_REGEX_SYNTAX: re.Pattern = re.compile(
+    r"\$|\\[^\WAfnrtv_]|\(\?|\[:|\{,"
+)
+
+
+def convert_to_arrow_backed_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns DataFrame, whose string columns (object dtype columns holding only strings and nulls) are Arrow-backed.
+
+    Other columns (already vectorized by NumPy) are left as they are.
+    """
+    if not pyarrow:
+        raise ImportError(
+            "Arrow-backed Pandas Batch data requires pyarrow; please 'pip install pyarrow'."
+        )
+
+    string_column_names: list = [
+        column_name
+        for column_name in df.columns
+        if df[column_name].dtype == object
+        and pd.api.types.infer_dtype(df[column_name], skipna=True) == "string"
+    ]
+    if not string_column_names:
+        return df
+
+    return df.astype(
+        {column_name: _ARROW_STRING_DTYPE for column_name in string_column_names}
+    )
+
+
+def is_arrow_backed(column: pd.Series) -> bool:
+    return hasattr(column.array, "__arrow_array__") and (
+        getattr(column.dtype, "storage", None) == ARROW_DTYPE_BACKEND
+        or type(column.dtype).__name__ == "ArrowDtype"
+    )
+
+
+def get_arrow_string_array(
+    column: pd.Series, allow_nulls: bool = False
+) -> Optional[pyarrow.ChunkedArray]:
+    """Returns Arrow data of Arrow-backed string column (or None, if kernels are not applicable).
+
+    Null values are rendered as strings (e.g., "None") by NumPy-backed map implementations; hence, unless "allow_nulls"
+    is set, columns with null values are left to those implementations.
+    """
+    if not (pyarrow and is_arrow_backed(column=column)):
+        return None
+
+    array = _get_arrow_data(column=column)
+    if not (
+        pyarrow.types.is_string(array.type) or pyarrow.types.is_large_string(array.type)
+    ):
+        return None
+
+    if array.null_count > 0 and not allow_nulls:
+        return None
+
+    return array
+
+
+def match_regex(column: pd.Series, regex: str) -> Optional[pd.Series]:
+    """Arrow counterpart of "column.astype(str).str.contains(regex)" (None, if not applicable).
+
+    Only patterns, whose RE2 semantics are known to agree with Python "re" semantics, are evaluated by Arrow.
+    """
+    if _RE2_INCOMPATIBLE_REGEX_SYNTAX.search(regex):
+        return None
+
+    array: Optional[pyarrow.ChunkedArray] = get_arrow_string_array(column=column)
+    if array is None:
+        return None
+
+    try:
+        return _to_series(
+            array=compute.match_substring_regex(array, pattern=regex), column=column
+        )
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+        # RE2 (used by Arrow) does not support all of Python regular expression syntax (e.g., backreferences).
+        logger.debug(
+            f'Regular expression "{regex}" is not supported by pyarrow.compute ({e}); falling back to Pandas.'
+        )
+        return None
+
+
+def value_length(column: pd.Series) -> Optional[pd.Series]:
+    """Arrow counterpart of "column.astype(str).str.len()" (None, if not applicable)."""
+    array: Optional[pyarrow.ChunkedArray] = get_arrow_string_array(column=column)
+    if array is None:
+        return None
+
+    return _to_series(
+        array=compute.utf8_length(array).cast(pyarrow.int64()), column=column
+    )
+
+
+def is_in(column: pd.Series, value_set: Iterable[Any]) -> Optional[pd.Series]:
+    """Arrow counterpart of "column.isin(value_set)" (None, if not applicable, e.g., for non-string "value_set")."""
+    array: Optional[pyarrow.ChunkedArray] = get_arrow_string_array(column=column)
+    if array is None:
+        return None
+
+    value_list: list = list(value_set)
+    if not all(isinstance(value, str) for value in value_list):
+        return None
+
+    return _to_series(
+        array=compute.is_in(
+            array, value_set=pyarrow.array(value_list, type=array.type)
+        ),
+        column=column,
+    )
+
+
+def is_null(column: pd.Series) -> Optional[pd.Series]:
+    """Arrow counterpart of "column.isnull()" (reads validity bitmap only; None, if column is not Arrow-backed)."""
+    if not (pyarrow and is_arrow_backed(column=column)):
+        return None
+
+    return _to_series(
+        array=compute.is_null(_get_arrow_data(column=column)),
+        column=column,
+    )
+
+
+def value_counts(column: pd.Series) -> Optional[pd.Series]:
+    """Arrow counterpart of "column.value_counts()" (None, if not applicable).
+
+    Like NumPy-backed implementation, null values are not counted; result has "int64" counts and object dtype index.
+    """
+    array: Optional[pyarrow.ChunkedArray] = get_arrow_string_array(
+        column=column, allow_nulls=True
+    )
+    if array is None:
+        return None
+
+    value_counts_array = compute.value_counts(array.drop_null())
+    counts = pd.Series(
+        value_counts_array.field("counts").to_numpy().astype(np.int64),
+        index=pd.Index(value_counts_array.field("values").to_pylist(), dtype=object),
+        name=column.name,
+    )
+    return counts.sort_values(ascending=False, kind="stable")
+
+
+def _get_arrow_data(column: pd.Series) -> pyarrow.ChunkedArray:
+    data = column.array.__arrow_array__()
+    if isinstance(data, pyarrow.Array):
+        return pyarrow.chunked_array([data])
+
+    return data
+
+
+def _to_series(array: pyarrow.ChunkedArray, column: pd.Series) -> pd.Series:
+    return pd.Series(
+        array.to_numpy(zero_copy_only=False), index=column.index, name=column.name
+    )
@@ -0,0 +1,230 @@
+"""Fingerprints of Pandas Batch data ("pandas_data_fingerprint" and "pandas_data_sample_fingerprint" batch markers).
+
+Hashing every value of DataFrame (and pickling it, if some of its values are unhashable) costs as much time and memory
+as loading DataFrame in the first place; hence, "PandasExecutionEngine" can fingerprint Batch data by one of these
+methods:
+
+- "full" (default) -- hashes every value of DataFrame (skipped for DataFrame over "HASH_THRESHOLD").
+- "file_metadata" -- hashes size and modification time (local files), or ETag (S3, Azure, and GCS objects) of file read.
+- "parquet_footer" -- hashes footer metadata (row groups and their column statistics) of Parquet file read.
+- "sample" -- hashes shape, columns, and dtypes of DataFrame, together with (at most "sample_size") evenly spaced rows
+  (including first and last rows); DataFrame having no more rows than "sample_size" is hashed in full.
+- "none" -- no fingerprint.
+
+File-based methods also hash reader options, splitting, and sampling directives of "BatchSpec", and fall back to the
+"sample" method, whenever Batch data was not read from file (or from Parquet file, respectively).
+
+Fingerprints, which identify contents of Batch data, are recorded as "pandas_data_fingerprint" batch marker.  Sampled
+fingerprints are lossy (changes of rows, which were not sampled, go unnoticed); hence, they are recorded under separate
+"pandas_data_sample_fingerprint" batch marker, which is never treated as identity of Batch data (e.g., by metric cache).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.pyarrow import parquet, pyarrow
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch_spec import BatchSpec
+
+logger = logging.getLogger(__name__)
+
+
+HASH_THRESHOLD = 1e9
+
+FULL_FINGERPRINT_METHOD: str = "full"
+SAMPLE_FINGERPRINT_METHOD: str = "sample"
+FILE_METADATA_FINGERPRINT_METHOD: str = "file_metadata"
+PARQUET_FOOTER_FINGERPRINT_METHOD: str = "parquet_footer"
+NO_FINGERPRINT_METHOD: str = "none"
+
+BATCH_FINGERPRINT_METHODS: tuple = (
+    FULL_FINGERPRINT_METHOD,
+    FILE_METADATA_FINGERPRINT_METHOD,
+    PARQUET_FOOTER_FINGERPRINT_METHOD,
+    SAMPLE_FINGERPRINT_METHOD,
+    NO_FINGERPRINT_METHOD,
+)
+
+DEFAULT_FINGERPRINT_SAMPLE_SIZE: int = 10000
+
+PANDAS_DATA_FINGERPRINT_MARKER: str = "pandas_data_fingerprint"
+PANDAS_DATA_SAMPLE_FINGERPRINT_MARKER: str = "pandas_data_sample_fingerprint"
+
+_BATCH_SPEC_FINGERPRINT_KEYS: tuple = (
+    "reader_method",
+    "reader_options",
+    "splitter_method",
+    "splitter_kwargs",
+    "sampling_method",
+    "sampling_kwargs",
+)
+
+
+def hash_pandas_dataframe(df):
+    try:
+        obj = pd.util.hash_pandas_object(df, index=True).values
+    except TypeError:
+        # In case of facing unhashable objects (like dict), use pickle
+        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+
+    return hashlib.md5(obj).hexdigest()
+
+
+def hash_pandas_dataframe_sample(df: pd.DataFrame, sample_size: int) -> str:
+    """Hashes shape, columns, and dtypes of DataFrame, as well as at most "sample_size" of its evenly spaced rows."""
+    num_rows: int = len(df.index)
+    if num_rows <= sample_size:
+        return hash_pandas_dataframe(df)
+
+    positions: np.ndarray = np.linspace(
+        0, num_rows - 1, num=sample_size, dtype=np.int64
+    )
+    return _hash_json(
+        {
+            "shape": list(df.shape),
+            "columns": [str(column) for column in df.columns],
+            "dtypes": [str(dtype) for dtype in df.dtypes],
+            "sample": hash_pandas_dataframe(df.iloc[positions]),
+        }
+    )
+
+
+def get_pandas_batch_fingerprint(  # noqa: PLR0911, PLR0913
+    df: pd.DataFrame,
+    batch_spec: BatchSpec,
+    method: str = FULL_FINGERPRINT_METHOD,
+    sample_size: int = DEFAULT_FINGERPRINT_SAMPLE_SIZE,
+    file_metadata: Optional[dict] = None,
+    file_path: Optional[str] = None,
+    file_buffer: Any = None,
+) -> Optional[Tuple[str, str]]:
+    """Returns batch marker name and fingerprint of Batch data (or None, if no fingerprint is to be computed).
+
+    Exact fingerprints are named "pandas_data_fingerprint"; lossy (sampled) ones are named
+    "pandas_data_sample_fingerprint".
+
+    Args:
+        df: Batch data (after splitting and sampling directives of "batch_spec" have been applied)
+        batch_spec: "BatchSpec", whose data "df" is
+        method: fingerprint method (one of "BATCH_FINGERPRINT_METHODS")
+        sample_size: maximum number of rows hashed by "sample" method
+        file_metadata: metadata of cloud storage object read, if any (e.g., ETag, size, and modification time)
+        file_path: path of local file (or directory) read, if any
+        file_buffer: in-memory contents of cloud storage object read, if any
+
+    Returns:
+        Tuple of batch marker name and hexadecimal MD5 digest, or None
+    """
+    if method == NO_FINGERPRINT_METHOD:
+        return None
+
+    if method == FULL_FINGERPRINT_METHOD:
+        if df.memory_usage().sum() < HASH_THRESHOLD:
+            return PANDAS_DATA_FINGERPRINT_MARKER, hash_pandas_dataframe(df)
+
+        return None
+
+    parquet_source: Any = file_buffer if file_buffer is not None else file_path
+    if method == PARQUET_FOOTER_FINGERPRINT_METHOD and parquet_source is not None:
+        parquet_footer: Optional[dict] = _get_parquet_footer(
+            parquet_source=parquet_source
+        )
+        if parquet_footer is not None:
+            return PANDAS_DATA_FINGERPRINT_MARKER, _hash_json(
+                {
+                    "parquet_footer": parquet_footer,
+                    "batch_spec": _get_batch_spec_fingerprint_kwargs(
+                        batch_spec=batch_spec
+                    ),
+                }
+            )
+
+    if method in (FILE_METADATA_FINGERPRINT_METHOD, PARQUET_FOOTER_FINGERPRINT_METHOD):
+        if file_metadata is None and file_path is not None:
+            file_metadata = get_local_file_metadata(path=file_path)
+
+        if file_metadata:
+            return PANDAS_DATA_FINGERPRINT_MARKER, _hash_json(
+                {
+                    "file_metadata": file_metadata,
+                    "batch_spec": _get_batch_spec_fingerprint_kwargs(
+                        batch_spec=batch_spec
+                    ),
+                }
+            )
+
+    if len(df.index) <= sample_size:
+        # DataFrame, having no more rows than sample size, is hashed in full.
+        return PANDAS_DATA_FINGERPRINT_MARKER, hash_pandas_dataframe(df)
+
+    return PANDAS_DATA_SAMPLE_FINGERPRINT_MARKER, hash_pandas_dataframe_sample(
+        df=df, sample_size=sample_size
+    )
+
+
+def get_local_file_metadata(path: str) -> Optional[dict]:
+    """Returns sizes and modification times of local file (or of files in local directory), if path exists."""
+    if not os.path.exists(path):  # noqa: PTH110
+        return None
+
+    if not os.path.isdir(path):  # noqa: PTH112
+        return _get_local_file_stat(path=path)
+
+    directory_path: str
+    file_names: list
+    file_stats: dict = {}
+    for directory_path, _, file_names in os.walk(path):
+        file_name: str
+        for file_name in file_names:
+            file_path: str = os.path.join(directory_path, file_name)  # noqa: PTH118
+            file_stats[os.path.relpath(file_path, path)] = _get_local_file_stat(
+                path=file_path
+            )
+
+    return {"path": path, "files": file_stats}
+
+
+def _get_local_file_stat(path: str) -> dict:
+    stat: os.stat_result = os.stat(path)  # noqa: PTH116
+    return {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _get_parquet_footer(parquet_source: Any) -> Optional[dict]:
+    if not parquet:
+        return None
+
+    try:
+        if hasattr(parquet_source, "seek"):
+            parquet_source.seek(0)
+
+        return parquet.read_metadata(parquet_source).to_dict()
+    except (OSError, ValueError, pyarrow.ArrowException) as e:
+        # Directories of Parquet files and non-Parquet files have no (single) footer; other methods apply instead.
+        logger.debug(f"Unable to read Parquet footer for batch fingerprint: {e}")
+        return None
+    finally:
+        if hasattr(parquet_source, "seek"):
+            parquet_source.seek(0)
+
+
+def _get_batch_spec_fingerprint_kwargs(batch_spec: BatchSpec) -> dict:
+    return {
+        key: batch_spec.get(key)
+        for key in _BATCH_SPEC_FINGERPRINT_KEYS
+        if batch_spec.get(key) is not None
+    }
+
+
+def _hash_json(data: dict) -> str:
+    return hashlib.md5(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.pyarrow import parquet, pyarrow
+from great_expectations.core.batch import BatchData
+
+ChunkReaderFn = Callable[[], Iterator[pd.DataFrame]]
+
+
+class PandasChunkedBatchData(BatchData):
+    """Batch data, which is read (as pandas DataFrame chunks of bounded size) every time it is scanned.
+
+    Batch data is never materialized in its entirety; metrics are computed per chunk and merged (see
+    "PandasExecutionEngine.resolve_metrics()").  Row index continues across chunks (as if the file were read at once).
+    """
+
+    def __init__(self, execution_engine, chunk_reader_fn: ChunkReaderFn) -> None:
+        super().__init__(execution_engine=execution_engine)
+        self._chunk_reader_fn = chunk_reader_fn
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        raise gx_exceptions.ExecutionEngineError(
+            "PandasChunkedBatchData is read in chunks and cannot be accessed as a single DataFrame."
+        )
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        return self._chunk_reader_fn()
+
+    def head(self, n_rows: int = 5) -> pd.DataFrame:
+        chunk: pd.DataFrame
+        for chunk in self.iter_chunks():
+            return chunk.head(n=n_rows)
+
+        return pd.DataFrame({})
+
+
+def get_csv_chunk_reader_fn(path, chunk_size: int, **reader_options) -> ChunkReaderFn:
+    def _read_csv_chunks() -> Iterator[pd.DataFrame]:
+        with pd.read_csv(path, chunksize=chunk_size, **reader_options) as reader:
+            yield from reader
+
+    return _read_csv_chunks
+
+
+def get_parquet_chunk_reader_fn(
+    path, chunk_size: int, **reader_options
+) -> ChunkReaderFn:
+    if not pyarrow:
+        raise gx_exceptions.ExecutionEngineError(
+            "Reading Parquet files in chunks requires pyarrow; please 'pip install pyarrow'."
+        )
+
+    unsupported_reader_options: set = set(reader_options) - {"columns"}
+    if unsupported_reader_options:
+        raise gx_exceptions.ExecutionEngineError(
+            f"""Reader options {sorted(unsupported_reader_options)} are not supported when reading Parquet files in \
+chunks."""
+        )
+
+    def _read_parquet_chunks() -> Iterator[pd.DataFrame]:
+        parquet_file = parquet.ParquetFile(path)
+        offset: int = 0
+        record_batch: pyarrow.RecordBatch
+        chunk: pd.DataFrame
+        for record_batch in parquet_file.iter_batches(
+            batch_size=chunk_size, columns=reader_options.get("columns")
+        ):
+            chunk = record_batch.to_pandas()
+            chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+    return _read_parquet_chunks
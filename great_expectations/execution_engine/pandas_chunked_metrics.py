@@ -0,0 +1,487 @@
+"""Merging of metric values computed over chunks of "PandasChunkedBatchData" into metric values over the whole Batch.
+
+Each mergeable metric has a "ChunkedMetricMerger", which reduces per-chunk metric value to (small) partial state and
+combines partial states of all chunks.  Partial function metrics (e.g., map conditions) are only ever evaluated per
+chunk, as dependencies of mergeable metrics; other metrics cannot be computed over chunked Batch data.
+
+Metrics requested with "allow_relative_error" keep fixed-memory sketches (see "great_expectations.core.sketches") as
+partial states, so that distinct counts, heavy hitters, and quantiles are mergeable as well.
+"""
+from __future__ import annotations
+
+import ast
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.core.sketches import (
+    HyperLogLogSketch,
+    KllSketch,
+    SpaceSavingSketch,
+    get_sketch_relative_error,
+    is_sketch_relative_error,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+
+
+class ChunkLocalMetricValue:
+    """Stands in for value of partial function metric, which only exists per chunk (and is never merged)."""
+
+    def __init__(self, metric_id: Tuple[str, str, str]) -> None:
+        self._metric_id = metric_id
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self._metric_id}>"
+
+
+class ChunkedMetricMerger(ABC):
+    """Combines per-chunk values of one metric into metric value over all chunks."""
+
+    def get_chunk_state(
+        self,
+        metric_value: Any,
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+    ) -> Any:
+        """Reduces metric value computed over chunk (loaded into "chunk_execution_engine") to mergeable state."""
+        return metric_value
+
+    @abstractmethod
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        pass
+
+
+class FirstChunkMerger(ChunkedMetricMerger):
+    """For metrics, which do not depend on rows (e.g., "table.columns")."""
+
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        return chunk_states[0] if chunk_states else None
+
+
+class SumMerger(ChunkedMetricMerger):
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        return sum(chunk_states)
+
+
+class MinMerger(ChunkedMetricMerger):
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        return pd.Series(chunk_states, dtype=object).dropna().min()
+
+
+class MaxMerger(ChunkedMetricMerger):
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        return pd.Series(chunk_states, dtype=object).dropna().max()
+
+
+class MeanMerger(ChunkedMetricMerger):
+    """Averages per-chunk means, weighted by numbers of non-null column values in chunks."""
+
+    def get_chunk_state(
+        self,
+        metric_value: Any,
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+    ) -> Tuple[Any, int]:
+        domain_records: pd.DataFrame = chunk_execution_engine.get_domain_records(
+            domain_kwargs=metric_configuration.metric_domain_kwargs
+        )
+        column_name: str = metric_configuration.metric_domain_kwargs["column"]
+        return metric_value, int(domain_records[column_name].count())
+
+    def merge(
+        self,
+        chunk_states: List[Tuple[Any, int]],
+        metric_configuration: MetricConfiguration,
+    ) -> Any:
+        total_count: int = sum(count for _, count in chunk_states)
+        if total_count == 0:
+            return float("nan")
+
+        return (
+            sum(mean * count for mean, count in chunk_states if count > 0) / total_count
+        )
+
+
+class DistinctValuesMerger(ChunkedMetricMerger):
+    def merge(
+        self, chunk_states: List[set], metric_configuration: MetricConfiguration
+    ) -> set:
+        return set().union(*chunk_states)
+
+
+class DistinctValuesCountMerger(ChunkedMetricMerger):
+    """Counts distinct values of union of per-chunk distinct value sets (per-chunk counts are not mergeable).
+
+    If "allow_relative_error" is set, per-chunk "HyperLogLogSketch" objects (of fixed size) stand in for value sets.
+    """
+
+    def get_chunk_state(
+        self,
+        metric_value: Any,
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+    ) -> Union[set, HyperLogLogSketch]:
+        column: pd.Series = _get_chunk_column(
+            metric_configuration=metric_configuration,
+            chunk_execution_engine=chunk_execution_engine,
+        )
+        relative_error: Optional[float] = _get_relative_error(
+            metric_configuration=metric_configuration
+        )
+        if relative_error is None:
+            return set(column.dropna().unique())
+
+        sketch = HyperLogLogSketch.from_relative_error(relative_error=relative_error)
+        sketch.update_many(items=column)
+        return sketch
+
+    def merge(
+        self,
+        chunk_states: List[Union[set, HyperLogLogSketch]],
+        metric_configuration: MetricConfiguration,
+    ) -> int:
+        if _get_relative_error(metric_configuration=metric_configuration) is None:
+            return len(set().union(*chunk_states))
+
+        sketch: HyperLogLogSketch = chunk_states[0]
+        other: HyperLogLogSketch
+        for other in chunk_states[1:]:
+            sketch.merge(other=other)
+
+        return sketch.count()
+
+
+class ValueCountsMerger(ChunkedMetricMerger):
+    """Adds per-chunk value counts and re-applies sorting of "column.value_counts" metric.
+
+    If "allow_relative_error" is set, per-chunk value counts are summarized by "SpaceSavingSketch" objects (of fixed
+    size), and only heavy hitters (values, whose estimated count reaches "relative_error" times number of values) remain.
+    """
+
+    def get_chunk_state(
+        self,
+        metric_value: Any,
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+    ) -> Union[pd.Series, SpaceSavingSketch]:
+        relative_error: Optional[float] = _get_relative_error(
+            metric_configuration=metric_configuration
+        )
+        if relative_error is None:
+            return metric_value
+
+        # Per-chunk metric value only holds heavy hitters of chunk; all counts of chunk are summarized instead.
+        sketch = SpaceSavingSketch.from_relative_error(relative_error=relative_error)
+        sketch.update_counts(
+            counts=_get_chunk_column(
+                metric_configuration=metric_configuration,
+                chunk_execution_engine=chunk_execution_engine,
+            )
+            .value_counts()
+            .to_dict()
+        )
+        return sketch
+
+    def merge(
+        self,
+        chunk_states: List[Union[pd.Series, SpaceSavingSketch]],
+        metric_configuration: MetricConfiguration,
+    ) -> pd.Series:
+        relative_error: Optional[float] = _get_relative_error(
+            metric_configuration=metric_configuration
+        )
+        if relative_error is None:
+            counts: pd.Series = _add_value_counts(value_counts=chunk_states)
+        else:
+            counts = _get_heavy_hitter_counts(
+                sketches=chunk_states, relative_error=relative_error
+            )
+
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs or {}
+        if metric_value_kwargs.get("sort", "value") == "value":
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                # Having values of multiple types in a object dtype column (e.g., strings and floats)
+                # raises a TypeError when the sorting method performs comparisons.
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+
+        return counts
+
+
+class QuantileValuesMerger(ChunkedMetricMerger):
+    """Estimates quantiles from merged per-chunk "KllSketch" objects (only if "allow_relative_error" is set)."""
+
+    def get_chunk_state(
+        self,
+        metric_value: Any,
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+    ) -> KllSketch:
+        relative_error: Optional[float] = _get_relative_error(
+            metric_configuration=metric_configuration
+        )
+        if relative_error is None:
+            raise gx_exceptions.ExecutionEngineError(
+                f"""Metric "{metric_configuration.metric_name}" can only be computed over chunked Batch data \
+approximately; please set "allow_relative_error"."""
+            )
+
+        sketch = KllSketch.from_relative_error(relative_error=relative_error)
+        sketch.update_many(
+            items=_get_chunk_column(
+                metric_configuration=metric_configuration,
+                chunk_execution_engine=chunk_execution_engine,
+            )
+            .dropna()
+            .tolist()
+        )
+        return sketch
+
+    def merge(
+        self, chunk_states: List[KllSketch], metric_configuration: MetricConfiguration
+    ) -> list:
+        sketch: KllSketch = chunk_states[0]
+        other: KllSketch
+        for other in chunk_states[1:]:
+            sketch.merge(other=other)
+
+        return sketch.quantiles(
+            quantiles=metric_configuration.metric_value_kwargs["quantiles"]
+        )
+
+
+class TableHeadMerger(ChunkedMetricMerger):
+    def merge(
+        self,
+        chunk_states: List[pd.DataFrame],
+        metric_configuration: MetricConfiguration,
+    ) -> pd.DataFrame:
+        df: pd.DataFrame = pd.concat(chunk_states) if chunk_states else pd.DataFrame()
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs or {}
+        if metric_value_kwargs.get("fetch_all", False):
+            return df
+
+        n_rows: int = (
+            metric_value_kwargs.get("n_rows")
+            if metric_value_kwargs.get("n_rows") is not None
+            else 5  # noqa: PLR2004
+        )
+        return df.head(n=n_rows)
+
+
+class UnexpectedListMerger(ChunkedMetricMerger):
+    """Concatenates per-chunk lists (or DataFrames) and truncates them according to "result_format"."""
+
+    def merge(
+        self, chunk_states: List[Any], metric_configuration: MetricConfiguration
+    ) -> Any:
+        if chunk_states and isinstance(chunk_states[0], pd.DataFrame):
+            merged: Any = pd.concat(chunk_states)
+        else:
+            merged = [item for chunk_state in chunk_states for item in chunk_state]
+
+        return _truncate_to_result_format(
+            value=merged, metric_configuration=metric_configuration
+        )
+
+
+class UnexpectedValueCountsMerger(ChunkedMetricMerger):
+    def merge(
+        self,
+        chunk_states: List[pd.Series],
+        metric_configuration: MetricConfiguration,
+    ) -> pd.Series:
+        return _truncate_to_result_format(
+            value=_add_value_counts(value_counts=chunk_states),
+            metric_configuration=metric_configuration,
+        )
+
+
+class UnexpectedIndexQueryMerger(ChunkedMetricMerger):
+    """Combines per-chunk "df.filter(items=[...], axis=0)" queries into one query over all unexpected indices."""
+
+    _QUERY_PATTERN = re.compile(r"^df\.filter\(items=(\[.*\]), axis=0\)$", re.DOTALL)
+
+    def merge(
+        self,
+        chunk_states: List[Optional[str]],
+        metric_configuration: MetricConfiguration,
+    ) -> Optional[str]:
+        if all(chunk_state is None for chunk_state in chunk_states):
+            return None
+
+        index_list: list = []
+        chunk_state: Optional[str]
+        for chunk_state in chunk_states:
+            if chunk_state is None:
+                continue
+
+            match = self._QUERY_PATTERN.match(chunk_state)
+            if match is None:
+                return chunk_state
+
+            index_list.extend(ast.literal_eval(match.group(1)))
+
+        return f"df.filter(items={index_list}, axis=0)"
+
+
+def _get_relative_error(metric_configuration: MetricConfiguration) -> Optional[float]:
+    """Returns relative error target of sketch (or None, if approximate metric is not requested)."""
+    allow_relative_error: Any = (metric_configuration.metric_value_kwargs or {}).get(
+        "allow_relative_error", False
+    )
+    if not is_sketch_relative_error(allow_relative_error=allow_relative_error):
+        return None
+
+    return get_sketch_relative_error(allow_relative_error=allow_relative_error)
+
+
+def _get_chunk_column(
+    metric_configuration: MetricConfiguration,
+    chunk_execution_engine: PandasExecutionEngine,
+) -> pd.Series:
+    return chunk_execution_engine.get_domain_column_values(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        column_name=metric_configuration.metric_domain_kwargs["column"],
+    )
+
+
+def _get_heavy_hitter_counts(
+    sketches: List[SpaceSavingSketch], relative_error: float
+) -> pd.Series:
+    sketch: SpaceSavingSketch = sketches[0]
+    other: SpaceSavingSketch
+    for other in sketches[1:]:
+        sketch.merge(other=other)
+
+    heavy_hitters: List[Tuple[Any, int, int]] = sketch.heavy_hitters(
+        min_count=relative_error * sketch.num_items
+    )
+    return pd.Series(
+        [count for _, count, _ in heavy_hitters],
+        index=pd.Index([item for item, _, _ in heavy_hitters], dtype=object),
+        dtype="int64",
+    )
+
+
+def _add_value_counts(value_counts: List[pd.Series]) -> pd.Series:
+    if not value_counts:
+        return pd.Series(dtype=int)
+
+    return (
+        pd.concat(value_counts)
+        .groupby(level=0, sort=False)
+        .sum()
+        .rename(value_counts[0].name)
+    )
+
+
+def _truncate_to_result_format(value: Any, metric_configuration: MetricConfiguration):
+    result_format: dict = (metric_configuration.metric_value_kwargs or {}).get(
+        "result_format", {}
+    )
+    if not isinstance(result_format, dict) or "partial_unexpected_count" not in (
+        result_format
+    ):
+        return value
+
+    if result_format.get("result_format") == "COMPLETE":
+        return value
+
+    return value[: result_format["partial_unexpected_count"]]
+
+
+CHUNKED_METRIC_MERGERS_BY_METRIC_NAME: Dict[str, ChunkedMetricMerger] = {
+    "table.columns": FirstChunkMerger(),
+    "table.column_types": FirstChunkMerger(),
+    "table.column_count": FirstChunkMerger(),
+    "table.row_count": SumMerger(),
+    "table.head": TableHeadMerger(),
+    "column.min": MinMerger(),
+    "column.max": MaxMerger(),
+    "column_values.length.min": MinMerger(),
+    "column_values.length.max": MaxMerger(),
+    "column_values.nonnull.count": SumMerger(),
+    "column_values.null.count": SumMerger(),
+    "column_values.between.count": SumMerger(),
+    "column.sum": SumMerger(),
+    "column.mean": MeanMerger(),
+    "column.distinct_values": DistinctValuesMerger(),
+    "column.distinct_values.count": DistinctValuesCountMerger(),
+    "column.value_counts": ValueCountsMerger(),
+    "column.quantile_values": QuantileValuesMerger(),
+}
+
+CHUNKED_METRIC_MERGERS_BY_METRIC_NAME_SUFFIX: Dict[str, ChunkedMetricMerger] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: SumMerger(),
+    SummarizationMetricNameSuffixes.FILTERED_ROW_COUNT.value: SumMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: UnexpectedListMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value: UnexpectedListMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value: UnexpectedListMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUE_COUNTS.value: UnexpectedValueCountsMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value: UnexpectedIndexQueryMerger(),
+}
+
+# Map metrics, whose condition for a row depends on other rows (so that their per-chunk values cannot be merged).
+NON_ROW_LOCAL_MAP_METRIC_NAMES: Tuple[str, ...] = (
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.unique",
+    "compound_columns.count",
+)
+
+CHUNK_LOCAL_METRIC_NAME_SUFFIXES: Tuple[str, ...] = (
+    MetricPartialFunctionTypeSuffixes.MAP.value,
+    MetricPartialFunctionTypeSuffixes.CONDITION.value,
+)
+
+
+def get_chunked_metric_merger(metric_name: str) -> Optional[ChunkedMetricMerger]:
+    """Returns merger for metric (or None, if metric values over chunks cannot be merged)."""
+    if _is_non_row_local_map_metric(metric_name=metric_name):
+        return None
+
+    if metric_name in CHUNKED_METRIC_MERGERS_BY_METRIC_NAME:
+        return CHUNKED_METRIC_MERGERS_BY_METRIC_NAME[metric_name]
+
+    return CHUNKED_METRIC_MERGERS_BY_METRIC_NAME_SUFFIX.get(metric_name.split(".")[-1])
+
+
+def is_chunk_local_metric(metric_name: str) -> bool:
+    """Determines whether or not metric is partial function, computed per chunk only (as dependency)."""
+    return (
+        not _is_non_row_local_map_metric(metric_name=metric_name)
+        and metric_name.split(".")[-1] in CHUNK_LOCAL_METRIC_NAME_SUFFIXES
+    )
+
+
+def _is_non_row_local_map_metric(metric_name: str) -> bool:
+    return any(
+        metric_name == map_metric_name or metric_name.startswith(f"{map_metric_name}.")
+        for map_metric_name in NON_ROW_LOCAL_MAP_METRIC_NAMES
+    )
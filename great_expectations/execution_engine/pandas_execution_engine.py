@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import datetime
-import hashlib
 import logging
-import pickle
 from functools import partial
 from io import BytesIO
 from typing import (
@@ -12,6 +10,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,6 +18,7 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
@@ -38,14 +38,38 @@ from great_expectations.core.batch_spec import (
     S3BatchSpec,
 )
 from great_expectations.core.metric_domain_types import (
-    MetricDomainTypes,  # noqa: TCH001
+    MetricDomainTypes,
 )
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,  # noqa: TCH001
     SplitDomainKwargs,  # noqa: TCH001
 )
+from great_expectations.execution_engine.pandas_arrow_util import (
+    SUPPORTED_DTYPE_BACKENDS,
+    convert_to_arrow_backed_dataframe,
+)
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_batch_fingerprint import (
+    BATCH_FINGERPRINT_METHODS,
+    DEFAULT_FINGERPRINT_SAMPLE_SIZE,
+    FULL_FINGERPRINT_METHOD,
+    get_pandas_batch_fingerprint,
+    hash_pandas_dataframe,  # noqa: F401 # kept importable from this module
+)
+from great_expectations.execution_engine.pandas_chunked_batch_data import (
+    ChunkReaderFn,
+    PandasChunkedBatchData,
+    get_csv_chunk_reader_fn,
+    get_parquet_chunk_reader_fn,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    ChunkedMetricMerger,
+    ChunkLocalMetricValue,
+    get_chunked_metric_merger,
+    is_chunk_local_metric,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
@@ -56,10 +80,11 @@ from great_expectations.execution_engine.split_and_sample.pandas_data_splitter i
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
-logger = logging.getLogger(__name__)
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
+logger = logging.getLogger(__name__)
 
-HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
@@ -74,6 +99,17 @@ class PandasExecutionEngine(ExecutionEngine):
         *args: Positional arguments for configuring PandasExecutionEngine
         **kwargs: Keyword arguments for configuring PandasExecutionEngine
 
+    If "chunk_size" (number of rows) is configured, then local CSV and Parquet files are not loaded into memory;
+    instead, metrics are computed over chunks of at most "chunk_size" rows, read one at a time, and merged.
+
+    If "dtype_backend" is "pyarrow", then string columns of loaded Batch data are Arrow-backed, and string metrics
+    (regular expressions, value lengths, set membership, nulls, value counts) use "pyarrow.compute" kernels.
+
+    "batch_fingerprint_method" selects how Batch data is fingerprinted: "full" (default; hashes every value),
+    "file_metadata", "parquet_footer", "sample" (hashes at most "batch_fingerprint_sample_size" evenly spaced rows,
+    along with shape, columns, and dtypes), or "none".  Exact fingerprints are recorded as "pandas_data_fingerprint"
+    batch marker; sampled ones as "pandas_data_sample_fingerprint".  See "pandas_batch_fingerprint" module for details.
+
     For example:
     ```python
         execution_engine: ExecutionEngine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
@@ -112,6 +148,48 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int)
+            or isinstance(chunk_size, bool)
+            or chunk_size < 1
+        ):
+            raise gx_exceptions.ExecutionEngineError(
+                f'"chunk_size" must be a positive integer (number of rows); received "{chunk_size}".'
+            )
+
+        self._chunk_size = chunk_size
+
+        dtype_backend: Optional[str] = kwargs.pop("dtype_backend", None)
+        if dtype_backend is not None and dtype_backend not in SUPPORTED_DTYPE_BACKENDS:
+            raise gx_exceptions.ExecutionEngineError(
+                f'"dtype_backend" must be one of {SUPPORTED_DTYPE_BACKENDS}; received "{dtype_backend}".'
+            )
+
+        self._dtype_backend = dtype_backend
+
+        batch_fingerprint_method: str = kwargs.pop(
+            "batch_fingerprint_method", FULL_FINGERPRINT_METHOD
+        )
+        if batch_fingerprint_method not in BATCH_FINGERPRINT_METHODS:
+            raise gx_exceptions.ExecutionEngineError(
+                f'"batch_fingerprint_method" must be one of {BATCH_FINGERPRINT_METHODS}; received "{batch_fingerprint_method}".'
+            )
+
+        batch_fingerprint_sample_size: int = kwargs.pop(
+            "batch_fingerprint_sample_size", DEFAULT_FINGERPRINT_SAMPLE_SIZE
+        )
+        if (
+            not isinstance(batch_fingerprint_sample_size, int)
+            or isinstance(batch_fingerprint_sample_size, bool)
+            or batch_fingerprint_sample_size < 1
+        ):
+            raise gx_exceptions.ExecutionEngineError(
+                f'"batch_fingerprint_sample_size" must be a positive integer (number of rows); received "{batch_fingerprint_sample_size}".'
+            )
+
+        self._batch_fingerprint_method = batch_fingerprint_method
+        self._batch_fingerprint_sample_size = batch_fingerprint_sample_size
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -119,6 +197,9 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        # Boolean masks of Domain records (keyed by Batch and row filtering directives) are shared by all metrics.
+        self._domain_masks: Dict[tuple, Optional[np.ndarray]] = {}
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -129,6 +210,16 @@ class PandasExecutionEngine(ExecutionEngine):
                 "gcs_options": gcs_options,
             }
         )
+        if chunk_size is not None:
+            self._config["chunk_size"] = chunk_size
+        if dtype_backend is not None:
+            self._config["dtype_backend"] = dtype_backend
+        if batch_fingerprint_method != FULL_FINGERPRINT_METHOD:
+            self._config["batch_fingerprint_method"] = batch_fingerprint_method
+        if batch_fingerprint_sample_size != DEFAULT_FINGERPRINT_SAMPLE_SIZE:
+            self._config[
+                "batch_fingerprint_sample_size"
+            ] = batch_fingerprint_sample_size
 
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
@@ -190,15 +281,21 @@ class PandasExecutionEngine(ExecutionEngine):
         validator.expose_dataframe_methods = True
 
     def load_batch_data(
-        self, batch_id: str, batch_data: Union[PandasBatchData, pd.DataFrame]
+        self,
+        batch_id: str,
+        batch_data: Union[PandasBatchData, PandasChunkedBatchData, pd.DataFrame],
     ) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
-        elif not isinstance(batch_data, PandasBatchData):
+        elif not isinstance(batch_data, (PandasBatchData, PandasChunkedBatchData)):
             raise gx_exceptions.GreatExpectationsError(
-                "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
+                "PandasExecutionEngine requires batch data that is either a DataFrame, a PandasBatchData, or a \
+PandasChunkedBatchData object"
             )
 
+        self._domain_masks = {
+            key: mask for key, mask in self._domain_masks.items() if key[0] != batch_id
+        }
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
@@ -213,6 +310,11 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        # Describe file (or cloud storage object) read, so that its Batch data can be fingerprinted without hashing it.
+        file_metadata: Optional[dict] = None
+        file_path: Optional[str] = None
+        file_buffer: Optional[BytesIO] = None
+
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -267,6 +369,13 @@ class PandasExecutionEngine(ExecutionEngine):
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
+            file_metadata = {
+                "path": path,
+                "etag": s3_object.get("ETag"),
+                "size": s3_object.get("ContentLength"),
+                "last_modified": s3_object.get("LastModified"),
+            }
+            file_buffer = buf
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -293,6 +402,13 @@ class PandasExecutionEngine(ExecutionEngine):
             buf = BytesIO(azure_object.readall())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
+            file_metadata = {
+                "path": path,
+                "etag": azure_object.properties.etag,
+                "size": azure_object.properties.size,
+                "last_modified": azure_object.properties.last_modified,
+            }
+            file_buffer = buf
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -322,14 +438,30 @@ Bucket: {error}"""
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
+            # Download populates ETag and generation of blob (from response headers).
+            if gcs_blob.etag is not None or gcs_blob.generation is not None:
+                file_metadata = {
+                    "path": batch_spec.path,
+                    "etag": gcs_blob.etag,
+                    "generation": gcs_blob.generation,
+                    "size": gcs_blob.size,
+                }
+            file_buffer = buf
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
+            if self._chunk_size is not None:
+                return (
+                    self._get_chunked_batch_data(batch_spec=batch_spec),
+                    batch_markers,
+                )
+
             reader_fn = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
+            file_path = path
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
@@ -356,13 +488,63 @@ not {batch_spec.__class__.__name__}"""
             )
 
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        batch_fingerprint: Optional[Tuple[str, str]] = get_pandas_batch_fingerprint(
+            df=df,
+            batch_spec=batch_spec,
+            method=self._batch_fingerprint_method,
+            sample_size=self._batch_fingerprint_sample_size,
+            file_metadata=file_metadata,
+            file_path=file_path,
+            file_buffer=file_buffer,
+        )
+        if batch_fingerprint is not None:
+            batch_markers[batch_fingerprint[0]] = batch_fingerprint[1]
+
+        if self._dtype_backend is not None:
+            df = convert_to_arrow_backed_dataframe(df=df)
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
         return typed_batch_data, batch_markers
 
+    def _get_chunked_batch_data(
+        self, batch_spec: PathBatchSpec
+    ) -> PandasChunkedBatchData:
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            raise gx_exceptions.ExecutionEngineError(
+                "Splitting and sampling are not supported, when PandasExecutionEngine reads files in chunks."
+            )
+
+        path: str = batch_spec.path
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options: dict = dict(batch_spec.reader_options or {})
+        if reader_method is None:
+            path_guess: dict = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {
+                **(path_guess.get("reader_options") or {}),
+                **reader_options,
+            }
+
+        chunk_reader_fn: ChunkReaderFn
+        if reader_method == "read_csv":
+            chunk_reader_fn = get_csv_chunk_reader_fn(
+                path, chunk_size=self._chunk_size, **reader_options
+            )
+        elif reader_method == "read_parquet":
+            chunk_reader_fn = get_parquet_chunk_reader_fn(
+                path, chunk_size=self._chunk_size, **reader_options
+            )
+        else:
+            raise gx_exceptions.ExecutionEngineError(
+                f'Reader method "{reader_method}" does not support reading files in chunks; only "read_csv" and \
+"read_parquet" do.'
+            )
+
+        return PandasChunkedBatchData(
+            execution_engine=self, chunk_reader_fn=chunk_reader_fn
+        )
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         splitter_method_name: Optional[str] = batch_spec.get("splitter_method")
         if splitter_method_name:
@@ -483,6 +665,214 @@ not {batch_spec.__class__.__name__}"""
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Metrics of Batches loaded as "PandasChunkedBatchData" are computed per chunk and merged; all other metrics
+        are resolved as usual (see "ExecutionEngine.resolve_metrics()").
+        """
+        metrics_to_resolve = list(metrics_to_resolve)
+
+        chunked_metrics_to_resolve: List[MetricConfiguration] = []
+        other_metrics_to_resolve: List[MetricConfiguration] = []
+
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            if isinstance(
+                self._get_metric_batch_data(metric_configuration=metric_to_resolve),
+                PandasChunkedBatchData,
+            ):
+                chunked_metrics_to_resolve.append(metric_to_resolve)
+            else:
+                other_metrics_to_resolve.append(metric_to_resolve)
+
+        if not chunked_metrics_to_resolve:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if other_metrics_to_resolve:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=other_metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        resolved_metrics.update(
+            self._resolve_metrics_over_chunks(
+                metrics_to_resolve=chunked_metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+        return resolved_metrics
+
+    def _get_metric_batch_data(self, metric_configuration: MetricConfiguration) -> Any:
+        batch_id: Optional[str] = (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self.batch_manager.active_batch_data_id
+        )
+        return self.batch_manager.batch_data_cache.get(batch_id)  # type: ignore[arg-type]
+
+    def _get_metric_trace_args(
+        self, metric_computation_configuration: MetricComputationConfiguration
+    ) -> dict:
+        """Adds number of rows of Batch data, over which metric is computed, to trace event."""
+        trace_args: dict = super()._get_metric_trace_args(
+            metric_computation_configuration=metric_computation_configuration
+        )
+        if not trace_args:
+            return trace_args
+
+        batch_data: Any = self._get_metric_batch_data(
+            metric_configuration=metric_computation_configuration.metric_configuration
+        )
+        if isinstance(batch_data, PandasBatchData):
+            trace_args["rows_scanned"] = len(batch_data.dataframe)
+
+        return trace_args
+
+    def _resolve_metrics_over_chunks(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes metrics over "PandasChunkedBatchData" in one pass over its chunks.
+
+        Partial function metrics (e.g., map conditions) only exist per chunk and resolve to "ChunkLocalMetricValue"
+        placeholders.  Every other metric must have "ChunkedMetricMerger"; it is computed (together with its
+        chunk-local dependencies) over each chunk, loaded into auxiliary "PandasExecutionEngine", and per-chunk values
+        are merged.  Already resolved (whole Batch) dependencies are reused as is.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        mergeable_metrics_by_batch_id: Dict[
+            Optional[str], List[Tuple[MetricConfiguration, ChunkedMetricMerger]]
+        ] = {}
+
+        metric_to_resolve: MetricConfiguration
+        merger: Optional[ChunkedMetricMerger]
+        for metric_to_resolve in metrics_to_resolve:
+            if is_chunk_local_metric(metric_name=metric_to_resolve.metric_name):
+                resolved_metrics[metric_to_resolve.id] = ChunkLocalMetricValue(
+                    metric_id=metric_to_resolve.id
+                )
+                continue
+
+            merger = get_chunked_metric_merger(
+                metric_name=metric_to_resolve.metric_name
+            )
+            if merger is None:
+                raise gx_exceptions.ExecutionEngineError(
+                    f'Metric "{metric_to_resolve.metric_name}" cannot be computed over batch data read in chunks; \
+please configure PandasExecutionEngine without "chunk_size" to compute it.'
+                )
+
+            mergeable_metrics_by_batch_id.setdefault(
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.batch_manager.active_batch_data_id,
+                [],
+            ).append((metric_to_resolve, merger))
+
+        batch_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+            metric_id: metric_value
+            for metric_id, metric_value in (metrics or {}).items()
+            if not isinstance(metric_value, ChunkLocalMetricValue)
+        }
+
+        batch_id: Optional[str]
+        mergeable_metrics: List[Tuple[MetricConfiguration, ChunkedMetricMerger]]
+        batch_data: PandasChunkedBatchData
+        chunk_execution_engine: PandasExecutionEngine
+        chunk_states: Dict[Tuple[str, str, str], list]
+        chunk: pd.DataFrame
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue]
+        for batch_id, mergeable_metrics in mergeable_metrics_by_batch_id.items():
+            batch_data = self.batch_manager.batch_data_cache[batch_id]  # type: ignore[index,assignment]
+            chunk_execution_engine = PandasExecutionEngine(
+                caching=False,
+                discard_subset_failing_expectations=self.discard_subset_failing_expectations,
+            )
+            chunk_states = {
+                metric_to_resolve.id: [] for metric_to_resolve, _ in mergeable_metrics
+            }
+            with self._metric_resolution_tracer.span(
+                name="chunk_pass",
+                category="metric_bundle",
+                args={"batch_id": batch_id, "rows_scanned": 0, "chunks": 0},
+                metric_ids=[
+                    metric_to_resolve.id for metric_to_resolve, _ in mergeable_metrics
+                ],
+            ) as trace_args:
+                for chunk in batch_data.iter_chunks():
+                    chunk_execution_engine.load_batch_data(
+                        batch_id=batch_id, batch_data=chunk  # type: ignore[arg-type]
+                    )
+                    chunk_metrics = dict(batch_metrics)
+                    for metric_to_resolve, merger in mergeable_metrics:
+                        self._resolve_metric_over_chunk(
+                            metric_configuration=metric_to_resolve,
+                            chunk_execution_engine=chunk_execution_engine,
+                            chunk_metrics=chunk_metrics,
+                            runtime_configuration=runtime_configuration,
+                        )
+                        chunk_states[metric_to_resolve.id].append(
+                            merger.get_chunk_state(
+                                metric_value=chunk_metrics[metric_to_resolve.id],
+                                metric_configuration=metric_to_resolve,
+                                chunk_execution_engine=chunk_execution_engine,
+                            )
+                        )
+
+                    trace_args["rows_scanned"] = trace_args.get(
+                        "rows_scanned", 0
+                    ) + len(chunk)
+                    trace_args["chunks"] = trace_args.get("chunks", 0) + 1
+
+            for metric_to_resolve, merger in mergeable_metrics:
+                resolved_metrics[metric_to_resolve.id] = merger.merge(
+                    chunk_states=chunk_states[metric_to_resolve.id],
+                    metric_configuration=metric_to_resolve,
+                )
+
+        return resolved_metrics
+
+    @staticmethod
+    def _resolve_metric_over_chunk(
+        metric_configuration: MetricConfiguration,
+        chunk_execution_engine: PandasExecutionEngine,
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """Resolves metric (after its dependencies, depth first) over chunk, recording values in "chunk_metrics"."""
+        if metric_configuration.id in chunk_metrics:
+            return
+
+        metric_dependency: MetricConfiguration
+        for metric_dependency in metric_configuration.metric_dependencies.values():
+            PandasExecutionEngine._resolve_metric_over_chunk(
+                metric_configuration=metric_dependency,
+                chunk_execution_engine=chunk_execution_engine,
+                chunk_metrics=chunk_metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        chunk_metrics.update(
+            chunk_execution_engine.resolve_metrics(
+                metrics_to_resolve=[metric_configuration],
+                metrics=chunk_metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+
     def resolve_metric_bundle(
         self, metric_fn_bundle
     ) -> Dict[Tuple[str, str, str], Any]:
@@ -492,7 +882,7 @@ not {batch_spec.__class__.__name__}"""
         )  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).
 
     @public_api
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -504,6 +894,63 @@ not {batch_spec.__class__.__name__}"""
         Returns:
             A DataFrame (the data on which to compute returned in the format of a Pandas DataFrame)
         """
+        data: pd.DataFrame = self._get_batch_dataframe(domain_kwargs=domain_kwargs)
+        mask: Optional[np.ndarray] = self.get_domain_mask(domain_kwargs=domain_kwargs)
+        if mask is None:
+            return data
+
+        return data[mask]
+
+    def get_domain_column_values(
+        self, domain_kwargs: dict, column_name: str
+    ) -> pd.Series:
+        """Returns values of one column of Domain records (equivalent to "get_domain_records()[column_name]").
+
+        Only the column itself is filtered by Domain mask, rather than all columns of Batch data.
+        """
+        column: pd.Series = self._get_batch_dataframe(domain_kwargs=domain_kwargs)[
+            column_name
+        ]
+        mask: Optional[np.ndarray] = self.get_domain_mask(domain_kwargs=domain_kwargs)
+        if mask is None:
+            return column
+
+        return column[mask]
+
+    def get_column_compute_domain(
+        self, domain_kwargs: dict
+    ) -> Tuple[pd.Series, dict, dict]:
+        """Counterpart of "get_compute_domain()" for "column" Domain, which returns values of Domain column (see
+        "get_domain_column_values()") instead of all columns of Domain records.
+        """
+        split_domain_kwargs: SplitDomainKwargs = self._split_domain_kwargs(
+            domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column: pd.Series = self.get_domain_column_values(
+            domain_kwargs=domain_kwargs,
+            column_name=split_domain_kwargs.accessor["column"],
+        )
+        return column, split_domain_kwargs.compute, split_domain_kwargs.accessor
+
+    def get_domain_mask(self, domain_kwargs: dict) -> Optional[np.ndarray]:
+        """Returns boolean mask, selecting Domain records (per "row_condition" and "ignore_row_if" directives) from
+        Batch data (or None, if Domain comprises all rows).
+
+        Masks are memoized per Batch and row filtering directives, so that metrics sharing Domain evaluate its
+        "row_condition" only once.
+        """
+        key: tuple = self._get_domain_mask_key(domain_kwargs=domain_kwargs)
+        if key in self._domain_masks:
+            return self._domain_masks[key]
+
+        mask: Optional[np.ndarray] = self._compute_domain_mask(
+            data=self._get_batch_dataframe(domain_kwargs=domain_kwargs),
+            domain_kwargs=domain_kwargs,
+        )
+        self._domain_masks[key] = mask
+        return mask
+
+    def _get_batch_dataframe(self, domain_kwargs: dict) -> pd.DataFrame:
         table = domain_kwargs.get("table", None)
         if table:
             raise ValueError(
@@ -514,22 +961,57 @@ not {batch_spec.__class__.__name__}"""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(
+                return cast(
                     PandasBatchData, self.batch_manager.active_batch_data
                 ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:  # noqa: PLR5501
-            if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+
+            raise gx_exceptions.ValidationError(
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(
+                PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
+            ).dataframe
+
+        raise gx_exceptions.ValidationError(
+            f"Unable to find batch with batch_id {batch_id}"
+        )
+
+    def _get_domain_mask_key(self, domain_kwargs: dict) -> tuple:
+        ignore_row_if_key: Optional[tuple] = None
+        if "column" not in domain_kwargs and (
+            "column_A" in domain_kwargs
+            and "column_B" in domain_kwargs
+            and "ignore_row_if" in domain_kwargs
+        ):
+            ignore_row_if_key = (
+                domain_kwargs["ignore_row_if"],
+                domain_kwargs["column_A"],
+                domain_kwargs["column_B"],
+            )
+        elif (
+            "column" not in domain_kwargs
+            and "column_list" in domain_kwargs
+            and "ignore_row_if" in domain_kwargs
+        ):
+            ignore_row_if_key = (
+                domain_kwargs["ignore_row_if"],
+                *domain_kwargs["column_list"],
+            )
+
+        return (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id,
+            domain_kwargs.get("row_condition") or None,
+            domain_kwargs.get("condition_parser"),
+            ignore_row_if_key,
+        )
+
+    @staticmethod
+    def _compute_domain_mask(  # noqa: C901
+        data: pd.DataFrame, domain_kwargs: dict
+    ) -> Optional[np.ndarray]:
+        mask: Optional[np.ndarray] = None
 
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
@@ -542,69 +1024,61 @@ not {batch_spec.__class__.__name__}"""
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+
+            # Evaluating row condition (as "DataFrame.query()" would, but without selecting rows).
+            mask = np.asarray(
+                data.eval(row_condition, parser=condition_parser), dtype=bool
+            )
+            if mask.shape != (len(data),):
+                raise ValueError(
+                    f'row_condition "{row_condition}" does not evaluate to a boolean value for every row.'
+                )
 
         if "column" in domain_kwargs:
-            return data
+            return mask
 
+        columns: Optional[list] = None
+        ignore_row_if: Optional[str] = None
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
+            columns = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
             ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
+            if ignore_row_if not in [
+                "both_values_are_missing",
+                "either_value_is_missing",
+                "neither",
+            ]:
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                 )
-            elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            columns = domain_kwargs["column_list"]
+            ignore_row_if = domain_kwargs["ignore_row_if"]
+            if ignore_row_if not in [
+                "all_values_are_missing",
+                "any_value_is_missing",
+                "never",
+            ]:
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                 )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
 
-            return data
+        ignore_row_if_mask: Optional[np.ndarray] = None
+        if ignore_row_if in ["both_values_are_missing", "all_values_are_missing"]:
+            ignore_row_if_mask = data[columns].notna().any(axis=1).to_numpy()
+        elif ignore_row_if in ["either_value_is_missing", "any_value_is_missing"]:
+            ignore_row_if_mask = data[columns].notna().all(axis=1).to_numpy()
 
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+        if ignore_row_if_mask is None:
+            return mask
 
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
+        if mask is None:
+            return ignore_row_if_mask
 
-            return data
-
-        return data
+        return mask & ignore_row_if_mask
 
     @public_api
     def get_compute_domain(
@@ -647,13 +1121,3 @@ not {batch_spec.__class__.__name__}"""
         )
 
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
-
-
-def hash_pandas_dataframe(df):
-    try:
-        obj = pd.util.hash_pandas_object(df, index=True).values
-    except TypeError:
-        # In case of facing unhashable objects (like dict), use pickle
-        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
-
-    return hashlib.md5(obj).hexdigest()
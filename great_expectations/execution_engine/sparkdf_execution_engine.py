@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import logging
+import threading
 from functools import reduce
 from typing import (
     Any,
@@ -50,10 +51,14 @@ from great_expectations.exceptions import (
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
-    MetricComputationConfiguration,  # noqa: TCH001
+    MetricComputationConfiguration,
     SplitDomainKwargs,  # noqa: TCH001
 )
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
+from great_expectations.execution_engine.sparkdf_metric_aggregates import (
+    SparkMetricAggregate,
+    get_spark_metric_aggregate,
+)
 from great_expectations.execution_engine.split_and_sample.sparkdf_data_sampler import (
     SparkDataSampler,
 )
@@ -94,6 +99,12 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist: If True (default), then creation of the Spark DataFrame is done outside this class
         spark_config: Dictionary of Spark configuration options
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
+        single_pass_aggregation: If True, then records of every compute Domain are persisted once (and unpersisted
+            once metric resolution is complete), and quantiles (with relative error), histograms, and unexpected counts
+            of "column_pair" and "multicolumn" map metrics are computed as part of "DataFrame.agg()" action, shared by
+            all aggregate metrics of the compute Domain (rather than by Spark jobs of their own)
+        compute_domain_storage_level: Name of "pyspark.StorageLevel" for records of compute Domains, persisted in
+            "single_pass_aggregation" mode (default is "MEMORY_AND_DISK")
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
     For example:
@@ -190,6 +201,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=True,
+        single_pass_aggregation: bool = False,
+        compute_domain_storage_level: str = "MEMORY_AND_DISK",
         **kwargs,
     ) -> None:
         self._persist = persist
@@ -206,6 +219,21 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         self.spark = spark
 
+        if not isinstance(
+            getattr(pyspark.StorageLevel, compute_domain_storage_level, None),
+            pyspark.StorageLevel,
+        ):
+            raise ExecutionEngineError(
+                f'Unrecognized compute_domain_storage_level "{compute_domain_storage_level}".'
+            )
+
+        self._single_pass_aggregation = single_pass_aggregation
+        self._compute_domain_storage_level = getattr(
+            pyspark.StorageLevel, compute_domain_storage_level
+        )
+        self._persisted_domain_records: Dict[str, pyspark.DataFrame] = {}
+        self._persisted_domain_records_lock = threading.Lock()
+
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
@@ -218,6 +246,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if single_pass_aggregation:
+            self._config["single_pass_aggregation"] = single_pass_aggregation
+        if compute_domain_storage_level != "MEMORY_AND_DISK":
+            self._config["compute_domain_storage_level"] = compute_domain_storage_level
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
@@ -468,7 +500,7 @@ illegal.  Please check your config."""
             )
 
     @public_api
-    def get_domain_records(  # noqa: C901, PLR0912, PLR0915
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> "pyspark.DataFrame":  # noqa F821
@@ -485,6 +517,15 @@ illegal.  Please check your config."""
         This may be caused by it becoming great_expectations.compatibility.not_imported.NotImported when pyspark is not installed.
         </Alex>
         """
+        if self._single_pass_aggregation:
+            return self._get_persisted_domain_records(domain_kwargs=domain_kwargs)
+
+        return self._get_domain_records(domain_kwargs=domain_kwargs)
+
+    def _get_domain_records(  # noqa: C901, PLR0912, PLR0915
+        self,
+        domain_kwargs: dict,
+    ) -> pyspark.DataFrame:
         table = domain_kwargs.get("table", None)
         if table:
             raise ValueError(
@@ -590,6 +631,61 @@ illegal.  Please check your config."""
 
         return data
 
+    def _get_persisted_domain_records(self, domain_kwargs: dict) -> pyspark.DataFrame:
+        """Returns records of Domain, persisted (with "compute_domain_storage_level") upon first request.
+
+        Domains, which only differ in keys that do not filter records (e.g., "column"), share persisted records.
+        Records already cached (e.g., Batch data loaded with "persist") are returned as they are.
+        """
+        domain_records_id: str = self._get_domain_records_id(
+            domain_kwargs=domain_kwargs
+        )
+        with self._persisted_domain_records_lock:
+            if domain_records_id in self._persisted_domain_records:
+                return self._persisted_domain_records[domain_records_id]
+
+        data: pyspark.DataFrame = self._get_domain_records(domain_kwargs=domain_kwargs)
+        if data.is_cached:
+            return data
+
+        with self._persisted_domain_records_lock:
+            if domain_records_id not in self._persisted_domain_records:
+                self._persisted_domain_records[domain_records_id] = data.persist(
+                    self._compute_domain_storage_level
+                )
+
+            return self._persisted_domain_records[domain_records_id]
+
+    def _get_domain_records_id(self, domain_kwargs: dict) -> str:
+        record_domain_kwargs: dict = {
+            key: value for key, value in domain_kwargs.items() if key != "column"
+        }
+        # Records of "column" Domain are not filtered by "ignore_row_if" directive.
+        if "column" in domain_kwargs:
+            for key in ("column_A", "column_B", "column_list", "ignore_row_if"):
+                record_domain_kwargs.pop(key, None)
+
+        record_domain_kwargs["batch_id"] = (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_id
+        )
+        record_domain_kwargs["filter_conditions"] = [
+            filter_condition.condition
+            for filter_condition in domain_kwargs.get("filter_conditions", [])
+        ]
+        return IDDict(record_domain_kwargs).to_id()
+
+    def release_metric_resolution_resources(self) -> None:
+        """Unpersists records of compute Domains, persisted in "single_pass_aggregation" mode."""
+        with self._persisted_domain_records_lock:
+            persisted_domain_records: List[pyspark.DataFrame] = list(
+                self._persisted_domain_records.values()
+            )
+            self._persisted_domain_records = {}
+
+        data: pyspark.DataFrame
+        for data in persisted_domain_records:
+            data.unpersist()
+
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
         """Combine row conditions using AND if condition_type is SPARK_SQL
@@ -700,6 +796,65 @@ illegal.  Please check your config."""
 
         return new_domain_kwargs
 
+    def _build_direct_and_bundled_metric_computation_configurations(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[
+        List[MetricComputationConfiguration],
+        List[MetricComputationConfiguration],
+    ]:
+        """In "single_pass_aggregation" mode, directly-computable metrics having aggregate form are bundled as well.
+
+        See "great_expectations.execution_engine.sparkdf_metric_aggregates" for metrics, which have aggregate form.
+        """
+        metric_fn_direct_configurations: List[MetricComputationConfiguration]
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration]
+        (
+            metric_fn_direct_configurations,
+            metric_fn_bundle_configurations,
+        ) = super()._build_direct_and_bundled_metric_computation_configurations(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        if not self._single_pass_aggregation:
+            return metric_fn_direct_configurations, metric_fn_bundle_configurations
+
+        remaining_metric_fn_direct_configurations: List[
+            MetricComputationConfiguration
+        ] = []
+
+        metric_computation_configuration: MetricComputationConfiguration
+        metric_aggregate: Optional[SparkMetricAggregate]
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            metric_aggregate = get_spark_metric_aggregate(
+                metric_configuration=metric_computation_configuration.metric_configuration,
+                metrics=metric_computation_configuration.metric_provider_kwargs[
+                    "metrics"
+                ],
+                execution_engine=self,
+            )
+            if metric_aggregate is None:
+                remaining_metric_fn_direct_configurations.append(
+                    metric_computation_configuration
+                )
+            else:
+                metric_fn_bundle_configurations.append(
+                    MetricComputationConfiguration(
+                        metric_configuration=metric_computation_configuration.metric_configuration,
+                        metric_fn=metric_aggregate,
+                        metric_provider_kwargs=metric_computation_configuration.metric_provider_kwargs,
+                        compute_domain_kwargs=metric_aggregate.compute_domain_kwargs,
+                    )
+                )
+
+        return (
+            remaining_metric_fn_direct_configurations,
+            metric_fn_bundle_configurations,
+        )
+
     def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
@@ -742,21 +897,28 @@ illegal.  Please check your config."""
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in aggregates:
                 aggregates[domain_id] = {
-                    "column_aggregates": [],
+                    "metric_fns": [],
                     "metric_ids": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
-            aggregates[domain_id]["column_aggregates"].append(metric_fn)
+            aggregates[domain_id]["metric_fns"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
 
-            assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
+            assert len(aggregate["metric_fns"]) == len(aggregate["metric_ids"])
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+            res = df.agg(
+                *[
+                    metric_fn.aggregate_fn
+                    if isinstance(metric_fn, SparkMetricAggregate)
+                    else metric_fn
+                    for metric_fn in aggregate["metric_fns"]
+                ]
+            ).collect()
 
             logger.debug(
                 f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
@@ -771,12 +933,16 @@ illegal.  Please check your config."""
 
             idx: int
             metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(aggregate["metric_ids"]):
+            for idx, (metric_id, metric_fn) in enumerate(
+                zip(aggregate["metric_ids"], aggregate["metric_fns"])
+            ):
+                value = res[0][idx]
+                if isinstance(metric_fn, SparkMetricAggregate):
+                    value = metric_fn.post_process_fn(value)
+
                 # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,
                 # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.
-                resolved_metrics[metric_id] = convert_to_json_serializable(
-                    data=res[0][idx]
-                )
+                resolved_metrics[metric_id] = convert_to_json_serializable(data=value)
 
         return resolved_metrics
 
@@ -0,0 +1,283 @@
+"""Aggregate forms of Spark metrics, which are otherwise computed by dedicated Spark jobs.
+
+In "single_pass_aggregation" mode, "SparkDFExecutionEngine" computes directly-computable metrics listed here as
+aggregate expressions; these are bundled with aggregate metrics of the same compute Domain and evaluated by one
+"DataFrame.agg()" action per compute Domain (instead of "approxQuantile()", "Bucketizer", or "count()" jobs of their own).
+
+Each "SparkMetricAggregateBuilder" declines (returns None) metric configurations, for which aggregate form would not
+reproduce result of dedicated Spark job; such metrics are computed by their metric functions, as usual.
+"""
+from __future__ import annotations
+
+import logging
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import pyspark
+    from great_expectations.execution_engine import SparkDFExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SparkMetricAggregate:
+    """Aggregate expression, computing metric over records of compute Domain, and conversion of its value to metric.
+
+    Args:
+        aggregate_fn: aggregate "pyspark.Column" expression, evaluated in "DataFrame.agg()" over compute Domain
+        compute_domain_kwargs: Domain kwargs, whose records "aggregate_fn" is evaluated over
+        post_process_fn: converts value of "aggregate_fn" to metric value
+    """
+
+    aggregate_fn: pyspark.Column
+    compute_domain_kwargs: dict
+    post_process_fn: Callable[[Any], MetricValue]
+
+
+class SparkMetricAggregateBuilder(ABC):
+    """Expresses directly-computable metric as "SparkMetricAggregate" (when this yields same metric value)."""
+
+    @abstractmethod
+    def build(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[str, Any],
+        execution_engine: SparkDFExecutionEngine,
+    ) -> Optional[SparkMetricAggregate]:
+        pass
+
+
+class QuantileValuesAggregateBuilder(SparkMetricAggregateBuilder):
+    """Approximate quantiles by "percentile_approx()" (Spark 3.1+), having same relative error as "approxQuantile()".
+
+    Exact quantiles ("allow_relative_error" of False or 0.0) are left to "approxQuantile()", which computes them exactly.
+    """
+
+    def build(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[str, Any],
+        execution_engine: SparkDFExecutionEngine,
+    ) -> Optional[SparkMetricAggregate]:
+        if not hasattr(F, "percentile_approx"):
+            return None
+
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs or {}
+        allow_relative_error: Any = metric_value_kwargs.get(
+            "allow_relative_error", False
+        )
+        if (
+            not isinstance(allow_relative_error, float)
+            or allow_relative_error <= 0.0  # noqa: PLR2004
+            or allow_relative_error > 1.0  # noqa: PLR2004
+        ):
+            return None
+
+        compute_domain_kwargs: dict
+        accessor_domain_kwargs: dict
+        (
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = _split_column_domain_kwargs(
+            metric_configuration=metric_configuration,
+            execution_engine=execution_engine,
+        )
+        # Like "approxQuantile()", null and NaN values are ignored, and quantiles are computed over values cast to double.
+        column: pyspark.Column = F.col(accessor_domain_kwargs["column"]).cast("double")
+        return SparkMetricAggregate(
+            aggregate_fn=F.percentile_approx(
+                F.when(~F.isnan(column), column),
+                list(metric_value_kwargs["quantiles"]),
+                math.ceil(1.0 / allow_relative_error),
+            ),
+            compute_domain_kwargs=compute_domain_kwargs,
+            post_process_fn=_get_quantile_values,
+        )
+
+
+class HistogramAggregateBuilder(SparkMetricAggregateBuilder):
+    """Counts values per bin by conditional counts (instead of "Bucketizer" and "groupBy()" jobs).
+
+    Bins follow numpy convention (lower_bound <= value < upper_bound), except for last bin, which includes its upper
+    bound; values outside of bins are discarded (with warning), as is done by "column.histogram" metric function.
+    """
+
+    def build(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[str, Any],
+        execution_engine: SparkDFExecutionEngine,
+    ) -> Optional[SparkMetricAggregate]:
+        bins: List[float] = [
+            float(bin_edge)
+            for bin_edge in metric_configuration.metric_value_kwargs["bins"]
+        ]
+
+        compute_domain_kwargs: dict
+        accessor_domain_kwargs: dict
+        (
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = _split_column_domain_kwargs(
+            metric_configuration=metric_configuration,
+            execution_engine=execution_engine,
+        )
+        column: pyspark.Column = F.col(accessor_domain_kwargs["column"]).cast("double")
+        is_valid: pyspark.Column = column.isNotNull() & ~F.isnan(column)
+
+        bin_conditions: List[pyspark.Column] = [
+            (column >= lower_bound) & (column < upper_bound)
+            for lower_bound, upper_bound in zip(bins[:-2], bins[1:-1])
+        ]
+        bin_conditions.append((column >= bins[-2]) & (column <= bins[-1]))
+        bin_conditions.append(column < bins[0])
+        bin_conditions.append(column > bins[-1])
+
+        condition: pyspark.Column
+        return SparkMetricAggregate(
+            aggregate_fn=F.array(
+                *[
+                    F.count(F.when(is_valid & condition, True))
+                    for condition in bin_conditions
+                ]
+            ),
+            compute_domain_kwargs=compute_domain_kwargs,
+            post_process_fn=_get_histogram,
+        )
+
+
+class UnexpectedCountAggregateBuilder(SparkMetricAggregateBuilder):
+    """Counts unexpected rows of "column_pair" and "multicolumn" map metrics by conditional count.
+
+    (Unexpected counts of "column" map metrics are aggregate metrics already.)  Window function conditions cannot be
+    evaluated inside of "DataFrame.agg()"; hence, their unexpected counts are computed by their metric functions.
+    """
+
+    def build(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[str, Any],
+        execution_engine: SparkDFExecutionEngine,
+    ) -> Optional[SparkMetricAggregate]:
+        if "unexpected_condition" not in metrics:
+            return None
+
+        # Imported here to avoid circular import of metric registry.
+        from great_expectations.expectations.registry import get_metric_provider
+
+        condition_metric_name: str = f"{metric_configuration.metric_name.rsplit('.', 1)[0]}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}"
+        condition_metric_fn: Callable
+        _, condition_metric_fn = get_metric_provider(
+            metric_name=condition_metric_name, execution_engine=execution_engine
+        )
+        if (
+            getattr(condition_metric_fn, "metric_fn_type", None)
+            != MetricPartialFunctionTypes.MAP_CONDITION_FN
+        ):
+            return None
+
+        unexpected_condition: pyspark.Column
+        compute_domain_kwargs: dict
+        accessor_domain_kwargs: dict
+        (
+            unexpected_condition,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = metrics["unexpected_condition"]
+        # Accessor Domain kwargs are needed to apply "ignore_row_if" directive (as is done by metric function).
+        return SparkMetricAggregate(
+            aggregate_fn=F.count(F.when(unexpected_condition, True)),
+            compute_domain_kwargs=dict(
+                **compute_domain_kwargs, **accessor_domain_kwargs
+            ),
+            post_process_fn=int,
+        )
+
+
+def _split_column_domain_kwargs(
+    metric_configuration: MetricConfiguration,
+    execution_engine: SparkDFExecutionEngine,
+) -> tuple:
+    split_domain_kwargs = execution_engine._split_domain_kwargs(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
+    return split_domain_kwargs.compute, split_domain_kwargs.accessor
+
+
+def _get_quantile_values(value: Optional[list]) -> list:
+    # "percentile_approx()" over no (non-null) values is null, where "approxQuantile()" returns empty list.
+    return [] if value is None else list(value)
+
+
+def _get_histogram(value: list) -> List[int]:
+    counts: List[int] = [int(count) for count in value]
+    if counts[-2] > 0:
+        logger.warning("Discarding histogram values below lowest bin.")
+
+    if counts[-1] > 0:
+        logger.warning("Discarding histogram values above highest bin.")
+
+    return counts[:-2]
+
+
+SPARK_METRIC_AGGREGATE_BUILDERS_BY_METRIC_NAME: Dict[
+    str, SparkMetricAggregateBuilder
+] = {
+    "column.quantile_values": QuantileValuesAggregateBuilder(),
+    "column.histogram": HistogramAggregateBuilder(),
+}
+
+SPARK_METRIC_AGGREGATE_BUILDERS_BY_METRIC_NAME_SUFFIX: Dict[
+    str, SparkMetricAggregateBuilder
+] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: UnexpectedCountAggregateBuilder(),
+}
+
+
+def get_spark_metric_aggregate(
+    metric_configuration: MetricConfiguration,
+    metrics: Dict[str, Any],
+    execution_engine: SparkDFExecutionEngine,
+) -> Optional[SparkMetricAggregate]:
+    """Returns aggregate form of directly-computable metric (or None, if metric has no aggregate form).
+
+    Args:
+        metric_configuration: directly-computable metric
+        metrics: resolved metric dependencies of metric, by their names
+        execution_engine: "SparkDFExecutionEngine", computing metric
+
+    Returns:
+        "SparkMetricAggregate" to be bundled with other aggregates of its compute Domain, or None
+    """
+    metric_name: str = metric_configuration.metric_name
+    builder: Optional[
+        SparkMetricAggregateBuilder
+    ] = SPARK_METRIC_AGGREGATE_BUILDERS_BY_METRIC_NAME.get(
+        metric_name
+    ) or SPARK_METRIC_AGGREGATE_BUILDERS_BY_METRIC_NAME_SUFFIX.get(
+        metric_name.split(".")[-1]
+    )
+    if builder is None:
+        return None
+
+    return builder.build(
+        metric_configuration=metric_configuration,
+        metrics=metrics,
+        execution_engine=execution_engine,
+    )
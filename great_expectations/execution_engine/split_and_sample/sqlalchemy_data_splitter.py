@@ -16,9 +16,10 @@ not by itself.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
@@ -30,7 +31,6 @@ from great_expectations.execution_engine.split_and_sample.data_splitter import (
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 
 if TYPE_CHECKING:
-    from great_expectations.compatibility import sqlalchemy
     from great_expectations.execution_engine.sqlalchemy_execution_engine import (
         SqlAlchemyExecutionEngine,
     )
@@ -329,6 +329,7 @@ class SqlAlchemyDataSplitter(DataSplitter):
         selectable: sqlalchemy.Selectable,
         splitter_method_name: str,
         splitter_kwargs: dict,
+        batch_identifiers: Optional[dict] = None,
     ) -> List[dict]:
         """Build data used to construct batch identifiers for the input table using the provided splitter config.
 
@@ -339,6 +340,9 @@ class SqlAlchemyDataSplitter(DataSplitter):
             selectable: Selectable to split.
             splitter_method_name: Desired splitter method to use.
             splitter_kwargs: Dict of directives used by the splitter method as keyword arguments of key=value.
+            batch_identifiers: Optional (possibly partial) batch identifiers, of the same form as those returned
+                (e.g., {column_name: {"year": 2022}} for datetime splitters); only matching batch identifiers are
+                queried for (the filter is evaluated by the database, rather than applied to all distinct values).
 
         Returns:
             List of dicts of the form [{column_name: {"key": value}}]
@@ -346,6 +350,18 @@ class SqlAlchemyDataSplitter(DataSplitter):
         processed_splitter_method_name: str = self._get_splitter_method_name(
             splitter_method_name
         )
+        batch_identifiers_filter: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_batch_identifiers_filter(
+            splitter_method_name=processed_splitter_method_name,
+            splitter_kwargs=splitter_kwargs,
+            batch_identifiers=batch_identifiers,
+        )
+        if batch_identifiers_filter is not None:
+            selectable = self._filter_selectable(
+                selectable=selectable, batch_identifiers_filter=batch_identifiers_filter
+            )
+
         batch_identifiers_list: List[dict]
         if self._is_datetime_splitter(processed_splitter_method_name):
             splitter_fn_name: str = self.DATETIME_SPLITTER_METHOD_TO_GET_UNIQUE_BATCH_IDENTIFIERS_METHOD_MAPPING[
@@ -366,6 +382,74 @@ class SqlAlchemyDataSplitter(DataSplitter):
 
         return batch_identifiers_list
 
+    def _get_batch_identifiers_filter(
+        self,
+        splitter_method_name: str,
+        splitter_kwargs: dict,
+        batch_identifiers: Optional[dict],
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        """Translates (possibly partial) batch identifiers into predicate on rows of splitted selectable.
+
+        Predicates are the same as those selecting rows of a batch (e.g., "split_on_mod_integer()"); datetime splitters
+        constrain only those date parts, which are specified.  Returns None, if there is nothing to filter on.
+        """
+        if not batch_identifiers:
+            return None
+
+        if self._is_datetime_splitter(splitter_method_name):
+            column_name: str = splitter_kwargs["column_name"]
+            date_parts_dict: dict = batch_identifiers.get(column_name) or {}
+            predicates: list = [
+                sa.extract(date_part, sa.column(column_name)) == value
+                for date_part, value in date_parts_dict.items()
+                if value is not None
+            ]
+            return sa.and_(*predicates) if predicates else None
+
+        if splitter_method_name == SplitterMethod.SPLIT_ON_MULTI_COLUMN_VALUES:
+            column_values: dict = {
+                column_name: value
+                for column_name, value in batch_identifiers.items()
+                if column_name in splitter_kwargs["column_names"] and value is not None
+            }
+            return (
+                self.split_on_multi_column_values(
+                    column_names=splitter_kwargs["column_names"],
+                    batch_identifiers=column_values,
+                )
+                if column_values
+                else None
+            )
+
+        if splitter_method_name == SplitterMethod.SPLIT_ON_WHOLE_TABLE:
+            return None
+
+        if batch_identifiers.get(splitter_kwargs.get("column_name")) is None:
+            return None
+
+        return getattr(self, splitter_method_name)(
+            batch_identifiers=batch_identifiers, **splitter_kwargs
+        )
+
+    @staticmethod
+    def _filter_selectable(
+        selectable: sqlalchemy.Selectable,
+        batch_identifiers_filter: sqlalchemy.ColumnElement,
+    ) -> sqlalchemy.Selectable:
+        """Restricts selectable (table, query, or textual table reference) to rows satisfying filter."""
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+            sqlalchemy.TextualSelect
+            and isinstance(selectable, sqlalchemy.TextualSelect)
+        ):
+            selectable = selectable.subquery()
+
+        return (
+            sa.select(sa.text("*"))
+            .select_from(selectable)
+            .where(batch_identifiers_filter)
+            .subquery()
+        )
+
     def _is_datetime_splitter(self, splitter_method_name: str) -> bool:
         """Whether the splitter method is a datetime splitter.
 
@@ -73,10 +73,22 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    canonicalize_compute_domain_kwargs,
+    chunk_select_expressions,
+    get_base_domain_kwargs,
+    get_max_select_expressions,
+    is_fusible_metric_fn,
+    make_metric_fn_conditional,
+)
+from great_expectations.execution_engine.sqlalchemy_temp_table_manager import (
+    SqlAlchemyTempTableManager,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -280,6 +292,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
         concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+        max_metric_resolution_workers (int): If greater than 1, independent metrics and compute Domain bundles are \
+            resolved concurrently, in up to this many threads (ignored for dialects requiring single persisted \
+            connection, such as sqlite and mssql).
+        metric_cache (MetricCache or dict): Cache of resolved metric values, or its config (see "ExecutionEngine").
+        batch_unexpected_index_queries (bool): If True, unexpected index lists (requested with \
+            "unexpected_index_column_names") of map Expectations, which scan the same Batch selectable, are retrieved \
+            together in one query, rather than in one query (and table scan) per Expectation.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -300,15 +319,28 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        max_metric_resolution_workers: Optional[int] = None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        batch_unexpected_index_queries: bool = False,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        if concurrency is None and data_context is not None:
+            concurrency = data_context.concurrency
+
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            concurrency=concurrency,
+            max_metric_resolution_workers=max_metric_resolution_workers,
+            metric_cache=metric_cache,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._batch_unexpected_index_queries = batch_unexpected_index_queries
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by
@@ -459,6 +491,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_metric_resolution_workers": max_metric_resolution_workers,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
+            "batch_unexpected_index_queries": batch_unexpected_index_queries,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -468,6 +503,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._data_splitter = SqlAlchemyDataSplitter(dialect=self.dialect_name)
         self._data_sampler = SqlAlchemyDataSampler()
 
+        self._temp_table_manager = SqlAlchemyTempTableManager(execution_engine=self)
+
     def _setup_engine(
         self,
         kwargs: MutableMapping[str, Any],
@@ -525,6 +562,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self) -> Optional[str]:
         return self._url
 
+    @property
+    def temp_table_manager(self) -> SqlAlchemyTempTableManager:
+        """Creates (and reuses) scratch tables while computing metrics; drops them, when this engine is closed."""
+        return self._temp_table_manager
+
     @property
     def dialect(self) -> sqlalchemy.Dialect:
         return self.engine.dialect
@@ -691,26 +733,79 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             selectable = selectable.columns().subquery()
 
         # Filtering by row condition.
-        if (
-            "row_condition" in domain_kwargs
-            and domain_kwargs["row_condition"] is not None
-        ):
-            condition_parser = domain_kwargs["condition_parser"]
-            if condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_sqlalchemy(
-                    domain_kwargs["row_condition"]
-                )
-                selectable = (
-                    sa.select(sa.text("*"))
-                    .select_from(selectable)
-                    .where(parsed_condition)
-                )
-            else:
-                raise GreatExpectationsError(
-                    "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
-                )
+        row_condition_predicate: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_row_condition_predicate(domain_kwargs=domain_kwargs)
+        if row_condition_predicate is not None:
+            selectable = (
+                sa.select(sa.text("*"))
+                .select_from(selectable)
+                .where(row_condition_predicate)
+            )
 
         # Filtering by filter_conditions
+        filter_conditions_predicate: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_filter_conditions_predicate(domain_kwargs=domain_kwargs)
+        if filter_conditions_predicate is not None:
+            # SQLAlchemy 2.0 deprecated select_from() from a non-Table asset without a subquery.
+            # Implicit coercion of SELECT and textual SELECT constructs into FROM clauses is deprecated.
+            if not isinstance(selectable, (sa.Table, Subquery)):
+                selectable = selectable.subquery()
+
+            selectable = (
+                sa.select(sa.text("*"))
+                .select_from(selectable)
+                .where(filter_conditions_predicate)
+            )
+
+        # Filtering by ignore_row_if directive
+        ignore_row_if_predicate: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_ignore_row_if_predicate(domain_kwargs=domain_kwargs)
+        if ignore_row_if_predicate is not None:
+            selectable = get_sqlalchemy_selectable(
+                sa.select(sa.text("*"))
+                .select_from(get_sqlalchemy_selectable(selectable))
+                .where(ignore_row_if_predicate)
+            )
+
+        return selectable
+
+    def _get_domain_records_predicates(
+        self, domain_kwargs: dict
+    ) -> List[sqlalchemy.ColumnElement]:
+        """Returns row filtering predicates, which "get_domain_records()" applies (in order) to Batch selectable."""
+        predicate: Optional[sqlalchemy.ColumnElement]
+        return [
+            predicate
+            for predicate in (
+                self._get_row_condition_predicate(domain_kwargs=domain_kwargs),
+                self._get_filter_conditions_predicate(domain_kwargs=domain_kwargs),
+                self._get_ignore_row_if_predicate(domain_kwargs=domain_kwargs),
+            )
+            if predicate is not None
+        ]
+
+    @staticmethod
+    def _get_row_condition_predicate(
+        domain_kwargs: dict,
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        if domain_kwargs.get("row_condition") is None:
+            return None
+
+        condition_parser = domain_kwargs["condition_parser"]
+        if condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_sqlalchemy(domain_kwargs["row_condition"])
+
+        raise GreatExpectationsError(
+            "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
+        )
+
+    @staticmethod
+    def _get_filter_conditions_predicate(
+        domain_kwargs: dict,
+    ) -> Optional[sqlalchemy.ColumnElement]:
         filter_conditions: List[RowCondition] = domain_kwargs.get(
             "filter_conditions", []
         )
@@ -721,25 +816,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 filter_condition.condition_type == RowConditionParserType.GE
             ), "filter_condition must be of type GX for SqlAlchemyExecutionEngine"
 
-            # SQLAlchemy 2.0 deprecated select_from() from a non-Table asset without a subquery.
-            # Implicit coercion of SELECT and textual SELECT constructs into FROM clauses is deprecated.
-            if not isinstance(selectable, (sa.Table, Subquery)):
-                selectable = selectable.subquery()
+            return parse_condition_to_sqlalchemy(filter_condition.condition)
 
-            selectable = (
-                sa.select(sa.text("*"))
-                .select_from(selectable)
-                .where(parse_condition_to_sqlalchemy(filter_condition.condition))
-            )
-        elif len(filter_conditions) > 1:
+        if len(filter_conditions) > 1:
             raise GreatExpectationsError(
                 "SqlAlchemyExecutionEngine currently only supports a single filter condition."
             )
 
+        return None
+
+    def _get_ignore_row_if_predicate(  # noqa: C901, PLR0912
+        self, domain_kwargs: dict
+    ) -> Optional[sqlalchemy.ColumnElement]:
         if "column" in domain_kwargs:
-            return selectable
+            return None
 
-        # Filtering by ignore_row_if directive
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
@@ -765,38 +856,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                sa.column(column_A_name) == None,  # noqa: E711
-                                sa.column(column_B_name) == None,  # noqa: E711
-                            )
-                        )
+                return sa.not_(
+                    sa.and_(
+                        sa.column(column_A_name) == None,  # noqa: E711
+                        sa.column(column_B_name) == None,  # noqa: E711
                     )
                 )
-            elif ignore_row_if == "either_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                sa.column(column_A_name) == None,  # noqa: E711
-                                sa.column(column_B_name) == None,  # noqa: E711
-                            )
-                        )
+
+            if ignore_row_if == "either_value_is_missing":
+                return sa.not_(
+                    sa.or_(
+                        sa.column(column_A_name) == None,  # noqa: E711
+                        sa.column(column_B_name) == None,  # noqa: E711
                     )
                 )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
 
-            return selectable
+            if ignore_row_if != "neither":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+
+            return None
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             if cast(
@@ -812,44 +892,31 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                *(
-                                    sa.column(column_name) == None  # noqa: E711
-                                    for column_name in column_list
-                                )
-                            )
+                return sa.not_(
+                    sa.and_(
+                        *(
+                            sa.column(column_name) == None  # noqa: E711
+                            for column_name in column_list
                         )
                     )
                 )
-            elif ignore_row_if == "any_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                *(
-                                    sa.column(column_name) == None  # noqa: E711
-                                    for column_name in column_list
-                                )
-                            )
+
+            if ignore_row_if == "any_value_is_missing":
+                return sa.not_(
+                    sa.or_(
+                        *(
+                            sa.column(column_name) == None  # noqa: E711
+                            for column_name in column_list
                         )
                     )
                 )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(
-                        f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
-                    )
 
-            return selectable
+            if ignore_row_if != "never":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
 
-        return selectable
+        return None
 
     @public_api
     def get_compute_domain(
@@ -1031,9 +1098,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[sqlalchemy.Row]
-
-        # We need a different query for each Domain (where clause).
+        # We need a different query for each Domain (where clause), unless Domains are fused into one query below.
         queries: Dict[Tuple[str, str, str], dict] = {}
 
         query: dict
@@ -1045,102 +1110,377 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             metric_to_resolve: MetricConfiguration = (
                 bundled_metric_configuration.metric_configuration
             )
-            metric_fn: Any = bundled_metric_configuration.metric_fn
-            compute_domain_kwargs: dict = (
-                bundled_metric_configuration.compute_domain_kwargs or {}
+            compute_domain_kwargs: IDDict = canonicalize_compute_domain_kwargs(
+                compute_domain_kwargs=bundled_metric_configuration.compute_domain_kwargs
+                or {}
             )
-            if not isinstance(compute_domain_kwargs, IDDict):
-                compute_domain_kwargs = IDDict(compute_domain_kwargs)
-
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in queries:
                 queries[domain_id] = {
-                    "select": [],
+                    "metric_fns": [],
+                    "metric_names": [],
                     "metric_ids": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
-            if self.engine.dialect.name == "clickhouse":
-                queries[domain_id]["select"].append(
-                    metric_fn.label(
-                        metric_to_resolve.metric_name.join(
-                            random.choices(string.ascii_lowercase, k=4)
-                        )
-                    )
+            queries[domain_id]["metric_fns"].append(
+                bundled_metric_configuration.metric_fn
+            )
+            queries[domain_id]["metric_names"].append(metric_to_resolve.metric_name)
+            queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+
+        max_select_expressions: Optional[int] = get_max_select_expressions(
+            dialect_name=self.engine.dialect.name
+        )
+
+        offset: int
+        select: List[sqlalchemy.Label]
+        for query in self._fuse_bundled_metric_queries(queries=queries):
+            select = [
+                self._label_bundled_metric_fn(
+                    metric_fn=metric_fn, metric_name=metric_name
                 )
-            else:
-                queries[domain_id]["select"].append(
-                    metric_fn.label(metric_to_resolve.metric_name)
+                for metric_fn, metric_name in zip(
+                    query["metric_fns"], query["metric_names"]
+                )
+            ]
+            for offset, select_chunk in chunk_select_expressions(
+                select_expressions=select,
+                max_select_expressions=max_select_expressions,
+            ):
+                resolved_metrics.update(
+                    self._execute_bundled_metrics_query(
+                        select=select_chunk,
+                        metric_ids=query["metric_ids"][
+                            offset : offset + len(select_chunk)
+                        ],
+                        domain_kwargs=query["domain_kwargs"],
+                    )
                 )
 
-            queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+        return resolved_metrics
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs
-            )
+    def _fuse_bundled_metric_queries(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> List[dict]:
+        """Fuses per-Domain bundled metric queries, which scan the same Batch selectable, into a single query.
 
-            assert len(query["select"]) == len(query["metric_ids"])
+        Compute Domains that differ only in row filtering directives are computed in one scan of their common Batch
+        selectable; each aggregate is made conditional on row filtering predicate of its Domain.  Metrics, whose
+        expressions cannot be rewritten this way, remain in (smaller) queries against their own Domains.
+        """
+        queries_by_base_domain_id: Dict[Tuple[str, str, str], List[dict]] = {}
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(
-                    selectable, sqlalchemy.TextClause
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (
-                    sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)
-                ) or (
-                    sqlalchemy.TextualSelect
-                    and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.subquery()
-                    )
+        query: dict
+        for query in queries.values():
+            queries_by_base_domain_id.setdefault(
+                get_base_domain_kwargs(
+                    compute_domain_kwargs=query["domain_kwargs"]
+                ).to_id(),
+                [],
+            ).append(query)
+
+        dialect_name: str = self.engine.dialect.name
+
+        fused_queries: List[dict] = []
+
+        base_domain_queries: List[dict]
+        fused_query: dict
+        residual_query: dict
+        predicates: List[sqlalchemy.ColumnElement]
+        predicate: Optional[sqlalchemy.ColumnElement]
+        for base_domain_queries in queries_by_base_domain_id.values():
+            if len(base_domain_queries) < 2:  # noqa: PLR2004
+                fused_queries.extend(base_domain_queries)
+                continue
+
+            fused_query = {
+                "metric_fns": [],
+                "metric_names": [],
+                "metric_ids": [],
+                "domain_kwargs": get_base_domain_kwargs(
+                    compute_domain_kwargs=base_domain_queries[0]["domain_kwargs"]
+                ),
+            }
+            for query in base_domain_queries:
+                predicates = self._get_domain_records_predicates(
+                    domain_kwargs=query["domain_kwargs"]
+                )
+                if not predicates:
+                    predicate = None
+                elif len(predicates) == 1:
+                    predicate = predicates[0]
                 else:
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable
-                    )
+                    predicate = sa.and_(*predicates)
+
+                residual_query = {
+                    "metric_fns": [],
+                    "metric_names": [],
+                    "metric_ids": [],
+                    "domain_kwargs": query["domain_kwargs"],
+                }
+                for metric_fn, metric_name, metric_id in zip(
+                    query["metric_fns"], query["metric_names"], query["metric_ids"]
+                ):
+                    if predicate is None:
+                        fused_query["metric_fns"].append(metric_fn)
+                    elif is_fusible_metric_fn(metric_fn=metric_fn):
+                        fused_query["metric_fns"].append(
+                            make_metric_fn_conditional(
+                                metric_fn=metric_fn,
+                                predicate=predicate,
+                                dialect_name=dialect_name,
+                            )
+                        )
+                    else:
+                        residual_query["metric_fns"].append(metric_fn)
+                        residual_query["metric_names"].append(metric_name)
+                        residual_query["metric_ids"].append(metric_id)
+                        continue
+
+                    fused_query["metric_names"].append(metric_name)
+                    fused_query["metric_ids"].append(metric_id)
 
-                logger.debug(f"Attempting query {str(sa_query_object)}")
-                res = self.execute_query(sa_query_object).fetchall()
+                if residual_query["metric_ids"]:
+                    fused_queries.append(residual_query)
 
+            if fused_query["metric_ids"]:
                 logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+                    f"""SqlAlchemyExecutionEngine fused {len(fused_query["metric_ids"])} metrics from \
+{len(base_domain_queries)} domains into one query on base domain_id {fused_query["domain_kwargs"].to_id()}"""
+                )
+                fused_queries.append(fused_query)
+
+        return fused_queries
+
+    def _label_bundled_metric_fn(
+        self, metric_fn: Any, metric_name: str
+    ) -> sqlalchemy.Label:
+        if self.engine.dialect.name == "clickhouse":
+            return metric_fn.label(
+                metric_name.join(random.choices(string.ascii_lowercase, k=4))
+            )
+
+        return metric_fn.label(metric_name)
+
+    def _execute_bundled_metrics_query(
+        self,
+        select: List[sqlalchemy.Label],
+        metric_ids: List[Tuple[str, str, str]],
+        domain_kwargs: dict,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        res: List[sqlalchemy.Row]
+
+        selectable: sqlalchemy.Selectable = self.get_domain_records(
+            domain_kwargs=domain_kwargs
+        )
+
+        assert len(select) == len(metric_ids)
+
+        try:
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+                sa_query_object = sa.select(*select).select_from(
+                    selectable.columns().subquery()
+                )
+            elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+                sqlalchemy.TextualSelect
+                and isinstance(selectable, sqlalchemy.TextualSelect)
+            ):
+                sa_query_object = sa.select(*select).select_from(selectable.subquery())
+            else:
+                sa_query_object = sa.select(*select).select_from(selectable)
+
+            logger.debug(f"Attempting query {str(sa_query_object)}")
+            res = self.execute_query(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
 {IDDict(domain_kwargs).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(metric_ids) == len(res[0]), "unexpected number of metrics returned"
+
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for idx, metric_id in enumerate(metric_ids):
+            # Converting SQL query execution results into JSON-serializable format produces simple data types,
+            # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.
+            resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+
+        return resolved_metrics
+
+    def _process_direct_and_bundled_metric_computation_configurations(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Unless disabled ("batch_unexpected_index_queries"), resolves unexpected index lists, whose Domains scan the
+        same Batch selectable, together in one query per Batch selectable, before processing remaining metrics.
+
+        Should batched query fail (e.g., if dialect does not support window functions), every unexpected index list in
+        it is computed separately (so that any failure is attributed to its own metric).
+        """
+        if not self._batch_unexpected_index_queries:
+            return (
+                super()._process_direct_and_bundled_metric_computation_configurations(
+                    metric_fn_direct_configurations=metric_fn_direct_configurations,
+                    metric_fn_bundle_configurations=metric_fn_bundle_configurations,
                 )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+            )
 
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["metric_ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(query["metric_ids"]):
-                # Converting SQL query execution results into JSON-serializable format produces simple data types,
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.
-                resolved_metrics[metric_id] = convert_to_json_serializable(
-                    data=res[0][idx]
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        batched_metric_configurations: List[MetricConfiguration] = []
+
+        metric_computation_configurations: List[MetricComputationConfiguration]
+        for (
+            metric_computation_configurations
+        ) in self._group_unexpected_index_list_metric_computation_configurations(
+            metric_computation_configurations=metric_fn_direct_configurations
+        ):
+            try:
+                resolved_metrics.update(
+                    self._resolve_batched_unexpected_index_list_metrics(
+                        metric_computation_configurations=metric_computation_configurations
+                    )
+                )
+            except Exception as e:
+                logger.debug(
+                    f"""Batched query of {len(metric_computation_configurations)} unexpected index lists failed \
+({type(e).__name__}: "{str(e)}"); resolving them one at a time."""
                 )
+                continue
+
+            batched_metric_configurations.extend(
+                [
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in metric_computation_configurations
+                ]
+            )
 
+        if self._caching:
+            metric_configuration: MetricConfiguration
+            self._get_active_metric_cache().update(
+                {
+                    self._get_metric_cache_key(
+                        metric_configuration=metric_configuration
+                    ): resolved_metrics[metric_configuration.id]
+                    for metric_configuration in batched_metric_configurations
+                }
+            )
+
+        resolved_metrics.update(
+            super()._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=[
+                    metric_computation_configuration
+                    for metric_computation_configuration in metric_fn_direct_configurations
+                    if metric_computation_configuration.metric_configuration.id
+                    not in resolved_metrics
+                ],
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+        )
         return resolved_metrics
 
+    @staticmethod
+    def _group_unexpected_index_list_metric_computation_configurations(
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> List[List[MetricComputationConfiguration]]:
+        """Groups unexpected index list metrics of map Expectations by Batch selectable scanned by their Domains
+        (groups of fewer than two metrics are left out, since batching them would not save any queries).
+        """
+        from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
+            _is_sqlalchemy_metric_selectable,
+        )
+        from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (
+            _sqlalchemy_map_condition_index,
+        )
+
+        metric_computation_configurations_by_base_domain_id: Dict[
+            Tuple[str, str, str], List[MetricComputationConfiguration]
+        ] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        metric_provider_kwargs: dict
+        for metric_computation_configuration in metric_computation_configurations:
+            metric_provider_kwargs = (
+                metric_computation_configuration.metric_provider_kwargs
+            )
+            if (
+                metric_computation_configuration.metric_fn
+                is not _sqlalchemy_map_condition_index
+                or "unexpected_index_column_names"
+                not in metric_provider_kwargs["metric_value_kwargs"]["result_format"]
+                or _is_sqlalchemy_metric_selectable(
+                    map_metric_provider=metric_provider_kwargs["cls"]
+                )
+            ):
+                continue
+
+            metric_computation_configurations_by_base_domain_id.setdefault(
+                get_base_domain_kwargs(
+                    compute_domain_kwargs=metric_provider_kwargs["metrics"][
+                        "unexpected_condition"
+                    ][1]
+                ).to_id(),
+                [],
+            ).append(metric_computation_configuration)
+
+        return [
+            metric_computation_configurations
+            for metric_computation_configurations in metric_computation_configurations_by_base_domain_id.values()
+            if len(metric_computation_configurations) > 1
+        ]
+
+    def _resolve_batched_unexpected_index_list_metrics(
+        self,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        from great_expectations.expectations.metrics.map_metric_provider.map_condition_auxilliary_methods import (
+            _sqlalchemy_map_condition_index_batch,
+        )
+
+        metric_ids: List[Tuple[str, str, str]] = [
+            metric_computation_configuration.metric_configuration.id
+            for metric_computation_configuration in metric_computation_configurations
+        ]
+        with self._metric_resolution_tracer.span(
+            name="unexpected_index_list_batch",
+            category="metric_bundle",
+            args={"metric_ids": metric_ids},
+            metric_ids=metric_ids,
+        ):
+            unexpected_index_lists: List[
+                List[Dict[str, Any]]
+            ] = _sqlalchemy_map_condition_index_batch(
+                execution_engine=self,
+                metric_provider_kwargs_list=[
+                    metric_computation_configuration.metric_provider_kwargs
+                    for metric_computation_configuration in metric_computation_configurations
+                ],
+            )
+
+        logger.debug(
+            f"""SqlAlchemyExecutionEngine retrieved {len(metric_ids)} unexpected index lists in one query."""
+        )
+
+        return dict(zip(metric_ids, unexpected_index_lists))
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1159,6 +1499,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        # Scratch tables are dropped while their (persisted) connection is still open.
+        self._temp_table_manager.drop_all()
+
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1206,6 +1549,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         selectable: sqlalchemy.Selectable,
         splitter_method_name: str,
         splitter_kwargs: dict,
+        batch_identifiers: Optional[dict] = None,
     ) -> List[dict]:
         """Build data used to construct batch identifiers for the input table using the provided splitter config.
 
@@ -1215,6 +1559,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             selectable: Selectable to split.
             splitter_method_name: Desired splitter method to use.
             splitter_kwargs: Dict of directives used by the splitter method as keyword arguments of key=value.
+            batch_identifiers: Optional (possibly partial) batch identifiers; only matching ones are queried for.
 
         Returns:
             List of dicts of the form [{column_name: {"key": value}}]
@@ -1224,6 +1569,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             selectable=selectable,
             splitter_method_name=splitter_method_name,
             splitter_kwargs=splitter_kwargs,
+            batch_identifiers=batch_identifiers,
         )
 
     def _build_selectable_from_batch_spec(
@@ -1373,6 +1719,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return batch_data, batch_markers
 
+    def _get_metric_resolution_max_workers(self) -> int:
+        """Dialects, whose temp tables live in single persisted connection, cannot share it across threads."""
+        if self.dialect_name in _PERSISTED_CONNECTION_DIALECTS:
+            return 1
+
+        return super()._get_metric_resolution_max_workers()
+
     @contextmanager
     def get_connection(self) -> sqlalchemy.Connection:
         """Get a connection for executing queries.
@@ -1412,11 +1765,29 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             CursorResult for sqlalchemy 2.0+ or LegacyCursorResult for earlier versions.
         """
-        with self.get_connection() as connection:
-            result = connection.execute(query)
+        with self._metric_resolution_tracer.span(
+            name="execute_query", category="sql"
+        ) as trace_args:
+            if self._metric_resolution_tracer.enabled:
+                trace_args["sql"] = self._get_query_text(query=query)
+
+            with self.get_connection() as connection:
+                result = connection.execute(query)
 
         return result
 
+    def _get_query_text(self, query: sqlalchemy.Selectable) -> str:
+        try:
+            return str(
+                query.compile(
+                    dialect=self.engine.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        except Exception:
+            # Not all bound parameter values can be rendered as literals; fall back to parameterized SQL text.
+            return str(query)
+
     @public_api
     @new_method_or_class(version="0.16.14")
     def execute_query_in_transaction(
@@ -0,0 +1,313 @@
+"""Fusion of bundled SQL aggregate metrics computed over different compute domains into fewer queries.
+
+"SqlAlchemyExecutionEngine.resolve_metric_bundle()" issues one "SELECT" per distinct compute domain.  Compute domains
+that only differ in their row filtering directives ("row_condition", "filter_conditions", and "ignore_row_if") scan
+the same underlying Batch selectable; for such domains, every aggregate can instead be made conditional on its row
+filtering predicate (using "CASE WHEN" or, where supported, "FILTER (WHERE ...)"), so that all of them are computed
+together in a single scan of the Batch selectable.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.core import IDDict
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+logger = logging.getLogger(__name__)
+
+# Domain kwargs, which only narrow down rows of Batch selectable (they are applied as "WHERE" clauses).
+ROW_FILTERING_DOMAIN_KWARG_NAMES: Tuple[str, ...] = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+    "ignore_row_if",
+    "column_A",
+    "column_B",
+    "column_list",
+)
+
+# Values of "ignore_row_if" directive, which do not filter out any rows.
+_NEUTRAL_IGNORE_ROW_IF_DIRECTIVES: Tuple[str, ...] = (
+    "neither",
+    "never",
+)
+
+# Aggregate functions, whose value over predicate-filtered rows equals their value over "CASE WHEN" expression.
+_AGGREGATE_FUNCTION_NAMES: Tuple[str, ...] = (
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "stdev",
+    "stdevp",
+    "sum",
+    "var",
+    "var_pop",
+    "var_samp",
+    "variance",
+    "varp",
+)
+
+# Row-independent scalar functions, allowed to combine (already aggregated) values of fused metrics.
+_SCALAR_FUNCTION_NAMES: Tuple[str, ...] = (
+    "abs",
+    "cast",
+    "coalesce",
+    "exp",
+    "ln",
+    "nullif",
+    "power",
+    "round",
+    "sqrt",
+)
+
+# Dialects, supporting aggregate "FILTER (WHERE ...)" clause (otherwise, "CASE WHEN" expressions are used).
+_DIALECTS_SUPPORTING_AGGREGATE_FILTER: Tuple[GXSqlDialect, ...] = (
+    GXSqlDialect.POSTGRESQL,
+)
+
+# Maximum number of expressions allowed in "SELECT" list (dialects not listed here are treated as unconstrained).
+MAX_SELECT_EXPRESSIONS_BY_DIALECT: Dict[GXSqlDialect, int] = {
+    GXSqlDialect.BIGQUERY: 10000,
+    GXSqlDialect.MSSQL: 4096,
+    GXSqlDialect.MYSQL: 4096,
+    GXSqlDialect.ORACLE: 1000,
+    GXSqlDialect.POSTGRESQL: 1664,
+    GXSqlDialect.REDSHIFT: 1600,
+    GXSqlDialect.SQLITE: 2000,
+}
+
+
+def canonicalize_compute_domain_kwargs(compute_domain_kwargs: dict) -> IDDict:
+    """Removes compute domain kwargs, which do not affect records of compute domain (so that equivalent compute domains
+    share same ID).
+
+    Args:
+        compute_domain_kwargs: compute domain kwargs as supplied by "MetricComputationConfiguration"
+
+    Returns:
+        Equivalent compute domain kwargs as "IDDict"
+    """
+    canonical_domain_kwargs: IDDict = IDDict(
+        {
+            key: value
+            for key, value in compute_domain_kwargs.items()
+            if value is not None
+        }
+    )
+
+    if "row_condition" not in canonical_domain_kwargs:
+        canonical_domain_kwargs.pop("condition_parser", None)
+
+    if not canonical_domain_kwargs.get("filter_conditions", True):
+        canonical_domain_kwargs.pop("filter_conditions")
+
+    if (
+        canonical_domain_kwargs.get("ignore_row_if")
+        in _NEUTRAL_IGNORE_ROW_IF_DIRECTIVES
+    ):
+        canonical_domain_kwargs.pop("ignore_row_if")
+
+    if "ignore_row_if" not in canonical_domain_kwargs:
+        for key in ("column_A", "column_B", "column_list"):
+            canonical_domain_kwargs.pop(key, None)
+
+    return canonical_domain_kwargs
+
+
+def get_base_domain_kwargs(compute_domain_kwargs: dict) -> IDDict:
+    """Returns compute domain kwargs, stripped of row filtering directives (i.e., identifying Batch selectable)."""
+    return IDDict(
+        {
+            key: value
+            for key, value in compute_domain_kwargs.items()
+            if key not in ROW_FILTERING_DOMAIN_KWARG_NAMES
+        }
+    )
+
+
+def is_fusible_metric_fn(metric_fn: Any) -> bool:
+    """Determines whether or not bundled metric expression can be made conditional on row filtering predicate.
+
+    Fusible expressions are composed of supported aggregate functions (with at most one argument each), combined by
+    operators, literals, and row-independent scalar functions.  Columns may only be referenced as aggregate arguments.
+    Window functions, ordered-set aggregates, aggregates with "FILTER" clause, and subqueries are not fusible.
+
+    Args:
+        metric_fn: SQLAlchemy expression, computing metric value (as returned by metric "partial" function)
+
+    Returns:
+        Boolean flag indicating whether or not metric expression is fusible
+    """
+    if not isinstance(metric_fn, sqlalchemy.ColumnElement):
+        return False
+
+    return _count_fusible_aggregates(element=metric_fn) not in (None, 0)
+
+
+def make_metric_fn_conditional(
+    metric_fn: sqlalchemy.ColumnElement,
+    predicate: sqlalchemy.ColumnElement,
+    dialect_name: str,
+) -> sqlalchemy.ColumnElement:
+    """Rewrites every aggregate in (fusible) metric expression to only take into account rows satisfying predicate.
+
+    Args:
+        metric_fn: fusible SQLAlchemy metric expression (see "is_fusible_metric_fn()")
+        predicate: row filtering predicate (i.e., "WHERE" clause of metric's compute domain)
+        dialect_name: name of SQL dialect of query
+
+    Returns:
+        Metric expression, whose value computed over Batch selectable equals value of "metric_fn" over compute domain
+    """
+    use_aggregate_filter: bool = dialect_name in _DIALECTS_SUPPORTING_AGGREGATE_FILTER
+
+    def _replace(element: Any) -> Optional[sqlalchemy.ColumnElement]:
+        if not _is_aggregate_function(element=element):
+            return None
+
+        if use_aggregate_filter:
+            return element.filter(predicate)
+
+        return _make_aggregate_conditional(aggregate=element, predicate=predicate)
+
+    return sa.sql.visitors.replacement_traverse(metric_fn, {}, _replace)
+
+
+def get_max_select_expressions(dialect_name: str) -> Optional[int]:
+    """Returns maximum number of expressions in "SELECT" list for dialect (or None, if unconstrained)."""
+    dialect: GXSqlDialect
+    for dialect, max_select_expressions in MAX_SELECT_EXPRESSIONS_BY_DIALECT.items():
+        if dialect == dialect_name:
+            return max_select_expressions
+
+    return None
+
+
+def chunk_select_expressions(
+    select_expressions: List[Any], max_select_expressions: Optional[int]
+) -> Iterable[Tuple[int, List[Any]]]:
+    """Splits "SELECT" list into consecutive chunks, respecting dialect limit; yields (offset, chunk) pairs."""
+    if not max_select_expressions or len(select_expressions) <= max_select_expressions:
+        yield 0, select_expressions
+        return
+
+    offset: int
+    for offset in range(0, len(select_expressions), max_select_expressions):
+        yield offset, select_expressions[offset : offset + max_select_expressions]
+
+
+def _count_fusible_aggregates(element: Any) -> Optional[int]:
+    """Returns number of aggregates in expression (None, if expression contains non-fusible constructs)."""
+    if _is_aggregate_function(element=element):
+        return 1 if _is_fusible_aggregate(aggregate=element) else None
+
+    if _is_non_fusible_construct(element=element):
+        return None
+
+    if isinstance(element, sa.sql.functions.FunctionElement) and (
+        element.name.lower() not in _SCALAR_FUNCTION_NAMES
+    ):
+        return None
+
+    num_aggregates: int = 0
+
+    child: Any
+    num_child_aggregates: Optional[int]
+    for child in element.get_children():
+        num_child_aggregates = _count_fusible_aggregates(element=child)
+        if num_child_aggregates is None:
+            return None
+
+        num_aggregates += num_child_aggregates
+
+    return num_aggregates
+
+
+def _is_aggregate_function(element: Any) -> bool:
+    return (
+        isinstance(element, sa.sql.functions.FunctionElement)
+        and getattr(element, "name", "").lower() in _AGGREGATE_FUNCTION_NAMES
+    )
+
+
+def _is_fusible_aggregate(aggregate: sqlalchemy.ColumnElement) -> bool:
+    arguments: list = list(aggregate.clauses)
+    if len(arguments) > 1:
+        return False
+
+    return not any(
+        _contains_non_fusible_construct(element=argument) for argument in arguments
+    )
+
+
+def _is_non_fusible_construct(element: Any) -> bool:
+    return isinstance(
+        element,
+        (
+            sa.sql.elements.ColumnClause,
+            sa.sql.elements.TextClause,
+            sa.sql.elements.Over,
+            sa.sql.elements.WithinGroup,
+            sa.sql.elements.FunctionFilter,
+            sa.sql.selectable.ScalarSelect,
+            sa.sql.selectable.SelectBase,
+        ),
+    )
+
+
+def _contains_non_fusible_construct(element: Any) -> bool:
+    if isinstance(
+        element,
+        (
+            sa.sql.elements.Over,
+            sa.sql.elements.WithinGroup,
+            sa.sql.elements.FunctionFilter,
+            sa.sql.selectable.ScalarSelect,
+            sa.sql.selectable.SelectBase,
+        ),
+    ) or _is_aggregate_function(element=element):
+        return True
+
+    return any(
+        _contains_non_fusible_construct(element=child)
+        for child in element.get_children()
+    )
+
+
+def _make_aggregate_conditional(
+    aggregate: sqlalchemy.ColumnElement, predicate: sqlalchemy.ColumnElement
+) -> sqlalchemy.ColumnElement:
+    arguments: list = list(aggregate.clauses)
+    if not arguments or _is_star(element=arguments[0]):
+        # "COUNT(*)" counts rows satisfying predicate.
+        return sa.func.count(sa.case((predicate, sa.literal(1))))
+
+    argument: sqlalchemy.ColumnElement = arguments[0]
+    if (
+        isinstance(argument, sa.sql.elements.UnaryExpression)
+        and argument.operator is sa.sql.operators.distinct_op
+    ):
+        argument = sa.distinct(sa.case((predicate, argument.element)))
+    else:
+        argument = sa.case((predicate, argument))
+
+    return getattr(sa.func, aggregate.name)(argument, type_=aggregate.type)
+
+
+def _is_star(element: Any) -> bool:
+    return (
+        isinstance(
+            element,
+            (sa.sql.elements.ColumnClause, sa.sql.elements.TextClause),
+        )
+        and str(element) == "*"
+    )
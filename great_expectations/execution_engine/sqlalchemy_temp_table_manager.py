@@ -0,0 +1,142 @@
+"""Scratch (temporary) tables, which "SqlAlchemyExecutionEngine" creates while computing metrics.
+
+Scratch tables are created directly from their column definitions (no reflection of database metadata is involved),
+kept in a pool once released, and handed out again (emptied) to subsequent requests for a table with same columns, so
+that repeated metric computations on the same connection do not each pay for "CREATE TABLE".  All tables created are
+dropped deterministically when "SqlAlchemyExecutionEngine" is closed.
+
+Temporary tables only outlive single statement for dialects, whose "SqlAlchemyExecutionEngine" keeps one persisted
+connection (e.g., mssql and sqlite); hence, these are the dialects scratch tables are meant for.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.util import generate_temporary_table_name
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyTempTableManager:
+    """Creates, pools (for reuse), and drops scratch tables of "SqlAlchemyExecutionEngine".
+
+    Args:
+        execution_engine: "SqlAlchemyExecutionEngine", on whose connection scratch tables are created and used
+    """
+
+    def __init__(self, execution_engine: SqlAlchemyExecutionEngine) -> None:
+        self._execution_engine = execution_engine
+        self._lock = threading.Lock()
+        self._temp_tables: List[sqlalchemy.Table] = []
+        self._available_temp_tables: Dict[Tuple, List[sqlalchemy.Table]] = {}
+
+    @property
+    def temp_tables(self) -> List[sqlalchemy.Table]:
+        """Scratch tables created (and not yet dropped)."""
+        with self._lock:
+            return list(self._temp_tables)
+
+    @contextmanager
+    def scratch_table(
+        self, columns: Dict[str, sa.types.TypeEngine]
+    ) -> Iterator[sqlalchemy.Table]:
+        """Provides empty scratch table, having given (non-nullable) columns, for the duration of enclosed block.
+
+        Args:
+            columns: names of columns mapped to their SQLAlchemy types
+
+        Returns:
+            Scratch table, which is returned to the pool (for reuse) upon exit from enclosed block
+        """
+        temp_table_key: Tuple = tuple(
+            (column_name, repr(column_type))
+            for column_name, column_type in columns.items()
+        )
+        temp_table: sqlalchemy.Table = self._acquire_temp_table(
+            temp_table_key=temp_table_key, columns=columns
+        )
+        try:
+            yield temp_table
+        finally:
+            with self._lock:
+                self._available_temp_tables.setdefault(temp_table_key, []).append(
+                    temp_table
+                )
+
+    def drop_all(self) -> None:
+        """Drops all scratch tables created; failure to drop one of them is logged (and does not prevent the rest)."""
+        with self._lock:
+            temp_tables: List[sqlalchemy.Table] = self._temp_tables
+            self._temp_tables = []
+            self._available_temp_tables = {}
+
+        temp_table: sqlalchemy.Table
+        for temp_table in temp_tables:
+            try:
+                self._execution_engine.execute_query_in_transaction(
+                    sa.schema.DropTable(temp_table)
+                )
+            except sqlalchemy.SQLAlchemyError as e:
+                logger.warning(
+                    f'Unable to drop scratch table "{temp_table.name}": {str(e)}'
+                )
+
+    def _acquire_temp_table(
+        self, temp_table_key: Tuple, columns: Dict[str, sa.types.TypeEngine]
+    ) -> sqlalchemy.Table:
+        with self._lock:
+            available_temp_tables: List[
+                sqlalchemy.Table
+            ] = self._available_temp_tables.get(temp_table_key, [])
+            temp_table: sqlalchemy.Table | None = (
+                available_temp_tables.pop() if available_temp_tables else None
+            )
+
+        if temp_table is not None:
+            self._execution_engine.execute_query_in_transaction(temp_table.delete())
+            return temp_table
+
+        temp_table = self._build_temp_table(columns=columns)
+        self._execution_engine.execute_query_in_transaction(
+            sa.schema.CreateTable(temp_table)
+        )
+        with self._lock:
+            self._temp_tables.append(temp_table)
+
+        return temp_table
+
+    def _build_temp_table(
+        self, columns: Dict[str, sa.types.TypeEngine]
+    ) -> sqlalchemy.Table:
+        column_name: str
+        column_type: sa.types.TypeEngine
+        table_columns: List[sa.Column] = [
+            sa.Column(column_name, column_type, primary_key=False, nullable=False)
+            for column_name, column_type in columns.items()
+        ]
+
+        # mssql expects all temporary table names to have a prefix '#'; other dialects declare them "TEMPORARY".
+        if self._execution_engine.dialect_name == GXSqlDialect.MSSQL:
+            return sa.Table(
+                generate_temporary_table_name(default_table_name_prefix="#ge_temp_"),
+                sa.MetaData(),
+                *table_columns,
+            )
+
+        return sa.Table(
+            generate_temporary_table_name(default_table_name_prefix="ge_temp_"),
+            sa.MetaData(),
+            *table_columns,
+            prefixes=["TEMPORARY"],
+        )
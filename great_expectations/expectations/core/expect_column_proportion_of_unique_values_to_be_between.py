@@ -62,6 +62,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        allow_relative_error (boolean or float): \
+            Whether to allow approximate (HyperLogLog-based) unique value count on backends that support it; a float \
+            sets relative standard error of the count.
 
     Other Parameters:
         result_format (str or None): \
@@ -104,11 +107,13 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
+    approximate_metric_dependencies = ("column.unique_proportion",)
     success_keys = (
         "min_value",
         "strict_min",
         "max_value",
         "strict_max",
+        "allow_relative_error",
         "auto",
         "profiler_config",
     )
@@ -187,6 +192,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -382,10 +388,13 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
-            metric_name="column.unique_proportion",
+        return self._add_approximation_details(
+            validation_result=self._validate_metric_value_between(
+                metric_name="column.unique_proportion",
+                configuration=configuration,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            ),
             configuration=configuration,
-            metrics=metrics,
-            runtime_configuration=runtime_configuration,
-            execution_engine=execution_engine,
         )
@@ -56,6 +56,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
             The minimum number of unique values allowed.
         max_value (int or None): \
             The maximum number of unique values allowed.
+        allow_relative_error (boolean or float): \
+            Whether to allow approximate (HyperLogLog-based) unique value count on backends that support it; a float \
+            sets relative standard error of the count.
 
     Other Parameters:
         result_format (str or None): \
@@ -98,9 +101,11 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.distinct_values.count",)
+    approximate_metric_dependencies = ("column.distinct_values.count",)
     success_keys = (
         "min_value",
         "max_value",
+        "allow_relative_error",
         "auto",
         "profiler_config",
     )
@@ -179,6 +184,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -380,10 +386,13 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+        return self._add_approximation_details(
+            validation_result=self._validate_metric_value_between(
+                metric_name="column.distinct_values.count",
+                configuration=configuration,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            ),
             configuration=configuration,
-            metrics=metrics,
-            runtime_configuration=runtime_configuration,
-            execution_engine=execution_engine,
         )
@@ -69,6 +69,8 @@ from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.core.sketches import get_sketch_relative_error
+from great_expectations.core.unexpected_index_ranges import expand_unexpected_index_list
 from great_expectations.core.util import nested_update
 from great_expectations.exceptions import (
     ExpectationNotFoundError,
@@ -835,8 +837,8 @@ class Expectation(metaclass=MetaExpectation):
             "partial_unexpected_counts"
         )
         # this means the result_format is COMPLETE and we have the full set of unexpected indices
-        unexpected_index_list: Optional[List[dict]] = result_dict.get(
-            "unexpected_index_list"
+        unexpected_index_list: Optional[List[dict]] = expand_unexpected_index_list(
+            result_dict.get("unexpected_index_list")
         )
         unexpected_count: int = result_dict["unexpected_count"]
         if partial_unexpected_counts:
@@ -1170,10 +1172,7 @@ class Expectation(metaclass=MetaExpectation):
         if not configuration:
             configuration = self.configuration
 
-        configuration = deepcopy(configuration)
-
-        if runtime_configuration:
-            configuration.kwargs.update(runtime_configuration)
+        configuration = configuration.derive(kwargs=runtime_configuration)
 
         success_kwargs = self.get_success_kwargs(configuration=configuration)
         runtime_kwargs = {
@@ -2655,6 +2654,9 @@ class ColumnAggregateExpectation(BatchExpectation, ABC):
     domain_keys = ("batch_id", "table", "column", "row_condition", "condition_parser")
     domain_type = MetricDomainTypes.COLUMN
 
+    # Metric dependencies, which are requested as approximate (sketch-based) metrics, if "allow_relative_error" is set.
+    approximate_metric_dependencies: Tuple[str, ...] = tuple()
+
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration] = None
     ) -> None:
@@ -2669,6 +2671,80 @@ class ColumnAggregateExpectation(BatchExpectation, ABC):
         except AssertionError as e:
             raise InvalidExpectationConfigurationError(str(e))
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = (
+            super().get_validation_dependencies(
+                configuration=configuration,
+                execution_engine=execution_engine,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+
+        allow_relative_error: Union[bool, float] = self._get_allow_relative_error(
+            configuration=configuration
+        )
+        if not allow_relative_error:
+            return validation_dependencies
+
+        # Only approximate metrics carry "allow_relative_error"; exact ones keep their identity (and are shared).
+        metric_name: str
+        metric_configuration: Optional[MetricConfiguration]
+        for metric_name in self.approximate_metric_dependencies:
+            metric_configuration = validation_dependencies.get_metric_configuration(
+                metric_name=metric_name
+            )
+            if metric_configuration is None:
+                continue
+
+            validation_dependencies.set_metric_configuration(
+                metric_name=metric_name,
+                metric_configuration=MetricConfiguration(
+                    metric_name=metric_configuration.metric_name,
+                    metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+                    metric_value_kwargs={
+                        **(metric_configuration.metric_value_kwargs or {}),
+                        "allow_relative_error": allow_relative_error,
+                    },
+                ),
+            )
+
+        return validation_dependencies
+
+    def _add_approximation_details(
+        self,
+        validation_result: dict,
+        configuration: Optional[ExpectationConfiguration] = None,
+    ) -> dict:
+        """Reports relative error bound of approximate metrics (if "allow_relative_error" is set) in result details."""
+        allow_relative_error: Union[bool, float] = self._get_allow_relative_error(
+            configuration=configuration
+        )
+        if allow_relative_error:
+            validation_result["result"].setdefault("details", {})[
+                "relative_error"
+            ] = get_sketch_relative_error(allow_relative_error=allow_relative_error)
+
+        return validation_result
+
+    def _get_allow_relative_error(
+        self, configuration: Optional[ExpectationConfiguration] = None
+    ) -> Union[bool, float]:
+        if not self.approximate_metric_dependencies:
+            return False
+
+        if not configuration:
+            configuration = self.configuration
+
+        return configuration.kwargs.get(
+            "allow_relative_error",
+            self.default_kwarg_values.get("allow_relative_error", False),
+        )
+
 
 @public_api
 class ColumnExpectation(ColumnAggregateExpectation, ABC):
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Union
 
 import pandas as pd
 
@@ -9,12 +9,17 @@ from great_expectations.compatibility.pyspark import (
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    get_sketch_relative_error,
+    is_sketch_relative_error,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
@@ -23,6 +28,16 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
+# SQL dialects, which have native (sketch-based) approximate distinct count aggregate function.
+APPROXIMATE_COUNT_DISTINCT_FUNCTION_NAMES: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.AWSATHENA: "approx_distinct",
+    GXSqlDialect.BIGQUERY: "approx_count_distinct",
+    GXSqlDialect.CLICKHOUSE: "uniq",
+    GXSqlDialect.MSSQL: "approx_count_distinct",
+    GXSqlDialect.SNOWFLAKE: "approx_count_distinct",
+    GXSqlDialect.TRINO: "approx_distinct",
+}
+
 
 class ColumnDistinctValues(ColumnAggregateMetricProvider):
     metric_name = "column.distinct_values"
@@ -106,6 +121,14 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
 
 
 class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Number of distinct non-null values.
+
+    Optional "allow_relative_error" metric value kwarg (True or float relative standard error) permits approximate
+    (HyperLogLog-based) count, where engine has it: Spark, SQL dialects with native approximate distinct count function,
+    and chunked Pandas Batch data (whose per-chunk sketches are merged).  Elsewhere, count is exact.  This kwarg is not
+    among "value_keys", so that exact metric keeps its identity (and is shared by all metrics depending on it).
+    """
+
     metric_name = "column.distinct_values.count"
 
     @column_aggregate_value(engine=PandasExecutionEngine)
@@ -116,6 +139,8 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
     def _sqlalchemy(
         cls,
         column: sqlalchemy.ColumnClause,
+        _dialect,
+        allow_relative_error: Union[bool, float] = False,
         **kwargs,
     ) -> sqlalchemy.Selectable:
         """
@@ -123,12 +148,23 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         This was causing performance issues due to the complex query used in column.value_counts and subsequent
         in-memory operations.
         """
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            dialect: GXSqlDialect
+            function_name: str
+            for (
+                dialect,
+                function_name,
+            ) in APPROXIMATE_COUNT_DISTINCT_FUNCTION_NAMES.items():
+                if dialect == _dialect.name:
+                    return getattr(sa.func, function_name)(column)
+
         return sa.func.count(sa.distinct(column))
 
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(
         cls,
         column: pyspark.Column,
+        allow_relative_error: Union[bool, float] = False,
         **kwargs,
     ) -> pyspark.Column:
         """
@@ -136,6 +172,14 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         This was causing performance issues due to the complex query used in column.value_counts and subsequent
         in-memory operations.
         """
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            return F.approx_count_distinct(
+                column,
+                rsd=get_sketch_relative_error(
+                    allow_relative_error=allow_relative_error
+                ),
+            )
+
         return F.countDistinct(column)
 
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -16,6 +16,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.quantile_util import (
+    get_column_values_at_row_positions,
+    get_median_row_positions,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -57,34 +61,35 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         if not nonnull_count:
             return None
 
-        element_values = execution_engine.execute_query(
-            sa.select(column)
-            .order_by(column)
-            .where(column != None)  # noqa: E711
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
+        # Center value(s) of ordered non-null column values are obtained with one query.
+        row_positions: List[int] = get_median_row_positions(row_count=nonnull_count)
+        values_by_row_position: Dict[int, Any] = get_column_values_at_row_positions(
+            column=column,
+            row_positions=row_positions,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            ignore_nulls=True,
         )
-
-        column_values = list(element_values.fetchall())
+        column_values: List[Any] = [
+            values_by_row_position[row_position]
+            for row_position in row_positions
+            if row_position in values_by_row_position
+        ]
 
         if len(column_values) == 0:
             column_median = None
-        elif nonnull_count % 2 == 0:
+        elif len(column_values) == 2:  # noqa: PLR2004
             # An even number of column values: take the average of the two center values
             column_median = (
                 float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
+                    column_values[0]
+                    + column_values[1]  # left center value  # right center value
                 )
                 / 2.0
             )  # Average center values
-        else:  # noqa: PLR5501
+        else:
             # An odd number of column values, we can just take the center value
-            if len(column_values) == 1:
-                column_median = column_values[0][0]  # The only value
-            else:
-                column_median = column_values[1][0]  # True center value
+            column_median = column_values[0]  # True center value
 
         return column_median
 
@@ -62,9 +62,16 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
+        # Approximate distinct count is requested only if permitted; otherwise, exact metric (shared with others) is used.
+        allow_relative_error = (metric.metric_value_kwargs or {}).get(
+            "allow_relative_error", False
+        )
         dependencies["column.distinct_values.count"] = MetricConfiguration(
             metric_name="column.distinct_values.count",
             metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={"allow_relative_error": allow_relative_error}
+            if allow_relative_error
+            else None,
         )
 
         dependencies[
@@ -1,9 +1,8 @@
 import ast
-import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 import numpy as np
 
@@ -12,6 +11,7 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import is_sketch_relative_error
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -24,6 +24,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.quantile_util import (
+    get_column_quantiles_from_row_positions,
+    get_column_quantiles_from_sketch,
+)
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 
 logger = logging.getLogger(__name__)
@@ -44,7 +48,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         """Quantile Function"""
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
-        if not allow_relative_error:
+        # Exact quantiles are within any relative error; hence, approximation is only ever permitted here.
+        if not allow_relative_error or is_sketch_relative_error(
+            allow_relative_error=allow_relative_error
+        ):
             allow_relative_error = "nearest"
 
         if allow_relative_error not in interpolation_options:
@@ -135,6 +142,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 selectable=selectable,
                 execution_engine=execution_engine,
                 table_row_count=table_row_count,
+                allow_relative_error=allow_relative_error,
             )
         elif dialect_name == GXSqlDialect.AWSATHENA:
             return _get_column_quantiles_athena(
@@ -343,40 +351,36 @@ def _get_column_quantiles_clickhouse(
         raise pe
 
 
-def _get_column_quantiles_sqlite(
+def _get_column_quantiles_sqlite(  # noqa: PLR0913
     column,
     quantiles: Iterable,
     selectable,
     execution_engine: SqlAlchemyExecutionEngine,
     table_row_count,
+    allow_relative_error: Union[bool, str, float] = False,
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "execution_engine.execute_query()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    SQLite has no analytical aggregate functions (such as "percentile_disc"); hence, all quantiles are obtained in one
+    query, returning only rows at requested positions of ordered column ("ROW_NUMBER()" window function is available
+    starting with SQLite 3.25; older versions use single ordered scan).  If relative error is allowed, approximate
+    quantiles are computed from "KllSketch" in one unordered scan instead.
     """
-    offsets: List[int] = [quantile * table_row_count - 1 for quantile in quantiles]
-    quantile_queries: List[sqlalchemy.Select] = [
-        sa.select(column)
-        .order_by(column.asc())
-        .offset(offset)
-        .limit(1)
-        .select_from(selectable)
-        for offset in offsets
-    ]
-
-    quantile_result: Row
-    quantile_query: sqlalchemy.Select
     try:
-        quantiles_results: List[Row] = [
-            execution_engine.execute_query(quantile_query).fetchone()
-            for quantile_query in quantile_queries
-        ]
-        return list(
-            itertools.chain.from_iterable(
-                [list(quantile_result) for quantile_result in quantiles_results]
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            return get_column_quantiles_from_sketch(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                execution_engine=execution_engine,
+                relative_error=allow_relative_error,
             )
+
+        return get_column_quantiles_from_row_positions(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            row_count=table_row_count,
         )
     except sqlalchemy.ProgrammingError as pe:
         exception_message: str = "An SQL syntax Exception occurred."
@@ -467,6 +471,15 @@ def _get_column_quantiles_generic_sqlalchemy(
                     f'The SQL engine dialect "{str(execution_engine.dialect)}" does not support computing quantiles '
                     "without approximation error; set allow_relative_error to True to allow approximate quantiles."
                 )
+        elif is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            # Dialect has neither exact nor approximate "percentile_disc"; approximate quantiles with sketch.
+            return get_column_quantiles_from_sketch(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                execution_engine=execution_engine,
+                relative_error=allow_relative_error,
+            )
         else:
             raise ValueError(
                 f'The SQL engine dialect "{str(execution_engine.dialect)}" does not support computing quantiles with '
@@ -5,10 +5,15 @@ import pandas as pd
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    get_sketch_relative_error,
+    is_sketch_relative_error,
+)
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
@@ -20,6 +25,15 @@ if TYPE_CHECKING:
 
 
 class ColumnValueCounts(ColumnAggregateMetricProvider):
+    """Counts of non-null column values.
+
+    Optional "allow_relative_error" metric value kwarg (True or float "relative_error") turns metric into heavy hitters:
+    only values, whose count reaches "relative_error" times number of non-null values, are returned (so that at most
+    "1 / relative_error" values are fetched).  Counts are exact, except for chunked Pandas Batch data, where they are
+    estimated by merged "SpaceSavingSketch" objects (overestimated by at most "relative_error" times number of values).
+    This kwarg is not among "value_keys", so that exact metric keeps its identity.
+    """
+
     metric_name = "column.value_counts"
     value_keys = ("sort", "collate")
 
@@ -50,7 +64,16 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         )
         column: str = accessor_domain_kwargs["column"]
 
-        counts: pd.Series = df[column].value_counts()
+        counts: Optional[pd.Series] = pandas_arrow_util.value_counts(column=df[column])
+        if counts is None:
+            counts = df[column].value_counts()
+        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            counts = counts[
+                counts
+                >= get_sketch_relative_error(allow_relative_error=allow_relative_error)
+                * counts.sum()
+            ]
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
@@ -109,6 +132,21 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
                 .where(sa.column(column).isnot(None))
                 .group_by(sa.column(column))
             )
+        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            # Only heavy hitters are fetched (rather than counts of all distinct values).
+            nonnull_count_query: sqlalchemy.Select = sa.select(
+                sa.func.count(sa.column(column))
+            ).select_from(selectable)
+            if hasattr(nonnull_count_query, "scalar_subquery"):
+                nonnull_count = nonnull_count_query.scalar_subquery()
+            else:
+                nonnull_count = nonnull_count_query.as_scalar()
+            query = query.having(
+                sa.func.count(sa.column(column))
+                >= get_sketch_relative_error(allow_relative_error=allow_relative_error)
+                * nonnull_count
+            )
         if sort == "value":
             # NOTE: depending on the way the underlying database collates columns,
             # ordering can vary. postgresql collate "C" matches default sort
@@ -159,6 +197,14 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         value_counts_df: pyspark.DataFrame = (
             df.select(column).where(F.col(column).isNotNull()).groupBy(column).count()
         )
+        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if is_sketch_relative_error(allow_relative_error=allow_relative_error):
+            nonnull_count: int = df.where(F.col(column).isNotNull()).count()
+            value_counts_df = value_counts_df.where(
+                F.col("count")
+                >= get_sketch_relative_error(allow_relative_error=allow_relative_error)
+                * nonnull_count
+            )
 
         if sort == "value":
             value_counts_df = value_counts_df.orderBy(column)
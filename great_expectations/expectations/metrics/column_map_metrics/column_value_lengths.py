@@ -11,6 +11,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -88,6 +89,10 @@ class ColumnValuesValueLength(ColumnMapMetricProvider):
 
     @column_function_partial(engine=PandasExecutionEngine)
     def _pandas_function(cls, column, **kwargs):
+        arrow_result = pandas_arrow_util.value_length(column=column)
+        if arrow_result is not None:
+            return arrow_result
+
         return column.astype(str).str.len()
 
     @column_function_partial(engine=SqlAlchemyExecutionEngine)
@@ -7,6 +7,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -42,6 +43,10 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
 
+        arrow_result = pandas_arrow_util.is_in(column=column, value_set=value_set)
+        if arrow_result is not None:
+            return arrow_result
+
         return column.isin(value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -7,6 +7,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -29,7 +30,11 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
     def _pandas(cls, column, regex_list, match_on, **kwargs):
         regex_matches = []
         for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
+            arrow_result = pandas_arrow_util.match_regex(column=column, regex=regex)
+            if arrow_result is None:
+                arrow_result = column.astype(str).str.contains(regex)
+
+            regex_matches.append(arrow_result)
         regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
 
         if match_on == "any":
@@ -4,6 +4,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -20,6 +21,10 @@ class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
+        arrow_result = pandas_arrow_util.match_regex(column=column, regex=regex)
+        if arrow_result is not None:
+            return ~arrow_result
+
         return ~column.astype(str).str.contains(regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -9,6 +9,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
+    pandas_arrow_util,
 )
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -27,6 +28,10 @@ class ColumnValuesNull(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
+        arrow_result = pandas_arrow_util.is_null(column=column)
+        if arrow_result is not None:
+            return arrow_result
+
         return column.isnull()
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -89,26 +89,22 @@ def column_function_partial(  # noqa: C901, PLR0915
                 )
 
                 (
-                    df,
+                    column,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                ) = execution_engine.get_column_compute_domain(
+                    domain_kwargs=metric_domain_kwargs
                 )
 
-                column_name: Union[
-                    str, sqlalchemy.quoted_name
-                ] = accessor_domain_kwargs["column"]
-
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
                 if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                    column = column[column.notnull()]
 
                 values = metric_fn(
                     cls,
-                    df[column_name],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
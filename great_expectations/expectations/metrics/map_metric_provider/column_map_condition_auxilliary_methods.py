@@ -64,7 +64,9 @@ def _pandas_column_map_condition_values(
 
     column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
-    df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs, column_name=column_name
+    )
 
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
@@ -75,9 +77,7 @@ def _pandas_column_map_condition_values(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
     if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+        domain_values = domain_values[domain_values.notnull()]
 
     domain_values = domain_values[
         boolean_mapped_unexpected_values == True  # noqa: E712
@@ -132,7 +132,9 @@ def _pandas_column_map_series_and_domain_values(
 
     column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
-    df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs, column_name=column_name
+    )
 
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
@@ -143,9 +145,7 @@ def _pandas_column_map_series_and_domain_values(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
     if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+        domain_values = domain_values[domain_values.notnull()]
 
     domain_values = domain_values[
         boolean_mapped_unexpected_values == True  # noqa: E712
@@ -195,7 +195,9 @@ def _pandas_column_map_condition_value_counts(
 
     column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
-    df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    domain_values = execution_engine.get_domain_column_values(
+        domain_kwargs=compute_domain_kwargs, column_name=column_name
+    )
 
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
@@ -206,9 +208,7 @@ def _pandas_column_map_condition_value_counts(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
     if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+        domain_values = domain_values[domain_values.notnull()]
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
@@ -22,8 +22,16 @@ from great_expectations.compatibility.sqlalchemy import (
 from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.core.unexpected_index_ranges import (
+    UnexpectedIndexRanges,
+    build_unexpected_index_list,
+    use_unexpected_index_ranges,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    get_base_domain_kwargs,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
 )
@@ -33,10 +41,7 @@ from great_expectations.expectations.metrics.util import (
     get_sqlalchemy_source_table_and_schema,
     sql_statement_with_post_compile_to_string,
 )
-from great_expectations.util import (
-    generate_temporary_table_name,
-    get_sqlalchemy_selectable,
-)
+from great_expectations.util import get_sqlalchemy_selectable
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -70,7 +75,7 @@ def _pandas_map_condition_index(
     metric_value_kwargs: dict,
     metrics: Dict[str, Any],
     **kwargs,
-) -> Union[List[int], List[Dict[str, Any]]]:
+) -> Union[List[int], List[Dict[str, Any]], UnexpectedIndexRanges]:
     (
         boolean_mapped_unexpected_values,
         compute_domain_kwargs,
@@ -129,6 +134,15 @@ def _pandas_map_condition_index(
     result_format = metric_value_kwargs["result_format"]
     domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
 
+    if (
+        result_format["result_format"] == "COMPLETE"
+        and use_unexpected_index_ranges(result_format=result_format)
+        and not result_format.get("unexpected_index_column_names")
+        and _is_default_pandas_index(index=domain_records_df.index)
+    ):
+        # Default (integer) row indices are kept in compact form (unless list is smaller); list form is produced on demand.
+        return build_unexpected_index_list(indices=domain_records_df.index.to_numpy())
+
     unexpected_index_list: Union[
         List[int], List[Dict[str, Any]]
     ] = compute_unexpected_pandas_indices(
@@ -183,28 +197,51 @@ def _pandas_map_condition_query(
     with all of the available "domain_kwargs" keys.
     """
     domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    domain_records_df: pd.DataFrame = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs
-    )
 
+    domain_records: Union[pd.DataFrame, pd.Series]
     if "column" in accessor_domain_kwargs:
         column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
             "column"
         ]
 
+        # Only index of unexpected rows is needed; hence, Domain column (rather than all Domain records) suffices.
+        domain_records = execution_engine.get_domain_column_values(
+            domain_kwargs=domain_kwargs, column_name=column_name
+        )
+
         filter_column_isnull = kwargs.get(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            domain_records_df = domain_records_df[
-                domain_records_df[column_name].notnull()
-            ]
+            domain_records = domain_records[domain_records.notnull()]
+    else:
+        domain_records = execution_engine.get_domain_records(
+            domain_kwargs=domain_kwargs
+        )
+
+    domain_values_df_filtered = domain_records[boolean_mapped_unexpected_values]
+    if use_unexpected_index_ranges(
+        result_format=result_format
+    ) and _is_default_pandas_index(index=domain_values_df_filtered.index):
+        unexpected_index_list: Union[
+            UnexpectedIndexRanges, List[int]
+        ] = build_unexpected_index_list(
+            indices=domain_values_df_filtered.index.to_numpy()
+        )
+        if isinstance(unexpected_index_list, UnexpectedIndexRanges):
+            return f"df.filter(items={unexpected_index_list.to_python_expression()}, axis=0)"
+
+        return f"df.filter(items={unexpected_index_list}, axis=0)"
 
-    domain_values_df_filtered = domain_records_df[boolean_mapped_unexpected_values]
     index_list = domain_values_df_filtered.index.to_list()
     return f"df.filter(items={index_list}, axis=0)"
 
 
+def _is_default_pandas_index(index: pd.Index) -> bool:
+    """Determines whether or not index is unnamed (single-level) integer index (e.g., default "RangeIndex")."""
+    return index.nlevels == 1 and index.name is None and index.dtype.kind in "iu"
+
+
 def _pandas_map_condition_rows(
     cls,
     execution_engine: PandasExecutionEngine,
@@ -318,54 +355,29 @@ def _sqlalchemy_map_condition_unexpected_count_value(
         selectable = get_sqlalchemy_selectable(selectable)
         count_selectable = count_selectable.select_from(selectable)
 
+    unexpected_count: int
     try:
         if execution_engine.dialect_name == GXSqlDialect.MSSQL:
-            with execution_engine.get_connection() as connection:
-                if not connection.closed:
-                    temp_table_obj = _generate_temp_table(
-                        connection=connection,
-                        metric_domain_kwargs=metric_domain_kwargs,
-                        metric_value_kwargs=metric_value_kwargs,
-                        metrics=metrics,
+            with execution_engine.temp_table_manager.scratch_table(
+                columns={"condition": sa.Integer}
+            ) as temp_table_obj:
+                inner_case_query: sqlalchemy.Insert = (
+                    temp_table_obj.insert().from_select(
+                        [count_case_statement],
+                        count_selectable,
                     )
-                else:
-                    with connection.begin():
-                        temp_table_obj = _generate_temp_table(
-                            connection=connection,
-                            metric_domain_kwargs=metric_domain_kwargs,
-                            metric_value_kwargs=metric_value_kwargs,
-                            metrics=metrics,
-                        )
-            inner_case_query: sqlalchemy.Insert = temp_table_obj.insert().from_select(
-                [count_case_statement],
-                count_selectable,
-            )
-            execution_engine.execute_query_in_transaction(inner_case_query)
-
-            count_selectable = temp_table_obj
+                )
+                execution_engine.execute_query_in_transaction(inner_case_query)
 
-        count_selectable = get_sqlalchemy_selectable(count_selectable)
-        unexpected_count_query: sqlalchemy.Select = (
-            sa.select(
-                sa.func.sum(sa.column("condition")).label("unexpected_count"),
-            )
-            .select_from(count_selectable)
-            .alias("UnexpectedCountSubquery")
-        )
-        unexpected_count: Union[float, int] = execution_engine.execute_query(
-            sa.select(
-                unexpected_count_query.c[
-                    f"{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
-                ],
+                unexpected_count = _sqlalchemy_condition_sum(
+                    execution_engine=execution_engine,
+                    count_selectable=temp_table_obj,
+                )
+        else:
+            unexpected_count = _sqlalchemy_condition_sum(
+                execution_engine=execution_engine,
+                count_selectable=count_selectable,
             )
-        ).scalar()
-        # Unexpected count can be None if the table is empty, in which case the count
-        # should default to zero.
-        try:
-            unexpected_count = int(unexpected_count)
-        except TypeError:
-            unexpected_count = 0
-
     except sqlalchemy.OperationalError as oe:
         exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
         raise gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
@@ -375,6 +387,34 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     return convert_to_json_serializable(unexpected_count)
 
 
+def _sqlalchemy_condition_sum(
+    execution_engine: SqlAlchemyExecutionEngine,
+    count_selectable: Union[sqlalchemy.Select, sqlalchemy.Table],
+) -> int:
+    """Sums "condition" column of given selectable (its "CASE" indicators of unexpected values) into unexpected count."""
+    count_selectable = get_sqlalchemy_selectable(count_selectable)
+    unexpected_count_query: sqlalchemy.Select = (
+        sa.select(
+            sa.func.sum(sa.column("condition")).label("unexpected_count"),
+        )
+        .select_from(count_selectable)
+        .alias("UnexpectedCountSubquery")
+    )
+    unexpected_count: Union[float, int] = execution_engine.execute_query(
+        sa.select(
+            unexpected_count_query.c[
+                f"{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+            ],
+        )
+    ).scalar()
+    # Unexpected count can be None if the table is empty, in which case the count
+    # should default to zero.
+    try:
+        return int(unexpected_count)
+    except TypeError:
+        return 0
+
+
 def _sqlalchemy_map_condition_rows(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
@@ -416,6 +456,25 @@ def _sqlalchemy_map_condition_rows(
         )
 
 
+def _get_domain_column_name_list(
+    accessor_domain_kwargs: dict,
+) -> List[Union[str, sqlalchemy.quoted_name]]:
+    """Returns names of columns, on which map Expectation is run (in order of their accessor Domain kwargs)."""
+    # column map expectations
+    if "column" in accessor_domain_kwargs:
+        return [accessor_domain_kwargs["column"]]
+
+    # multi-column map expectations
+    if "column_list" in accessor_domain_kwargs:
+        return list(accessor_domain_kwargs["column_list"])
+
+    # column-pair map expectations
+    if "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        return [accessor_domain_kwargs["column_A"], accessor_domain_kwargs["column_B"]]
+
+    return []
+
+
 def _sqlalchemy_map_condition_query(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
@@ -445,25 +504,9 @@ def _sqlalchemy_map_condition_query(
     if return_unexpected_index_query is False:
         return
 
-    domain_column_name_list: List[str] = list()
-    # column map expectations
-    if "column" in accessor_domain_kwargs:
-        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
-            "column"
-        ]
-        domain_column_name_list.append(column_name)
-    # multi-column map expectations
-    elif "column_list" in accessor_domain_kwargs:
-        column_list: List[Union[str, sqlalchemy.quoted_name]] = accessor_domain_kwargs[
-            "column_list"
-        ]
-        domain_column_name_list = column_list
-    # column-map expectations
-    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
-        column_list: List[Union[str, sqlalchemy.quoted_name]] = list()
-        column_list.append(accessor_domain_kwargs["column_A"])
-        column_list.append(accessor_domain_kwargs["column_B"])
-        domain_column_name_list = column_list
+    domain_column_name_list: List[
+        Union[str, sqlalchemy.quoted_name]
+    ] = _get_domain_column_name_list(accessor_domain_kwargs=accessor_domain_kwargs)
 
     column_selector: List[sa.Column] = []
 
@@ -531,25 +574,9 @@ def _sqlalchemy_map_condition_index(
     if "unexpected_index_column_names" not in result_format:
         return None
 
-    domain_column_name_list: List[str] = list()
-    # column map expectations
-    if "column" in accessor_domain_kwargs:
-        column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
-            "column"
-        ]
-        domain_column_name_list.append(column_name)
-    # multi-column map expectations
-    elif "column_list" in accessor_domain_kwargs:
-        column_list: List[Union[str, sqlalchemy.quoted_name]] = accessor_domain_kwargs[
-            "column_list"
-        ]
-        domain_column_name_list = column_list
-    # column-map expectations
-    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
-        column_list: List[Union[str, sqlalchemy.quoted_name]] = list()
-        column_list.append(accessor_domain_kwargs["column_A"])
-        column_list.append(accessor_domain_kwargs["column_B"])
-        domain_column_name_list = column_list
+    domain_column_name_list: List[
+        Union[str, sqlalchemy.quoted_name]
+    ] = _get_domain_column_name_list(accessor_domain_kwargs=accessor_domain_kwargs)
 
     domain_kwargs: dict = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     all_table_columns: List[str] = metrics.get("table.columns")
@@ -607,6 +634,167 @@ def _sqlalchemy_map_condition_index(
     return unexpected_index_list
 
 
+def _sqlalchemy_map_condition_index_batch(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_provider_kwargs_list: List[dict],
+) -> List[List[Dict[str, Any]]]:
+    """
+    Returns indices of the metric values which do not meet an expected Expectation condition for several instances of
+    ColumnMapExpectation (each given by keyword arguments of "_sqlalchemy_map_condition_index()"), whose compute
+    Domains differ only in row filtering directives (i.e., scan the same Batch selectable), using a single query.
+
+    Every unexpected condition is conjoined with row filtering predicates of its Domain; rows violating any of them are
+    selected in one scan, with per-Expectation flag and "ROW_NUMBER()" (ordered by "unexpected_index_column_names"),
+    capping each Expectation at its own `partial_unexpected_count`.  Index lists are in order of their index columns.
+    """
+    conditions: List[sqlalchemy.ColumnElement] = []
+    index_column_names_list: List[List[str]] = []
+    domain_column_names_list: List[List[Union[str, sqlalchemy.quoted_name]]] = []
+    partial_unexpected_counts: List[int] = []
+    selected_column_names: List[Union[str, sqlalchemy.quoted_name]] = []
+
+    metric_provider_kwargs: dict
+    metrics: Dict[str, Any]
+    result_format: dict
+    unexpected_index_column_names: List[str]
+    domain_column_name_list: List[Union[str, sqlalchemy.quoted_name]]
+    column_name: Union[str, sqlalchemy.quoted_name]
+    for metric_provider_kwargs in metric_provider_kwargs_list:
+        metrics = metric_provider_kwargs["metrics"]
+        (
+            unexpected_condition,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = metrics.get("unexpected_condition")
+
+        result_format = metric_provider_kwargs["metric_value_kwargs"]["result_format"]
+        unexpected_index_column_names = result_format["unexpected_index_column_names"]
+        all_table_columns: List[str] = metrics.get("table.columns")
+        for column_name in unexpected_index_column_names:
+            if column_name not in all_table_columns:
+                raise gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                    message=f'Error: The unexpected_index_column: "{column_name}" in does not exist in SQL Table. '
+                    f"Please check your configuration and try again."
+                )
+
+        domain_column_name_list = _get_domain_column_name_list(
+            accessor_domain_kwargs=accessor_domain_kwargs
+        )
+        for column_name in unexpected_index_column_names + domain_column_name_list:
+            if column_name not in selected_column_names:
+                selected_column_names.append(column_name)
+
+        conditions.append(
+            sa.and_(
+                unexpected_condition,
+                *execution_engine._get_domain_records_predicates(
+                    domain_kwargs=dict(
+                        **compute_domain_kwargs, **accessor_domain_kwargs
+                    )
+                ),
+            )
+        )
+        index_column_names_list.append(unexpected_index_column_names)
+        domain_column_names_list.append(domain_column_name_list)
+        partial_unexpected_counts.append(result_format["partial_unexpected_count"])
+
+    compute_domain_kwargs = metric_provider_kwargs_list[0]["metrics"][
+        "unexpected_condition"
+    ][1]
+    domain_records_as_selectable: Union[
+        sa.Table, sa.Select
+    ] = get_sqlalchemy_selectable(
+        execution_engine.get_domain_records(
+            domain_kwargs=get_base_domain_kwargs(
+                compute_domain_kwargs=compute_domain_kwargs
+            )
+        )
+    )
+
+    idx: int
+    condition: sqlalchemy.ColumnElement
+    flag: sqlalchemy.ColumnElement
+    flags_and_row_numbers: List[sqlalchemy.Label] = []
+    for idx, condition in enumerate(conditions):
+        flag = sa.case((condition, 1), else_=0)
+        flags_and_row_numbers.append(flag.label(f"gx_unexpected_flag_{idx}"))
+        flags_and_row_numbers.append(
+            sa.func.row_number()
+            .over(
+                partition_by=flag,
+                order_by=[
+                    sa.column(column_name)
+                    for column_name in index_column_names_list[idx]
+                ]
+                or flag,
+            )
+            .label(f"gx_unexpected_row_number_{idx}")
+        )
+
+    unexpected_rows_subquery: sqlalchemy.Subquery = (
+        sa.select(
+            *[sa.column(column_name) for column_name in selected_column_names],
+            *flags_and_row_numbers,
+        )
+        .select_from(domain_records_as_selectable)
+        .where(sa.or_(*conditions))
+        .subquery()
+    )
+    flag_offset: int = len(selected_column_names)
+    final_query: sa.select = sa.select(*unexpected_rows_subquery.c).where(
+        sa.or_(
+            *[
+                sa.and_(
+                    unexpected_rows_subquery.c[f"gx_unexpected_flag_{idx}"] == 1,
+                    unexpected_rows_subquery.c[f"gx_unexpected_row_number_{idx}"]
+                    <= partial_unexpected_count,
+                )
+                for idx, partial_unexpected_count in enumerate(
+                    partial_unexpected_counts
+                )
+            ]
+        )
+    )
+    query_result: List[sqlalchemy.Row] = execution_engine.execute_query(
+        final_query
+    ).fetchall()
+
+    ranked_unexpected_index_lists: List[List[tuple]] = [[] for _ in conditions]
+
+    row: sqlalchemy.Row
+    row_number: int
+    for row in query_result:
+        for idx in range(len(conditions)):
+            row_number = row[flag_offset + 2 * idx + 1]
+            if (
+                row[flag_offset + 2 * idx] != 1
+                or row_number > partial_unexpected_counts[idx]
+            ):
+                continue
+
+            # the last columns are the columns the Expectation is being run on
+            ranked_unexpected_index_lists[idx].append(
+                (
+                    row_number,
+                    {
+                        column_name: row[selected_column_names.index(column_name)]
+                        for column_name in index_column_names_list[idx]
+                        + domain_column_names_list[idx]
+                    },
+                )
+            )
+
+    return [
+        [
+            primary_key_dict
+            for _, primary_key_dict in sorted(
+                ranked_unexpected_index_list, key=lambda element: element[0]
+            )
+        ]
+        for ranked_unexpected_index_list in ranked_unexpected_index_lists
+    ]
+
+
 def _spark_map_condition_unexpected_count_aggregate_fn(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -819,24 +1007,3 @@ def _spark_map_condition_query(
         "Column<'(", ""
     ).replace(")'>", "")
     return f"df.filter(F.expr({unexpected_condition_filtered}))"
-
-
-def _generate_temp_table(
-    connection: sa.engine.base.Connection,
-    metric_domain_kwargs: Dict,
-    metric_value_kwargs: Dict,
-    metrics: Dict[str, Any],
-    **kwargs,
-) -> sa.Table:
-    temp_table_name: str = generate_temporary_table_name(
-        default_table_name_prefix="#ge_temp_"
-    )
-    metadata: sa.MetaData = sa.MetaData()
-    metadata.reflect(bind=connection)
-    temp_table_obj: sa.Table = sa.Table(
-        temp_table_name,
-        metadata,
-        sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
-    )
-    temp_table_obj.create(bind=connection, checkfirst=True)
-    return temp_table_obj
@@ -0,0 +1,238 @@
+"""Quantile computation for SQL dialects without (exact) "percentile_disc" support.
+
+All requested quantiles (and the median) are obtained from one query: a "ROW_NUMBER()" window query returning only
+rows at requested positions, where window functions are available, or a single ordered scan otherwise.  Alternatively,
+approximate quantiles are computed from a "KllSketch" in one unordered scan.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.core.sketches import (
+    KllSketch,
+    get_sketch_relative_error,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+logger = logging.getLogger(__name__)
+
+# Number of rows fetched from database at a time, when scanning column values.
+SCAN_PARTITION_SIZE: int = 10000
+
+_ROW_NUMBER_LABEL: str = "gx_row_number"
+_VALUE_LABEL: str = "gx_value"
+
+# Minimum server versions, at which "ROW_NUMBER() OVER (...)" window function is supported.
+_MIN_WINDOW_FUNCTION_VERSIONS: Dict[GXSqlDialect, tuple] = {
+    GXSqlDialect.SQLITE: (3, 25),
+    GXSqlDialect.MYSQL: (8, 0),
+}
+
+
+def get_quantile_row_positions(quantiles: Iterable[float], row_count: int) -> List[int]:
+    """Returns (zero-based) positions of rows holding requested quantiles in ordered column.
+
+    Positions match "ORDER BY column OFFSET quantile * row_count - 1 LIMIT 1" (i.e., "percentile_disc" semantics).
+    """
+    return [max(int(quantile * row_count - 1), 0) for quantile in quantiles]
+
+
+def get_median_row_positions(row_count: int) -> List[int]:
+    """Returns (zero-based) positions of center row (odd "row_count") or of two center rows (even "row_count")."""
+    if row_count % 2 == 0:
+        return [max(row_count // 2 - 1, 0), row_count // 2]
+
+    return [row_count // 2]
+
+
+def dialect_supports_window_functions(
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> bool:
+    dialect_name: str = execution_engine.dialect_name
+    server_version_info: Optional[tuple] = getattr(
+        execution_engine.engine.dialect, "server_version_info", None
+    )
+
+    dialect: GXSqlDialect
+    min_version: tuple
+    for dialect, min_version in _MIN_WINDOW_FUNCTION_VERSIONS.items():
+        if dialect == dialect_name:
+            return server_version_info is not None and (
+                tuple(server_version_info[: len(min_version)]) >= min_version
+            )
+
+    return True
+
+
+def get_column_values_at_row_positions(  # noqa: PLR0913
+    column: sqlalchemy.ColumnClause,
+    row_positions: Sequence[int],
+    selectable: sqlalchemy.Selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    ignore_nulls: bool = False,
+    use_window_function: Optional[bool] = None,
+) -> Dict[int, Any]:
+    """Obtains values at given positions of ordered column with one query.
+
+    Args:
+        column: column, whose values are ordered
+        row_positions: zero-based positions of rows in ordered column
+        selectable: compute domain selectable
+        execution_engine: "SqlAlchemyExecutionEngine" executing the query
+        ignore_nulls: if True, NULL values are excluded prior to ordering
+        use_window_function: whether to use "ROW_NUMBER()" window query (None means "if dialect supports it")
+
+    Returns:
+        Dictionary, mapping (available) row positions to column values
+    """
+    if not row_positions:
+        return {}
+
+    if use_window_function is None:
+        use_window_function = dialect_supports_window_functions(
+            execution_engine=execution_engine
+        )
+
+    if use_window_function:
+        return _get_column_values_at_row_positions_with_window_function(
+            column=column,
+            row_positions=row_positions,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            ignore_nulls=ignore_nulls,
+        )
+
+    return _get_column_values_at_row_positions_with_ordered_scan(
+        column=column,
+        row_positions=row_positions,
+        selectable=selectable,
+        execution_engine=execution_engine,
+        ignore_nulls=ignore_nulls,
+    )
+
+
+def get_column_quantiles_from_row_positions(  # noqa: PLR0913
+    column: sqlalchemy.ColumnClause,
+    quantiles: Sequence[float],
+    selectable: sqlalchemy.Selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    row_count: int,
+    use_window_function: Optional[bool] = None,
+) -> list:
+    """Computes exact quantiles ("percentile_disc" semantics) of column values with one query."""
+    row_positions: List[int] = get_quantile_row_positions(
+        quantiles=quantiles, row_count=row_count
+    )
+    values_by_row_position: Dict[int, Any] = get_column_values_at_row_positions(
+        column=column,
+        row_positions=row_positions,
+        selectable=selectable,
+        execution_engine=execution_engine,
+        use_window_function=use_window_function,
+    )
+    return [values_by_row_position.get(row_position) for row_position in row_positions]
+
+
+def get_column_quantiles_from_sketch(
+    column: sqlalchemy.ColumnClause,
+    quantiles: Sequence[float],
+    selectable: sqlalchemy.Selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    relative_error: Union[bool, float] = True,
+) -> list:
+    """Computes approximate quantiles of non-NULL column values from "KllSketch", built in one unordered scan.
+
+    Args:
+        column: column, whose quantiles are computed
+        quantiles: quantiles to compute
+        selectable: compute domain selectable
+        execution_engine: "SqlAlchemyExecutionEngine" executing the query
+        relative_error: normalized rank error target (True means "DEFAULT_SKETCH_RELATIVE_ERROR")
+
+    Returns:
+        List of approximate quantile values (in order of "quantiles")
+    """
+    sketch = KllSketch.from_relative_error(
+        relative_error=get_sketch_relative_error(allow_relative_error=relative_error)
+    )
+
+    query: sqlalchemy.Select = (
+        sa.select(column).where(column != None).select_from(selectable)  # noqa: E711
+    )
+    result = execution_engine.execute_query(query)
+    partition: list
+    for partition in iter(lambda: result.fetchmany(SCAN_PARTITION_SIZE), []):
+        sketch.update_many(row[0] for row in partition)
+
+    logger.debug(
+        f"KllSketch summarized {sketch.num_items} values of column {column} with {sketch.num_retained_items} items"
+    )
+    return sketch.quantiles(quantiles=quantiles)
+
+
+def _get_column_values_at_row_positions_with_window_function(
+    column: sqlalchemy.ColumnClause,
+    row_positions: Sequence[int],
+    selectable: sqlalchemy.Selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    ignore_nulls: bool,
+) -> Dict[int, Any]:
+    ranked_query: sqlalchemy.Select = sa.select(
+        column.label(_VALUE_LABEL),
+        sa.func.row_number().over(order_by=column.asc()).label(_ROW_NUMBER_LABEL),
+    ).select_from(selectable)
+    if ignore_nulls:
+        ranked_query = ranked_query.where(column != None)  # noqa: E711
+
+    ranked_rows = ranked_query.subquery()
+    query: sqlalchemy.Select = sa.select(
+        ranked_rows.c[_ROW_NUMBER_LABEL], ranked_rows.c[_VALUE_LABEL]
+    ).where(
+        ranked_rows.c[_ROW_NUMBER_LABEL].in_(
+            sorted({row_position + 1 for row_position in row_positions})
+        )
+    )
+    return {
+        row_number - 1: value
+        for row_number, value in execution_engine.execute_query(query).fetchall()
+    }
+
+
+def _get_column_values_at_row_positions_with_ordered_scan(
+    column: sqlalchemy.ColumnClause,
+    row_positions: Sequence[int],
+    selectable: sqlalchemy.Selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    ignore_nulls: bool,
+) -> Dict[int, Any]:
+    query: sqlalchemy.Select = (
+        sa.select(column)
+        .order_by(column.asc())
+        .limit(max(row_positions) + 1)
+        .select_from(selectable)
+    )
+    if ignore_nulls:
+        query = query.where(column != None)  # noqa: E711
+
+    requested_row_positions: set = set(row_positions)
+    values_by_row_position: Dict[int, Any] = {}
+
+    result = execution_engine.execute_query(query)
+    row_position: int = 0
+    partition: list
+    for partition in iter(lambda: result.fetchmany(SCAN_PARTITION_SIZE), []):
+        for row in partition:
+            if row_position in requested_row_positions:
+                values_by_row_position[row_position] = row[0]
+
+            row_position += 1
+
+    return values_by_row_position
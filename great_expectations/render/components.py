@@ -393,6 +393,7 @@ class RenderedBootstrapTableContent(RenderedComponentContent):
         subheader=None,
         styling=None,
         content_block_type="bootstrap_table",
+        table_data_shards=None,
     ) -> None:
         super().__init__(content_block_type=content_block_type, styling=styling)
         self.table_data = table_data
@@ -401,6 +402,8 @@ class RenderedBootstrapTableContent(RenderedComponentContent):
         self.table_options = table_options
         self.header = header
         self.subheader = subheader
+        # Paths of scripts, appending further rows to table, once page has loaded (see "bootstrap_table.j2").
+        self.table_data_shards = table_data_shards
 
     @public_api
     def to_json_dict(self) -> dict[str, JSONValues]:
@@ -418,6 +421,8 @@ class RenderedBootstrapTableContent(RenderedComponentContent):
         )
         if self.table_options is not None:
             d["table_options"] = self.table_options
+        if self.table_data_shards is not None:
+            d["table_data_shards"] = self.table_data_shards
         if self.title_row is not None:
             if isinstance(self.title_row, RenderedContent):
                 d["title_row"] = self.title_row.to_json_dict()
@@ -1,12 +1,16 @@
+import datetime
+import json
 import logging
 import os
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
@@ -14,16 +18,24 @@ from great_expectations.data_context.store.html_site_store import (
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.render.renderer.site_builder_manifest import (
+    SiteBuilderManifest,
+    get_resource_fingerprint,
+)
 from great_expectations.render.util import resource_key_passes_run_name_filter
 
 logger = logging.getLogger(__name__)
 
+# Number of source resources retrieved from source store by one bulk request of "SiteSectionBuilder".
+SOURCE_RESOURCE_BATCH_SIZE = 100
+
 FALSEY_YAML_STRINGS = [
     "0",
     "None",
@@ -109,9 +121,39 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Sites, configured with ``incremental: true``, keep a build manifest (see
+    "SiteBuilderManifest") in their store backend: pages are only rendered
+    when their stored resources change, and the index page is built from
+    link information recorded in the manifest, so that builds for given
+    resource identifiers (e.g., by UpdateDataDocsAction) neither list nor
+    read every stored resource.  Full builds (without resource identifiers)
+    list the stores again, cleaning up pages of resources no longer stored.
+    With ``max_render_workers`` greater than 1, pages of each section are
+    rendered and written concurrently by that many threads::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental: true
+            max_render_workers: 8
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    Index pages of sites with very long validation histories can be split
+    into shards: with ``index_shard_size`` configured, the index builder
+    writes links to shard scripts (under ``index/``) of at most that many
+    links each, while collecting them, and the index page loads the shards,
+    one after another, once it has loaded itself::
+
+        local_site:
+            class_name: SiteBuilder
+            site_index_builder:
+                class_name: DefaultSiteIndexBuilder
+                index_shard_size: 1000
     """
 
-    def __init__(  # noqa: C901, PLR0912, PLR0913
+    def __init__(  # noqa: C901, PLR0912, PLR0913, PLR0915
         self,
         data_context,
         store_backend,
@@ -121,6 +163,8 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         cloud_mode=False,
+        incremental=False,
+        max_render_workers=None,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
         **kwargs,
@@ -133,6 +177,7 @@ class SiteBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        self.max_render_workers = max_render_workers
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -182,6 +227,13 @@ class SiteBuilder:
                 store_backend=store_backend, runtime_environment=runtime_environment
             )
 
+        # GX Cloud (JSON) Data Docs have no index page; hence, they are always built in full.
+        self.manifest: Optional[SiteBuilderManifest] = (
+            SiteBuilderManifest(target_store=self.target_store)
+            if incremental and not cloud_mode
+            else None
+        )
+
         default_site_section_builders_config = {
             "expectations": {
                 "class_name": "DefaultSiteSectionBuilder",
@@ -242,6 +294,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "manifest": self.manifest,
+                    "max_render_workers": self.max_render_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -274,6 +328,7 @@ class SiteBuilder:
                 },
                 "site_section_builders_config": site_section_builders,
                 "cloud_mode": self.cloud_mode,
+                "manifest": self.manifest,
             },
             config_defaults={
                 "name": "site_index_builder",
@@ -307,6 +362,11 @@ class SiteBuilder:
 
         :return:
         """
+        if self.manifest is not None:
+            self.manifest.load()
+            if not resource_identifiers:
+                # Full build lists stores again (cleaning up pages of resources, which are no longer stored).
+                self.manifest.reset_site_keys()
 
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
@@ -317,9 +377,19 @@ class SiteBuilder:
         if self.cloud_mode:
             return
 
-        self.target_store.copy_static_assets()
+        if (
+            self.manifest is None
+            or not resource_identifiers
+            or not self.manifest.static_assets_copied
+        ):
+            self.target_store.copy_static_assets()
+            if self.manifest is not None:
+                self.manifest.set_static_assets_copied()
 
         _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        if self.manifest is not None:
+            self.manifest.save()
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -358,6 +428,8 @@ class DefaultSiteSectionBuilder:
         view=None,
         data_context_id=None,
         cloud_mode=False,
+        manifest=None,
+        max_render_workers=None,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
         **kwargs,
@@ -374,6 +446,8 @@ class DefaultSiteSectionBuilder:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
         self.ge_cloud_mode = cloud_mode
+        self.manifest: Optional[SiteBuilderManifest] = None if cloud_mode else manifest
+        self.max_render_workers = max_render_workers
         if renderer is None:
             raise exceptions.InvalidConfigError(
                 "SiteSectionBuilder requires a renderer configuration "
@@ -416,14 +490,24 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: PLR0912
-        source_store_keys = self.source_store.list_keys()
-        if self.name == "validations" and self.validation_results_limit:
-            source_store_keys = sorted(
-                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
-            )[: self.validation_results_limit]
+        # Pages are rendered again, whenever their resources or rendering configuration (this salt) change.
+        self._fingerprint_salt = json.dumps(
+            {
+                "great_expectations_version": ge_version,
+                "renderer": renderer,
+                "view": view,
+                "data_context_id": data_context_id,
+                "show_how_to_buttons": show_how_to_buttons,
+            },
+            sort_keys=True,
+            default=str,
+        )
 
-        for resource_key in source_store_keys:
+    def build(self, resource_identifiers=None) -> None:
+        resource_keys = []
+        for resource_key in self._get_source_store_keys(
+            resource_identifiers=resource_identifiers
+        ):
             # if no resource_identifiers are passed, the section
             # builder will build
             # a page for every key in its source store.
@@ -437,77 +521,201 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
+
+            resource_keys.append(resource_key)
+
+        # Source resources are retrieved in bulk (one batch at a time, bounding memory); pages are rendered and written
+        # by up to "max_render_workers" threads; manifest is updated by this thread.
+        max_workers: int = self.max_render_workers or 1
+        batch_start: int
+        batch_keys: list
+        source_resources: Dict[Any, Any]
+        async_results: List[Tuple[Any, AsyncResult[Optional[str]]]]
+        fingerprint: Optional[str]
+        async_result: AsyncResult[Optional[str]]
+        with AsyncExecutor(
+            concurrency_config=ConcurrencyConfig(enabled=max_workers > 1),
+            max_workers=max_workers,
+        ) as async_executor:
+            for batch_start in range(0, len(resource_keys), SOURCE_RESOURCE_BATCH_SIZE):
+                batch_keys = resource_keys[
+                    batch_start : batch_start + SOURCE_RESOURCE_BATCH_SIZE
+                ]
+                source_resources = self._get_source_resources(resource_keys=batch_keys)
+                async_results = [
+                    (
+                        resource_key,
+                        async_executor.submit(
+                            self._build_page,
+                            resource_key=resource_key,
+                            source_resource=source_resources.get(resource_key),
+                        ),
+                    )
+                    for resource_key in batch_keys
+                ]
+                for resource_key, async_result in async_results:
+                    fingerprint = async_result.result()
+                    if self.manifest is not None and fingerprint is not None:
+                        self.manifest.set_fingerprint(
+                            section_name=self.name,
+                            resource_key=resource_key,
+                            fingerprint=fingerprint,
+                        )
+
+    def _get_source_store_keys(self, resource_identifiers=None) -> list:
+        limit_validation_results: bool = bool(
+            self.name == "validations" and self.validation_results_limit
+        )
+        if (
+            self.manifest is not None
+            and resource_identifiers
+            and not limit_validation_results
+        ):
+            # Incremental build of given resources looks them up, rather than listing all keys of source store.
+            return [
+                resource_key
+                for resource_key in resource_identifiers
+                if isinstance(resource_key, self.source_store.key_class)
+                and self.source_store.has_key(resource_key)
+            ]
+
+        source_store_keys = self.source_store.list_keys()
+        if limit_validation_results:
+            source_store_keys = sorted(
+                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
+            )[: self.validation_results_limit]
+
+        return source_store_keys
+
+    def _get_source_resources(self, resource_keys: list) -> Dict[Any, Any]:
+        """Retrieves source resources (serialized, if pages are tracked by manifest) of given keys in one bulk request.
+
+        If any of resources cannot be retrieved, nothing is returned, and every page retrieves its own resource instead
+        (skipping missing ones).
+        """
+        if self.cloud_mode or not resource_keys:
+            return {}
+
+        source_resources: list
+        try:
+            if self.manifest is None:
+                source_resources = self.source_store.get_many(resource_keys)
+            else:
+                source_resources = self.source_store.store_backend.get_many(
+                    [
+                        self.source_store.key_to_tuple(resource_key)
+                        for resource_key in resource_keys
+                    ]
+                )
+        except exceptions.InvalidKeyError:
+            return {}
+
+        return dict(zip(resource_keys, source_resources))
+
+    def _build_page(
+        self, resource_key, source_resource: Optional[Any] = None
+    ) -> Optional[str]:
+        """Renders and writes page of resource; returns fingerprint of resource, if page is tracked by manifest.
+
+        Source resource (as returned by "_get_source_resources") is retrieved from source store, unless it is given.
+        """
+        fingerprint: Optional[str] = None
+        try:
+            if self.manifest is None:
+                resource = source_resource or self.source_store.get(resource_key)
+            else:
+                serialized_resource = (
+                    source_resource
+                    or self.source_store.store_backend.get(
+                        self.source_store.key_to_tuple(resource_key)
                     )
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
                 )
-                continue
+                fingerprint = get_resource_fingerprint(
+                    serialized_resource=serialized_resource,
+                    salt=self._fingerprint_salt,
+                )
+                if fingerprint == self.manifest.get_fingerprint(
+                    section_name=self.name, resource_key=resource_key
+                ):
+                    logger.debug(f"        Skipping unchanged resource {resource_key}")
+                    return None
+
+                resource = (
+                    self.source_store.deserialize(serialized_resource)
+                    if serialized_resource
+                    else None
+                )
 
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
+                resource = ExpectationSuite(**resource, data_context=self.data_context)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return None
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
                 logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
                 )
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(
+                        resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  '
+                f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+            return None
+
+        return fingerprint
 
 
 class DefaultSiteIndexBuilder:
@@ -526,6 +734,8 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        manifest=None,
+        index_shard_size=None,
         **kwargs,
     ) -> None:
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -538,6 +748,10 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        # Site keys and validation result link information are taken from manifest (if any) of incremental site.
+        self.manifest: Optional[SiteBuilderManifest] = manifest
+        # Links of sections are written to shards of index page, each holding at most this many links, if configured.
+        self.index_shard_size = index_shard_size
 
         if renderer is None:
             renderer = {
@@ -581,6 +795,21 @@ class DefaultSiteIndexBuilder:
                 class_name=view["class_name"],
             )
 
+        if self.index_shard_size is not None and (
+            not isinstance(self.index_shard_size, int) or self.index_shard_size < 1
+        ):
+            raise exceptions.InvalidConfigError(
+                f"index_shard_size must be a positive integer, not {self.index_shard_size!r}"
+            )
+        if self.index_shard_size and not (
+            hasattr(self.renderer_class, "render_link_table_rows")
+            and hasattr(self.view_class, "render_bootstrap_table_data_shard")
+        ):
+            raise exceptions.InvalidConfigError(
+                "index_shard_size requires renderer and view, which render shards of index page "
+                "(such as SiteIndexPageRenderer and DefaultJinjaIndexPageView)"
+            )
+
     def add_resource_info_to_index_links_dict(  # noqa: PLR0913
         self,
         index_links_dict,
@@ -736,6 +965,10 @@ class DefaultSiteIndexBuilder:
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
         :return: tuple(index_page_url, index_links_dict)
+
+        If "index_shard_size" is configured, links of each section are written to shards of the index page, as soon as
+        "index_shard_size" of them are collected; "{section_name}_links" of the returned index_links_dict then hold
+        no links, and "{section_name}_link_shards" hold the shards ("filepath" and "link_count") instead.
         """
 
         # Loop over sections in the HtmlStore
@@ -744,6 +977,9 @@ class DefaultSiteIndexBuilder:
             logger.debug("Skipping index rendering")
             return None, None
 
+        self._build_timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y%m%dT%H%M%S.%fZ"
+        )
         index_links_dict = OrderedDict()
         index_links_dict["site_name"] = self.site_name
 
@@ -762,6 +998,11 @@ class DefaultSiteIndexBuilder:
         self._add_validations_to_index_links(
             index_links_dict, validation_and_profiling_result_site_keys
         )
+        if self.index_shard_size:
+            for section_name in ("expectations", "profiling", "validations"):
+                self._write_index_links_shard(
+                    index_links_dict, section_name, is_last_shard=True
+                )
 
         viewable_content = ""
         try:
@@ -790,34 +1031,55 @@ diagnose and repair the underlying issue.  Detailed information follows:
     ) -> None:
         expectations = self.site_section_builders_config.get("expectations", "None")
         if expectations and expectations not in FALSEY_YAML_STRINGS:
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get(
-                    "source_store_name"
-                )
-            ].list_keys()
-            expectation_suite_site_keys = [
-                ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
-                for expectation_suite_tuple in self.target_store.store_backends[
-                    ExpectationSuiteIdentifier
-                ].list_keys()
-            ]
-            if skip_and_clean_missing:
-                cleaned_keys = []
-                for expectation_suite_site_key in expectation_suite_site_keys:
-                    if expectation_suite_site_key not in expectation_suite_source_keys:
-                        self.target_store.store_backends[
-                            ExpectationSuiteIdentifier
-                        ].remove_key(expectation_suite_site_key)
-                    else:
-                        cleaned_keys.append(expectation_suite_site_key)
-                expectation_suite_site_keys = cleaned_keys
-
+            expectation_suite_site_keys = self._get_expectation_suite_site_keys(
+                skip_and_clean_missing=skip_and_clean_missing
+            )
             for expectation_suite_key in expectation_suite_site_keys:
                 self.add_resource_info_to_index_links_dict(
                     index_links_dict=index_links_dict,
                     expectation_suite_name=expectation_suite_key.expectation_suite_name,
                     section_name="expectations",
                 )
+                self._write_index_links_shard(index_links_dict, "expectations")
+
+    def _get_expectation_suite_site_keys(
+        self, skip_and_clean_missing: bool
+    ) -> List[ExpectationSuiteIdentifier]:
+        if self.manifest is not None:
+            manifest_site_keys = self.manifest.get_site_keys(key_type="expectations")
+            if manifest_site_keys is not None:
+                return manifest_site_keys
+
+        expectation_suite_source_keys = self.data_context.stores[
+            self.site_section_builders_config["expectations"].get("source_store_name")
+        ].list_keys()
+        expectation_suite_site_keys = [
+            ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
+            for expectation_suite_tuple in self.target_store.store_backends[
+                ExpectationSuiteIdentifier
+            ].list_keys()
+        ]
+        if skip_and_clean_missing:
+            cleaned_keys = []
+            for expectation_suite_site_key in expectation_suite_site_keys:
+                if expectation_suite_site_key not in expectation_suite_source_keys:
+                    self.target_store.store_backends[
+                        ExpectationSuiteIdentifier
+                    ].remove_key(expectation_suite_site_key)
+                    if self.manifest is not None:
+                        self.manifest.remove_resource(
+                            resource_key=expectation_suite_site_key
+                        )
+                else:
+                    cleaned_keys.append(expectation_suite_site_key)
+            expectation_suite_site_keys = cleaned_keys
+
+        if self.manifest is not None:
+            self.manifest.set_site_keys(
+                key_type="expectations", resource_keys=expectation_suite_site_keys
+            )
+
+        return expectation_suite_site_keys
 
     def _build_validation_and_profiling_result_site_keys(
         self, skip_and_clean_missing: bool
@@ -833,6 +1095,13 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 if (validations and validations not in FALSEY_YAML_STRINGS)
                 else "profiling"
             )
+            if self.manifest is not None:
+                manifest_site_keys: Optional[
+                    List[ValidationResultIdentifier]
+                ] = self.manifest.get_site_keys(key_type="validations")
+                if manifest_site_keys is not None:
+                    return manifest_site_keys
+
             validation_and_profiling_result_source_keys = set(
                 self.data_context.stores[
                     self.site_section_builders_config[source_store].get(
@@ -858,10 +1127,20 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[
                             ValidationResultIdentifier
                         ].remove_key(validation_result_site_key)
+                        if self.manifest is not None:
+                            self.manifest.remove_resource(
+                                resource_key=validation_result_site_key
+                            )
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
 
+            if self.manifest is not None:
+                self.manifest.set_site_keys(
+                    key_type="validations",
+                    resource_keys=validation_and_profiling_result_site_keys,
+                )
+
         return validation_and_profiling_result_site_keys
 
     def _add_profiling_to_index_links(
@@ -883,15 +1162,13 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    link_info: dict = self._get_validation_result_link_info(
+                        validation_result_key=profiling_result_key,
+                        section_name="profiling",
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = link_info["batch_kwargs"]
+                    batch_spec = link_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -909,6 +1186,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 except Exception:
                     error_msg = f"Profiling result not found: {str(profiling_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
+                    continue
+
+                self._write_index_links_shard(index_links_dict, "profiling")
 
     def _add_validations_to_index_links(
         self,
@@ -938,16 +1218,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    link_info: dict = self._get_validation_result_link_info(
+                        validation_result_key=validation_result_key,
+                        section_name="validations",
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = link_info["validation_success"]
+                    batch_kwargs = link_info["batch_kwargs"]
+                    batch_spec = link_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -966,6 +1244,83 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 except Exception:
                     error_msg = f"Validation result not found: {str(validation_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
+                    continue
+
+                self._write_index_links_shard(index_links_dict, "validations")
+
+    def _write_index_links_shard(
+        self,
+        index_links_dict: OrderedDict,
+        section_name: str,
+        is_last_shard: bool = False,
+    ) -> None:
+        """Moves links of section, collected so far, to shard of index page (once "index_shard_size" are collected).
+
+        Only links of the current shard are held in memory; the index page loads shards, listed in index_links_dict.
+        """
+        if not self.index_shard_size:
+            return
+
+        links: list = index_links_dict.get(f"{section_name}_links", [])
+        link_shards: list = index_links_dict.setdefault(
+            f"{section_name}_link_shards", []
+        )
+        if links and (is_last_shard or len(links) >= self.index_shard_size):
+            table_data: list = self.renderer_class.render_link_table_rows(
+                section_name=section_name, link_dicts=links
+            )
+            shard: str = self.view_class.render_bootstrap_table_data_shard(
+                table_data,
+                data_context_id=self.data_context_id,
+                show_how_to_buttons=self.show_how_to_buttons,
+            )
+            shard_filepath: str = self.target_store.write_index_shard(
+                section_name=section_name,
+                shard_number=len(link_shards) + 1,
+                shard=shard,
+            )
+            link_shards.append(
+                {
+                    # Shards are rewritten by every build; query string keeps browsers from loading stale shards.
+                    "filepath": f"{shard_filepath}?d={self._build_timestamp}",
+                    "link_count": len(links),
+                }
+            )
+            index_links_dict[f"{section_name}_links"] = []
+
+        if is_last_shard:
+            self.target_store.remove_index_shards(
+                section_name=section_name, first_shard_number=len(link_shards) + 1
+            )
+
+    def _get_validation_result_link_info(
+        self, validation_result_key: ValidationResultIdentifier, section_name: str
+    ) -> dict:
+        """Returns validation success and Batch identifiers of validation result (cached in manifest, if incremental)."""
+        if self.manifest is not None:
+            cached_link_info: Optional[dict] = self.manifest.get_index_link_info(
+                resource_key=validation_result_key
+            )
+            if cached_link_info is not None:
+                return cached_link_info
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        link_info: dict = {
+            "validation_success": validation.success,
+            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+            "batch_spec": validation.meta.get("batch_spec", {}),
+        }
+        if self.manifest is not None:
+            self.manifest.set_index_link_info(
+                resource_key=validation_result_key, index_link_info=link_info
+            )
+
+        return link_info
 
 
 class CallToActionButton:
@@ -0,0 +1,190 @@
+"""Build manifest of Data Docs site, enabling incremental builds of its pages and of its index page.
+
+The manifest is a JSON document, stored in the target store of the site (alongside its static assets), recording:
+
+- fingerprint (hash of stored source resource and of renderer configuration) of every page rendered by each section,
+  so that pages are only rendered again when their source resources (or renderers) change;
+- link information (validation success and Batch identifiers) of every validation and profiling result in the index,
+  so that the index builder does not retrieve every stored validation result on each build;
+- keys of all pages of the site, so that the index builder does not list the source and target stores on each build;
+- version of static assets copied to the site.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
+
+from great_expectations import __version__ as ge_version
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.core.data_context_key import DataContextKey
+    from great_expectations.data_context.store.html_site_store import HtmlSiteStore
+
+logger = logging.getLogger(__name__)
+
+SITE_BUILDER_MANIFEST_VERSION: int = 1
+
+SITE_KEY_CLASSES: Dict[str, Type[DataContextKey]] = {
+    "expectations": ExpectationSuiteIdentifier,
+    "validations": ValidationResultIdentifier,
+}
+
+
+class SiteBuilderManifest:
+    """Manifest of Data Docs site, loaded from (and saved to) target "HtmlSiteStore" of "SiteBuilder" on each build.
+
+    Pages are tracked by resource keys, serialized as JSON arrays of their tuples.  Site keys are unknown (None), until
+    index builder lists target store; full (not incremental) builds reset them, so that missing pages are cleaned up.
+    """
+
+    def __init__(self, target_store: HtmlSiteStore) -> None:
+        self._target_store = target_store
+        self._fingerprints: Dict[str, Dict[str, str]] = {}
+        self._index_links: Dict[str, dict] = {}
+        self._site_keys: Dict[str, Optional[Set[str]]] = {}
+        self._static_assets_version: Optional[str] = None
+        self._clear()
+
+    def load(self) -> None:
+        """Loads manifest from target store (manifest, which is missing, unreadable, or outdated, is empty)."""
+        self._clear()
+
+        manifest: Optional[dict] = None
+        try:
+            serialized_manifest: Optional[str] = self._target_store.read_manifest()
+            if serialized_manifest:
+                manifest = json.loads(serialized_manifest)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read Data Docs site manifest: {e}")
+
+        if not manifest or manifest.get("version") != SITE_BUILDER_MANIFEST_VERSION:
+            return
+
+        self._fingerprints = manifest.get("fingerprints", {})
+        self._index_links = manifest.get("index_links", {})
+        site_keys: Dict[str, Optional[List[str]]] = manifest.get("site_keys", {})
+        key_type: str
+        for key_type in SITE_KEY_CLASSES:
+            keys: Optional[List[str]] = site_keys.get(key_type)
+            self._site_keys[key_type] = None if keys is None else set(keys)
+
+        self._static_assets_version = manifest.get("static_assets_version")
+
+    def save(self) -> None:
+        """Writes manifest to target store."""
+        manifest: dict = {
+            "version": SITE_BUILDER_MANIFEST_VERSION,
+            "fingerprints": self._fingerprints,
+            "index_links": self._index_links,
+            "site_keys": {
+                key_type: None if keys is None else sorted(keys)
+                for key_type, keys in self._site_keys.items()
+            },
+            "static_assets_version": self._static_assets_version,
+        }
+        self._target_store.write_manifest(json.dumps(manifest, indent=2))
+
+    def _clear(self) -> None:
+        self._fingerprints = {}
+        self._index_links = {}
+        self._site_keys = {key_type: None for key_type in SITE_KEY_CLASSES}
+        self._static_assets_version = None
+
+    def get_fingerprint(
+        self, section_name: str, resource_key: DataContextKey
+    ) -> Optional[str]:
+        return self._fingerprints.get(section_name, {}).get(
+            _serialize_key(resource_key)
+        )
+
+    def set_fingerprint(
+        self, section_name: str, resource_key: DataContextKey, fingerprint: str
+    ) -> None:
+        serialized_key: str = _serialize_key(resource_key)
+        self._fingerprints.setdefault(section_name, {})[serialized_key] = fingerprint
+        # Resource was rendered anew; its index link information may have changed as well.
+        self._index_links.pop(serialized_key, None)
+        self.add_site_key(resource_key=resource_key)
+
+    def get_index_link_info(self, resource_key: DataContextKey) -> Optional[dict]:
+        return self._index_links.get(_serialize_key(resource_key))
+
+    def set_index_link_info(
+        self, resource_key: DataContextKey, index_link_info: dict
+    ) -> None:
+        self._index_links[_serialize_key(resource_key)] = convert_to_json_serializable(
+            index_link_info
+        )
+
+    def get_site_keys(self, key_type: str) -> Optional[List[DataContextKey]]:
+        """Returns keys of pages of given type ("expectations" or "validations"), or None, if they are unknown."""
+        keys: Optional[Set[str]] = self._site_keys[key_type]
+        if keys is None:
+            return None
+
+        key_class: Type[DataContextKey] = SITE_KEY_CLASSES[key_type]
+        return [key_class.from_tuple(tuple(json.loads(key))) for key in sorted(keys)]
+
+    def set_site_keys(self, key_type: str, resource_keys: List[DataContextKey]) -> None:
+        self._site_keys[key_type] = {
+            _serialize_key(resource_key) for resource_key in resource_keys
+        }
+
+    def add_site_key(self, resource_key: DataContextKey) -> None:
+        key_type: str
+        key_class: Type[DataContextKey]
+        for key_type, key_class in SITE_KEY_CLASSES.items():
+            keys: Optional[Set[str]] = self._site_keys[key_type]
+            if isinstance(resource_key, key_class) and keys is not None:
+                keys.add(_serialize_key(resource_key))
+
+    def remove_resource(self, resource_key: DataContextKey) -> None:
+        """Forgets page of resource (after it has been removed from site)."""
+        serialized_key: str = _serialize_key(resource_key)
+        fingerprints: Dict[str, str]
+        for fingerprints in self._fingerprints.values():
+            fingerprints.pop(serialized_key, None)
+
+        self._index_links.pop(serialized_key, None)
+        keys: Optional[Set[str]]
+        for keys in self._site_keys.values():
+            if keys is not None:
+                keys.discard(serialized_key)
+
+    def reset_site_keys(self) -> None:
+        """Makes site keys unknown, so that index builder lists (and cleans up) target store on next build."""
+        key_type: str
+        for key_type in SITE_KEY_CLASSES:
+            self._site_keys[key_type] = None
+
+    @property
+    def static_assets_copied(self) -> bool:
+        return self._static_assets_version == ge_version
+
+    def set_static_assets_copied(self) -> None:
+        self._static_assets_version = ge_version
+
+
+def get_resource_fingerprint(serialized_resource: Any, salt: str) -> str:
+    """Returns MD5 hash of stored (serialized) resource, together with "salt" (e.g., renderer configuration)."""
+    if isinstance(serialized_resource, str):
+        serialized_resource = serialized_resource.encode("utf-8")
+    elif not isinstance(serialized_resource, bytes):
+        serialized_resource = json.dumps(
+            serialized_resource, sort_keys=True, default=str
+        ).encode("utf-8")
+
+    md5 = hashlib.md5(salt.encode("utf-8"))
+    md5.update(serialized_resource)
+    return md5.hexdigest()
+
+
+def _serialize_key(resource_key: DataContextKey) -> str:
+    return json.dumps(list(resource_key.to_tuple()))
@@ -46,21 +46,18 @@ class SiteIndexPageRenderer(Renderer):
                 "sortable": "true",
             },
         ]
-        expectation_suite_link_dicts = index_links_dict.get("expectations_links", [])
-        table_data = []
-
-        for dict_ in expectation_suite_link_dicts:
-            table_data.append(
-                {
-                    "expectation_suite_name": dict_.get("expectation_suite_name"),
-                    "_table_row_link_path": dict_.get("filepath"),
-                }
-            )
+        table_data = [
+            cls._get_expectation_suites_table_row(dict_)
+            for dict_ in index_links_dict.get("expectations_links", [])
+        ]
 
         return RenderedBootstrapTableContent(
             **{
                 "table_columns": table_columns,
                 "table_data": table_data,
+                "table_data_shards": cls._get_table_data_shards(
+                    index_links_dict, section_name="expectations"
+                ),
                 "table_options": table_options,
                 "styling": {
                     "classes": ["col-12", "ge-index-page-table-container"],
@@ -125,30 +122,18 @@ class SiteIndexPageRenderer(Renderer):
                 "filterControl": "select",
             },
         ]
-        profiling_link_dicts = index_links_dict.get("profiling_links", [])
-        table_data = []
-
-        for dict_ in profiling_link_dicts:
-            table_data.append(
-                {
-                    "run_time": cls._get_formatted_datetime(dict_.get("run_time")),
-                    "_run_time_sort": cls._get_timestamp(dict_.get("run_time")),
-                    "asset_name": dict_.get("asset_name"),
-                    "batch_identifier": cls._render_batch_id_cell(
-                        dict_.get("batch_identifier"),
-                        dict_.get("batch_kwargs"),
-                        dict_.get("batch_spec"),
-                    ),
-                    "_batch_identifier_sort": dict_.get("batch_identifier"),
-                    "profiler_name": dict_.get("expectation_suite_name").split(".")[-1],
-                    "_table_row_link_path": dict_.get("filepath"),
-                }
-            )
+        table_data = [
+            cls._get_profiling_results_table_row(dict_)
+            for dict_ in index_links_dict.get("profiling_links", [])
+        ]
 
         return RenderedBootstrapTableContent(
             **{
                 "table_columns": table_columns,
                 "table_data": table_data,
+                "table_data_shards": cls._get_table_data_shards(
+                    index_links_dict, section_name="profiling"
+                ),
                 "table_options": table_options,
                 "styling": {
                     "classes": ["col-12", "ge-index-page-table-container"],
@@ -228,41 +213,18 @@ class SiteIndexPageRenderer(Renderer):
                 "filterDataCollector": "expectationSuiteNameFilterDataCollector",
             },
         ]
-        validation_link_dicts = index_links_dict.get("validations_links", [])
-        table_data = []
-
-        for dict_ in validation_link_dicts:
-            table_data.append(
-                {
-                    "validation_success": cls._render_validation_success_cell(
-                        dict_.get("validation_success")
-                    ),
-                    "run_time": cls._get_formatted_datetime(dict_.get("run_time")),
-                    "_run_time_sort": cls._get_timestamp(dict_.get("run_time")),
-                    "run_name": dict_.get("run_name"),
-                    "batch_identifier": cls._render_batch_id_cell(
-                        dict_.get("batch_identifier"),
-                        dict_.get("batch_kwargs"),
-                        dict_.get("batch_spec"),
-                    ),
-                    "_batch_identifier_sort": dict_.get("batch_identifier"),
-                    "expectation_suite_name": cls._render_expectation_suite_cell(
-                        dict_.get("expectation_suite_name"),
-                        dict_.get("expectation_suite_filepath"),
-                    ),
-                    "_expectation_suite_name_sort": dict_.get("expectation_suite_name"),
-                    "_table_row_link_path": dict_.get("filepath"),
-                    "_validation_success_text": "Success"
-                    if dict_.get("validation_success")
-                    else "Failed",
-                    "asset_name": dict_.get("asset_name"),
-                }
-            )
+        table_data = [
+            cls._get_validation_results_table_row(dict_)
+            for dict_ in index_links_dict.get("validations_links", [])
+        ]
 
         return RenderedBootstrapTableContent(
             **{
                 "table_columns": table_columns,
                 "table_data": table_data,
+                "table_data_shards": cls._get_table_data_shards(
+                    index_links_dict, section_name="validations"
+                ),
                 "table_options": table_options,
                 "styling": {
                     "classes": ["col-12", "ge-index-page-table-container"],
@@ -276,6 +238,79 @@ class SiteIndexPageRenderer(Renderer):
             }
         )
 
+    @classmethod
+    def render_link_table_rows(cls, section_name: str, link_dicts: list) -> list:
+        """Renders index links of section ("expectations", "profiling", or "validations") as rows of its table.
+
+        Used to render shards of index page, which keeps rows of large tables out of the page itself.
+        """
+        get_table_row = {
+            "expectations": cls._get_expectation_suites_table_row,
+            "profiling": cls._get_profiling_results_table_row,
+            "validations": cls._get_validation_results_table_row,
+        }[section_name]
+        return [get_table_row(dict_) for dict_ in link_dicts]
+
+    @classmethod
+    def _get_table_data_shards(cls, index_links_dict, section_name):
+        link_shards = index_links_dict.get(f"{section_name}_link_shards")
+        if not link_shards:
+            return None
+
+        return [link_shard["filepath"] for link_shard in link_shards]
+
+    @classmethod
+    def _get_expectation_suites_table_row(cls, dict_):
+        return {
+            "expectation_suite_name": dict_.get("expectation_suite_name"),
+            "_table_row_link_path": dict_.get("filepath"),
+        }
+
+    # TODO: deprecate dual batch api support in 0.14
+    @classmethod
+    def _get_profiling_results_table_row(cls, dict_):
+        return {
+            "run_time": cls._get_formatted_datetime(dict_.get("run_time")),
+            "_run_time_sort": cls._get_timestamp(dict_.get("run_time")),
+            "asset_name": dict_.get("asset_name"),
+            "batch_identifier": cls._render_batch_id_cell(
+                dict_.get("batch_identifier"),
+                dict_.get("batch_kwargs"),
+                dict_.get("batch_spec"),
+            ),
+            "_batch_identifier_sort": dict_.get("batch_identifier"),
+            "profiler_name": dict_.get("expectation_suite_name").split(".")[-1],
+            "_table_row_link_path": dict_.get("filepath"),
+        }
+
+    # TODO: deprecate dual batch api support in 0.14
+    @classmethod
+    def _get_validation_results_table_row(cls, dict_):
+        return {
+            "validation_success": cls._render_validation_success_cell(
+                dict_.get("validation_success")
+            ),
+            "run_time": cls._get_formatted_datetime(dict_.get("run_time")),
+            "_run_time_sort": cls._get_timestamp(dict_.get("run_time")),
+            "run_name": dict_.get("run_name"),
+            "batch_identifier": cls._render_batch_id_cell(
+                dict_.get("batch_identifier"),
+                dict_.get("batch_kwargs"),
+                dict_.get("batch_spec"),
+            ),
+            "_batch_identifier_sort": dict_.get("batch_identifier"),
+            "expectation_suite_name": cls._render_expectation_suite_cell(
+                dict_.get("expectation_suite_name"),
+                dict_.get("expectation_suite_filepath"),
+            ),
+            "_expectation_suite_name_sort": dict_.get("expectation_suite_name"),
+            "_table_row_link_path": dict_.get("filepath"),
+            "_validation_success_text": "Success"
+            if dict_.get("validation_success")
+            else "Failed",
+            "asset_name": dict_.get("asset_name"),
+        }
+
     @classmethod
     def _render_expectation_suite_cell(
         cls, expectation_suite_name, expectation_suite_path
@@ -410,7 +445,9 @@ class SiteIndexPageRenderer(Renderer):
 
             tabs = []
 
-            if index_links_dict.get("validations_links"):
+            if index_links_dict.get("validations_links") or index_links_dict.get(
+                "validations_link_shards"
+            ):
                 tabs.append(
                     {
                         "tab_name": "Validation Results",
@@ -419,7 +456,9 @@ class SiteIndexPageRenderer(Renderer):
                         ),
                     }
                 )
-            if index_links_dict.get("profiling_links"):
+            if index_links_dict.get("profiling_links") or index_links_dict.get(
+                "profiling_link_shards"
+            ):
                 tabs.append(
                     {
                         "tab_name": "Profiling Results",
@@ -428,7 +467,9 @@ class SiteIndexPageRenderer(Renderer):
                         ),
                     }
                 )
-            if index_links_dict.get("expectations_links"):
+            if index_links_dict.get("expectations_links") or index_links_dict.get(
+                "expectations_link_shards"
+            ):
                 tabs.append(
                     {
                         "tab_name": "Expectation Suites",
@@ -218,6 +218,14 @@ class DefaultJinjaView:
             self.render_dict_values(context, table_data_dict, index, content_block_id)
         return table_data
 
+    def render_bootstrap_table_data_shard(self, table_data, **kwargs) -> str:
+        """Renders rows of "bootstrap_table" content block as shard script, appending them to table that loads it."""
+        table_data = RenderedContent.rendered_content_list_to_json(
+            table_data, check_dicts=True
+        )
+        table_data = self.render_bootstrap_table_data(kwargs, table_data)
+        return f"appendTableDataShard({json.dumps(table_data)});\n"
+
     def get_html_escaped_json_string_from_dict(self, source_dict):
         return json.dumps(source_dict).replace('"', '\\"').replace('"', "&quot;")
 
@@ -0,0 +1,758 @@
+"""Incremental validation of append-only Data Assets.
+
+States of mergeable metrics (counts, sums, minima and maxima, means, value counts, etc.) over rows validated so far are
+persisted in "MetricStateStore", together with watermark (maximum value of watermark column over these rows).  On
+subsequent validation runs, these metrics are computed only over delta (rows, whose watermark column value exceeds
+stored watermark), delta values are merged into stored states, and merged states yield metric values over all rows.
+
+Incremental validation relies on Data Asset being append-only, with watermark column increasing across appends: rows
+are never updated or deleted, and rows appended later never carry watermark less than or equal to that of any row
+validated earlier.  Metrics, which cannot be merged (e.g., quantiles, uniqueness, or unexpected index lists), as well as
+metrics, whose values cannot be kept in JSON-serializable state, are computed over all rows, as usual.
+
+WARNING: This module is experimental.
+"""
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric_function_types import (
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.core.sketches import is_sketch_relative_error
+from great_expectations.data_context.types.resource_identifiers import (
+    MetricStateIdentifier,
+)
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    NON_ROW_LOCAL_MAP_METRIC_NAMES,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.data_context.store import MetricStateStore
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metrics_calculator import (
+        MetricsCalculator,
+        _MetricKey,
+        _MetricsDict,
+    )
+
+logger = logging.getLogger(__name__)
+
+JSONScalar = Union[bool, int, float, str, None]
+
+
+class UnsupportedMetricStateError(ValueError):
+    """Raised if metric value cannot be kept in (JSON-serializable) metric state."""
+
+    pass
+
+
+class MetricStateMerger(ABC):
+    """Reduces metric value computed over delta to JSON-serializable state and merges it into state of earlier rows."""
+
+    def get_delta_metric_dependencies(
+        self, delta_metric_configuration: MetricConfiguration
+    ) -> Dict[str, MetricConfiguration]:
+        """Additional metrics (computed over same delta), which are needed to build delta state."""
+        return {}
+
+    @abstractmethod
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> Any:
+        pass
+
+    @abstractmethod
+    def merge(
+        self, state: Any, delta_state: Any, metric_configuration: MetricConfiguration
+    ) -> Any:
+        pass
+
+    def get_metric_value(
+        self, state: Any, metric_configuration: MetricConfiguration
+    ) -> Any:
+        return state
+
+
+class SumStateMerger(MetricStateMerger):
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        return _get_json_scalar(value=metric_value)
+
+    def merge(
+        self,
+        state: JSONScalar,
+        delta_state: JSONScalar,
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        if delta_state is None:
+            return state
+
+        if state is None:
+            return delta_state
+
+        return state + delta_state  # type: ignore[operator]
+
+
+class MinStateMerger(MetricStateMerger):
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        return _get_json_scalar(value=metric_value)
+
+    def merge(
+        self,
+        state: JSONScalar,
+        delta_state: JSONScalar,
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        values: List[JSONScalar] = [
+            value for value in (state, delta_state) if not _is_null(value=value)
+        ]
+        return min(values) if values else state  # type: ignore[type-var]
+
+
+class MaxStateMerger(MetricStateMerger):
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        return _get_json_scalar(value=metric_value)
+
+    def merge(
+        self,
+        state: JSONScalar,
+        delta_state: JSONScalar,
+        metric_configuration: MetricConfiguration,
+    ) -> JSONScalar:
+        values: List[JSONScalar] = [
+            value for value in (state, delta_state) if not _is_null(value=value)
+        ]
+        return max(values) if values else state  # type: ignore[type-var]
+
+
+class MeanStateMerger(MetricStateMerger):
+    """Keeps mean together with number of non-null column values, by which means are weighted when merged."""
+
+    def get_delta_metric_dependencies(
+        self, delta_metric_configuration: MetricConfiguration
+    ) -> Dict[str, MetricConfiguration]:
+        return {
+            "column_values.nonnull.count": MetricConfiguration(
+                metric_name="column_values.nonnull.count",
+                metric_domain_kwargs=delta_metric_configuration.metric_domain_kwargs,
+            )
+        }
+
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        return [
+            _get_json_scalar(value=metric_value),
+            int(dependency_values["column_values.nonnull.count"]),
+        ]
+
+    def merge(
+        self,
+        state: List[JSONScalar],
+        delta_state: List[JSONScalar],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        mean, count = state
+        delta_mean, delta_count = delta_state
+        if not delta_count:
+            return state
+
+        if not count:
+            return delta_state
+
+        total_count: int = count + delta_count  # type: ignore[operator]
+        return [
+            (mean * count + delta_mean * delta_count) / total_count,  # type: ignore[operator]
+            total_count,
+        ]
+
+    def get_metric_value(
+        self, state: List[JSONScalar], metric_configuration: MetricConfiguration
+    ) -> JSONScalar:
+        return state[0]
+
+
+class DistinctValuesStateMerger(MetricStateMerger):
+    """Keeps distinct values (as list); "column.distinct_values.count" metric is derived from them as well."""
+
+    def get_delta_metric_dependencies(
+        self, delta_metric_configuration: MetricConfiguration
+    ) -> Dict[str, MetricConfiguration]:
+        if delta_metric_configuration.metric_name == "column.distinct_values":
+            return {}
+
+        if is_sketch_relative_error(
+            allow_relative_error=(
+                delta_metric_configuration.metric_value_kwargs or {}
+            ).get("allow_relative_error", False)
+        ):
+            raise UnsupportedMetricStateError(
+                "Approximate distinct value counts cannot be kept in metric state."
+            )
+
+        return {
+            "column.distinct_values": MetricConfiguration(
+                metric_name="column.distinct_values",
+                metric_domain_kwargs=delta_metric_configuration.metric_domain_kwargs,
+            )
+        }
+
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        distinct_values: Any = dependency_values.get(
+            "column.distinct_values", metric_value
+        )
+        return [_get_json_scalar(value=value) for value in distinct_values]
+
+    def merge(
+        self,
+        state: List[JSONScalar],
+        delta_state: List[JSONScalar],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        return list(dict.fromkeys(state + delta_state))
+
+    def get_metric_value(
+        self, state: List[JSONScalar], metric_configuration: MetricConfiguration
+    ) -> Union[set, int]:
+        if metric_configuration.metric_name == "column.distinct_values":
+            return set(state)
+
+        return len(state)
+
+
+class ValueCountsStateMerger(MetricStateMerger):
+    """Keeps (value, count) pairs and re-applies sorting of "column.value_counts" metric to merged counts."""
+
+    def get_delta_state(
+        self,
+        metric_value: pd.Series,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> List[List[JSONScalar]]:
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs or {}
+        if metric_value_kwargs.get("collate") is not None or is_sketch_relative_error(
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error", False)
+        ):
+            raise UnsupportedMetricStateError(
+                "Collated or approximate value counts cannot be kept in metric state."
+            )
+
+        return [
+            [_get_json_scalar(value=value), int(count)]
+            for value, count in metric_value.items()
+        ]
+
+    def merge(
+        self,
+        state: List[List[JSONScalar]],
+        delta_state: List[List[JSONScalar]],
+        metric_configuration: MetricConfiguration,
+    ) -> List[List[JSONScalar]]:
+        counts: Dict[JSONScalar, int] = {}
+        value: JSONScalar
+        count: int
+        for value, count in state + delta_state:  # type: ignore[assignment,misc]
+            counts[value] = counts.get(value, 0) + count
+
+        return [[value, count] for value, count in counts.items()]
+
+    def get_metric_value(
+        self,
+        state: List[List[JSONScalar]],
+        metric_configuration: MetricConfiguration,
+    ) -> pd.Series:
+        counts = pd.Series(
+            [count for _, count in state],
+            index=pd.Index([value for value, _ in state], dtype=object),
+            dtype="int64",
+        )
+        sort: str = (metric_configuration.metric_value_kwargs or {}).get(
+            "sort", "value"
+        )
+        if sort == "value":
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                # Having values of multiple types (e.g., strings and floats) raises a TypeError when sorting.
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+        elif sort == "count":
+            counts.sort_values(ascending=False, kind="stable", inplace=True)
+
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+class PartialUnexpectedValuesStateMerger(MetricStateMerger):
+    """Keeps first "partial_unexpected_count" unexpected values (complete unexpected value lists are not kept)."""
+
+    def get_delta_state(
+        self,
+        metric_value: Any,
+        dependency_values: Dict[str, Any],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        if self._get_partial_unexpected_count(metric_configuration) is None:
+            raise UnsupportedMetricStateError(
+                "Complete unexpected value lists cannot be kept in metric state."
+            )
+
+        return [_get_json_scalar(value=value) for value in metric_value]
+
+    def merge(
+        self,
+        state: List[JSONScalar],
+        delta_state: List[JSONScalar],
+        metric_configuration: MetricConfiguration,
+    ) -> List[JSONScalar]:
+        return (state + delta_state)[
+            : self._get_partial_unexpected_count(metric_configuration)
+        ]
+
+    @staticmethod
+    def _get_partial_unexpected_count(
+        metric_configuration: MetricConfiguration,
+    ) -> Optional[int]:
+        result_format: Any = (metric_configuration.metric_value_kwargs or {}).get(
+            "result_format", {}
+        )
+        if (
+            not isinstance(result_format, dict)
+            or result_format.get("result_format") == "COMPLETE"
+        ):
+            return None
+
+        return result_format.get("partial_unexpected_count")
+
+
+METRIC_STATE_MERGERS_BY_METRIC_NAME: Dict[str, MetricStateMerger] = {
+    "table.row_count": SumStateMerger(),
+    "column.min": MinStateMerger(),
+    "column.max": MaxStateMerger(),
+    "column_values.length.min": MinStateMerger(),
+    "column_values.length.max": MaxStateMerger(),
+    "column_values.nonnull.count": SumStateMerger(),
+    "column_values.null.count": SumStateMerger(),
+    "column.sum": SumStateMerger(),
+    "column.mean": MeanStateMerger(),
+    "column.distinct_values": DistinctValuesStateMerger(),
+    "column.distinct_values.count": DistinctValuesStateMerger(),
+    "column.value_counts": ValueCountsStateMerger(),
+}
+
+METRIC_STATE_MERGERS_BY_METRIC_NAME_SUFFIX: Dict[str, MetricStateMerger] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: SumStateMerger(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: PartialUnexpectedValuesStateMerger(),
+}
+
+
+def get_metric_state_merger(
+    metric_configuration: MetricConfiguration,
+) -> Optional[MetricStateMerger]:
+    """Returns merger for metric (or None, if metric cannot be computed incrementally).
+
+    Metrics over filtered Domains (having "row_condition") and map metrics, whose condition for a row depends on other
+    rows (e.g., uniqueness), are never computed incrementally.
+    """
+    if metric_configuration.metric_domain_kwargs.get("row_condition"):
+        return None
+
+    metric_name: str = metric_configuration.metric_name
+    if any(
+        metric_name == map_metric_name or metric_name.startswith(f"{map_metric_name}.")
+        for map_metric_name in NON_ROW_LOCAL_MAP_METRIC_NAMES
+    ):
+        return None
+
+    if metric_name in METRIC_STATE_MERGERS_BY_METRIC_NAME:
+        return METRIC_STATE_MERGERS_BY_METRIC_NAME[metric_name]
+
+    return METRIC_STATE_MERGERS_BY_METRIC_NAME_SUFFIX.get(metric_name.split(".")[-1])
+
+
+class IncrementalValidation:
+    """Resolves mergeable metrics over rows appended since previous validation run and merges them into stored states.
+
+    Args:
+        metric_state_store: "MetricStateStore", in which metric states (with their watermarks) are persisted
+        data_asset_name: name of Data Asset, whose metric states are kept (together with "watermark_column")
+        watermark_column: column, whose values increase with every append (e.g., load timestamp or sequence number)
+    """
+
+    def __init__(
+        self,
+        metric_state_store: MetricStateStore,
+        data_asset_name: str,
+        watermark_column: str,
+    ) -> None:
+        self._metric_state_store = metric_state_store
+        self._data_asset_name = data_asset_name
+        self._watermark_column = watermark_column
+
+    @property
+    def metric_state_store(self) -> MetricStateStore:
+        return self._metric_state_store
+
+    @property
+    def data_asset_name(self) -> str:
+        return self._data_asset_name
+
+    @property
+    def watermark_column(self) -> str:
+        return self._watermark_column
+
+    def get_metric_state_key(
+        self, metric_configuration: MetricConfiguration
+    ) -> MetricStateIdentifier:
+        """Metric states are keyed independently of Batch ID, which can change from one validation run to the next."""
+        metric_domain_kwargs = IDDict(metric_configuration.metric_domain_kwargs)
+        metric_domain_kwargs.pop("batch_id", None)
+        metric_kwargs = IDDict(
+            {
+                "metric_domain_kwargs": metric_domain_kwargs,
+                "metric_value_kwargs": metric_configuration.metric_value_kwargs or {},
+            }
+        )
+        return MetricStateIdentifier(
+            data_asset_name=self._data_asset_name,
+            watermark_column=self._watermark_column,
+            metric_name=metric_configuration.metric_name,
+            metric_kwargs_id=metric_kwargs.to_id(),
+        )
+
+    def resolve_metrics(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        metrics_calculator: MetricsCalculator,
+        execution_engine: ExecutionEngine,
+        runtime_configuration: Optional[dict] = None,
+    ) -> _MetricsDict:
+        """Resolves mergeable metrics among given ones over delta and updates their stored states.
+
+        Metrics are grouped by their stored watermarks (metrics without stored state, e.g., of newly added Expectations,
+        are computed over all rows), and each group is computed (together with maximum of watermark column over its
+        delta) in one metrics computation.
+
+        Args:
+            metric_configurations: metrics needed for validation
+            metrics_calculator: "MetricsCalculator", which computes metrics over delta
+            execution_engine: "ExecutionEngine", whose type determines syntax of delta "row_condition"
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+
+        Returns:
+            Values (over all rows) of metrics, which were resolved incrementally, with metric ID as key.
+        """
+        metric_groups: Dict[
+            Tuple[Optional[str], str],
+            List[Tuple[MetricConfiguration, MetricStateMerger, Optional[dict]]],
+        ] = {}
+
+        metric_configuration: MetricConfiguration
+        merger: Optional[MetricStateMerger]
+        stored: Optional[dict]
+        for metric_configuration in {
+            metric_configuration.id: metric_configuration
+            for metric_configuration in metric_configurations
+        }.values():
+            merger = get_metric_state_merger(metric_configuration=metric_configuration)
+            if merger is None:
+                continue
+
+            stored = self._get_metric_state(metric_configuration=metric_configuration)
+            metric_groups.setdefault(
+                (
+                    metric_configuration.metric_domain_kwargs.get("batch_id"),
+                    json.dumps(stored["watermark"] if stored else None),
+                ),
+                [],
+            ).append((metric_configuration, merger, stored))
+
+        resolved_metrics: _MetricsDict = {}
+
+        batch_id: Optional[str]
+        watermark_id: str
+        metrics: List[Tuple[MetricConfiguration, MetricStateMerger, Optional[dict]]]
+        for (batch_id, watermark_id), metrics in metric_groups.items():
+            resolved_metrics.update(
+                self._resolve_metric_group(
+                    metrics=metrics,
+                    batch_id=batch_id,
+                    watermark=json.loads(watermark_id),
+                    metrics_calculator=metrics_calculator,
+                    execution_engine=execution_engine,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _resolve_metric_group(  # noqa: PLR0913
+        self,
+        metrics: List[Tuple[MetricConfiguration, MetricStateMerger, Optional[dict]]],
+        batch_id: Optional[str],
+        watermark: JSONScalar,
+        metrics_calculator: MetricsCalculator,
+        execution_engine: ExecutionEngine,
+        runtime_configuration: Optional[dict] = None,
+    ) -> _MetricsDict:
+        delta_domain_kwargs: dict = self._get_delta_domain_kwargs(
+            execution_engine=execution_engine, watermark=watermark
+        )
+
+        watermark_domain_kwargs: dict = {"column": self._watermark_column}
+        if batch_id is not None:
+            watermark_domain_kwargs["batch_id"] = batch_id
+
+        watermark_metric_configuration = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={**watermark_domain_kwargs, **delta_domain_kwargs},
+        )
+        delta_metric_configurations: List[MetricConfiguration] = [
+            watermark_metric_configuration
+        ]
+        delta_metrics: List[
+            Tuple[
+                MetricConfiguration,
+                MetricStateMerger,
+                Optional[dict],
+                MetricConfiguration,
+                Dict[str, MetricConfiguration],
+            ]
+        ] = []
+
+        metric_configuration: MetricConfiguration
+        merger: MetricStateMerger
+        stored: Optional[dict]
+        delta_metric_configuration: MetricConfiguration
+        delta_metric_dependencies: Dict[str, MetricConfiguration]
+        for metric_configuration, merger, stored in metrics:
+            delta_metric_configuration = MetricConfiguration(
+                metric_name=metric_configuration.metric_name,
+                metric_domain_kwargs={
+                    **metric_configuration.metric_domain_kwargs,
+                    **delta_domain_kwargs,
+                },
+                metric_value_kwargs=metric_configuration.metric_value_kwargs,
+            )
+            try:
+                delta_metric_dependencies = merger.get_delta_metric_dependencies(
+                    delta_metric_configuration=delta_metric_configuration
+                )
+            except UnsupportedMetricStateError as e:
+                logger.info(
+                    f'Metric "{metric_configuration.metric_name}" is not computed incrementally: {str(e)}'
+                )
+                continue
+
+            delta_metrics.append(
+                (
+                    metric_configuration,
+                    merger,
+                    stored,
+                    delta_metric_configuration,
+                    delta_metric_dependencies,
+                )
+            )
+            delta_metric_configurations.append(delta_metric_configuration)
+            delta_metric_configurations.extend(delta_metric_dependencies.values())
+
+        resolved_delta_metrics: _MetricsDict = metrics_calculator.compute_metrics(
+            metric_configurations=delta_metric_configurations,
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=0,
+        )
+        if watermark_metric_configuration.id not in resolved_delta_metrics:
+            return {}
+
+        delta_watermark: Any = resolved_delta_metrics[watermark_metric_configuration.id]
+        new_watermark: JSONScalar = (
+            watermark
+            if _is_null(value=delta_watermark)
+            else _get_watermark(value=delta_watermark)
+        )
+
+        resolved_metrics: _MetricsDict = {}
+        metric_states: Dict[MetricStateIdentifier, dict] = {}
+
+        state: Any
+        for (
+            metric_configuration,
+            merger,
+            stored,
+            delta_metric_configuration,
+            delta_metric_dependencies,
+        ) in delta_metrics:
+            if not _are_resolved(
+                metric_ids=[delta_metric_configuration.id]
+                + [dependency.id for dependency in delta_metric_dependencies.values()],
+                metrics=resolved_delta_metrics,
+            ):
+                continue
+
+            try:
+                state = merger.get_delta_state(
+                    metric_value=resolved_delta_metrics[delta_metric_configuration.id],
+                    dependency_values={
+                        name: resolved_delta_metrics[dependency.id]
+                        for name, dependency in delta_metric_dependencies.items()
+                    },
+                    metric_configuration=metric_configuration,
+                )
+                if stored is not None:
+                    state = merger.merge(
+                        state=stored["state"],
+                        delta_state=state,
+                        metric_configuration=metric_configuration,
+                    )
+
+                resolved_metrics[metric_configuration.id] = merger.get_metric_value(
+                    state=state, metric_configuration=metric_configuration
+                )
+            except UnsupportedMetricStateError as e:
+                logger.info(
+                    f'Metric "{metric_configuration.metric_name}" is not computed incrementally: {str(e)}'
+                )
+                continue
+
+            metric_states[
+                self.get_metric_state_key(metric_configuration=metric_configuration)
+            ] = {"watermark": new_watermark, "state": state}
+
+        key: MetricStateIdentifier
+        value: dict
+        for key, value in metric_states.items():
+            self._metric_state_store.set(key=key, value=value)
+
+        return resolved_metrics
+
+    def _get_metric_state(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[dict]:
+        key: MetricStateIdentifier = self.get_metric_state_key(
+            metric_configuration=metric_configuration
+        )
+        if not self._metric_state_store.has_key(key=key):
+            return None
+
+        return self._metric_state_store.get(key=key)
+
+    def _get_delta_domain_kwargs(
+        self, execution_engine: ExecutionEngine, watermark: JSONScalar
+    ) -> dict:
+        """Domain kwargs, restricting Domain to rows past watermark (or no restriction, if there is no watermark)."""
+        if watermark is None:
+            return {}
+
+        is_number: bool = isinstance(watermark, (int, float))
+        if isinstance(execution_engine, PandasExecutionEngine):
+            return {
+                "condition_parser": "pandas",
+                "row_condition": f"`{self._watermark_column}` > {watermark!r}",
+            }
+
+        if isinstance(execution_engine, SparkDFExecutionEngine):
+            literal: str = (
+                str(watermark)
+                if is_number
+                else "'{}'".format(str(watermark).replace("'", "\\'"))
+            )
+            return {
+                "condition_parser": "spark",
+                "row_condition": f"`{self._watermark_column}` > {literal}",
+            }
+
+        literal = str(watermark) if is_number else f'"{watermark}"'
+        return {
+            "condition_parser": "great_expectations__experimental__",
+            "row_condition": f'col("{self._watermark_column}")>{literal}',
+        }
+
+
+def _are_resolved(metric_ids: List[_MetricKey], metrics: _MetricsDict) -> bool:
+    return all(metric_id in metrics for metric_id in metric_ids)
+
+
+def _is_null(value: Any) -> bool:
+    if isinstance(value, np.datetime64):
+        return bool(np.isnat(value))
+
+    return (
+        value is None
+        or value is pd.NaT
+        or (isinstance(value, float) and np.isnan(value))
+    )
+
+
+def _get_json_scalar(value: MetricValue) -> JSONScalar:
+    """Returns metric value as JSON scalar (NaN stands for missing value); other values cannot be kept in state."""
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if value is None or value is pd.NaT:
+        return None
+
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+
+    if isinstance(value, (bool, int, float, str)):
+        return value
+
+    raise UnsupportedMetricStateError(
+        f"Value of type {type(value).__name__} cannot be kept in metric state."
+    )
+
+
+def _get_watermark(value: Any) -> JSONScalar:
+    """Returns watermark as number or string (date and time values are rendered in ISO 8601 format, space separated)."""
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    elif isinstance(value, np.generic):
+        value = value.item()
+
+    # "pd.Timestamp" is rendered as is, since "datetime.datetime" would truncate its nanoseconds.
+    if isinstance(value, (pd.Timestamp, datetime.date, datetime.datetime)):
+        return str(value)
+
+    return _get_json_scalar(value=value)
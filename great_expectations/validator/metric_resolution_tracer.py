@@ -0,0 +1,220 @@
+"""
+Instrumentation of metric resolution: timings of metric computations, bundles, queries, and metric graph resolution
+steps, metric cache hits and misses, and metric computation failures (retries).
+
+"MetricResolutionTracer" is attached to "ExecutionEngine" (see "ExecutionEngine.metric_resolution_tracer"); events are
+recorded in Chrome trace event format (https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU),
+so that exported trace can be inspected in "chrome://tracing" or "https://ui.perfetto.dev".  When no tracer is
+attached, "NULL_METRIC_RESOLUTION_TRACER" (which records nothing) stands in for it.
+
+WARNING: This module is experimental.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from great_expectations.core.util import convert_to_json_serializable
+
+
+class MetricResolutionTracer:
+    """Records (thread-safe) trace events of metric resolution.
+
+    Durations of metric computations are also accumulated per metric ID; metrics computed together (in one bundle)
+    share duration of their bundle evenly, so that time can be attributed to Expectations depending on these metrics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._origin: float = time.perf_counter()
+        self._pid: int = os.getpid()
+        self._events: List[dict] = []
+        self._counters: Dict[str, int] = {}
+        self._metric_durations: Dict[Tuple[str, str, str], float] = {}
+        self._metadata: Dict[str, Any] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    @property
+    def events(self) -> List[dict]:
+        with self._lock:
+            return list(self._events)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        args: Optional[dict] = None,
+        metric_ids: Optional[List[Tuple[str, str, str]]] = None,
+    ) -> Iterator[dict]:
+        """Records duration of enclosed block as complete ("X") event.
+
+        Yielded "args" dictionary may be amended within the block (e.g., with SQL text or number of rows); if
+        "metric_ids" are given, duration is attributed to these metrics (in equal shares).
+        """
+        span_args: dict = dict(args or {})
+        start: float = time.perf_counter()
+        try:
+            yield span_args
+        finally:
+            duration: float = time.perf_counter() - start
+            self._add_event(
+                event={
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": self._get_timestamp(instant=start),
+                    "dur": duration * 1.0e6,
+                    "pid": self._pid,
+                    "tid": threading.get_ident(),
+                    "args": _to_json_serializable(data=span_args),
+                }
+            )
+            if metric_ids:
+                self._add_metric_duration(metric_ids=metric_ids, duration=duration)
+
+    def instant(self, name: str, category: str, args: Optional[dict] = None) -> None:
+        """Records point-in-time ("i") event (e.g., failure of metric computation)."""
+        self._add_event(
+            event={
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "t",
+                "ts": self._get_timestamp(instant=time.perf_counter()),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": _to_json_serializable(data=args or {}),
+            }
+        )
+
+    def increment(self, name: str, category: str, **counts: int) -> None:
+        """Adds to cumulative counters (e.g., metric cache hits and misses) and records their values as "C" event."""
+        with self._lock:
+            counter_name: str
+            count: int
+            for counter_name, count in counts.items():
+                self._counters[f"{name}.{counter_name}"] = (
+                    self._counters.get(f"{name}.{counter_name}", 0) + count
+                )
+
+            values: Dict[str, int] = {
+                counter_name: self._counters[f"{name}.{counter_name}"]
+                for counter_name in counts
+            }
+
+        self._add_event(
+            event={
+                "name": name,
+                "cat": category,
+                "ph": "C",
+                "ts": self._get_timestamp(instant=time.perf_counter()),
+                "pid": self._pid,
+                "args": values,
+            }
+        )
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Sets additional (JSON-serializable) information, exported as "otherData" of trace."""
+        with self._lock:
+            self._metadata[key] = _to_json_serializable(data=value)
+
+    def get_metric_durations(self) -> Dict[Tuple[str, str, str], float]:
+        """Returns accumulated computation time (in seconds) per metric ID."""
+        with self._lock:
+            return dict(self._metric_durations)
+
+    def to_chrome_trace(self) -> dict:
+        """Returns trace in Chrome trace event (JSON object) format."""
+        with self._lock:
+            return {
+                "traceEvents": sorted(self._events, key=lambda event: event["ts"]),
+                "displayTimeUnit": "ms",
+                "otherData": {
+                    "counters": dict(self._counters),
+                    **self._metadata,
+                },
+            }
+
+    def dump(self, path: str) -> None:
+        """Writes trace in Chrome trace event format into JSON file."""
+        with open(path, "w") as outfile:
+            json.dump(self.to_chrome_trace(), outfile)
+
+    def _add_event(self, event: dict) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    def _add_metric_duration(
+        self, metric_ids: List[Tuple[str, str, str]], duration: float
+    ) -> None:
+        share: float = duration / len(metric_ids)
+        with self._lock:
+            metric_id: Tuple[str, str, str]
+            for metric_id in metric_ids:
+                self._metric_durations[metric_id] = (
+                    self._metric_durations.get(metric_id, 0.0) + share
+                )
+
+    def _get_timestamp(self, instant: float) -> float:
+        # Chrome trace event timestamps are in microseconds.
+        return (instant - self._origin) * 1.0e6
+
+
+def get_metric_resolution_tracer(execution_engine: Any) -> MetricResolutionTracer:
+    """Returns tracer attached to "ExecutionEngine" (or "NULL_METRIC_RESOLUTION_TRACER", if there is none)."""
+    tracer = getattr(execution_engine, "metric_resolution_tracer", None)
+    if isinstance(tracer, MetricResolutionTracer):
+        return tracer
+
+    return NULL_METRIC_RESOLUTION_TRACER
+
+
+def _to_json_serializable(data: Any) -> Any:
+    # Tracing must never fail metric resolution; values without JSON representation are recorded as strings.
+    try:
+        return convert_to_json_serializable(data=data)
+    except TypeError:
+        return str(data)
+
+
+class _NullMetricResolutionTracer(MetricResolutionTracer):
+    """Stands in for "MetricResolutionTracer", when metric resolution is not traced; records nothing."""
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        args: Optional[dict] = None,
+        metric_ids: Optional[List[Tuple[str, str, str]]] = None,
+    ) -> Iterator[dict]:
+        yield {}
+
+    def instant(self, name: str, category: str, args: Optional[dict] = None) -> None:
+        pass
+
+    def increment(self, name: str, category: str, **counts: int) -> None:
+        pass
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        pass
+
+
+NULL_METRIC_RESOLUTION_TRACER: MetricResolutionTracer = _NullMetricResolutionTracer()
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import traceback
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -20,6 +22,10 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metric_resolution_tracer import (
+    MetricResolutionTracer,
+    get_metric_resolution_tracer,
+)
 
 if TYPE_CHECKING:
     from great_expectations.core import IDDict
@@ -71,6 +77,152 @@ class MetricEdge:
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class _MetricDependencyIndex:
+    """Adjacency-list index over "MetricEdge" objects of "ValidationGraph" object.
+
+    Metric ids are computed exactly once per edge, when index is built, instead of on every traversal of graph edges.
+    Only "left" vertices of edges are scheduled for resolution ("right" vertices are their dependencies).
+    """
+
+    def __init__(self, edges: Iterable[MetricEdge]) -> None:
+        self._vertices: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependencies: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._dependents: Dict[_MetricKey, Set[_MetricKey]] = defaultdict(set)
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: _MetricKey
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id not in self._vertices:
+                self._vertices[left_id] = edge.left
+                self._dependencies[left_id] = set()
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                self._dependencies[left_id].add(right_id)
+                self._dependents[right_id].add(left_id)
+
+    @property
+    def vertices(self) -> Dict[_MetricKey, MetricConfiguration]:
+        return self._vertices
+
+    @property
+    def dependencies(self) -> Dict[_MetricKey, Set[_MetricKey]]:
+        return self._dependencies
+
+    @property
+    def dependents(self) -> Dict[_MetricKey, Set[_MetricKey]]:
+        return self._dependents
+
+    def get_cyclic_metric_ids(self) -> Set[_MetricKey]:
+        """Returns ids of metrics participating in dependency cycles (iterative depth-first search with coloring)."""
+        in_progress: Set[_MetricKey] = set()
+        visited: Set[_MetricKey] = set()
+        cyclic_metric_ids: Set[_MetricKey] = set()
+
+        path: List[_MetricKey]
+        stack: List[Tuple[_MetricKey, List[_MetricKey]]]
+        metric_id: _MetricKey
+        dependency_id: _MetricKey
+        for root_id in self._vertices:
+            if root_id in visited:
+                continue
+
+            path = [root_id]
+            in_progress.add(root_id)
+            stack = [(root_id, list(self._dependencies[root_id]))]
+            while stack:
+                metric_id, pending_dependency_ids = stack[-1]
+                if not pending_dependency_ids:
+                    stack.pop()
+                    path.pop()
+                    in_progress.discard(metric_id)
+                    visited.add(metric_id)
+                    continue
+
+                dependency_id = pending_dependency_ids.pop()
+                if dependency_id in in_progress:
+                    cyclic_metric_ids.update(path[path.index(dependency_id) :])
+                elif dependency_id not in visited and dependency_id in self._vertices:
+                    path.append(dependency_id)
+                    in_progress.add(dependency_id)
+                    stack.append(
+                        (dependency_id, list(self._dependencies[dependency_id]))
+                    )
+
+        return cyclic_metric_ids
+
+
+class _MetricResolutionSchedule:
+    """Topological (Kahn-style) schedule of metric resolution, driven by "_MetricDependencyIndex" object.
+
+    Unmet dependency counters are computed once; as metrics get resolved, counters of their dependents are decremented,
+    and metrics, whose dependencies have all been met, move to the ready set.  Each ready set is one topological level.
+    """
+
+    def __init__(
+        self,
+        index: _MetricDependencyIndex,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        self._index = index
+        self._ready_ids: Set[_MetricKey] = set()
+        self._unmet_dependency_counts: Dict[_MetricKey, int] = {}
+
+        metric_id: _MetricKey
+        dependency_ids: Set[_MetricKey]
+        num_unmet_dependencies: int
+        for metric_id, dependency_ids in index.dependencies.items():
+            if metric_id in metrics:
+                continue
+
+            num_unmet_dependencies = len(
+                [
+                    dependency_id
+                    for dependency_id in dependency_ids
+                    if dependency_id not in metrics
+                ]
+            )
+            if num_unmet_dependencies == 0:
+                self._ready_ids.add(metric_id)
+            else:
+                self._unmet_dependency_counts[metric_id] = num_unmet_dependencies
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Metrics not yet resolved, whose dependencies have all been resolved."""
+        return {self._index.vertices[metric_id] for metric_id in self._ready_ids}
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Metrics not yet resolved, which still have unresolved dependencies."""
+        return {
+            self._index.vertices[metric_id]
+            for metric_id in self._unmet_dependency_counts
+        }
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Removes resolved metrics from schedule and promotes dependents, whose last unmet dependency got resolved."""
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            if metric_id in self._ready_ids:
+                self._ready_ids.remove(metric_id)
+            elif metric_id in self._unmet_dependency_counts:
+                # Resolved ahead of its dependencies (e.g., supplied externally); it no longer needs to be scheduled.
+                del self._unmet_dependency_counts[metric_id]
+            else:
+                continue
+
+            for dependent_id in self._index.dependents.get(metric_id, ()):
+                if dependent_id in self._unmet_dependency_counts:
+                    self._unmet_dependency_counts[dependent_id] -= 1
+                    if self._unmet_dependency_counts[dependent_id] == 0:
+                        del self._unmet_dependency_counts[dependent_id]
+                        self._ready_ids.add(dependent_id)
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -86,6 +238,8 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        self._index: Optional[_MetricDependencyIndex] = None
+
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
         return self.edge_ids == other.edge_ids
@@ -105,6 +259,18 @@ class ValidationGraph:
         if edge.id not in self._edge_ids:
             self._edges.append(edge)
             self._edge_ids.add(edge.id)
+            self._index = None
+
+    def _get_index(self) -> _MetricDependencyIndex:
+        """Returns adjacency-list index over edges of this "ValidationGraph" object (built lazily, once per change).
+
+        Index is built when needed (not upon "add()"), because "MetricConfiguration" ids of dependencies become final
+        only after their default kwargs have been set by "build_metric_dependency_graph()".
+        """
+        if self._index is None:
+            self._index = _MetricDependencyIndex(edges=self._edges)
+
+        return self._index
 
     def build_metric_dependency_graph(
         self,
@@ -119,7 +285,22 @@ class ValidationGraph:
             metric_configuration: Desired MetricConfiguration object to be resolved.
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
         """
+        self._build_metric_dependency_graph(
+            metric_configuration=metric_configuration,
+            runtime_configuration=runtime_configuration,
+            ancestor_metric_ids=set(),
+        )
 
+    def _build_metric_dependency_graph(
+        self,
+        metric_configuration: MetricConfiguration,
+        runtime_configuration: Optional[dict],
+        ancestor_metric_ids: Set[_MetricKey],
+    ) -> None:
+        """
+        Recursive implementation of "build_metric_dependency_graph()"; "ancestor_metric_ids" holds ids of metrics on
+        current dependency path, so that any dependency leading back to one of them is detected as circular.
+        """
         metric_impl_klass: MetricProvider
         metric_provider: Callable
         (
@@ -143,11 +324,12 @@ class ValidationGraph:
             )
         else:
             metric_configuration.metric_dependencies = metric_dependencies
+            metric_id: _MetricKey = metric_configuration.id
+            path_metric_ids: Set[_MetricKey] = ancestor_metric_ids | {metric_id}
             for metric_dependency in metric_dependencies.values():
-                # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
-                if metric_dependency.id == metric_configuration.id:
+                if metric_dependency.id in path_metric_ids:
                     logger.warning(
-                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                        f"Metric {str(metric_id)} has created a circular dependency"
                     )
                     continue
                 self.add(
@@ -156,9 +338,10 @@ class ValidationGraph:
                         right=metric_dependency,
                     )
                 )
-                self.build_metric_dependency_graph(
+                self._build_metric_dependency_graph(
                     metric_configuration=metric_dependency,
                     runtime_configuration=runtime_configuration,
+                    ancestor_metric_ids=path_metric_ids,
                 )
 
     def set_metric_configuration_default_kwargs_if_absent(
@@ -204,12 +387,21 @@ class ValidationGraph:
         aborted_metrics_info: Dict[
             _MetricKey,
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ] = self._resolve(
-            metrics=resolved_metrics,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
-            show_progress_bars=show_progress_bars,
-        )
+        ]
+        try:
+            aborted_metrics_info = self._resolve(
+                metrics=resolved_metrics,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+                show_progress_bars=show_progress_bars,
+            )
+        finally:
+            # Like tracer, resource release is optional for stand-ins of "ExecutionEngine" (e.g., in tests).
+            release_metric_resolution_resources: Optional[Callable[[], None]] = getattr(
+                self._execution_engine, "release_metric_resolution_resources", None
+            )
+            if release_metric_resolution_resources is not None:
+                release_metric_resolution_resources()
 
         return resolved_metrics, aborted_metrics_info
 
@@ -250,9 +442,22 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        # Topological schedule is computed once and then updated incrementally, as metrics get resolved.
+        schedule = _MetricResolutionSchedule(index=self._get_index(), metrics=metrics)
+
+        resolved_metrics: Dict[_MetricKey, MetricValue]
+
+        tracer: MetricResolutionTracer = get_metric_resolution_tracer(
+            execution_engine=self._execution_engine
+        )
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = schedule.ready_metrics
+            needed_metrics = schedule.needed_metrics
+
+            if len(ready_metrics) == 0 and len(needed_metrics) > 0:
+                self._log_unresolvable_metrics(needed_metrics=needed_metrics)
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -273,19 +478,30 @@ class ValidationGraph:
 
             for metric in ready_metrics:
                 if metric.id in failed_metric_info and failed_metric_info[metric.id]["num_failures"] >= MAX_METRIC_COMPUTATION_RETRIES:  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                    if metric.id not in aborted_metrics_info:
+                        tracer.instant(
+                            name="metric_resolution_aborted",
+                            category="validation_graph",
+                            args={"metric_id": metric.id},
+                        )
                     aborted_metrics_info[metric.id] = failed_metric_info[metric.id]
                 else:
                     computable_metrics.add(metric)
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
+                with tracer.span(
+                    name="resolve_metrics",
+                    category="validation_graph",
+                    args={"num_metrics": len(computable_metrics)},
+                ):
+                    resolved_metrics = self._execution_engine.resolve_metrics(
                         metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         runtime_configuration=runtime_configuration,
                     )
-                )
+                metrics.update(resolved_metrics)
+                schedule.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -297,6 +513,18 @@ class ValidationGraph:
                         exception_message=exception_message,
                     )
                     for failed_metric in err.failed_metrics:
+                        tracer.instant(
+                            name="metric_resolution_failure",
+                            category="validation_graph",
+                            args={
+                                "metric_id": failed_metric.id,
+                                "num_failures": failed_metric_info.get(
+                                    failed_metric.id, {}
+                                ).get("num_failures", 0)
+                                + 1,
+                                "exception_message": exception_message,
+                            },
+                        )
                         if failed_metric.id in failed_metric_info:
                             failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
                             failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
@@ -335,23 +563,24 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        schedule = _MetricResolutionSchedule(index=self._get_index(), metrics=metrics)
+        return schedule.ready_metrics, schedule.needed_metrics
+
+    def _log_unresolvable_metrics(
+        self, needed_metrics: Set[MetricConfiguration]
+    ) -> None:
+        """Reports metrics, which can never become ready, distinguishing circular dependencies from missing ones."""
+        cyclic_metric_ids: Set[_MetricKey] = self._get_index().get_cyclic_metric_ids()
+        metric_configuration: MetricConfiguration
+        for metric_configuration in needed_metrics:
+            if metric_configuration.id in cyclic_metric_ids:
+                logger.warning(
+                    f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                )
+            else:
+                logger.debug(
+                    f"Metric {str(metric_configuration.id)} has unresolved dependencies"
+                )
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -434,13 +663,13 @@ class ExpectationValidationGraph:
         _MetricKey,
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
     ]:
-        graph_metric_ids: List[_MetricKey] = []
+        graph_metric_ids: Set[_MetricKey] = set()
         edge: MetricEdge
         vertex: MetricConfiguration
         for edge in self.graph.edges:
             for vertex in [edge.left, edge.right]:
                 if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+                    graph_metric_ids.add(vertex.id)
 
         metric_id: _MetricKey
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
@@ -69,6 +69,10 @@ from great_expectations.rule_based_profiler.rule_based_profiler import (
 from great_expectations.types import ClassConfig
 from great_expectations.util import load_class, verify_dynamic_loading_support
 from great_expectations.validator.exception_info import ExceptionInfo
+from great_expectations.validator.metric_resolution_tracer import (
+    MetricResolutionTracer,
+    get_metric_resolution_tracer,
+)
 from great_expectations.validator.metrics_calculator import (
     MetricsCalculator,
     _MetricKey,
@@ -108,6 +112,9 @@ if TYPE_CHECKING:
         ParameterContainer,
     )
     from great_expectations.rule_based_profiler.rule import Rule
+    from great_expectations.validator.incremental_validation import (
+        IncrementalValidation,
+    )
     from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -999,6 +1006,7 @@ class Validator:
         self,
         configurations: List[ExpectationConfiguration],
         runtime_configuration: Optional[dict] = None,
+        incremental_validation: Optional[IncrementalValidation] = None,
     ) -> List[ExpectationValidationResult]:
         """Obtains validation dependencies for each metric using the implementation of their associated expectation,
         then proceeds to add these dependencies to the validation graph, supply readily available metric implementations
@@ -1009,6 +1017,8 @@ class Validator:
             used to supply domain and values for metrics.
             runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics, such as the
             result_format.
+            incremental_validation (IncrementalValidation): If provided, mergeable metrics are computed over rows
+            appended since previous validation run only, and merged into their persisted states.
 
         Returns:
             A list of Validations, validating that all necessary metrics are available.
@@ -1027,6 +1037,14 @@ class Validator:
 
         processed_configurations: List[ExpectationConfiguration] = []
 
+        incrementally_resolved_metrics: _MetricsDict = {}
+        if incremental_validation is not None:
+            incrementally_resolved_metrics = self._resolve_metrics_incrementally(
+                configurations=configurations,
+                incremental_validation=incremental_validation,
+                runtime_configuration=runtime_configuration,
+            )
+
         (
             expectation_validation_graphs,
             evrs,
@@ -1036,6 +1054,7 @@ class Validator:
             processed_configurations=processed_configurations,
             catch_exceptions=catch_exceptions,
             runtime_configuration=runtime_configuration,
+            resolved_metrics=incrementally_resolved_metrics,
         )
 
         graph: ValidationGraph = (
@@ -1060,6 +1079,9 @@ class Validator:
                 show_progress_bars=self._determine_progress_bars(),
             )
         except Exception as err:
+            self._set_expectation_metric_resolution_durations(
+                expectation_validation_graphs=expectation_validation_graphs
+            )
             # If a general Exception occurs during the execution of "ValidationGraph.resolve()", then
             # all expectations in the suite are impacted, because it is impossible to attribute the failure to a metric.
             if catch_exceptions:
@@ -1074,17 +1096,32 @@ class Validator:
             else:
                 raise err
 
+        resolved_metrics.update(incrementally_resolved_metrics)
+
+        self._set_expectation_metric_resolution_durations(
+            expectation_validation_graphs=expectation_validation_graphs
+        )
+
+        tracer: MetricResolutionTracer = get_metric_resolution_tracer(
+            execution_engine=self._execution_engine
+        )
+
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
         for configuration in processed_configurations:
             try:
-                runtime_configuration_default = copy.deepcopy(runtime_configuration)
+                runtime_configuration_default = dict(runtime_configuration)
 
-                result = configuration.metrics_validate(
-                    metrics=resolved_metrics,
-                    execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration_default,
-                )
+                with tracer.span(
+                    name=configuration.expectation_type,
+                    category="expectation",
+                    args={"kwargs": configuration.kwargs} if tracer.enabled else None,
+                ):
+                    result = configuration.metrics_validate(
+                        metrics=resolved_metrics,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=runtime_configuration_default,
+                    )
                 evrs.append(result)
             except Exception as err:
                 if catch_exceptions:
@@ -1100,12 +1137,119 @@ class Validator:
 
         return evrs
 
-    def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+    def _resolve_metrics_incrementally(
+        self,
+        configurations: List[ExpectationConfiguration],
+        incremental_validation: IncrementalValidation,
+        runtime_configuration: Optional[dict] = None,
+    ) -> _MetricsDict:
+        """Resolves mergeable metrics, needed by Expectations, over rows appended since previous validation run.
+
+        Expectations, whose validation dependencies cannot be obtained, are skipped here (their errors are reported, when
+        their metric dependency sub-graphs are generated).
+        """
+        metric_configurations: List[MetricConfiguration] = []
+
+        configuration: ExpectationConfiguration
+        evaluated_config: ExpectationConfiguration
+        for configuration in configurations:
+            evaluated_config = configuration.derive(
+                kwargs={"batch_id": self.active_batch_id}
+            )
+            try:
+                expectation_impl = get_expectation_impl(
+                    evaluated_config.expectation_type
+                )
+                metric_configurations.extend(
+                    expectation_impl()
+                    .get_validation_dependencies(
+                        configuration=evaluated_config,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=runtime_configuration,
+                    )
+                    .get_metric_configurations()
+                )
+            except Exception as e:
+                logger.debug(
+                    f'Unable to obtain validation dependencies of "{configuration.expectation_type}": {str(e)}'
+                )
+
+        return incremental_validation.resolve_metrics(
+            metric_configurations=metric_configurations,
+            metrics_calculator=self._metrics_calculator,
+            execution_engine=self._execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def _set_expectation_metric_resolution_durations(
+        self, expectation_validation_graphs: List[ExpectationValidationGraph]
+    ) -> None:
+        """Attributes traced metric computation time to Expectations (slowest first), if metric resolution is traced.
+
+        Traced time of each metric (its even share of time of bundled computation, in which it was resolved) is split
+        evenly among Expectations, whose graphs contain this metric; hence, times attributed to all Expectations add up
+        to total traced metric computation time.
+        """
+        tracer: MetricResolutionTracer = get_metric_resolution_tracer(
+            execution_engine=self._execution_engine
+        )
+        if not tracer.enabled:
+            return
+
+        metric_durations: Dict[_MetricKey, float] = tracer.get_metric_durations()
+
+        expectation_metric_ids: List[Set[_MetricKey]] = []
+        num_expectations_by_metric_id: Dict[_MetricKey, int] = {}
+
+        expectation_validation_graph: ExpectationValidationGraph
+        metric_ids: Set[_MetricKey]
+        metric_id: _MetricKey
+        edge: MetricEdge
+        for expectation_validation_graph in expectation_validation_graphs:
+            metric_ids = set()
+            for edge in expectation_validation_graph.graph.edges:
+                metric_ids.add(edge.left.id)
+                if edge.right is not None:
+                    metric_ids.add(edge.right.id)
+
+            expectation_metric_ids.append(metric_ids)
+            for metric_id in metric_ids:
+                num_expectations_by_metric_id[metric_id] = (
+                    num_expectations_by_metric_id.get(metric_id, 0) + 1
+                )
+
+        expectation_durations: List[dict] = [
+            {
+                "expectation_type": expectation_validation_graph.configuration.expectation_type,
+                "kwargs": expectation_validation_graph.configuration.kwargs,
+                "num_metrics": len(metric_ids),
+                "metric_resolution_seconds": sum(
+                    metric_durations.get(metric_id, 0.0)
+                    / num_expectations_by_metric_id[metric_id]
+                    for metric_id in metric_ids
+                ),
+            }
+            for expectation_validation_graph, metric_ids in zip(
+                expectation_validation_graphs, expectation_metric_ids
+            )
+        ]
+
+        tracer.set_metadata(
+            key="expectations",
+            value=sorted(
+                expectation_durations,
+                key=lambda element: element["metric_resolution_seconds"],
+                reverse=True,
+            ),
+        )
+
+    def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(  # noqa: PLR0913
         self,
         expectation_configurations: List[ExpectationConfiguration],
         processed_configurations: List[ExpectationConfiguration],
         catch_exceptions: bool,
         runtime_configuration: Optional[dict] = None,
+        resolved_metrics: Optional[_MetricsDict] = None,
     ) -> Tuple[
         List[ExpectationValidationGraph],
         List[ExpectationValidationResult],
@@ -1113,6 +1257,10 @@ class Validator:
     ]:
         # While evaluating expectation configurations, create sub-graph for every metric dependency and incorporate
         # these sub-graphs under corresponding expectation-level sub-graph (state of ExpectationValidationGraph object).
+        # Already resolved metrics (e.g., resolved incrementally) are left out of sub-graphs.
+        if resolved_metrics is None:
+            resolved_metrics = {}
+
         expectation_validation_graphs: List[ExpectationValidationGraph] = []
         evrs: List[ExpectationValidationResult] = []
         configuration: ExpectationConfiguration
@@ -1128,8 +1276,9 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            evaluated_config = copy.deepcopy(configuration)
-            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            evaluated_config = configuration.derive(
+                kwargs={"batch_id": self.active_batch_id}
+            )
 
             expectation_impl = get_expectation_impl(evaluated_config.expectation_type)
             validation_dependencies: ValidationDependencies = (
@@ -1144,7 +1293,11 @@ class Validator:
                 expectation_validation_graph: ExpectationValidationGraph = ExpectationValidationGraph(
                     configuration=evaluated_config,
                     graph=self._metrics_calculator.build_metric_dependency_graph(
-                        metric_configurations=validation_dependencies.get_metric_configurations(),
+                        metric_configurations=[
+                            metric_configuration
+                            for metric_configuration in validation_dependencies.get_metric_configurations()
+                            if metric_configuration.id not in resolved_metrics
+                        ],
                         runtime_configuration=runtime_configuration,
                     ),
                 )
@@ -1406,6 +1559,7 @@ class Validator:
             ExpectationSuite object.
         """
 
+        # Returned suite is handed to (and may be mutated by) callers; hence, it must not share values with live suite.
         expectation_suite = copy.deepcopy(self.expectation_suite)
         expectations = expectation_suite.expectations
 
@@ -1550,6 +1704,8 @@ class Validator:
         run_name: Optional[str] = None,
         run_time: Optional[str] = None,
         checkpoint_name: Optional[str] = None,
+        trace_metric_resolution: bool = False,
+        incremental_validation: Optional[IncrementalValidation] = None,
     ) -> Union[ExpectationValidationResult, ExpectationSuiteValidationResult]:
         # noinspection SpellCheckingInspection
         """Run all expectations and return the outcome of the run.
@@ -1565,6 +1721,8 @@ class Validator:
             result_format: If None, uses the default value ('BASIC' or as specified). If string, the returned expectation output follows the specified format ('BOOLEAN_ONLY','BASIC', etc.).
             only_return_failures: If True, expectation results are only returned when `success = False`.
             checkpoint_name: Name of the Checkpoint which invoked this Validator.validate() call against an Expectation Suite. It will be added to `meta` field of the returned ExpectationSuiteValidationResult.
+            trace_metric_resolution: If True, timings of metric computations (per metric, bundle, and query, including SQL text), metric cache hits and misses, and metric computation failures are recorded and added (in Chrome trace event format, with metric computation time attributed to each Expectation) as `metric_resolution_trace` to `meta` field of the returned ExpectationSuiteValidationResult.
+            incremental_validation: If provided, mergeable metrics (e.g., row counts, minima and maxima, means, value counts, and unexpected counts) are computed only over rows appended since the previous validation run (per its watermark column), and merged into metric states persisted in its MetricStateStore; other metrics are computed over all rows.
 
         Returns:
             Object containg the results.
@@ -1686,10 +1844,22 @@ class Validator:
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
 
-            results = self.graph_validate(
-                configurations=expectations_to_evaluate,
-                runtime_configuration=runtime_configuration,
-            )
+            tracer: Optional[MetricResolutionTracer] = None
+            previous_tracer: Optional[MetricResolutionTracer] = None
+            if trace_metric_resolution:
+                tracer = MetricResolutionTracer()
+                previous_tracer = self._execution_engine.metric_resolution_tracer
+                self._execution_engine.metric_resolution_tracer = tracer
+
+            try:
+                results = self.graph_validate(
+                    configurations=expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                    incremental_validation=incremental_validation,
+                )
+            finally:
+                if tracer is not None:
+                    self._execution_engine.metric_resolution_tracer = previous_tracer
 
             if self._include_rendered_content:
                 for validation_result in results:
@@ -1727,6 +1897,9 @@ class Validator:
                 },
             )
 
+            if tracer is not None:
+                result.meta["metric_resolution_trace"] = tracer.to_chrome_trace()
+
             self._data_context = validation_data_context
         except Exception:
             if handler := getattr(data_context, "_usage_statistics_handler", None):
@@ -1834,23 +2007,8 @@ class Validator:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        # noinspection PyProtectedMember
+        return validation_graph._parse(metrics=metrics)
 
     def _initialize_expectations(
         self,
@@ -1,4 +1,5 @@
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from timeit import timeit
 from typing import Any, Dict
@@ -13,6 +14,7 @@ from great_expectations.core import (
 )
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.core.evaluation_parameters import (
+    _compile_evaluation_parameter_expression,
     _deduplicate_evaluation_parameter_dependencies,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
@@ -462,3 +464,49 @@ def test_now_evaluation_parameter():
     # Require parens to actually invoke
     with pytest.raises(EvaluationParameterError):
         parse_evaluation_parameter("now")
+
+
+@pytest.mark.unit
+def test_evaluation_parameter_expressions_are_compiled_once():
+    _compile_evaluation_parameter_expression.cache_clear()
+
+    assert (
+        parse_evaluation_parameter("x * 2 + y", {"x": 3, "y": 1}) == 7
+    )  # noqa: PLR2004
+    assert (
+        parse_evaluation_parameter("x * 2 + y", {"x": 5, "y": 0}) == 10
+    )  # noqa: PLR2004
+    assert find_evaluation_parameter_dependencies("x * 2 + y") == {
+        "urns": set(),
+        "other": {"x", "y"},
+    }
+
+    cache_info = _compile_evaluation_parameter_expression.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2  # noqa: PLR2004
+
+    # Substitution of parameter values does not leak into shared compiled expression.
+    assert _compile_evaluation_parameter_expression("x * 2 + y").expr_stack == (
+        "x",
+        "2",
+        "*",
+        "y",
+        "+",
+    )
+
+
+@pytest.mark.unit
+def test_evaluation_parameters_are_parsed_concurrently():
+    def _evaluate(value: int) -> list:
+        return [
+            parse_evaluation_parameter(
+                f"x * {value} + trunc(y / 2) - {value}", {"x": value, "y": value}
+            )
+            for _ in range(50)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_evaluate, range(1, 33)))
+
+    for value, values in enumerate(results, start=1):
+        assert values == [value * value + value // 2 - value] * 50
@@ -197,3 +197,45 @@ def test_expectation_configuration_patch(config4, config5, config6, config7):
 
     with pytest.raises(ValueError):
         config5.patch("add", "/foo/-", 4)
+
+
+@pytest.mark.unit
+def test_expectation_configuration_derive_shares_unchanged_kwargs_values(config1):
+    derived = config1.derive(kwargs={"batch_id": "my_batch_id"})
+
+    assert derived.kwargs == {**config1.kwargs, "batch_id": "my_batch_id"}
+    assert "batch_id" not in config1.kwargs
+    assert derived.kwargs["value_set"] is config1.kwargs["value_set"]
+    assert derived.meta == config1.meta and derived.meta is not config1.meta
+
+    # Patching derived configuration copies value being patched (copy on write).
+    derived.patch("add", "/value_set/-", 4)
+    assert derived.kwargs["value_set"] == [1, 2, 3, 4]
+    assert config1.kwargs["value_set"] == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_expectation_configuration_derive_preserves_raw_kwargs():
+    config = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": {"$PARAMETER": "upstream_min"}},
+    )
+    derived = config.derive()
+    derived.process_evaluation_parameters(evaluation_parameters={"upstream_min": 5})
+
+    assert derived.kwargs["min_value"] == 5  # noqa: PLR2004
+    assert config.kwargs["min_value"] == {"$PARAMETER": "upstream_min"}
+    assert derived.get_raw_configuration().kwargs == config.kwargs
+    assert derived.get_runtime_kwargs()["result_format"] == {
+        "result_format": "BASIC",
+        "partial_unexpected_count": 20,
+        "include_unexpected_rows": False,
+    }
+
+
+@pytest.mark.unit
+def test_expectation_configuration_get_raw_configuration_is_deep_copy(config1):
+    raw_config = config1.get_raw_configuration()
+    raw_config.kwargs["value_set"].append(4)
+
+    assert config1.kwargs["value_set"] == [1, 2, 3]
@@ -758,3 +758,87 @@ def test_replace_expectation_finds_no_matches(ge_cloud_suite, ge_cloud_id, exp4)
         str(err.value)
         == "More than one matching expectation was found. Please be more specific with your search criteria"
     )
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_follows_changes_to_expectations_list(
+    exp1, exp2, exp4, exp5
+):
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed", expectations=[exp1, exp2]
+    )
+    assert suite.find_expectation_indexes(exp4, "domain") == [1]
+
+    # Direct changes to "expectations" list (bypassing suite methods) are re-indexed upon next lookup.
+    suite.expectations.append(exp5)
+    assert suite.find_expectation_indexes(exp4, "domain") == [1, 2]
+    assert suite.find_expectation_indexes(exp4, "runtime") == []
+
+    suite.expectations.pop(0)
+    assert suite.find_expectation_indexes(exp4, "domain") == [0, 1]
+    assert suite.find_expectation_indexes(exp1, "domain") == []
+
+    suite.expectations = [exp5, exp1]
+    assert suite.find_expectation_indexes(exp4, "domain") == [0]
+    assert suite.find_expectation_indexes(exp1, "success") == [1]
+
+    suite.replace_expectation(
+        new_expectation_configuration=exp2, existing_expectation_configuration=exp1
+    )
+    assert suite.find_expectation_indexes(exp1, "domain") == []
+    assert suite.find_expectation_indexes(exp4, "domain") == [0, 1]
+
+    # Patched configuration is re-indexed.
+    suite.patch_expectation(
+        exp2, op="replace", path="/column", value="a", match_type="runtime"
+    )
+    assert suite.find_expectation_indexes(exp1, "domain") == [1]
+    assert suite.find_expectation_indexes(exp4, "domain") == [0]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_with_unhashable_domain_kwargs(exp1):
+    exp_with_list_column = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": ["a", {"b": ["c"]}], "value_set": [1]},
+    )
+    exp_with_unhashable_column = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": bytearray(b"a"), "value_set": [1]},
+    )
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed",
+        expectations=[exp_with_unhashable_column, exp1, exp_with_list_column],
+    )
+
+    assert suite.find_expectation_indexes(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": ["a", {"b": ["c"]}]},
+        )
+    ) == [2]
+    assert suite.find_expectation_indexes(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": bytearray(b"a")},
+        )
+    ) == [0]
+    assert suite.find_expectation_indexes(exp1) == [1]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_by_ge_cloud_id(ge_cloud_id, exp1, exp2, exp4):
+    exp2.ge_cloud_id = ge_cloud_id
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed", expectations=[exp1, exp2]
+    )
+    assert suite.find_expectation_indexes(ge_cloud_id=ge_cloud_id) == [1]
+
+    # Replacing configuration keeps its "ge_cloud_id".
+    suite.add_expectation(exp4, send_usage_event=False)
+    assert suite.expectations[1] is exp4
+    assert suite.find_expectation_indexes(ge_cloud_id=ge_cloud_id) == [1]
+
+    suite.remove_expectation(ge_cloud_id=ge_cloud_id)
+    assert suite.find_expectation_indexes(ge_cloud_id=ge_cloud_id) == []
+    assert suite.expectations == [exp1]
@@ -0,0 +1,205 @@
+import collections
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    DEFAULT_SKETCH_RELATIVE_ERROR,
+    HyperLogLogSketch,
+    KllSketch,
+    SpaceSavingSketch,
+    get_sketch_relative_error,
+    is_sketch_relative_error,
+)
+
+
+@pytest.mark.unit
+def test_kll_sketch_quantiles_are_exact_before_compaction():
+    sketch = KllSketch(k=200)
+    sketch.update_many([4, None, 1, 3, 2])
+
+    assert sketch.num_items == 4
+    assert sketch.quantiles(quantiles=[0.0, 0.25, 0.5, 0.75, 1.0]) == [1, 1, 2, 3, 4]
+
+
+@pytest.mark.unit
+def test_kll_sketch_quantiles_are_within_rank_error():
+    values = list(range(100000))
+    random.Random(0).shuffle(values)
+
+    sketch = KllSketch.from_relative_error(relative_error=0.01, seed=0)
+    sketch.update_many(values)
+
+    assert sketch.num_items == len(values)
+    assert sketch.num_retained_items < len(values) / 50
+
+    quantile: float
+    estimate: int
+    for quantile, estimate in zip(
+        [0.1, 0.25, 0.5, 0.75, 0.9],
+        sketch.quantiles(quantiles=[0.1, 0.25, 0.5, 0.75, 0.9]),
+    ):
+        assert abs(estimate / len(values) - quantile) <= 0.01
+
+
+@pytest.mark.unit
+def test_kll_sketch_merge():
+    sketch = KllSketch(k=50, seed=0)
+    sketch.update_many(range(0, 5000))
+    other = KllSketch(k=50, seed=1)
+    other.update_many(range(5000, 10000))
+
+    sketch.merge(other)
+
+    assert sketch.num_items == 10000
+    assert abs(sketch.quantile(0.5) - 5000) <= 10000 * 0.05
+
+
+@pytest.mark.unit
+def test_kll_sketch_invalid_parameters():
+    with pytest.raises(ValueError):
+        KllSketch(k=1)
+
+    with pytest.raises(ValueError):
+        KllSketch.from_relative_error(relative_error=0.0)
+
+    with pytest.raises(ValueError):
+        KllSketch().quantiles(quantiles=[1.5])
+
+
+@pytest.mark.unit
+def test_kll_sketch_relative_error():
+    assert KllSketch.from_relative_error(relative_error=0.01).relative_error <= 0.01
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_distinct_values", [0, 1, 10, 1000, 100000])
+def test_hyper_log_log_sketch_count_is_within_relative_error(num_distinct_values):
+    sketch = HyperLogLogSketch.from_relative_error(relative_error=0.01)
+    assert sketch.relative_error <= 0.01
+
+    sketch.update_many(pd.Series(np.arange(num_distinct_values)))
+    sketch.update_many(pd.Series(np.arange(num_distinct_values)))
+
+    assert abs(sketch.count() - num_distinct_values) <= max(
+        3 * sketch.relative_error * num_distinct_values, 1
+    )
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_ignores_nulls_and_hashes_values_like_columns():
+    sketch = HyperLogLogSketch()
+    sketch.update_many([1, 2, None, 2])
+    sketch.update(None)
+
+    other = HyperLogLogSketch()
+    other.update_many(pd.Series([1, 2]))
+
+    assert sketch.count() == 2  # noqa: PLR2004
+    sketch.merge(other=other)
+    assert sketch.count() == 2  # noqa: PLR2004
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_merge():
+    sketch = HyperLogLogSketch(precision=14)
+    sketch.update_many(pd.Series(np.arange(0, 60000)))
+    other = HyperLogLogSketch(precision=14)
+    other.update_many(pd.Series(np.arange(30000, 90000)))
+
+    sketch.merge(other=other)
+
+    assert abs(sketch.count() - 90000) <= 90000 * 3 * sketch.relative_error
+
+    with pytest.raises(ValueError):
+        sketch.merge(other=HyperLogLogSketch(precision=12))
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_invalid_parameters():
+    with pytest.raises(ValueError):
+        HyperLogLogSketch(precision=2)
+
+    with pytest.raises(ValueError):
+        HyperLogLogSketch.from_relative_error(relative_error=1.0)
+
+
+@pytest.fixture
+def skewed_values() -> list:
+    rng = random.Random(0)
+    return [int(rng.paretovariate(1.2)) for _ in range(20000)]
+
+
+@pytest.mark.unit
+def test_space_saving_sketch_counts_are_within_max_error(skewed_values):
+    sketch = SpaceSavingSketch.from_relative_error(relative_error=0.01)
+    sketch.update_many(skewed_values)
+
+    exact_counts = collections.Counter(skewed_values)
+    assert sketch.num_items == len(skewed_values)
+    assert sketch.max_error <= 0.01 * len(skewed_values)
+
+    item: int
+    count: int
+    error: int
+    for item, count, error in sketch.heavy_hitters():
+        assert count - error <= exact_counts[item] <= count
+
+    # Every item, whose count exceeds maximum error, is monitored.
+    assert {
+        item for item, _, _ in sketch.heavy_hitters(min_count=sketch.max_error + 1)
+    } >= {item for item, count in exact_counts.items() if count > sketch.max_error}
+
+
+@pytest.mark.unit
+def test_space_saving_sketch_merge_of_partition_counts(skewed_values):
+    sketch = SpaceSavingSketch(capacity=20)
+    partition_start: int
+    for partition_start in range(0, len(skewed_values), 5000):
+        sketch.update_counts(
+            counts=collections.Counter(
+                skewed_values[partition_start : partition_start + 5000]
+            )
+        )
+
+    exact_counts = collections.Counter(skewed_values)
+    assert sketch.num_items == len(skewed_values)
+
+    heavy_hitters = sketch.heavy_hitters(min_count=0.05 * len(skewed_values))
+    assert [item for item, _, _ in heavy_hitters] == [
+        item
+        for item, count in exact_counts.most_common()
+        if count >= 0.05 * len(skewed_values)
+    ]
+    for item, count, error in heavy_hitters:
+        assert count - error <= exact_counts[item] <= count
+        assert count - exact_counts[item] <= sketch.max_error
+
+    with pytest.raises(ValueError):
+        SpaceSavingSketch(capacity=0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "allow_relative_error,expected_is_sketch,expected_relative_error",
+    [
+        pytest.param(False, False, None, id="false"),
+        pytest.param(True, True, DEFAULT_SKETCH_RELATIVE_ERROR, id="true"),
+        pytest.param(0.05, True, 0.05, id="float"),
+        pytest.param("linear", False, None, id="interpolation"),
+    ],
+)
+def test_sketch_relative_error(
+    allow_relative_error, expected_is_sketch, expected_relative_error
+):
+    assert (
+        is_sketch_relative_error(allow_relative_error=allow_relative_error)
+        is expected_is_sketch
+    )
+    if expected_is_sketch:
+        assert (
+            get_sketch_relative_error(allow_relative_error=allow_relative_error)
+            == expected_relative_error
+        )
@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+import pytest
+
+from great_expectations.core.unexpected_index_ranges import (
+    UnexpectedIndexRanges,
+    build_unexpected_index_list,
+    expand_unexpected_index_list,
+    use_unexpected_index_ranges,
+)
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "indices",
+    [
+        pytest.param([], id="empty"),
+        pytest.param([7], id="single"),
+        pytest.param([0, 1, 2, 5, 7, 8, 3], id="unsorted_runs"),
+        pytest.param(list(range(1000)) + [2000], id="long_run"),
+    ],
+)
+def test_unexpected_index_ranges_behave_as_list_of_indices(indices):
+    index_ranges = UnexpectedIndexRanges.from_indices(indices=np.asarray(indices))
+
+    assert index_ranges == indices
+    assert len(index_ranges) == len(indices)
+    assert list(index_ranges) == indices
+    assert index_ranges.to_list() == indices
+    assert index_ranges[:3] == indices[:3]
+    assert index_ranges[2:-1] == indices[2:-1]
+    assert [index_ranges[position] for position in range(len(indices))] == indices
+    if indices:
+        assert index_ranges[-1] == indices[-1]
+
+    with pytest.raises(IndexError):
+        index_ranges[len(indices)]
+
+
+@pytest.mark.unit
+def test_unexpected_index_ranges_serialization():
+    index_ranges = UnexpectedIndexRanges.from_indices(
+        indices=list(range(1000)) + [1500] + list(range(2000, 2010))
+    )
+
+    serialized = json.loads(json.dumps(convert_to_json_serializable(index_ranges)))
+    assert serialized == {
+        "unexpected_index_ranges": [[0, 1000], [1500, 1501], [2000, 2010]]
+    }
+    assert UnexpectedIndexRanges.from_json_dict(data=serialized) == index_ranges
+    assert expand_unexpected_index_list(serialized) == index_ranges.to_list()
+    assert expand_unexpected_index_list([{"pk": 1}]) == [{"pk": 1}]
+    assert (
+        index_ranges.to_python_expression()
+        == "[*range(0, 1000), 1500, *range(2000, 2010)]"
+    )
+
+
+@pytest.mark.unit
+def test_build_unexpected_index_list_falls_back_to_list_of_scattered_indices():
+    index_ranges = build_unexpected_index_list(
+        indices=np.asarray(list(range(10)) + [20, 30])
+    )
+    assert isinstance(index_ranges, UnexpectedIndexRanges)
+    assert index_ranges.num_runs == 3  # noqa: PLR2004
+
+    indices = np.arange(0, 100, 2)
+    unexpected_index_list = build_unexpected_index_list(indices=indices)
+    assert not isinstance(unexpected_index_list, UnexpectedIndexRanges)
+    assert unexpected_index_list == indices.tolist()
+
+
+@pytest.mark.unit
+def test_use_unexpected_index_ranges():
+    assert not use_unexpected_index_ranges(result_format={"result_format": "COMPLETE"})
+    assert use_unexpected_index_ranges(
+        result_format={
+            "result_format": "COMPLETE",
+            "unexpected_index_list_format": "ranges",
+        }
+    )
+    with pytest.raises(ValueError):
+        use_unexpected_index_ranges(
+            result_format={
+                "result_format": "COMPLETE",
+                "unexpected_index_list_format": "bitmap",
+            }
+        )
@@ -0,0 +1,173 @@
+import os
+import stat
+import time
+from unittest import mock
+
+import pytest
+
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.data_context.store import (
+    CachedStoreBackend,
+    ExpectationsStore,
+    TupleFilesystemStoreBackend,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from great_expectations.exceptions import InvalidKeyError, StoreBackendError
+
+pytestmark = pytest.mark.filesystem
+
+
+def _build_cached_store_backend(tmp_path, **kwargs) -> CachedStoreBackend:
+    return CachedStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path / "store"),
+            "suppress_store_backend_id": True,
+        },
+        cache_directory=str(tmp_path / "cache"),
+        **kwargs,
+    )
+
+
+def test_CachedStoreBackend_revalidates_cached_values(tmp_path):
+    my_store = _build_cached_store_backend(tmp_path)
+    wrapped_store: TupleFilesystemStoreBackend = my_store.store_backend
+    my_store.set(("AAA",), "aaa")
+
+    with mock.patch.object(wrapped_store, "_get", wraps=wrapped_store._get) as mock_get:
+        assert my_store.get(("AAA",)) == "aaa"
+        assert my_store.get(("AAA",)) == "aaa"
+        # Unchanged value is downloaded only once.
+        assert mock_get.call_count == 1
+
+        # Value, changed behind the cache, is downloaded again.
+        with open(tmp_path / "store" / "AAA", "w") as f:
+            f.write("changed")
+
+        assert my_store.get(("AAA",)) == "changed"
+        assert mock_get.call_count == 2  # noqa: PLR2004
+
+        # Writes through the cache invalidate cached value.
+        my_store.set(("AAA",), "bbb")
+        assert my_store.get(("AAA",)) == "bbb"
+        assert mock_get.call_count == 3  # noqa: PLR2004
+
+    my_store.remove_key(("AAA",))
+    with pytest.raises(InvalidKeyError):
+        my_store.get(("AAA",))
+
+
+def test_CachedStoreBackend_ttl_mode(tmp_path):
+    my_store = _build_cached_store_backend(tmp_path, ttl_seconds=3600, revalidate=False)
+    wrapped_store: TupleFilesystemStoreBackend = my_store.store_backend
+    my_store.set(("AAA",), "aaa")
+    assert my_store.get(("AAA",)) == "aaa"
+
+    with mock.patch.object(
+        wrapped_store, "get_version", wraps=wrapped_store.get_version
+    ) as mock_get_version, mock.patch.object(
+        wrapped_store, "_get", wraps=wrapped_store._get
+    ) as mock_get:
+        # Fresh value is served without contacting wrapped backend (even after it changed behind the cache).
+        with open(tmp_path / "store" / "AAA", "w") as f:
+            f.write("changed")
+
+        assert my_store.get(("AAA",)) == "aaa"
+        mock_get.assert_not_called()
+        mock_get_version.assert_not_called()
+
+    expired_store = _build_cached_store_backend(
+        tmp_path, ttl_seconds=0, revalidate=False
+    )
+    assert expired_store.get(("AAA",)) == "changed"
+
+    with pytest.raises(StoreBackendError):
+        _build_cached_store_backend(tmp_path, revalidate=False)
+
+
+def test_CachedStoreBackend_expires_entries_validated_in_the_future(tmp_path):
+    my_store = _build_cached_store_backend(tmp_path, ttl_seconds=3600, revalidate=False)
+    my_store.set(("AAA",), "aaa")
+    my_store.get(("AAA",))
+    my_store._write_entry(
+        key=("AAA",), value="stale", version=None, validated_at=time.time() + 600
+    )
+
+    assert my_store.get(("AAA",)) == "aaa"
+
+
+def test_CachedStoreBackend_default_cache_directory_is_private(tmp_path):
+    my_store = CachedStoreBackend(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "store",
+            "suppress_store_backend_id": True,
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    cache_directory = os.path.dirname(my_store.cache_directory)
+    assert cache_directory == str(tmp_path / "uncommitted" / "store_cache")
+    assert "cache_directory" not in my_store.config
+    for path in (cache_directory, my_store.cache_directory):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o700  # noqa: PLR2004
+
+
+def test_CachedStoreBackend_evicts_least_recently_used_values(tmp_path):
+    my_store = _build_cached_store_backend(tmp_path, max_cache_size_bytes=1000)
+    keys = [(f"AAA_{idx}",) for idx in range(10)]
+    for key in keys:
+        my_store.set(key, "a" * 100)
+        my_store.get(key)
+
+    cache_entry_sizes = [
+        os.path.getsize(os.path.join(my_store.cache_directory, filename))
+        for filename in os.listdir(my_store.cache_directory)
+    ]
+    assert 0 < len(cache_entry_sizes) < len(keys)
+    assert sum(cache_entry_sizes) <= 1000  # noqa: PLR2004
+    # Most recently used value is cached.
+    assert os.path.isfile(my_store._get_entry_path(keys[-1]))
+
+    my_store.clear_cache()
+    assert os.listdir(my_store.cache_directory) == []
+    assert my_store.get_many(keys) == ["a" * 100] * len(keys)
+
+
+def test_ExpectationsStore_with_CachedStoreBackend(tmp_path, empty_data_context):
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "CachedStoreBackend",
+            "cache_directory": str(tmp_path / "cache"),
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "expectations",
+            },
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    assert isinstance(my_store.store_backend, CachedStoreBackend)
+    assert (
+        my_store.store_backend_id
+        == my_store.store_backend.store_backend.store_backend_id
+    )
+
+    key = ExpectationSuiteIdentifier(expectation_suite_name="my_suite")
+    suite = ExpectationSuite(
+        expectation_suite_name="my_suite", data_context=empty_data_context
+    )
+    my_store.set(key, suite)
+    for _ in range(2):
+        suite_dict: dict = my_store.get(key)
+        assert ExpectationSuite(**suite_dict, data_context=empty_data_context) == suite
+    assert my_store.list_keys() == [key]
+
+    # Data Context ID is taken from expectations store, persisted by wrapped backend.
+    with mock.patch.dict(
+        empty_data_context.stores,
+        {empty_data_context.expectations_store_name: my_store},
+    ):
+        assert empty_data_context._construct_data_context_id() == (
+            my_store.store_backend_id
+        )
@@ -133,3 +133,16 @@ def test_store_add_or_update(previous_key_exists: bool):
 
     store.add_or_update(key=key, value=value)
     assert store.get(key) == value
+
+
+@pytest.mark.unit
+def test_store_get_many():
+    store = Store()
+    keys = [StringKey("foo"), StringKey("bar")]
+    store.add(key=keys[0], value="foo_value")
+    store.add(key=keys[1], value="bar_value")
+
+    assert store.get_many(keys) == ["foo_value", "bar_value"]
+
+    with pytest.raises(gx_exceptions.InvalidKeyError):
+        store.get_many([*keys, StringKey("baz")])
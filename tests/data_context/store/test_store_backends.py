@@ -1281,6 +1281,92 @@ def test_TupleAzureBlobStoreBackend_account_url():
             mock_azure_credential.assert_called_once()
 
 
+@pytest.mark.big
+def test_TupleAzureBlobStoreBackend_bulk_operations():
+    pytest.importorskip("azure.storage.blob")
+    pytest.importorskip("azure.identity")
+    connection_string = "DefaultEndpointsProtocol=https;AccountName=dummy;AccountKey=secret;EndpointSuffix=core.windows.net"
+    prefix = "this_is_a_test_prefix"
+
+    my_store = TupleAzureBlobStoreBackend(
+        connection_string=connection_string,
+        prefix=prefix,
+        container="dummy-container",
+        filepath_prefix="expectations",
+        suppress_store_backend_id=True,
+    )
+
+    with mock.patch(
+        "great_expectations.compatibility.azure.BlobServiceClient", autospec=True
+    ):
+        mock_container_client = my_store._container_client
+        mock_container_client.download_blob.return_value.readall.return_value = b"aaa"
+
+        keys = [(f"AAA_{idx}",) for idx in range(10)]
+        assert my_store.get_many(keys) == ["aaa"] * 10
+        assert sorted(
+            call.args[0] for call in mock_container_client.download_blob.call_args_list
+        ) == sorted(
+            f"this_is_a_test_prefix/expectations/AAA_{idx}" for idx in range(10)
+        )
+
+        my_store.set_many([(key, "aaa") for key in keys])
+        assert mock_container_client.upload_blob.call_count == 10
+
+        my_store.list_keys()
+        mock_container_client.list_blobs.assert_called_once_with(
+            name_starts_with="this_is_a_test_prefix/expectations"
+        )
+
+        assert my_store.has_key(("AAA_0",))
+        mock_container_client.get_blob_client.assert_called_with(
+            "this_is_a_test_prefix/expectations/AAA_0"
+        )
+
+        from azure.core.exceptions import ResourceNotFoundError
+
+        mock_blob_client = mock_container_client.get_blob_client.return_value
+        mock_blob_client.get_blob_properties.side_effect = ResourceNotFoundError(
+            "The specified blob does not exist."
+        )
+        with pytest.raises(InvalidKeyError):
+            my_store.get_version(("AAA_0",))
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="google.cloud"),
+    reason="google is not installed",
+)
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="google"),
+    reason="google is not installed",
+)
+@pytest.mark.big
+def test_TupleGCSStoreBackend_bulk_operations():
+    with mock.patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_bucket = mock_gcs_client.return_value.bucket.return_value
+        mock_bucket.get_blob.return_value.download_as_bytes.return_value = b"aaa"
+
+        my_store = TupleGCSStoreBackend(
+            bucket="leakybucket",
+            project="dummy-project",
+            prefix="this_is_a_test_prefix",
+            filepath_prefix="expectations",
+            suppress_store_backend_id=True,
+            max_workers=2,
+        )
+
+        keys = [(f"AAA_{idx}",) for idx in range(10)]
+        assert my_store.get_many(keys) == ["aaa"] * 10
+        # Each worker thread creates its client once.
+        assert mock_gcs_client.call_count <= 2
+
+        my_store.list_keys()
+        mock_gcs_client.return_value.list_blobs.assert_called_once_with(
+            "leakybucket", prefix="this_is_a_test_prefix/expectations"
+        )
+
+
 @mock_s3
 @pytest.mark.slow  # 14.36s
 @pytest.mark.big
@@ -1348,6 +1434,58 @@ def test_TupleS3StoreBackend_list_over_1000_keys():
     assert len(keys) == num_keys_to_add + 1
 
 
+@mock_s3
+@pytest.mark.big
+def test_TupleS3StoreBackend_bulk_operations_and_scoped_listing():
+    bucket = "leakybucket"
+    prefix = "my_prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix=prefix,
+        filepath_prefix="expectations",
+        filepath_suffix=".json",
+        suppress_store_backend_id=True,
+        max_workers=4,
+    )
+    # Objects outside of "filepath_prefix" are never listed.
+    other_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix=prefix,
+        filepath_prefix="validations",
+        suppress_store_backend_id=True,
+    )
+    other_store.set(("ZZZ",), "zzz")
+
+    keys = [(f"suite_{idx}", f"part_{idx % 3}") for idx in range(12)]
+    assert my_store.set_many([(key, "{}") for key in keys]) == [
+        f"my_prefix/expectations/suite_{idx}/part_{idx % 3}.json" for idx in range(12)
+    ]
+
+    # Concurrent (fanned out) listing returns keys in the same order as sequential listing.
+    sequential_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix=prefix,
+        filepath_prefix="expectations",
+        filepath_suffix=".json",
+        suppress_store_backend_id=True,
+        max_workers=1,
+    )
+    assert my_store.list_keys() == sequential_store.list_keys()
+    assert sorted(my_store.list_keys()) == sorted(keys)
+
+    assert my_store.has_key(("suite_0", "part_0"))
+    assert not my_store.has_key(("suite_0", "part_1"))
+    assert my_store.remove_key(("suite_0", "part_0"))
+    assert not my_store.has_key(("suite_0", "part_0"))
+
+    with pytest.raises(ValueError):
+        TupleS3StoreBackend(bucket=bucket, max_workers=0)
+
+
 @pytest.mark.filesystem
 def test_InlineStoreBackend(empty_data_context: DataContext) -> None:
     inline_store_backend: InlineStoreBackend = InlineStoreBackend(
@@ -838,6 +838,37 @@ def test_postgres_slice_batch_count(
         assert len(batches) == expected_batch_count
 
 
+@pytest.mark.unit
+def test_postgres_slice_is_applied_before_loading_batches(
+    empty_data_context,
+    create_source: CreateSourceFixture,
+) -> None:
+    loaded_batch_identifiers: List[dict] = []
+
+    def collect_batch_identifiers(batch_spec: SqlAlchemyDatasourceBatchSpec) -> None:
+        loaded_batch_identifiers.append(batch_spec["batch_identifiers"])
+
+    with create_source(
+        validate_batch_spec=collect_batch_identifiers,
+        dialect="postgresql",
+        data_context=empty_data_context,
+    ) as source:
+        (
+            source,  # noqa: PLW2901
+            asset,
+        ) = create_and_add_table_asset_without_testing_connection(
+            source=source, name="my_asset", table_name="my_table"
+        )
+        asset.splitter = year_month_splitter(column_name="my_col")
+        asset.add_sorters(["-year", "-month"])
+        batch_request = asset.build_batch_request(batch_slice="[0]")
+        batches = asset.get_batch_list_from_batch_request(batch_request=batch_request)
+
+    assert len(batches) == 1
+    assert batches[0].metadata == {"year": 2022, "month": 12}
+    assert loaded_batch_identifiers == [{"my_col": {"year": 2022, "month": 12}}]
+
+
 @pytest.mark.unit
 def test_data_source_json_has_properties(create_source: CreateSourceFixture):
     with create_source(
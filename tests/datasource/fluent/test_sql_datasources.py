@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 from great_expectations.compatibility import sqlalchemy
@@ -169,5 +170,56 @@ def test_table_quoted_name_type_all_lower_case_normalizion_full():
             assert table_asset.table_name in quoted_table_names
 
 
+@pytest.fixture
+def sqlite_datasource_with_dates(empty_data_context, tmp_path) -> SQLDatasource:
+    database_path = tmp_path / "dates.db"
+    engine = sa.create_engine(f"sqlite:///{database_path}")
+    pd.DataFrame(
+        {
+            "event_date": pd.date_range("2020-01-01", "2021-12-31", freq="7D"),
+            "value": 1,
+        }
+    ).to_sql(name="events", con=engine, index=False)
+    engine.dispose()
+
+    return empty_data_context.sources.add_sqlite(
+        name="dates_datasource", connection_string=f"sqlite:///{database_path}"
+    )
+
+
+@pytest.mark.sqlite
+def test_partitions_are_filtered_in_query_cached_and_paged(
+    sqlite_datasource_with_dates, mocker: MockerFixture
+):
+    asset = sqlite_datasource_with_dates.add_table_asset(
+        name="events", table_name="events"
+    )
+    asset.add_splitter_year_and_month(column_name="event_date")
+
+    execution_engine = sqlite_datasource_with_dates.get_execution_engine()
+    execute_split_query_spy = mocker.spy(execution_engine, "execute_split_query")
+
+    pages = list(asset.iter_partitions(options={"year": 2021}, page_size=5))
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert {partition["year"] for page in pages for partition in page} == {2021}
+    assert "WHERE" in str(execute_split_query_spy.call_args.args[0])
+
+    batches = asset.get_batch_list_from_batch_request(
+        asset.build_batch_request(options={"year": 2021, "month": 3})
+    )
+    assert [batch.metadata for batch in batches] == [{"year": 2021, "month": 3}]
+    assert execute_split_query_spy.call_count == 2  # noqa: PLR2004
+
+    asset.set_partition_cache_ttl(ttl_seconds=60)
+    asset.get_batch_list_from_batch_request(asset.build_batch_request())
+    asset.get_batch_list_from_batch_request(asset.build_batch_request())
+    assert execute_split_query_spy.call_count == 3  # noqa: PLR2004
+
+    asset.clear_partition_cache()
+    batches = asset.get_batch_list_from_batch_request(asset.build_batch_request())
+    assert len(batches) == 24  # noqa: PLR2004
+    assert execute_split_query_spy.call_count == 4  # noqa: PLR2004
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
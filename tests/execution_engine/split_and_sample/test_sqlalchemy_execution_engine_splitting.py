@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 import os
-from typing import List
+from typing import List, Optional
 from unittest import mock
 
 import pandas as pd
@@ -640,3 +640,88 @@ def test_sqlite_split_and_sample_using_limit(
     for row_date in row_dates:
         assert row_date.month == 1
         assert row_date.year == 2018
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "splitter_method_name,splitter_kwargs,batch_identifiers,expected_batch_identifiers",
+    [
+        pytest.param(
+            "split_on_year_and_month",
+            {"column_name": "pickup_datetime"},
+            {"pickup_datetime": {"year": 2019}},
+            [
+                {"pickup_datetime": {"year": 2019, "month": month}}
+                for month in range(1, 13)
+            ],
+            id="partial_date_parts",
+        ),
+        pytest.param(
+            "split_on_year_and_month",
+            {"column_name": "pickup_datetime"},
+            {"pickup_datetime": {"year": 2019, "month": 6}},
+            [{"pickup_datetime": {"year": 2019, "month": 6}}],
+            id="all_date_parts",
+        ),
+        pytest.param(
+            "split_on_mod_integer",
+            {"column_name": "passenger_count", "mod": 2},
+            {"passenger_count": 1},
+            [{"passenger_count": 1}],
+            id="mod_integer",
+        ),
+        pytest.param(
+            "split_on_multi_column_values",
+            {"column_names": ["rate_code_id", "payment_type"]},
+            {"rate_code_id": 1},
+            None,
+            id="partial_multi_column_values",
+        ),
+    ],
+)
+def test_get_data_for_batch_identifiers_filters_batch_identifiers_in_query(
+    sa,
+    in_memory_sqlite_taxi_ten_trips_per_month_execution_engine,
+    splitter_method_name: str,
+    splitter_kwargs: dict,
+    batch_identifiers: dict,
+    expected_batch_identifiers: Optional[List[dict]],
+):
+    engine: SqlAlchemyExecutionEngine = (
+        in_memory_sqlite_taxi_ten_trips_per_month_execution_engine
+    )
+    split_queries: List[str] = []
+    execute_split_query = engine.execute_split_query
+
+    def _execute_split_query(split_query):
+        split_queries.append(str(split_query))
+        return execute_split_query(split_query)
+
+    engine.execute_split_query = _execute_split_query  # type: ignore[method-assign]
+
+    all_batch_identifiers: List[dict] = engine.get_data_for_batch_identifiers(
+        selectable=sa.text("main.test"),
+        splitter_method_name=splitter_method_name,
+        splitter_kwargs=splitter_kwargs,
+    )
+    filtered_batch_identifiers: List[dict] = engine.get_data_for_batch_identifiers(
+        selectable=sa.text("main.test"),
+        splitter_method_name=splitter_method_name,
+        splitter_kwargs=splitter_kwargs,
+        batch_identifiers=batch_identifiers,
+    )
+
+    assert "WHERE" not in split_queries[0]
+    assert "WHERE" in split_queries[1]
+
+    if expected_batch_identifiers is None:
+        expected_batch_identifiers = [
+            element
+            for element in all_batch_identifiers
+            if element["rate_code_id"] == batch_identifiers["rate_code_id"]
+        ]
+
+    assert len(filtered_batch_identifiers) < len(all_batch_identifiers)
+    assert sorted(filtered_batch_identifiers, key=str) == sorted(
+        expected_batch_identifiers, key=str
+    )
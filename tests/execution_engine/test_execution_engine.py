@@ -1,14 +1,17 @@
 from typing import Dict, Tuple
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.batch import BatchData, BatchMarkers
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -267,6 +270,115 @@ def test_resolve_metrics_with_aggregates_and_column_map():
     assert results[desired_metric.id] == 0
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "concurrency,max_metric_resolution_workers,execute_concurrently",
+    [
+        pytest.param(None, None, False, id="serial_by_default"),
+        pytest.param(None, 4, True, id="opt_in_with_max_workers"),
+        pytest.param(
+            ConcurrencyConfig(enabled=False), 4, False, id="disabled_by_concurrency"
+        ),
+        pytest.param(ConcurrencyConfig(enabled=True), 1, False, id="single_worker"),
+    ],
+)
+def test_resolve_metrics_concurrently(
+    concurrency, max_metric_resolution_workers, execute_concurrently
+):
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        concurrency=concurrency,
+        max_metric_resolution_workers=max_metric_resolution_workers,
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+
+    metrics.update(results)
+
+    desired_metrics = []
+    for column_name in ["a", "b"]:
+        for metric_name in ["column.mean", "column.max", "column.min"]:
+            metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": column_name},
+                metric_value_kwargs=None,
+            )
+            metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(metric)
+
+    with mock.patch(
+        "great_expectations.execution_engine.execution_engine.AsyncExecutor",
+        wraps=AsyncExecutor,
+    ) as mock_async_executor:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    async_executor_kwargs = mock_async_executor.call_args.kwargs
+    assert (
+        async_executor_kwargs["concurrency_config"].enabled
+        and async_executor_kwargs["max_workers"] > 1
+    ) is execute_concurrently
+
+    assert [results[metric.id] for metric in desired_metrics] == [
+        2.0,
+        3.0,
+        1.0,
+        5.5,
+        7,
+        4,
+    ]
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_reports_failed_metric():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, max_metric_resolution_workers=4
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+
+    metrics.update(results)
+
+    good_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    good_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    bad_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "not_in_table"},
+        metric_value_kwargs=None,
+    )
+    bad_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(
+            metrics_to_resolve=(good_metric, bad_metric), metrics=metrics
+        )
+
+    assert [metric.id for metric in e.value.failed_metrics] == [bad_metric.id]
+
+
 @pytest.mark.unit
 def test_resolve_metrics_with_extraneous_value_key():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
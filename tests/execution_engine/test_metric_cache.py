@@ -0,0 +1,293 @@
+import pathlib
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.batch import Batch, BatchDefinition, BatchMarkers
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    NoOpMetricCache,
+    SqliteMetricCache,
+    build_metric_cache,
+    estimate_metric_value_size,
+)
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_evicts_least_recently_used_entries():
+    metric_cache = InMemoryMetricCache(max_size=2)
+
+    metric_cache["a"] = 1
+    metric_cache["b"] = 2
+    assert metric_cache.get("a") == 1  # "a" becomes most recently used
+    metric_cache["c"] = 3
+
+    assert len(metric_cache) == 2
+    assert "a" in metric_cache
+    assert "b" not in metric_cache
+    assert "c" in metric_cache
+    assert metric_cache.statistics.evictions == 1
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_is_bounded_by_memory():
+    value = np.zeros(100, dtype=np.int64)
+    metric_cache = InMemoryMetricCache(max_memory_bytes=2 * value.nbytes)
+
+    metric_cache["a"] = value
+    metric_cache["b"] = value.copy()
+    assert len(metric_cache) == 2
+
+    metric_cache["c"] = value.copy()
+    assert len(metric_cache) == 2
+    assert "a" not in metric_cache
+    assert metric_cache.memory_bytes == 2 * value.nbytes
+
+    # Value larger than entire budget is not cached (and does not flush cache).
+    metric_cache["d"] = np.zeros(1000, dtype=np.int64)
+    assert "d" not in metric_cache
+    assert len(metric_cache) == 2
+
+
+@pytest.mark.unit
+def test_metric_cache_statistics():
+    metric_cache = InMemoryMetricCache()
+    metric_cache.update({"a": None})
+
+    assert metric_cache.lookup("a") == (True, None)
+    assert metric_cache.lookup("b") == (False, None)
+    assert metric_cache.get("b") is None
+
+    assert metric_cache.statistics.to_dict() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "hit_ratio": 1 / 3,
+    }
+
+
+@pytest.mark.unit
+def test_estimate_metric_value_size_accounts_for_pandas_objects():
+    series = pd.Series(["x" * 100] * 10)
+    assert estimate_metric_value_size(series) >= 1000
+    assert estimate_metric_value_size((series, {}, {})) > estimate_metric_value_size(
+        series
+    )
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_persists_across_instances(tmp_path: pathlib.Path):
+    filepath = str(tmp_path / "metric_cache.db")
+    key = ("my_batch_id", ("column.max", "column=a", tuple()))
+
+    metric_cache = SqliteMetricCache(filepath=filepath)
+    metric_cache[key] = [1, 2, 3]
+    metric_cache.close()
+
+    metric_cache = SqliteMetricCache(filepath=filepath)
+    assert metric_cache.get(key) == [1, 2, 3]
+    assert metric_cache.statistics.hits == 1
+    metric_cache.close()
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_evicts_least_recently_used_entries(
+    tmp_path: pathlib.Path,
+):
+    metric_cache = SqliteMetricCache(
+        filepath=str(tmp_path / "metric_cache.db"), max_size=2
+    )
+
+    metric_cache["a"] = 1
+    metric_cache["b"] = 2
+    assert metric_cache.get("a") == 1
+    metric_cache["c"] = 3
+
+    assert len(metric_cache) == 2
+    assert "b" not in metric_cache
+    assert metric_cache.statistics.evictions == 1
+    metric_cache.close()
+
+
+@pytest.mark.sqlite
+def test_sqlite_metric_cache_does_not_persist_backend_bound_values(
+    tmp_path: pathlib.Path,
+):
+    metric_cache = SqliteMetricCache(filepath=str(tmp_path / "metric_cache.db"))
+
+    metric_cache["partial_fn"] = (sa.func.max(sa.column("a")), {}, {})
+    assert "partial_fn" not in metric_cache
+    metric_cache.close()
+
+
+@pytest.mark.unit
+def test_build_metric_cache(tmp_path: pathlib.Path):
+    assert isinstance(
+        build_metric_cache(metric_cache=None, caching=False), NoOpMetricCache
+    )
+    assert isinstance(
+        build_metric_cache(metric_cache=None, caching=True), InMemoryMetricCache
+    )
+
+    metric_cache = build_metric_cache(
+        metric_cache={
+            "class_name": "SqliteMetricCache",
+            "filepath": str(tmp_path / "metric_cache.db"),
+            "max_size": 10,
+        },
+        caching=True,
+    )
+    assert isinstance(metric_cache, SqliteMetricCache)
+    metric_cache.close()
+
+
+def _resolve_column_max(
+    engine: PandasExecutionEngine,
+) -> Tuple[MetricConfiguration, Dict[Tuple[str, str, str], MetricValue]]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_max.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    return column_max, engine.resolve_metrics(
+        metrics_to_resolve=(column_max,), metrics=metrics
+    )
+
+
+@pytest.mark.unit
+def test_execution_engine_serves_resolved_metrics_from_metric_cache(
+    tmp_path: pathlib.Path,
+):
+    filepath = str(tmp_path / "metric_cache.db")
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+
+    def _build_engine(
+        data_asset_name: str, batch_fingerprint: Optional[str]
+    ) -> PandasExecutionEngine:
+        engine = PandasExecutionEngine(
+            metric_cache={"class_name": "SqliteMetricCache", "filepath": filepath},
+        )
+        batch_markers = BatchMarkers({"ge_load_time": "20230101T000000.000000Z"})
+        if batch_fingerprint is not None:
+            batch_markers["pandas_data_fingerprint"] = batch_fingerprint
+
+        batch = Batch(
+            data=df,
+            batch_definition=BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_data_connector",
+                data_asset_name=data_asset_name,
+                batch_identifiers=IDDict({}),
+            ),
+            batch_markers=batch_markers,
+        )
+        engine.batch_manager.load_batch_list(batch_list=[batch])
+        return engine
+
+    engine = _build_engine(data_asset_name="my_asset", batch_fingerprint="abc")
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 3
+    assert engine.metric_cache.statistics.hits == 0
+    engine.metric_cache.close()
+
+    # New engine (e.g., next run) with same batch and same persisted cache does not recompute the metric.
+    engine = _build_engine(data_asset_name="my_asset", batch_fingerprint="abc")
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 3
+    assert (
+        engine.metric_cache.statistics.hits == 3
+    )  # "table.column_types", "table.columns", "column.max"
+    engine.metric_cache.close()
+
+    # Same batch, whose data changed (and hence its fingerprint), does not reuse cached metric values.
+    engine = _build_engine(data_asset_name="my_asset", batch_fingerprint="def")
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 3
+    assert engine.metric_cache.statistics.hits == 0
+    engine.metric_cache.close()
+
+    # Different batch does not share cached metric values.
+    engine = _build_engine(data_asset_name="my_other_asset", batch_fingerprint="abc")
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 3
+    assert engine.metric_cache.statistics.hits == 0
+    engine.metric_cache.close()
+
+    # Metrics of batch without fingerprint are cached in memory only (never persisted).
+    for _ in range(2):
+        engine = _build_engine(data_asset_name="my_asset", batch_fingerprint=None)
+        column_max, results = _resolve_column_max(engine=engine)
+        assert results[column_max.id] == 3
+        assert engine.metric_cache.statistics.hits == 0
+        assert len(engine.metric_cache) == 9
+        engine.metric_cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "batch_fingerprint_method",
+    [
+        pytest.param("full", id="full"),
+        pytest.param("sample", id="sample"),
+    ],
+)
+def test_execution_engine_does_not_serve_persisted_metrics_of_changed_data(
+    tmp_path: pathlib.Path, batch_fingerprint_method: str
+):
+    filepath = str(tmp_path / "metric_cache.db")
+    df = pd.DataFrame({"a": np.arange(100000, dtype="float64")})
+
+    def _build_engine() -> PandasExecutionEngine:
+        engine = PandasExecutionEngine(
+            metric_cache={"class_name": "SqliteMetricCache", "filepath": filepath},
+            batch_fingerprint_method=batch_fingerprint_method,
+        )
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            batch_spec=RuntimeDataBatchSpec(batch_data=df)
+        )
+        batch = Batch(
+            data=batch_data,
+            batch_definition=BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_data_connector",
+                data_asset_name="my_asset",
+                batch_identifiers=IDDict({}),
+            ),
+            batch_markers=batch_markers,
+        )
+        engine.batch_manager.load_batch_list(batch_list=[batch])
+        return engine
+
+    engine = _build_engine()
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 99999
+    engine.metric_cache.close()
+
+    # Row, which is not part of fingerprint sample, changes between runs.
+    df.loc[12345, "a"] = 1.0e9
+
+    engine = _build_engine()
+    column_max, results = _resolve_column_max(engine=engine)
+    assert results[column_max.id] == 1.0e9
+    assert engine.metric_cache.statistics.hits == 0
+    engine.metric_cache.close()
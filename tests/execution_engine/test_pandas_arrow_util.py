@@ -0,0 +1,120 @@
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.execution_engine import pandas_arrow_util
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.validator.validator import Validator
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def string_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, 6],
+            "b": ["xa", "y", "zzz", "x", None, "x"],
+            "c": ["aa", "bb", "cc", "dd", "ee", "ff"],
+        }
+    )
+
+
+@pytest.mark.unit
+def test_convert_to_arrow_backed_dataframe(string_df):
+    df = pandas_arrow_util.convert_to_arrow_backed_dataframe(df=string_df)
+    assert str(df["a"].dtype) == "float64"
+    assert str(df["b"].dtype) == "string"
+    assert pandas_arrow_util.is_arrow_backed(column=df["b"])
+    assert not pandas_arrow_util.is_arrow_backed(column=string_df["b"])
+
+
+@pytest.mark.unit
+def test_arrow_kernels_match_pandas_implementations(string_df):
+    column = pandas_arrow_util.convert_to_arrow_backed_dataframe(df=string_df)["c"]
+    object_column = string_df["c"]
+
+    assert pandas_arrow_util.match_regex(column=column, regex="^[ab]").equals(
+        object_column.astype(str).str.contains("^[ab]")
+    )
+    assert pandas_arrow_util.value_length(column=column).equals(
+        object_column.astype(str).str.len()
+    )
+    assert pandas_arrow_util.is_in(column=column, value_set=["aa", "ff"]).tolist() == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert pandas_arrow_util.is_null(column=column).equals(object_column.isnull())
+
+
+@pytest.mark.unit
+def test_arrow_kernels_are_not_applicable(string_df):
+    df = pandas_arrow_util.convert_to_arrow_backed_dataframe(df=string_df)
+
+    # NumPy-backed column.
+    assert pandas_arrow_util.match_regex(column=string_df["c"], regex="a") is None
+    # Null values are rendered as strings by "astype(str)"; hence, only columns without nulls qualify.
+    assert pandas_arrow_util.value_length(column=df["b"]) is None
+    # Backreferences are not supported by RE2.
+    assert pandas_arrow_util.match_regex(column=df["c"], regex=r"(a)\1") is None
+    # Patterns, whose RE2 semantics differ from Python "re" semantics, are left to Pandas.
+    for regex in ("^aa$", r"\d", r"\w+", r"\bc", "(?i)a", "[[:alpha:]]", "a{,2}"):
+        assert pandas_arrow_util.match_regex(column=df["c"], regex=regex) is None
+    # Non-string value sets are left to "Series.isin()".
+    assert pandas_arrow_util.is_in(column=df["c"], value_set=[1, "aa"]) is None
+
+
+@pytest.mark.unit
+def test_arrow_value_counts(string_df):
+    df = pandas_arrow_util.convert_to_arrow_backed_dataframe(df=string_df)
+    counts = pandas_arrow_util.value_counts(column=df["b"])
+    assert counts.to_dict() == {"x": 2, "xa": 1, "y": 1, "zzz": 1}
+    assert counts.iloc[0] == 2  # noqa: PLR2004
+    assert str(counts.dtype) == "int64"
+
+
+def _get_expectation_results(df: pd.DataFrame, dtype_backend=None) -> list:
+    execution_engine = PandasExecutionEngine(dtype_backend=dtype_backend)
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(batch_data=df.copy())
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+    return [
+        validator.expect_column_values_to_match_regex(
+            "b", "^[xy]", result_format="COMPLETE"
+        ).to_json_dict(),
+        validator.expect_column_values_to_not_match_regex(
+            "b", "^[xy]", result_format="COMPLETE"
+        ).to_json_dict(),
+        validator.expect_column_value_lengths_to_be_between(
+            "c", 1, 2, result_format="COMPLETE"
+        ).to_json_dict(),
+        validator.expect_column_values_to_not_be_null(
+            "b", result_format="COMPLETE"
+        ).to_json_dict(),
+        validator.expect_column_distinct_values_to_be_in_set("b", ["x"]).to_json_dict(),
+    ]
+
+
+@pytest.mark.unit
+def test_arrow_dtype_backend_matches_numpy_backed_results(string_df):
+    assert _get_expectation_results(
+        df=string_df, dtype_backend="pyarrow"
+    ) == _get_expectation_results(df=string_df)
+
+
+@pytest.mark.unit
+def test_unsupported_dtype_backend():
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(dtype_backend="numpy_nullable")
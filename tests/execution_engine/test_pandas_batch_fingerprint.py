@@ -0,0 +1,197 @@
+import os
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.execution_engine.pandas_batch_fingerprint import (
+    hash_pandas_dataframe,
+    hash_pandas_dataframe_sample,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+
+
+def _get_fingerprint(
+    execution_engine: PandasExecutionEngine,
+    batch_spec,
+    marker_name: str = "pandas_data_fingerprint",
+):
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    return batch_markers.get(marker_name)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["v", "w", "x", "y", "z"]})
+
+
+@pytest.mark.unit
+def test_hash_pandas_dataframe_sample(df):
+    # DataFrame not exceeding sample size is hashed in full (so fingerprints of small Batches are unchanged).
+    assert hash_pandas_dataframe_sample(df=df, sample_size=5) == hash_pandas_dataframe(
+        df
+    )
+
+    # Only first and last rows (as well as shape, columns, and dtypes) are hashed.
+    fingerprint: str = hash_pandas_dataframe_sample(df=df, sample_size=2)
+    assert fingerprint != hash_pandas_dataframe(df)
+
+    changed_df = df.copy()
+    changed_df.loc[2, "a"] = 30
+    assert hash_pandas_dataframe_sample(df=changed_df, sample_size=2) == fingerprint
+
+    changed_df.loc[4, "a"] = 50
+    assert hash_pandas_dataframe_sample(df=changed_df, sample_size=2) != fingerprint
+    assert (
+        hash_pandas_dataframe_sample(df=df.rename(columns={"b": "c"}), sample_size=2)
+        != fingerprint
+    )
+    assert hash_pandas_dataframe_sample(df=df.iloc[:4], sample_size=2) != fingerprint
+
+
+@pytest.mark.unit
+def test_batch_fingerprint_methods_for_runtime_data(df):
+    # Every value is hashed by default.
+    assert _get_fingerprint(
+        execution_engine=PandasExecutionEngine(),
+        batch_spec=RuntimeDataBatchSpec(batch_data=df),
+    ) == hash_pandas_dataframe(df)
+    assert _get_fingerprint(
+        execution_engine=PandasExecutionEngine(batch_fingerprint_method="full"),
+        batch_spec=RuntimeDataBatchSpec(batch_data=df),
+    ) == hash_pandas_dataframe(df)
+    assert (
+        _get_fingerprint(
+            execution_engine=PandasExecutionEngine(batch_fingerprint_method="none"),
+            batch_spec=RuntimeDataBatchSpec(batch_data=df),
+        )
+        is None
+    )
+
+    # Sampled fingerprints are lossy; hence, they are recorded under separate batch marker.
+    sample_execution_engine = PandasExecutionEngine(
+        batch_fingerprint_method="sample", batch_fingerprint_sample_size=2
+    )
+    assert (
+        _get_fingerprint(
+            execution_engine=sample_execution_engine,
+            batch_spec=RuntimeDataBatchSpec(batch_data=df),
+        )
+        is None
+    )
+    assert _get_fingerprint(
+        execution_engine=sample_execution_engine,
+        batch_spec=RuntimeDataBatchSpec(batch_data=df),
+        marker_name="pandas_data_sample_fingerprint",
+    ) == hash_pandas_dataframe_sample(df=df, sample_size=2)
+
+    # DataFrame, having no more rows than sample size, is hashed in full.
+    assert _get_fingerprint(
+        execution_engine=PandasExecutionEngine(batch_fingerprint_method="sample"),
+        batch_spec=RuntimeDataBatchSpec(batch_data=df),
+    ) == hash_pandas_dataframe(df)
+
+    # File-based methods fall back to "sample" method for data, which was not read from file.
+    assert _get_fingerprint(
+        execution_engine=PandasExecutionEngine(
+            batch_fingerprint_method="file_metadata", batch_fingerprint_sample_size=2
+        ),
+        batch_spec=RuntimeDataBatchSpec(batch_data=df),
+        marker_name="pandas_data_sample_fingerprint",
+    ) == hash_pandas_dataframe_sample(df=df, sample_size=2)
+
+
+@pytest.mark.unit
+def test_file_metadata_batch_fingerprint(df, tmp_path):
+    path: str = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    execution_engine = PandasExecutionEngine(batch_fingerprint_method="file_metadata")
+
+    fingerprint: str = _get_fingerprint(
+        execution_engine=execution_engine,
+        batch_spec=PathBatchSpec(path=path, reader_method="read_csv"),
+    )
+    assert (
+        _get_fingerprint(
+            execution_engine=execution_engine,
+            batch_spec=PathBatchSpec(path=path, reader_method="read_csv"),
+        )
+        == fingerprint
+    )
+    assert fingerprint not in (
+        hash_pandas_dataframe(df),
+        hash_pandas_dataframe_sample(df=df, sample_size=2),
+    )
+
+    # Sampling directives are part of fingerprint.
+    assert (
+        _get_fingerprint(
+            execution_engine=execution_engine,
+            batch_spec=PathBatchSpec(
+                path=path,
+                reader_method="read_csv",
+                sampling_method="sample_using_limit",
+                sampling_kwargs={"n": 2},
+            ),
+        )
+        != fingerprint
+    )
+
+    df.iloc[:4].to_csv(path, index=False)
+    stat: os.stat_result = os.stat(path)  # noqa: PTH116
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert (
+        _get_fingerprint(
+            execution_engine=execution_engine,
+            batch_spec=PathBatchSpec(path=path, reader_method="read_csv"),
+        )
+        != fingerprint
+    )
+
+
+@pytest.mark.unit
+def test_parquet_footer_batch_fingerprint(df, tmp_path):
+    pytest.importorskip("pyarrow")
+
+    path: str = str(tmp_path / "data.parquet")
+    df.to_parquet(path)
+    execution_engine = PandasExecutionEngine(batch_fingerprint_method="parquet_footer")
+
+    fingerprint: str = _get_fingerprint(
+        execution_engine=execution_engine,
+        batch_spec=PathBatchSpec(path=path, reader_method="read_parquet"),
+    )
+
+    # Rewriting same data leaves footer (row counts and column statistics) unchanged.
+    os.utime(path, ns=(0, 0))
+    df.to_parquet(path)
+    assert (
+        _get_fingerprint(
+            execution_engine=execution_engine,
+            batch_spec=PathBatchSpec(path=path, reader_method="read_parquet"),
+        )
+        == fingerprint
+    )
+
+    df.iloc[:4].to_parquet(path)
+    assert (
+        _get_fingerprint(
+            execution_engine=execution_engine,
+            batch_spec=PathBatchSpec(path=path, reader_method="read_parquet"),
+        )
+        != fingerprint
+    )
+
+
+@pytest.mark.unit
+def test_unrecognized_batch_fingerprint_configuration():
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(batch_fingerprint_method="md5")
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(batch_fingerprint_sample_size=0)
@@ -0,0 +1,250 @@
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine.pandas_chunked_batch_data import (
+    PandasChunkedBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    UnexpectedIndexQueryMerger,
+    get_chunked_metric_merger,
+    is_chunk_local_metric,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def chunked_test_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, 6, 7, 8, 9, 10],
+            "b": ["x", "y", "z", "x", "y", "z", "x", "y", "z", "q"],
+        }
+    )
+
+
+def _get_validator(path: str, chunk_size=None) -> Validator:
+    execution_engine = PandasExecutionEngine(chunk_size=chunk_size)
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path)
+    )
+    return Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+
+
+def _get_expectation_results(validator: Validator) -> list:
+    return [
+        validator.expect_column_values_to_match_regex(
+            "b", "^[xy]$", result_format="COMPLETE"
+        ).result,
+        validator.expect_column_values_to_be_between(
+            "a", 2, 8, result_format="SUMMARY"
+        ).result,
+        validator.expect_column_values_to_not_be_null("a").result,
+        validator.expect_column_mean_to_be_between("a", 0, 10).result,
+        validator.expect_column_min_to_be_between("a", 0, 10).result,
+        validator.expect_column_max_to_be_between("a", 0, 10).result,
+        validator.expect_table_row_count_to_equal(10).result,
+        validator.expect_column_distinct_values_to_be_in_set("b", ["x"]).result,
+        validator.expect_column_unique_value_count_to_be_between("b", 1, 3).result,
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("file_name", ["data.csv", "data.parquet"])
+def test_chunked_metrics_match_metrics_over_whole_batch(
+    chunked_test_df, tmp_path, file_name
+):
+    path = str(tmp_path / file_name)
+    if file_name.endswith(".csv"):
+        chunked_test_df.to_csv(path, index=False)
+    else:
+        pytest.importorskip("pyarrow")
+        chunked_test_df.to_parquet(path)
+
+    validator = _get_validator(path=path)
+    chunked_validator = _get_validator(path=path, chunk_size=3)
+    assert isinstance(
+        chunked_validator.execution_engine.batch_manager.active_batch_data,
+        PandasChunkedBatchData,
+    )
+
+    # Values are compared by "repr()", so that NaN values (which are never equal to themselves) match.
+    assert repr(_get_expectation_results(validator=chunked_validator)) == repr(
+        _get_expectation_results(validator=validator)
+    )
+
+
+@pytest.mark.unit
+def test_chunked_unexpected_index_list_continues_across_chunks(
+    chunked_test_df, tmp_path
+):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+    validator = _get_validator(path=path, chunk_size=4)
+
+    result = validator.expect_column_values_to_match_regex(
+        "b", "^[xy]$", result_format={"result_format": "COMPLETE"}
+    ).result
+    assert result["unexpected_index_list"] == [2, 5, 8, 9]
+    assert result["unexpected_index_query"] == "df.filter(items=[2, 5, 8, 9], axis=0)"
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_rejects_non_mergeable_metric(chunked_test_df, tmp_path):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+    validator = _get_validator(path=path, chunk_size=3)
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        validator.expect_column_values_to_be_unique("b")
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        _ = validator.execution_engine.dataframe
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_resolves_placeholder_for_chunk_local_metric(
+    chunked_test_df, tmp_path
+):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+    validator = _get_validator(path=path, chunk_size=3)
+
+    metric = MetricConfiguration(
+        metric_name="column_values.nonnull.condition",
+        metric_domain_kwargs={"column": "a"},
+    )
+    resolved_metrics = validator.execution_engine.resolve_metrics(
+        metrics_to_resolve=(metric,)
+    )
+    assert "ChunkLocalMetricValue" in repr(resolved_metrics[metric.id])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "engine_kwargs,batch_spec_kwargs",
+    [
+        pytest.param({"chunk_size": 0}, None, id="invalid_chunk_size"),
+        pytest.param(
+            {"chunk_size": 3},
+            {"reader_method": "read_json"},
+            id="unsupported_reader_method",
+        ),
+        pytest.param(
+            {"chunk_size": 3},
+            {"sampling_method": "sample_using_random"},
+            id="sampling",
+        ),
+    ],
+)
+def test_chunked_batch_data_configuration_errors(
+    chunked_test_df, tmp_path, engine_kwargs, batch_spec_kwargs
+):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(**engine_kwargs).get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=path, **(batch_spec_kwargs or {}))
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,expected_mergeable,expected_chunk_local",
+    [
+        pytest.param("column.max", True, False, id="aggregate"),
+        pytest.param(
+            "column_values.match_regex.unexpected_count",
+            True,
+            False,
+            id="summarization",
+        ),
+        pytest.param(
+            "column_values.match_regex.condition", False, True, id="condition"
+        ),
+        pytest.param("column.median", False, False, id="not_mergeable"),
+        pytest.param(
+            "column_values.unique.unexpected_count", False, False, id="not_row_local"
+        ),
+        pytest.param("column_values.unique.condition", False, False, id="not_local"),
+    ],
+)
+def test_chunked_metric_classification(
+    metric_name, expected_mergeable, expected_chunk_local
+):
+    assert (
+        get_chunked_metric_merger(metric_name=metric_name) is not None
+    ) is expected_mergeable
+    assert is_chunk_local_metric(metric_name=metric_name) is expected_chunk_local
+
+
+@pytest.mark.unit
+def test_unexpected_index_query_merger():
+    metric_configuration = MetricConfiguration(
+        metric_name="column_values.match_regex.unexpected_index_query",
+        metric_domain_kwargs={"column": "b"},
+    )
+    assert (
+        UnexpectedIndexQueryMerger().merge(
+            chunk_states=[
+                "df.filter(items=[2], axis=0)",
+                None,
+                "df.filter(items=[8, 9], axis=0)",
+            ],
+            metric_configuration=metric_configuration,
+        )
+        == "df.filter(items=[2, 8, 9], axis=0)"
+    )
+
+
+@pytest.mark.unit
+def test_chunked_approximate_metrics_merge_sketches(chunked_test_df, tmp_path):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+    validator = _get_validator(path=path, chunk_size=3)
+
+    result = validator.expect_column_unique_value_count_to_be_between(
+        "b", 4, 4, allow_relative_error=True
+    )
+    assert result.success
+    assert result.result["details"] == {"relative_error": 0.01}
+
+    assert validator.expect_column_quantile_values_to_be_between(
+        "a",
+        quantile_ranges={
+            "quantiles": [0.0, 0.5, 1.0],
+            "value_ranges": [[1, 1], [5, 6], [10, 10]],
+        },
+        allow_relative_error=True,
+    ).success
+
+    metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"sort": "count", "allow_relative_error": 0.2},
+    )
+    value_counts = validator.compute_metrics(metric_configurations=[metric])[metric.id]
+    assert value_counts.to_dict() == {"x": 3, "y": 3, "z": 3}
+
+
+@pytest.mark.unit
+def test_chunked_quantile_values_require_relative_error(chunked_test_df, tmp_path):
+    path = str(tmp_path / "data.csv")
+    chunked_test_df.to_csv(path, index=False)
+    validator = _get_validator(path=path, chunk_size=3)
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        validator.expect_column_quantile_values_to_be_between(
+            "a",
+            quantile_ranges={"quantiles": [0.5], "value_ranges": [[5, 6]]},
+        )
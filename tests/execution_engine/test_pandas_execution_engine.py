@@ -238,6 +238,84 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.unit
+def test_get_domain_mask_is_memoized_per_batch_and_row_filtering_directives():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, None, 3, 4, 5]}
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {
+        "column_list": ["b", "c"],
+        "ignore_row_if": "any_value_is_missing",
+        "row_condition": "a>1",
+        "condition_parser": "pandas",
+    }
+    mask = engine.get_domain_mask(domain_kwargs=domain_kwargs)
+    assert mask.tolist() == [False, False, True, True, False]
+    assert engine.get_domain_mask(domain_kwargs=dict(domain_kwargs)) is mask
+
+    # Row condition alone selects "column" Domain records; mask is shared by all columns.
+    column_mask = engine.get_domain_mask(
+        domain_kwargs={
+            "column": "b",
+            "row_condition": "a>1",
+            "condition_parser": "pandas",
+        }
+    )
+    assert column_mask.tolist() == [False, True, True, True, True]
+    assert (
+        engine.get_domain_mask(
+            domain_kwargs={
+                "column": "c",
+                "row_condition": "a>1",
+                "condition_parser": "pandas",
+            }
+        )
+        is column_mask
+    )
+    assert engine.get_domain_mask(domain_kwargs={"column": "a"}) is None
+
+    # Reloading batch data invalidates its masks.
+    engine.load_batch_data(batch_data=df.iloc[:2], batch_id="1234")
+    assert engine.get_domain_mask(domain_kwargs=domain_kwargs).tolist() == [
+        False,
+        False,
+    ]
+
+
+@pytest.mark.unit
+def test_get_domain_column_values_with_row_condition():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]}
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {
+        "column": "c",
+        "row_condition": "b<5",
+        "condition_parser": "pandas",
+    }
+    column = engine.get_domain_column_values(
+        domain_kwargs=domain_kwargs, column_name="c"
+    )
+    assert column.equals(engine.get_domain_records(domain_kwargs=domain_kwargs)["c"])
+
+    (
+        column,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = engine.get_column_compute_domain(domain_kwargs=domain_kwargs)
+    assert column.equals(df["c"].iloc[:3])
+    assert compute_domain_kwargs == {
+        "row_condition": "b<5",
+        "condition_parser": "pandas",
+    }
+    assert accessor_domain_kwargs == {"column": "c"}
+
+
 @pytest.mark.unit
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
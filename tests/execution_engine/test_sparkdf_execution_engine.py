@@ -799,6 +799,106 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
     assert found_message
 
 
+def _build_single_pass_aggregation_spark_engine(
+    spark_session, single_pass_aggregation: bool
+) -> SparkDFExecutionEngine:
+    df: pyspark.DataFrame = spark_session.createDataFrame(
+        data=[(1.0, 1), (2.0, 1), (3.0, 2), (4.0, 2), (5.0, 3), (None, 3)],
+        schema=["a", "b"],
+    )
+    return SparkDFExecutionEngine(
+        spark_config=dict(spark_session.sparkContext.getConf().getAll()),
+        batch_data_dict={"1234": df},
+        force_reuse_spark_context=True,
+        persist=False,
+        single_pass_aggregation=single_pass_aggregation,
+    )
+
+
+def test_single_pass_aggregation_bundles_quantiles_and_histogram(caplog, spark_session):
+    quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 0.5, 1.0],
+            "allow_relative_error": 0.01,
+        },
+    )
+    histogram_metric = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"bins": [0.0, 2.0, 4.0, 5.0]},
+    )
+
+    single_pass_aggregation: bool
+    for single_pass_aggregation in (False, True):
+        engine: SparkDFExecutionEngine = _build_single_pass_aggregation_spark_engine(
+            spark_session=spark_session,
+            single_pass_aggregation=single_pass_aggregation,
+        )
+        caplog.clear()
+        caplog.set_level(logging.DEBUG, logger="great_expectations")
+        results: Dict[Tuple[str, str, str], MetricValue] = engine.resolve_metrics(
+            metrics_to_resolve=(quantile_values_metric, histogram_metric)
+        )
+        assert results[quantile_values_metric.id] == [1.0, 3.0, 5.0]
+        assert results[histogram_metric.id] == [1, 2, 2]
+        assert (
+            "SparkDFExecutionEngine computed 2 metrics on domain_id ()"
+            in caplog.messages
+        ) is single_pass_aggregation
+
+    # Exact quantiles are computed by "approxQuantile()" in any mode.
+    exact_quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.5], "allow_relative_error": False},
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=(exact_quantile_values_metric,))[
+        exact_quantile_values_metric.id
+    ] == [3.0]
+
+
+def test_single_pass_aggregation_persists_compute_domains_until_released(
+    spark_session,
+):
+    engine: SparkDFExecutionEngine = _build_single_pass_aggregation_spark_engine(
+        spark_session=spark_session, single_pass_aggregation=True
+    )
+    domain_kwargs: dict = {
+        "column": "a",
+        "row_condition": "b > 1",
+        "condition_parser": "spark",
+    }
+
+    df: pyspark.DataFrame = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert df.is_cached
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is df
+    # Records do not depend on column of "column" Domain.
+    assert (
+        engine.get_domain_records(domain_kwargs={**domain_kwargs, "column": "b"}) is df
+    )
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={**domain_kwargs, "row_condition": "b > 2"}
+        )
+        is not df
+    )
+
+    engine.release_metric_resolution_resources()
+    assert not df.is_cached
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is not df
+
+
+def test_single_pass_aggregation_with_unrecognized_storage_level(spark_session):
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(
+            force_reuse_spark_context=True,
+            single_pass_aggregation=True,
+            compute_domain_storage_level="NOT_A_STORAGE_LEVEL",
+        )
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs_alt(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
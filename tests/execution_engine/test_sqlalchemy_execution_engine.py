@@ -1,6 +1,7 @@
 import logging
 import os
 from typing import Dict, Tuple, cast
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -21,6 +22,9 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -29,6 +33,9 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     _dialect_requires_persisted_connection,
 )
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    MAX_SELECT_EXPRESSIONS_BY_DIALECT,
+)
 
 # Function to test for spark dataframe equality
 from great_expectations.expectations.row_conditions import (
@@ -303,6 +310,124 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def _build_fused_metric_computation_configurations(
+    sa,
+) -> Tuple[MetricComputationConfiguration, ...]:
+    b_notnull = RowCondition(
+        condition='col("b").notnull()',
+        condition_type=RowConditionParserType.GE,
+    )
+    b_less_than_5 = {
+        "row_condition": 'col("b")<5',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    metric_fns_and_compute_domain_kwargs = (
+        ("table.row_count", sa.func.count(), {}),
+        ("column.max", sa.func.max(sa.column("a")), {"row_condition": None}),
+        ("column.max", sa.func.max(sa.column("a")), {"filter_conditions": [b_notnull]}),
+        ("column.sum", sa.func.sum(sa.column("c")), {"filter_conditions": [b_notnull]}),
+        ("table.row_count", sa.func.count(), b_less_than_5),
+        (
+            "column.distinct_values.count",
+            sa.func.count(sa.distinct(sa.column("c"))),
+            b_less_than_5,
+        ),
+        (
+            "column.mean",
+            sa.func.sum(sa.column("a")) / sa.func.count(sa.column("a")),
+            {"filter_conditions": [b_notnull], **b_less_than_5},
+        ),
+        # Not fusible (unknown function), hence computed in separate query against its own Domain.
+        ("column.values", sa.func.group_concat(sa.column("a")), b_less_than_5),
+    )
+    return tuple(
+        MetricComputationConfiguration(
+            metric_configuration=MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"idx": idx},
+                metric_value_kwargs=None,
+            ),
+            metric_fn=metric_fn,
+            metric_provider_kwargs={},
+            compute_domain_kwargs=compute_domain_kwargs,
+        )
+        for idx, (metric_name, metric_fn, compute_domain_kwargs) in enumerate(
+            metric_fns_and_compute_domain_kwargs
+        )
+    )
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_fuses_domains_into_single_scan(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5],
+                "b": [2, 3, 4, 5, None],
+                "c": [1, 1, 3, 4, None],
+            }
+        ),
+        sa,
+    )
+    metric_computation_configurations = _build_fused_metric_computation_configurations(
+        sa=sa
+    )
+
+    with mock.patch.object(
+        execution_engine, "execute_query", wraps=execution_engine.execute_query
+    ) as mock_execute_query:
+        results = execution_engine.resolve_metric_bundle(
+            metric_fn_bundle=metric_computation_configurations
+        )
+
+    # One fused scan of Batch table, plus one query for non-fusible metric.
+    assert mock_execute_query.call_count == 2
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_computation_configurations
+    ] == [5, 5, 4, 9, 3, 2, 2, "1,2,3"]
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_splits_queries_at_dialect_select_expression_limit(
+    sa, monkeypatch
+):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None]}),
+        sa,
+    )
+    monkeypatch.setitem(MAX_SELECT_EXPRESSIONS_BY_DIALECT, GXSqlDialect.SQLITE, 2)
+
+    metric_computation_configurations = tuple(
+        MetricComputationConfiguration(
+            metric_configuration=MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": column_name, "idx": idx},
+                metric_value_kwargs=None,
+            ),
+            metric_fn=sa.func.max(sa.column(column_name)),
+            metric_provider_kwargs={},
+            compute_domain_kwargs={},
+        )
+        for idx, column_name in enumerate(("a", "b", "a", "b", "a"))
+    )
+
+    with mock.patch.object(
+        execution_engine, "execute_query", wraps=execution_engine.execute_query
+    ) as mock_execute_query:
+        results = execution_engine.resolve_metric_bundle(
+            metric_fn_bundle=metric_computation_configurations
+        )
+
+    assert mock_execute_query.call_count == 3
+    assert results == {
+        metric_computation_configuration.metric_configuration.id: value
+        for metric_computation_configuration, value in zip(
+            metric_computation_configurations, (5, 5, 5, 5, 5)
+        )
+    }
+
+
 def test_get_domain_records_with_column_domain(sa):
     df = pd.DataFrame(
         {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]}
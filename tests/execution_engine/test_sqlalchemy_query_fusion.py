@@ -0,0 +1,125 @@
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_query_fusion import (
+    canonicalize_compute_domain_kwargs,
+    chunk_select_expressions,
+    get_base_domain_kwargs,
+    is_fusible_metric_fn,
+    make_metric_fn_conditional,
+)
+
+pytestmark = pytest.mark.sqlite
+
+
+@pytest.mark.parametrize(
+    "compute_domain_kwargs,expected_canonical_domain_kwargs",
+    [
+        pytest.param({}, {}, id="empty"),
+        pytest.param(
+            {
+                "batch_id": "my_batch_id",
+                "table": None,
+                "row_condition": None,
+                "condition_parser": "great_expectations__experimental__",
+                "filter_conditions": [],
+            },
+            {"batch_id": "my_batch_id"},
+            id="no_row_filtering",
+        ),
+        pytest.param(
+            {"column_A": "a", "column_B": "b", "ignore_row_if": "neither"},
+            {},
+            id="neutral_ignore_row_if",
+        ),
+        pytest.param(
+            {"column_list": ["a", "b"], "ignore_row_if": "any_value_is_missing"},
+            {"column_list": ["a", "b"], "ignore_row_if": "any_value_is_missing"},
+            id="ignore_row_if",
+        ),
+    ],
+)
+def test_canonicalize_compute_domain_kwargs(
+    compute_domain_kwargs, expected_canonical_domain_kwargs
+):
+    assert (
+        canonicalize_compute_domain_kwargs(compute_domain_kwargs=compute_domain_kwargs)
+        == expected_canonical_domain_kwargs
+    )
+
+
+def test_get_base_domain_kwargs():
+    assert get_base_domain_kwargs(
+        compute_domain_kwargs={
+            "batch_id": "my_batch_id",
+            "row_condition": 'col("a")>1',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    ) == {"batch_id": "my_batch_id"}
+
+
+@pytest.mark.parametrize(
+    "metric_fn,expected_is_fusible",
+    [
+        pytest.param(sa.func.count(), True, id="count_star"),
+        pytest.param(sa.func.max(sa.column("a")), True, id="aggregate"),
+        pytest.param(
+            sa.func.sqrt(sa.func.avg(sa.column("a")) * 2), True, id="scalar_of_agg"
+        ),
+        pytest.param(sa.column("a"), False, id="bare_column"),
+        pytest.param(sa.literal(1), False, id="no_aggregate"),
+        pytest.param(
+            sa.func.percentile_disc(0.5).within_group(sa.column("a")),
+            False,
+            id="ordered_set_aggregate",
+        ),
+        pytest.param(sa.func.max(sa.column("a")).over(), False, id="window"),
+        pytest.param(
+            sa.func.group_concat(sa.column("a")), False, id="unknown_aggregate"
+        ),
+        pytest.param(
+            sa.func.max(sa.func.min(sa.column("a"))), False, id="nested_aggregate"
+        ),
+    ],
+)
+def test_is_fusible_metric_fn(metric_fn, expected_is_fusible):
+    assert is_fusible_metric_fn(metric_fn=metric_fn) is expected_is_fusible
+
+
+@pytest.mark.parametrize(
+    "dialect_name,expected_sql",
+    [
+        pytest.param(
+            "sqlite",
+            "count(DISTINCT CASE WHEN (a > 1) THEN a END) / count(CASE WHEN (a > 1) THEN 1 END)",
+            id="case_when",
+        ),
+        pytest.param(
+            "postgresql",
+            "count(DISTINCT a) FILTER (WHERE a > 1) / count(*) FILTER (WHERE a > 1)",
+            id="aggregate_filter",
+        ),
+    ],
+)
+def test_make_metric_fn_conditional(dialect_name, expected_sql):
+    metric_fn = sa.func.count(sa.distinct(sa.column("a"))) / sa.func.count()
+    conditional_metric_fn = make_metric_fn_conditional(
+        metric_fn=metric_fn,
+        predicate=sa.column("a") > 1,
+        dialect_name=dialect_name,
+    )
+    assert (
+        str(conditional_metric_fn.compile(compile_kwargs={"literal_binds": True}))
+        == expected_sql
+    )
+
+
+def test_chunk_select_expressions():
+    assert list(
+        chunk_select_expressions(
+            select_expressions=[1, 2, 3], max_select_expressions=None
+        )
+    ) == [(0, [1, 2, 3])]
+    assert list(
+        chunk_select_expressions(select_expressions=[1, 2, 3], max_select_expressions=2)
+    ) == [(0, [1, 2]), (2, [3])]
@@ -0,0 +1,107 @@
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+
+@pytest.fixture
+def execution_engine_and_statements(sa):
+    engine = sa.create_engine("sqlite://")
+    execution_engine = SqlAlchemyExecutionEngine(engine=engine)
+
+    statements: list = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    return execution_engine, statements
+
+
+def _get_temp_table_names(execution_engine: SqlAlchemyExecutionEngine) -> list:
+    return [
+        row[0]
+        for row in execution_engine.execute_query(
+            sa.text("SELECT name FROM sqlite_temp_master WHERE type = 'table'")
+        ).fetchall()
+    ]
+
+
+@pytest.mark.sqlite
+def test_scratch_tables_are_created_without_reflection_and_reused(
+    execution_engine_and_statements,
+):
+    execution_engine, statements = execution_engine_and_statements
+    temp_table_manager = execution_engine.temp_table_manager
+
+    with temp_table_manager.scratch_table(
+        columns={"condition": sa.Integer}
+    ) as temp_table:
+        execution_engine.execute_query_in_transaction(
+            temp_table.insert().values(condition=1)
+        )
+        with temp_table_manager.scratch_table(
+            columns={"condition": sa.Integer}
+        ) as other_temp_table:
+            assert other_temp_table.name != temp_table.name
+
+    assert not [
+        statement
+        for statement in statements
+        if "sqlite_master" in statement or "PRAGMA" in statement
+    ]
+    assert (
+        len([statement for statement in statements if "CREATE TEMPORARY" in statement])
+        == 2  # noqa: PLR2004
+    )
+
+    # Released scratch table is handed out again, emptied.
+    with temp_table_manager.scratch_table(
+        columns={"condition": sa.Integer}
+    ) as reused_temp_table:
+        assert reused_temp_table.name in (temp_table.name, other_temp_table.name)
+        assert (
+            execution_engine.execute_query(
+                sa.select(sa.func.count()).select_from(reused_temp_table)
+            ).scalar()
+            == 0
+        )
+
+    assert (
+        len([statement for statement in statements if "CREATE TEMPORARY" in statement])
+        == 2  # noqa: PLR2004
+    )
+
+    # Scratch tables with different columns are not interchangeable.
+    with temp_table_manager.scratch_table(
+        columns={"condition": sa.Float}
+    ) as float_temp_table:
+        assert float_temp_table.name not in (temp_table.name, other_temp_table.name)
+
+    assert len(temp_table_manager.temp_tables) == 3  # noqa: PLR2004
+
+
+@pytest.mark.sqlite
+def test_scratch_tables_are_dropped_on_close(execution_engine_and_statements):
+    execution_engine, statements = execution_engine_and_statements
+    temp_table_manager = execution_engine.temp_table_manager
+
+    with temp_table_manager.scratch_table(
+        columns={"condition": sa.Integer}
+    ) as temp_table:
+        pass
+
+    assert _get_temp_table_names(execution_engine=execution_engine) == [temp_table.name]
+
+    temp_table_manager.drop_all()
+    assert _get_temp_table_names(execution_engine=execution_engine) == []
+    assert temp_table_manager.temp_tables == []
+
+    with temp_table_manager.scratch_table(
+        columns={"condition": sa.Integer}
+    ) as temp_table:
+        pass
+
+    execution_engine.close()
+    assert statements[-1] == f"\nDROP TABLE {temp_table.name}"
+    assert temp_table_manager.temp_tables == []
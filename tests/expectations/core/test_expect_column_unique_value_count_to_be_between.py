@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.expectations.core.expect_column_proportion_of_unique_values_to_be_between import (
+    ExpectColumnProportionOfUniqueValuesToBeBetween,
+)
+from great_expectations.expectations.core.expect_column_unique_value_count_to_be_between import (
+    ExpectColumnUniqueValueCountToBeBetween,
+)
+from great_expectations.self_check.util import build_sa_execution_engine
+from great_expectations.validator.validator import Validator
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectation_class,metric_name",
+    [
+        pytest.param(
+            ExpectColumnUniqueValueCountToBeBetween,
+            "column.distinct_values.count",
+            id="unique_value_count",
+        ),
+        pytest.param(
+            ExpectColumnProportionOfUniqueValuesToBeBetween,
+            "column.unique_proportion",
+            id="proportion_of_unique_values",
+        ),
+    ],
+)
+def test_allow_relative_error_requests_approximate_metric(
+    expectation_class, metric_name
+):
+    expectation_type: str = expectation_class.expectation_type
+    exact_configuration = ExpectationConfiguration(
+        expectation_type=expectation_type,
+        kwargs={"column": "a", "min_value": 1, "max_value": 3},
+    )
+    approximate_configuration = ExpectationConfiguration(
+        expectation_type=expectation_type,
+        kwargs={
+            "column": "a",
+            "min_value": 1,
+            "max_value": 3,
+            "allow_relative_error": 0.05,
+        },
+    )
+
+    exact_metric_configuration = (
+        expectation_class(exact_configuration)
+        .get_validation_dependencies(configuration=exact_configuration)
+        .get_metric_configuration(metric_name=metric_name)
+    )
+    approximate_metric_configuration = (
+        expectation_class(approximate_configuration)
+        .get_validation_dependencies(configuration=approximate_configuration)
+        .get_metric_configuration(metric_name=metric_name)
+    )
+
+    assert "allow_relative_error" not in (
+        exact_metric_configuration.metric_value_kwargs or {}
+    )
+    assert (
+        approximate_metric_configuration.metric_value_kwargs["allow_relative_error"]
+        == 0.05  # noqa: PLR2004
+    )
+
+
+@pytest.mark.sqlite
+def test_allow_relative_error_falls_back_to_exact_count_in_sqlite(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 2, 3, None]}), sa
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[
+            Batch(data=execution_engine.batch_manager.active_batch_data),
+        ],
+    )
+
+    result = validator.expect_column_unique_value_count_to_be_between(
+        "a", 3, 3, allow_relative_error=True
+    )
+    assert result.success
+    assert result.result == {"observed_value": 3, "details": {"relative_error": 0.01}}
+
+    result = validator.expect_column_proportion_of_unique_values_to_be_between(
+        "a", 0.75, 0.75, allow_relative_error=True
+    )
+    assert result.success
@@ -3,10 +3,18 @@ from typing import Dict, Tuple
 import pandas as pd
 import pytest
 
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    RuntimeDataBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.core.unexpected_index_ranges import UnexpectedIndexRanges
 from great_expectations.exceptions import MetricResolutionError
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -20,6 +28,7 @@ from great_expectations.self_check.util import (
 )
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -532,3 +541,170 @@ def test_spark_unexpected_index_query_metric_without_id_pk(
             val
             == "df.filter(F.expr((animals IS NOT NULL) AND (NOT (animals IN (cat, fish, dog)))))"
         )
+
+
+def _validate_with_unexpected_index_column_names(
+    sa, df: pd.DataFrame, batch_unexpected_index_queries: bool
+) -> Tuple[list, list]:
+    engine = sa.create_engine("sqlite://")
+    df.to_sql(name="animal_table", con=engine, index=False)
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=engine, batch_unexpected_index_queries=batch_unexpected_index_queries
+    )
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(
+            table_name="animal_table", data_asset_name="animal_table"
+        )
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+    result_format: dict = {
+        "result_format": "SUMMARY",
+        "unexpected_index_column_names": ["pk_1"],
+        "partial_unexpected_count": 2,
+    }
+    expectation_suite = ExpectationSuite(
+        expectation_suite_name="unexpected_index_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": "animals",
+                    "value_set": ["cat", "fish", "dog"],
+                    "result_format": result_format,
+                },
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_in_set",
+                kwargs={
+                    "column": "pk_2",
+                    "value_set": ["zero", "three"],
+                    "result_format": result_format,
+                },
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": "pk_1",
+                    "min_value": 4,
+                    "result_format": result_format,
+                },
+            ),
+        ],
+    )
+
+    statements: list = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    result = validator.validate(expectation_suite=expectation_suite)
+    sa.event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    return [
+        expectation_result.result["partial_unexpected_index_list"]
+        for expectation_result in result.results
+    ], statements
+
+
+@pytest.mark.sqlite
+def test_sa_unexpected_index_lists_are_retrieved_in_one_query(sa, animal_table_df):
+    unexpected_index_lists, statements = _validate_with_unexpected_index_column_names(
+        sa=sa, df=animal_table_df, batch_unexpected_index_queries=False
+    )
+    (
+        batched_unexpected_index_lists,
+        batched_statements,
+    ) = _validate_with_unexpected_index_column_names(
+        sa=sa, df=animal_table_df, batch_unexpected_index_queries=True
+    )
+
+    assert batched_unexpected_index_lists == unexpected_index_lists
+    assert batched_unexpected_index_lists == [
+        [{"animals": "giraffe", "pk_1": 3}, {"animals": "lion", "pk_1": 4}],
+        [{"pk_1": 0, "pk_2": "zero"}, {"pk_1": 3, "pk_2": "three"}],
+        [{"pk_1": 0}, {"pk_1": 1}],
+    ]
+    assert len(batched_statements) == len(statements) - 2
+    assert (
+        len(
+            [statement for statement in batched_statements if "row_number" in statement]
+        )
+        == 1
+    )
+
+
+@pytest.mark.sqlite
+def test_sa_unexpected_index_lists_fall_back_to_one_query_per_expectation(
+    sa, animal_table_df, monkeypatch
+):
+    def _raise(*args, **kwargs):
+        raise sa.exc.OperationalError("SELECT", {}, Exception("no window functions"))
+
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "_resolve_batched_unexpected_index_list_metrics",
+        _raise,
+    )
+    unexpected_index_lists, statements = _validate_with_unexpected_index_column_names(
+        sa=sa, df=animal_table_df, batch_unexpected_index_queries=True
+    )
+
+    assert unexpected_index_lists == [
+        [{"animals": "giraffe", "pk_1": 3}, {"animals": "lion", "pk_1": 4}],
+        [{"pk_1": 0, "pk_2": "zero"}, {"pk_1": 3, "pk_2": "three"}],
+        [{"pk_1": 0}, {"pk_1": 1}],
+    ]
+    assert not [statement for statement in statements if "row_number" in statement]
+
+
+@pytest.mark.unit
+def test_pd_unexpected_index_list_and_query_as_ranges():
+    execution_engine = PandasExecutionEngine()
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(
+            batch_data=pd.DataFrame({"a": [i % 7 for i in range(20)]})
+        )
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+
+    result = validator.expect_column_values_to_be_between(
+        "a",
+        min_value=0,
+        max_value=3,
+        result_format={
+            "result_format": "COMPLETE",
+            "unexpected_index_list_format": "ranges",
+        },
+    )
+    unexpected_index_list = result.result["unexpected_index_list"]
+    assert isinstance(unexpected_index_list, UnexpectedIndexRanges)
+    assert unexpected_index_list == [4, 5, 6, 11, 12, 13, 18, 19]
+    assert result.result["partial_unexpected_index_list"] == [
+        4,
+        5,
+        6,
+        11,
+        12,
+        13,
+        18,
+        19,
+    ]
+    assert (
+        result.result["unexpected_index_query"]
+        == "df.filter(items=[*range(4, 7), *range(11, 14), *range(18, 20)], axis=0)"
+    )
+    assert result.to_json_dict()["result"]["unexpected_index_list"] == {
+        "unexpected_index_ranges": [[4, 7], [11, 14], [18, 20]]
+    }
+
+    result = validator.expect_column_values_to_be_between(
+        "a", min_value=0, max_value=3, result_format={"result_format": "COMPLETE"}
+    )
+    assert result.result["unexpected_index_list"] == [4, 5, 6, 11, 12, 13, 18, 19]
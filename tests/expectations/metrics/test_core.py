@@ -4555,6 +4555,30 @@ def test_value_counts_metric_sa(sa):
     ).equals(metrics[desired_metric_b.id])
 
 
+@pytest.mark.big
+@pytest.mark.parametrize("engine_type", ["pandas", "sqlite"])
+def test_value_counts_metric_heavy_hitters(sa, engine_type):
+    df = pd.DataFrame({"a": [1, 1, 1, 1, 2, 2, 2, 3, 4, None]})
+    if engine_type == "pandas":
+        engine = build_pandas_engine(df)
+    else:
+        engine = build_sa_execution_engine(df, sa)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "sort": "value",
+            "collate": None,
+            "allow_relative_error": 0.2,
+        },
+    )
+
+    metrics = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    # Only values, whose count reaches "0.2 * 9" non-null values, are returned.
+    assert metrics[desired_metric.id].to_dict() == {1.0: 4, 2.0: 3}
+
+
 @pytest.mark.big
 def test_value_counts_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
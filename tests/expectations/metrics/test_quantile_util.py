@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.quantile_util import (
+    get_column_quantiles_from_row_positions,
+    get_column_quantiles_from_sketch,
+    get_column_values_at_row_positions,
+    get_median_row_positions,
+    get_quantile_row_positions,
+)
+from great_expectations.self_check.util import build_sa_execution_engine
+
+
+@pytest.mark.unit
+def test_get_quantile_row_positions():
+    assert get_quantile_row_positions(
+        quantiles=[0.0, 0.25, 0.5, 0.75, 1.0], row_count=4
+    ) == [0, 0, 1, 2, 3]
+
+
+@pytest.mark.unit
+def test_get_median_row_positions():
+    assert get_median_row_positions(row_count=1) == [0]
+    assert get_median_row_positions(row_count=4) == [1, 2]
+    assert get_median_row_positions(row_count=5) == [2]
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("use_window_function", [True, False])
+def test_get_column_values_at_row_positions(sa, use_window_function):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [5, None, 3, 1, 4, 2]}), sa
+    )
+    selectable = execution_engine.get_compute_domain(
+        domain_kwargs={}, domain_type="table"
+    )[0]
+
+    with mock.patch.object(
+        execution_engine, "execute_query", wraps=execution_engine.execute_query
+    ) as mock_execute_query:
+        assert get_column_values_at_row_positions(
+            column=sa.column("a"),
+            row_positions=[0, 2, 4, 10],
+            selectable=selectable,
+            execution_engine=execution_engine,
+            ignore_nulls=True,
+            use_window_function=use_window_function,
+        ) == {0: 1, 2: 3, 4: 5}
+
+    assert mock_execute_query.call_count == 1
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("use_window_function", [True, False])
+def test_get_column_quantiles_from_row_positions(sa, use_window_function):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": [4, 2, 3, 1]}), sa)
+    selectable = execution_engine.get_compute_domain(
+        domain_kwargs={}, domain_type="table"
+    )[0]
+
+    assert get_column_quantiles_from_row_positions(
+        column=sa.column("a"),
+        quantiles=[0.25, 0.5, 0.75],
+        selectable=selectable,
+        execution_engine=execution_engine,
+        row_count=4,
+        use_window_function=use_window_function,
+    ) == [1, 2, 3]
+
+
+@pytest.mark.sqlite
+def test_get_column_quantiles_from_sketch(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": list(range(1000)) + [None]}), sa
+    )
+    selectable = execution_engine.get_compute_domain(
+        domain_kwargs={}, domain_type="table"
+    )[0]
+
+    quantiles = get_column_quantiles_from_sketch(
+        column=sa.column("a"),
+        quantiles=[0.25, 0.5, 0.75],
+        selectable=selectable,
+        execution_engine=execution_engine,
+        relative_error=0.05,
+    )
+    assert quantiles == pytest.approx([250, 500, 750], abs=50)
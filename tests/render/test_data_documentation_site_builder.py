@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -504,6 +505,149 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+def _sort_index_links(index_links_dict: Dict) -> Dict:
+    # Order of links follows listing of site store, which (unlike set of links) is not specified.
+    return {
+        links_name: sorted(links, key=lambda link_dict: link_dict["filepath"])
+        if links_name.endswith("_links")
+        else links
+        for links_name, links in index_links_dict.items()
+    }
+
+
+@pytest.mark.filterwarnings(
+    "ignore:String run_ids*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
+)
+@pytest.mark.slow
+def test_incremental_site_builder(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    full_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    )
+    _, expected_index_links_dict = full_site_builder.build()
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        max_render_workers=2,
+        **local_site_config,
+    )
+    with mock.patch.object(
+        site_builder.target_store, "set", wraps=site_builder.target_store.set
+    ) as mock_set:
+        _, index_links_dict = site_builder.build()
+    assert mock_set.call_count == len(
+        context.stores["expectations_store"].list_keys()
+    ) + len(context.stores["validations_store"].list_keys())
+    assert _sort_index_links(index_links_dict) == _sort_index_links(
+        expected_index_links_dict
+    )
+    assert site_builder.target_store.read_manifest() is not None
+
+    # Unchanged resources are not rendered again (and stored resources are retrieved in bulk).
+    validations_store_backend = context.stores["validations_store"].store_backend
+    with mock.patch.object(
+        site_builder.target_store, "set", wraps=site_builder.target_store.set
+    ) as mock_set, mock.patch.object(
+        validations_store_backend, "get", wraps=validations_store_backend.get
+    ) as mock_get, mock.patch.object(
+        validations_store_backend, "get_many", wraps=validations_store_backend.get_many
+    ) as mock_get_many:
+        _, index_links_dict = site_builder.build()
+    assert mock_set.call_count == 0
+    assert mock_get.call_count == 0
+    assert mock_get_many.call_count > 0
+    assert _sort_index_links(index_links_dict) == _sort_index_links(
+        expected_index_links_dict
+    )
+
+    # Builds for given resources neither list nor read stored resources, other than given ones.
+    validation_result_key = context.stores["validations_store"].list_keys()[0]
+    with mock.patch.object(
+        site_builder.target_store, "set", wraps=site_builder.target_store.set
+    ) as mock_set, mock.patch.object(
+        context.stores["validations_store"], "list_keys"
+    ) as mock_list_keys, mock.patch.object(
+        context, "get_validation_result"
+    ) as mock_get_validation_result:
+        _, index_links_dict = site_builder.build(
+            resource_identifiers=[validation_result_key]
+        )
+    assert mock_set.call_count == 0
+    assert mock_list_keys.call_count == 0
+    assert mock_get_validation_result.call_count == 0
+    assert _sort_index_links(index_links_dict) == _sort_index_links(
+        expected_index_links_dict
+    )
+
+
+@pytest.mark.filterwarnings(
+    "ignore:String run_ids*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
+)
+@pytest.mark.slow
+def test_site_builder_with_sharded_index(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    _, expected_index_links_dict = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    ).build()
+
+    local_site_config["site_index_builder"] = {
+        **local_site_config.get("site_index_builder", {}),
+        "index_shard_size": 2,
+    }
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    )
+    index_page_url, index_links_dict = site_builder.build()
+
+    site_dir = os.path.dirname(index_page_url[len("file://") :])  # noqa: PTH120
+    for section_name in ("expectations", "profiling", "validations"):
+        link_count = len(expected_index_links_dict.get(f"{section_name}_links", []))
+        link_shards = index_links_dict[f"{section_name}_link_shards"]
+        assert not index_links_dict.get(f"{section_name}_links")
+        assert len(link_shards) == (link_count + 1) // 2
+        assert sum(link_shard["link_count"] for link_shard in link_shards) == (
+            link_count
+        )
+        for link_shard in link_shards:
+            with open(
+                os.path.join(  # noqa: PTH118
+                    site_dir, link_shard["filepath"].split("?")[0]
+                )
+            ) as f:
+                assert f.read().startswith("appendTableDataShard([")
+
+    with open(index_page_url[len("file://") :]) as f:
+        index_page = f.read()
+    assert "loadTableDataShards(" in index_page
+    assert index_links_dict["profiling_link_shards"][0]["filepath"] in index_page
+
+    # Shards left over by larger index are removed.
+    site_builder.site_index_builder.index_shard_size = 1000
+    _, index_links_dict = site_builder.build()
+    assert len(index_links_dict["profiling_link_shards"]) == 1
+    assert sorted(
+        os.listdir(os.path.join(site_dir, "index", "profiling"))  # noqa: PTH118
+    ) == ["1.js"]
+
+
 @pytest.mark.filterwarnings(
     "ignore:name is deprecated as a batch_parameter*:DeprecationWarning:great_expectations.data_context.data_context"
 )
@@ -0,0 +1,287 @@
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    RuntimeDataBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.data_context.store import MetricStateStore
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.validator.incremental_validation import (
+    IncrementalValidation,
+    get_metric_state_merger,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def expectation_suite() -> ExpectationSuite:
+    return ExpectationSuite(
+        expectation_suite_name="incremental_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_mean_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 100},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 100},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_distinct_values_to_be_in_set",
+                kwargs={"column": "b", "value_set": ["x", "y"]},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_be_between",
+                kwargs={"min_value": 0, "max_value": 100},
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def initial_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ts": [1, 2, 3, 4],
+            "a": [1.0, 2.0, 3.0, 4.0],
+            "b": ["x", None, "y", "x"],
+        }
+    )
+
+
+@pytest.fixture
+def appended_df(initial_df) -> pd.DataFrame:
+    df = pd.concat(
+        [
+            initial_df,
+            pd.DataFrame(
+                {"ts": [5, 6, 7], "a": [10.0, 20.0, None], "b": ["z", None, "x"]}
+            ),
+        ],
+        ignore_index=True,
+    )
+    # Rows validated earlier are not scanned again; hence, changing one of them does not affect incremental results.
+    df.loc[0, "a"] = 1000.0
+    return df
+
+
+def _get_pandas_validator(df: pd.DataFrame) -> Validator:
+    execution_engine = PandasExecutionEngine()
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(batch_data=df)
+    )
+    return Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+
+
+def _get_observed_results(validation_result) -> list:
+    return [
+        {
+            key: value
+            for key, value in result.result.items()
+            if key not in ("details", "partial_unexpected_list")
+        }
+        for result in validation_result.results
+    ]
+
+
+@pytest.mark.unit
+def test_get_metric_state_merger():
+    assert get_metric_state_merger(
+        MetricConfiguration(
+            metric_name="column.mean", metric_domain_kwargs={"column": "a"}
+        )
+    )
+    assert get_metric_state_merger(
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_count",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"value_set": [1]},
+        )
+    )
+    # Metrics over filtered Domains, non-mergeable metrics, and row-dependent map metrics are not incremental.
+    assert not get_metric_state_merger(
+        MetricConfiguration(
+            metric_name="column.mean",
+            metric_domain_kwargs={
+                "column": "a",
+                "row_condition": "b > 0",
+                "condition_parser": "pandas",
+            },
+        )
+    )
+    assert not get_metric_state_merger(
+        MetricConfiguration(
+            metric_name="column.median", metric_domain_kwargs={"column": "a"}
+        )
+    )
+    assert not get_metric_state_merger(
+        MetricConfiguration(
+            metric_name="column_values.unique.unexpected_count",
+            metric_domain_kwargs={"column": "a"},
+        )
+    )
+
+
+@pytest.mark.unit
+def test_incremental_validation_merges_delta_into_stored_metric_states(
+    expectation_suite, initial_df, appended_df
+):
+    incremental_validation = IncrementalValidation(
+        metric_state_store=MetricStateStore(),
+        data_asset_name="my_asset",
+        watermark_column="ts",
+    )
+
+    result = _get_pandas_validator(df=initial_df).validate(
+        expectation_suite=expectation_suite,
+        incremental_validation=incremental_validation,
+    )
+    assert _get_observed_results(result) == [
+        {"observed_value": 2.5},
+        {"observed_value": 4.0},
+        {"element_count": 4, "unexpected_count": 1, "unexpected_percent": 25.0},
+        {"observed_value": ["x", "y"]},
+        {"observed_value": 4},
+    ]
+
+    metric_states = [
+        incremental_validation.metric_state_store.get(key)
+        for key in incremental_validation.metric_state_store.list_keys()
+    ]
+    assert metric_states
+    assert all(metric_state["watermark"] == 4 for metric_state in metric_states)
+
+    result = _get_pandas_validator(df=appended_df).validate(
+        expectation_suite=expectation_suite,
+        incremental_validation=incremental_validation,
+    )
+    assert result.success is False
+    assert _get_observed_results(result) == [
+        {"observed_value": pytest.approx(40.0 / 6)},
+        {"observed_value": 20.0},
+        {
+            "element_count": 7,
+            "unexpected_count": 2,
+            "unexpected_percent": pytest.approx(200.0 / 7),
+        },
+        {"observed_value": ["x", "y", "z"]},
+        {"observed_value": 7},
+    ]
+    assert all(
+        incremental_validation.metric_state_store.get(key)["watermark"]
+        == 7  # noqa: PLR2004
+        for key in incremental_validation.metric_state_store.list_keys()
+    )
+
+    # Full validation does scan changed row.
+    result = _get_pandas_validator(df=appended_df).validate(
+        expectation_suite=expectation_suite
+    )
+    assert _get_observed_results(result)[1] == {"observed_value": 1000.0}
+
+
+@pytest.mark.unit
+def test_incremental_validation_keeps_nanosecond_precision_of_watermark(
+    expectation_suite,
+):
+    df = pd.DataFrame(
+        {
+            "ts": pd.to_datetime(
+                ["2024-01-01 00:00:00", "2024-01-02 00:00:00.0000005"]
+            ),
+            "a": [1.0, 2.0],
+            "b": ["x", "y"],
+        }
+    )
+    incremental_validation = IncrementalValidation(
+        metric_state_store=MetricStateStore(),
+        data_asset_name="my_asset",
+        watermark_column="ts",
+    )
+
+    result = _get_pandas_validator(df=df).validate(
+        expectation_suite=expectation_suite,
+        incremental_validation=incremental_validation,
+    )
+    metric_states = {
+        key: incremental_validation.metric_state_store.get(key)
+        for key in incremental_validation.metric_state_store.list_keys()
+    }
+    assert metric_states
+    assert all(
+        metric_state["watermark"] == "2024-01-02 00:00:00.000000500"
+        for metric_state in metric_states.values()
+    )
+
+    # Re-validation without new rows scans no rows; hence, neither results nor stored metric states change.
+    revalidation_result = _get_pandas_validator(df=df).validate(
+        expectation_suite=expectation_suite,
+        incremental_validation=incremental_validation,
+    )
+    assert _get_observed_results(revalidation_result) == _get_observed_results(result)
+    assert {
+        key: incremental_validation.metric_state_store.get(key)
+        for key in incremental_validation.metric_state_store.list_keys()
+    } == metric_states
+
+
+@pytest.mark.sqlite
+def test_incremental_validation_scans_delta_only_with_sqlalchemy(
+    sa, expectation_suite, initial_df, appended_df
+):
+    engine = sa.create_engine("sqlite://")
+    incremental_validation = IncrementalValidation(
+        metric_state_store=MetricStateStore(),
+        data_asset_name="my_table",
+        watermark_column="ts",
+    )
+
+    df: pd.DataFrame
+    results: list = []
+    for df in (initial_df, appended_df):
+        df.to_sql(name="my_table", con=engine, index=False, if_exists="replace")
+        execution_engine = SqlAlchemyExecutionEngine(engine=engine)
+        batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=SqlAlchemyDatasourceBatchSpec(
+                table_name="my_table", data_asset_name="my_table"
+            )
+        )
+        validator = Validator(
+            execution_engine=execution_engine,
+            batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+        )
+        results.append(
+            _get_observed_results(
+                validator.validate(
+                    expectation_suite=expectation_suite,
+                    incremental_validation=incremental_validation,
+                )
+            )
+        )
+
+    assert results[1] == [
+        {"observed_value": pytest.approx(40.0 / 6)},
+        {"observed_value": 20.0},
+        {
+            "element_count": 7,
+            "unexpected_count": 2,
+            "unexpected_percent": pytest.approx(200.0 / 7),
+        },
+        {"observed_value": ["x", "y", "z"]},
+        {"observed_value": 7},
+    ]
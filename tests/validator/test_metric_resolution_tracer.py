@@ -0,0 +1,178 @@
+import json
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    RuntimeDataBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.validator.metric_resolution_tracer import (
+    NULL_METRIC_RESOLUTION_TRACER,
+    MetricResolutionTracer,
+    get_metric_resolution_tracer,
+)
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def expectation_suite() -> ExpectationSuite:
+    return ExpectationSuite(
+        expectation_suite_name="trace_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+        ],
+    )
+
+
+@pytest.mark.unit
+def test_span_instant_and_increment_are_recorded_in_chrome_trace_format():
+    tracer = MetricResolutionTracer()
+    metric_ids = [("column.max", "a", ()), ("column.min", "a", ())]
+
+    with tracer.span(
+        name="metric_bundle", category="metric_bundle", metric_ids=metric_ids
+    ) as args:
+        args["sql"] = "SELECT 1"
+
+    tracer.instant(name="metric_resolution_failure", category="validation_graph")
+    tracer.increment(name="metric_cache", category="cache", hits=2, misses=1)
+    tracer.increment(name="metric_cache", category="cache", hits=1, misses=0)
+    tracer.set_metadata(key="expectations", value=[{"expectation_type": "expect"}])
+
+    trace = tracer.to_chrome_trace()
+    assert json.loads(json.dumps(trace)) == trace
+
+    events = {event["ph"]: event for event in trace["traceEvents"]}
+    assert events["X"]["name"] == "metric_bundle"
+    assert events["X"]["args"] == {"sql": "SELECT 1"}
+    assert events["X"]["dur"] >= 0
+    assert events["i"]["name"] == "metric_resolution_failure"
+    assert events["C"]["args"] == {"hits": 3, "misses": 1}
+    assert trace["otherData"]["counters"] == {
+        "metric_cache.hits": 3,
+        "metric_cache.misses": 1,
+    }
+    assert trace["otherData"]["expectations"] == [{"expectation_type": "expect"}]
+
+    metric_durations = tracer.get_metric_durations()
+    assert set(metric_durations) == set(metric_ids)
+    assert metric_durations[metric_ids[0]] == metric_durations[metric_ids[1]]
+
+
+@pytest.mark.unit
+def test_null_tracer_records_nothing():
+    tracer = NULL_METRIC_RESOLUTION_TRACER
+    assert not tracer.enabled
+
+    with tracer.span(name="metric", category="metric") as args:
+        args["sql"] = "SELECT 1"
+    tracer.instant(name="metric_resolution_failure", category="validation_graph")
+    tracer.increment(name="metric_cache", category="cache", hits=1)
+
+    assert tracer.to_chrome_trace() == {
+        "traceEvents": [],
+        "displayTimeUnit": "ms",
+        "otherData": {"counters": {}},
+    }
+    assert get_metric_resolution_tracer(execution_engine=object()) is tracer
+
+
+@pytest.mark.unit
+def test_validate_attaches_metric_resolution_trace_to_meta(expectation_suite):
+    execution_engine = PandasExecutionEngine()
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(
+            batch_data=pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+        )
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+
+    result = validator.validate(
+        expectation_suite=expectation_suite, trace_metric_resolution=True
+    )
+    assert result.success is False
+    assert execution_engine.metric_resolution_tracer is NULL_METRIC_RESOLUTION_TRACER
+
+    trace = result.meta["metric_resolution_trace"]
+    metric_events = [
+        event for event in trace["traceEvents"] if event["cat"] == "metric"
+    ]
+    assert {event["name"] for event in metric_events} >= {
+        "column.max",
+        "column_values.nonnull.unexpected_count",
+    }
+    assert all(event["args"]["rows_scanned"] == 3 for event in metric_events)
+    assert {
+        event["name"] for event in trace["traceEvents"] if event["cat"] == "expectation"
+    } == {"expect_column_max_to_be_between", "expect_column_values_to_not_be_null"}
+
+    expectations = trace["otherData"]["expectations"]
+    assert len(expectations) == 2  # noqa: PLR2004
+    assert (
+        expectations[0]["metric_resolution_seconds"]
+        >= expectations[1]["metric_resolution_seconds"]
+        > 0
+    )
+
+    # Metrics computed by first validation run are served from metric cache.
+    result = validator.validate(
+        expectation_suite=expectation_suite, trace_metric_resolution=True
+    )
+    counters = result.meta["metric_resolution_trace"]["otherData"]["counters"]
+    assert counters["metric_cache.hits"] > 0
+    assert counters["metric_cache.misses"] == 0
+
+    result = validator.validate(expectation_suite=expectation_suite)
+    assert "metric_resolution_trace" not in result.meta
+
+
+@pytest.mark.sqlite
+def test_validate_records_sql_text_in_metric_resolution_trace(sa, expectation_suite):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]}).to_sql(
+        name="trace_table", con=engine, index=False
+    )
+    execution_engine = SqlAlchemyExecutionEngine(engine=engine)
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(
+            table_name="trace_table", data_asset_name="trace_table"
+        )
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+    )
+
+    result = validator.validate(
+        expectation_suite=expectation_suite, trace_metric_resolution=True
+    )
+
+    trace = result.meta["metric_resolution_trace"]
+    sql_texts = [
+        event["args"]["sql"] for event in trace["traceEvents"] if event["cat"] == "sql"
+    ]
+    assert sql_texts
+    assert any("max(a)" in sql_text for sql_text in sql_texts)
+    assert any(
+        event["name"] == "metric_bundle" and event["args"]["metric_ids"]
+        for event in trace["traceEvents"]
+    )
+    assert trace["otherData"]["counters"]["metric_cache.misses"] > 0
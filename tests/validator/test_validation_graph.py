@@ -16,6 +16,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricResolutionSchedule,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -284,6 +285,106 @@ def test_parse_validation_graph(
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+@pytest.mark.unit
+def test_parse_validation_graph_updates_schedule_incrementally(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
+    # noinspection PyProtectedMember
+    schedule = _MetricResolutionSchedule(index=graph._get_index(), metrics={})
+
+    available_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    num_levels = 0
+    while schedule.ready_metrics:
+        num_levels += 1
+        resolved_metric_ids = [
+            metric_configuration.id for metric_configuration in schedule.ready_metrics
+        ]
+        available_metrics.update(
+            {metric_id: "my_value" for metric_id in resolved_metric_ids}
+        )
+        schedule.mark_resolved(metric_ids=resolved_metric_ids)
+
+        # Incrementally maintained schedule must agree with schedule computed from scratch.
+        # noinspection PyProtectedMember
+        ready_metrics, needed_metrics = graph._parse(metrics=available_metrics)
+        assert {metric_configuration.id for metric_configuration in ready_metrics} == {
+            metric_configuration.id for metric_configuration in schedule.ready_metrics
+        }
+        assert len(needed_metrics) == len(schedule.needed_metrics)
+
+    assert num_levels > 1
+    assert len(schedule.needed_metrics) == 0
+
+
+@pytest.mark.unit
+def test_get_cyclic_metric_ids():
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    metric_a = MetricConfiguration(metric_name="metric_a", metric_domain_kwargs={})
+    metric_b = MetricConfiguration(metric_name="metric_b", metric_domain_kwargs={})
+    metric_c = MetricConfiguration(metric_name="metric_c", metric_domain_kwargs={})
+    metric_d = MetricConfiguration(metric_name="metric_d", metric_domain_kwargs={})
+
+    graph = ValidationGraph(
+        execution_engine=execution_engine,
+        edges=[
+            MetricEdge(left=metric_a, right=metric_b),
+            MetricEdge(left=metric_b, right=metric_c),
+            MetricEdge(left=metric_c, right=metric_a),
+            MetricEdge(left=metric_d, right=metric_a),
+        ],
+    )
+
+    # noinspection PyProtectedMember
+    assert graph._get_index().get_cyclic_metric_ids() == {
+        metric_a.id,
+        metric_b.id,
+        metric_c.id,
+    }
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_with_circular_dependency_terminates(caplog):
+    class ExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            return {
+                metric_configuration.id: "my_value"
+                for metric_configuration in metrics_to_resolve
+            }
+
+    execution_engine = cast(ExecutionEngine, ExecutionEngineFake())
+
+    metric_a = MetricConfiguration(metric_name="metric_a", metric_domain_kwargs={})
+    metric_b = MetricConfiguration(metric_name="metric_b", metric_domain_kwargs={})
+    metric_c = MetricConfiguration(metric_name="metric_c", metric_domain_kwargs={})
+
+    graph = ValidationGraph(
+        execution_engine=execution_engine,
+        edges=[
+            MetricEdge(left=metric_a, right=metric_b),
+            MetricEdge(left=metric_b, right=metric_a),
+            MetricEdge(left=metric_c),
+        ],
+    )
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert set(resolved_metrics.keys()) == {metric_c.id}
+    assert aborted_metrics_info == {}
+    assert "has created a circular dependency" in caplog.text
+
+
 @pytest.mark.unit
 def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,